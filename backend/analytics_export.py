@@ -0,0 +1,256 @@
+import os
+import sys
+import json
+import argparse
+import datetime
+from typing import Any, Iterator, Optional
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+from db_pool import db_pool
+from analytics_queries import RUN_COLUMNS, build_filters, build_export_query, serialize_row
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+# Output formats and their HTTP media types
+EXPORT_FORMATS = {
+    'ndjson'    : "application/x-ndjson",
+    'arrow'     : "application/vnd.apache.arrow.stream",
+    'parquet'   : "application/vnd.apache.parquet"
+}
+
+# Arrow type of each exportable column
+COLUMN_TYPES = {
+    'id'                                : "int64",
+    'run_id'                            : "string",
+    'user_id'                           : "int64",
+    'task_id'                           : "string",
+    'updated_steps'                     : "string",
+    'tokens_per_text_prompt'            : "int64",
+    'tokens_per_attachment'             : "int64",
+    'tokens_per_attachment_original'    : "int64",
+    'gpt_response'                      : "string",
+    'total_cost'                        : "float64",
+    'time_consumed'                     : "float64",
+    'feedback'                          : "string",
+    'cache_hit'                         : "bool",
+    'stage_timings'                     : "string",
+    'time_stamp'                        : "timestamp",
+    'question'                          : "string",
+    'level'                             : "int64",
+    'final_answer'                      : "string"
+}
+
+
+# Helper function to coerce a database value to its Arrow column type
+def coerce_value(value: Any, column_type: str) -> Any:
+    '''Convert MySQL values (decimals, tinyint booleans) for Arrow'''
+
+    if value is None:
+        return None
+    if column_type == "float64":
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    if column_type == "int64":
+        return int(value)
+    if column_type == "bool":
+        return bool(value)
+    if column_type == "string":
+        return value if isinstance(value, str) else str(value)
+    return value
+
+
+def iter_batches(columns: list[str], filters: dict[str, Any], batch_size: int) -> Iterator[list[tuple]]:
+    '''Stream the matching analytics rows from MySQL in lists of at most batch_size tuples
+
+    The cursor is unbuffered, so rows are pulled from the server as they are
+    consumed and at most one batch is held in memory.
+    '''
+
+    conditions, params = build_filters(**filters)
+    query, params = build_export_query(columns, conditions, params)
+
+    conn = db_pool.get_connection()
+    cursor = conn.cursor(buffered = False)
+
+    try:
+        logger.debug("SQL - Running a streaming SELECT statement")
+        cursor.execute(query, tuple(params))
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
+        logger.debug("SQL - Streaming SELECT statement complete")
+
+    finally:
+        # Closes the cursor first. When the consumer stopped early the cursor
+        # has unread rows and fails to close, so the pool discards the
+        # connection instead of draining the rest of the result set.
+        conn.close()
+
+
+class _ByteSink:
+    '''File-like object that hands written bytes back to the generator'''
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _arrow_schema(columns: list[str]):
+    import pyarrow as pa
+
+    types = {
+        'int64'     : pa.int64(),
+        'float64'   : pa.float64(),
+        'string'    : pa.string(),
+        'bool'      : pa.bool_(),
+        'timestamp' : pa.timestamp('us')
+    }
+    return pa.schema([(column, types[COLUMN_TYPES[column]]) for column in columns])
+
+
+def _record_batch(schema, columns: list[str], rows: list[tuple]):
+    import pyarrow as pa
+
+    arrays = [
+        pa.array([coerce_value(row[index], COLUMN_TYPES[column]) for row in rows], type = schema.field(column).type)
+        for index, column in enumerate(columns)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema = schema)
+
+
+def export_rows(export_format: str, columns: list[str], filters: dict[str, Any], batch_size: int = 1000) -> Iterator[bytes]:
+    '''Yield the analytics export as a stream of byte chunks, one per batch'''
+
+    if export_format == "ndjson":
+        for rows in iter_batches(columns, filters, batch_size):
+            yield "".join(
+                json.dumps(serialize_row(dict(zip(columns, row)))) + "\n" for row in rows
+            ).encode('utf-8')
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(columns)
+    sink = _ByteSink()
+
+    if export_format == "arrow":
+        writer = pa.ipc.new_stream(sink, schema)
+    else:
+        writer = pq.ParquetWriter(sink, schema, compression = os.getenv('EXPORT_PARQUET_COMPRESSION', 'zstd'))
+
+    try:
+        for rows in iter_batches(columns, filters, batch_size):
+            batch = _record_batch(schema, columns, rows)
+
+            if export_format == "arrow":
+                writer.write_batch(batch)
+            else:
+                writer.write_table(pa.Table.from_batches([batch]))
+
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+
+    # Stream end marker / Parquet footer
+    data = sink.drain()
+    if data:
+        yield data
+
+
+# Helper function to start an export before its response is sent
+def start_export(export_format: str, columns: list[str], filters: dict[str, Any], batch_size: int = 1000) -> Iterator[bytes]:
+    '''Borrow the connection and read the first batch, then return the whole stream of byte chunks
+
+    A PoolTimeout or database error is raised here, while the caller can
+    still answer with an error status, rather than cutting a 200 body short.
+    '''
+
+    chunks = export_rows(export_format, columns, filters, batch_size)
+    first = next(chunks, None)
+
+    def stream() -> Iterator[bytes]:
+        if first is not None:
+            yield first
+        yield from chunks
+
+    return stream()
+
+
+# Helper function to validate the export arguments shared by the route and the CLI
+def parse_columns(columns: Optional[str]) -> list[str]:
+    '''Split a comma separated column list (all columns when empty)'''
+
+    if not columns:
+        return list(RUN_COLUMNS)
+
+    selected = [column.strip() for column in columns.split(",") if column.strip()]
+    unknown = [column for column in selected if column not in RUN_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unsupported columns: {', '.join(unknown)}")
+    return selected
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description = "Stream the analytics table to NDJSON, Arrow IPC or Parquet")
+    parser.add_argument("--format", choices = list(EXPORT_FORMATS), default = "parquet")
+    parser.add_argument("--output", help = "Output file (defaults to stdout)")
+    parser.add_argument("--columns", help = "Comma separated list of columns")
+    parser.add_argument("--start", type = datetime.datetime.fromisoformat)
+    parser.add_argument("--end", type = datetime.datetime.fromisoformat)
+    parser.add_argument("--user-id", type = int)
+    parser.add_argument("--task-id")
+    parser.add_argument("--level", type = int)
+    parser.add_argument("--batch-size", type = int, default = 5000)
+    args = parser.parse_args()
+
+    filters = {
+        'start'     : args.start,
+        'end'       : args.end,
+        'user_id'   : args.user_id,
+        'task_id'   : args.task_id,
+        'level'     : args.level
+    }
+
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in export_rows(args.format, parse_columns(args.columns), filters, args.batch_size):
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
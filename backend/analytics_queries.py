@@ -0,0 +1,173 @@
+import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+
+# Numeric analytics columns (INT / DOUBLE since schema migration 1)
+PROMPT_TOKENS   = "a.tokens_per_text_prompt"
+FILE_TOKENS     = "a.tokens_per_attachment"
+ORIGINAL_TOKENS = "COALESCE(a.tokens_per_attachment_original, a.tokens_per_attachment)"
+TIME_CONSUMED   = "a.time_consumed"
+TOTAL_TOKENS    = f"(COALESCE({PROMPT_TOKENS}, 0) + COALESCE({FILE_TOKENS}, 0))"
+
+# Supported GROUP BY dimensions for the summary endpoint
+GROUPS = {
+    'day'   : "DATE(a.time_stamp)",
+    'user'  : "a.user_id",
+    'task'  : "a.task_id",
+    'level' : "g.level"
+}
+
+# Columns a client may select from the runs endpoint
+RUN_COLUMNS = {
+    'id'                                : "a.id",
+    'run_id'                            : "a.run_id",
+    'user_id'                           : "a.user_id",
+    'task_id'                           : "a.task_id",
+    'updated_steps'                     : "a.updated_steps",
+    'tokens_per_text_prompt'            : "a.tokens_per_text_prompt",
+    'tokens_per_attachment'             : "a.tokens_per_attachment",
+    'tokens_per_attachment_original'    : "a.tokens_per_attachment_original",
+    'gpt_response'                      : "a.gpt_response",
+    'total_cost'                        : "a.total_cost",
+    'time_consumed'                     : "a.time_consumed",
+    'feedback'                          : "a.feedback",
+    'cache_hit'                         : "a.cache_hit",
+    'stage_timings'                     : "a.stage_timings",
+    'time_stamp'                        : "a.time_stamp",
+    'question'                          : "g.question",
+    'level'                             : "g.level",
+    'final_answer'                      : "g.final_answer"
+}
+
+# Small columns returned when the client does not choose
+DEFAULT_RUN_COLUMNS = [
+    'id', 'user_id', 'task_id', 'tokens_per_text_prompt', 'tokens_per_attachment',
+    'total_cost', 'time_consumed', 'cache_hit', 'time_stamp'
+]
+
+
+# Helper function to build the WHERE clause shared by the analytics queries
+def build_filters(start: Optional[datetime.datetime] = None, end: Optional[datetime.datetime] = None, user_id: Optional[int] = None, task_id: Optional[str] = None, level: Optional[int] = None) -> tuple[list[str], list[Any]]:
+    '''Return the SQL conditions and their parameters for the given filters'''
+
+    conditions, params = [], []
+
+    if start is not None:
+        conditions.append("a.time_stamp >= %s")
+        params.append(start)
+    if end is not None:
+        conditions.append("a.time_stamp < %s")
+        params.append(end)
+    if user_id is not None:
+        conditions.append("a.user_id = %s")
+        params.append(user_id)
+    if task_id is not None:
+        conditions.append("a.task_id = %s")
+        params.append(task_id)
+    if level is not None:
+        conditions.append("g.level = %s")
+        params.append(level)
+
+    return conditions, params
+
+
+# Helper function to build the aggregate query
+def build_summary_query(group_by: Optional[str], conditions: list[str], params: list[Any]) -> tuple[str, list[Any]]:
+    '''Totals, averages, cost per token and tokens per second, optionally grouped'''
+
+    if group_by is not None and group_by not in GROUPS:
+        raise ValueError(f"Unsupported group_by '{group_by}', expected one of {', '.join(GROUPS)}")
+
+    group_column = f"{GROUPS[group_by]} AS group_key, " if group_by else ""
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    group = "GROUP BY group_key ORDER BY group_key" if group_by else ""
+
+    query = f"""
+    SELECT {group_column}
+        COUNT(*)                                                AS runs,
+        COUNT(DISTINCT a.user_id)                               AS users,
+        COUNT(DISTINCT a.task_id)                               AS tasks,
+        SUM({PROMPT_TOKENS})                                    AS prompt_tokens,
+        SUM({FILE_TOKENS})                                      AS attachment_tokens,
+        SUM({ORIGINAL_TOKENS})                                  AS original_attachment_tokens,
+        SUM({ORIGINAL_TOKENS}) - SUM({FILE_TOKENS})             AS trimmed_attachment_tokens,
+        SUM({TOTAL_TOKENS})                                     AS total_tokens,
+        SUM(a.total_cost)                                       AS total_cost,
+        AVG(a.total_cost)                                       AS avg_cost,
+        AVG({TIME_CONSUMED})                                    AS avg_time_consumed,
+        SUM(a.total_cost) / NULLIF(SUM({TOTAL_TOKENS}), 0)      AS cost_per_token,
+        SUM({TOTAL_TOKENS}) / NULLIF(SUM({TIME_CONSUMED}), 0)   AS tokens_per_second,
+        SUM(a.cache_hit)                                        AS cache_hits,
+        MIN(a.time_stamp)                                       AS first_run,
+        MAX(a.time_stamp)                                       AS last_run
+    FROM analytics a
+    JOIN gaia_features g ON g.task_id = a.task_id
+    {where}
+    {group}
+    """
+    return query, params
+
+
+# Helper function to build one page of the keyset-paginated runs query
+def build_runs_query(columns: list[str], after_id: int, limit: int, conditions: list[str], params: list[Any]) -> tuple[str, list[Any]]:
+    '''Select the chosen columns of the runs with id greater than after_id'''
+
+    unknown = [column for column in columns if column not in RUN_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unsupported columns: {', '.join(unknown)}")
+
+    # The id is always needed to fetch the next page
+    if 'id' not in columns:
+        columns = ['id'] + columns
+
+    select = ", ".join(f"{RUN_COLUMNS[column]} AS {column}" for column in columns)
+    where = " AND ".join(["a.id > %s"] + conditions)
+
+    query = f"""
+    SELECT {select}
+    FROM analytics a
+    JOIN gaia_features g ON g.task_id = a.task_id
+    WHERE {where}
+    ORDER BY a.id
+    LIMIT %s
+    """
+    return query, [after_id] + params + [limit]
+
+
+# Helper function to build the unpaginated export query
+def build_export_query(columns: list[str], conditions: list[str], params: list[Any]) -> tuple[str, list[Any]]:
+    '''Select the chosen columns of every matching run, in id order'''
+
+    unknown = [column for column in columns if column not in RUN_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unsupported columns: {', '.join(unknown)}")
+
+    select = ", ".join(f"{RUN_COLUMNS[column]} AS {column}" for column in columns)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    query = f"""
+    SELECT {select}
+    FROM analytics a
+    JOIN gaia_features g ON g.task_id = a.task_id
+    {where}
+    ORDER BY a.id
+    """
+    return query, params
+
+
+# Helper function to make a database row JSON serializable
+def serialize_row(row: dict[str, Any]) -> dict[str, Any]:
+    '''Convert dates to ISO strings and decimals to floats'''
+
+    processed_row = {}
+    for key, value in row.items():
+        if isinstance(value, (int, float, str, type(None))):
+            processed_row[key] = value
+        elif isinstance(value, Decimal):
+            processed_row[key] = float(value)
+        elif isinstance(value, (datetime.date, datetime.datetime)):
+            processed_row[key] = value.isoformat()
+        else:
+            processed_row[key] = str(value)
+    return processed_row
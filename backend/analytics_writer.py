@@ -0,0 +1,427 @@
+import os
+import json
+import time
+import queue
+import threading
+from typing import Any, Optional
+from dotenv import load_dotenv
+from mysql.connector import IntegrityError, DataError
+
+# Custom libraries
+from log_setup import get_logger
+from metrics import stage_duration
+from db_pool import db_pool
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+# Columns written for every run (missing keys are stored as NULL unless defaulted)
+ANALYTICS_COLUMNS = [
+    'run_id', 'user_id', 'task_id', 'updated_steps', 'tokens_per_text_prompt', 'tokens_per_attachment',
+    'tokens_per_attachment_original', 'gpt_response', 'total_cost', 'time_consumed', 'cache_hit', 'stage_timings'
+]
+ANALYTICS_DEFAULTS = {
+    'cache_hit' : False
+}
+
+
+class _FlushRequest:
+    '''Queue marker asking the worker to write everything queued before it'''
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class AnalyticsWriter:
+    '''Write-behind recorder for the analytics table
+
+    Requests only enqueue their row. A single worker thread drains the queue
+    and writes batches with one multi-row INSERT each, whenever `batch_size`
+    rows are waiting or `flush_interval` seconds have passed. The queue is
+    bounded: producers wait up to `enqueue_timeout` seconds for room, and rows
+    that still do not fit, or that cannot be written while MySQL is
+    unreachable, are appended to a local JSONL spill file. Spilled rows are
+    replayed when the worker starts, after every batch written, and while the
+    writer is idle at most every `replay_interval` seconds.
+
+    A batch MySQL refuses is written again one row at a time, so a single bad
+    row (e.g. an unknown user) does not hold back the others. Rows refused
+    with an integrity or data error, and unreadable spill lines, are moved to
+    the `dead_letter_path` JSONL file instead of being retried forever.
+    '''
+
+    def __init__(self, spill_path: str, dead_letter_path: Optional[str] = None, batch_size: int = 50, flush_interval: float = 2.0, max_queue: int = 10000, enqueue_timeout: float = 0.5, replay_interval: float = 30.0):
+        self.spill_path         = spill_path
+        self.dead_letter_path   = dead_letter_path or f"{spill_path}.dead"
+        self.batch_size         = batch_size
+        self.flush_interval     = flush_interval
+        self.max_queue          = max_queue
+        self.enqueue_timeout    = enqueue_timeout
+        self.replay_interval    = replay_interval
+
+        self._queue             = queue.Queue(maxsize = max_queue)
+        self._thread            = None
+        self._stopping          = threading.Event()
+        self._outstanding       = 0
+        self._next_replay       = 0.0
+        self._spill_lock        = threading.Lock()
+        self._stats_lock        = threading.Lock()
+
+        # Counters
+        self.enqueued           = 0
+        self.written            = 0
+        self.spilled            = 0
+        self.replayed           = 0
+        self.batches            = 0
+        self.failed_batches     = 0
+        self.dead_lettered      = 0
+        self.worker_errors      = 0
+        self.worker_restarts    = 0
+        self.last_flush_ms      = 0.0
+        self.max_flush_ms       = 0.0
+        self._total_flush_ms    = 0.0
+
+    def start(self) -> None:
+        '''Start the worker thread (no-op if it is already running)'''
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(target = self._run, name = "analytics-writer", daemon = True)
+            self._thread.start()
+            logger.info("INTERNAL - Analytics writer started")
+
+    def alive(self) -> bool:
+        '''Whether the worker thread is running'''
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_running(self) -> None:
+        '''Restart a worker that died unexpectedly (never one that was closed)'''
+
+        if self._thread is not None and not self._thread.is_alive() and not self._stopping.is_set():
+            logger.error("Error: AnalyticsWriter worker thread died, restarting it")
+            with self._stats_lock:
+                self.worker_restarts += 1
+            self.start()
+
+    def record(self, data: dict[str, Any]) -> bool:
+        '''Queue one analytics row; returns False if it had to be spilled to disk'''
+
+        row = tuple(data.get(column, ANALYTICS_DEFAULTS.get(column)) for column in ANALYTICS_COLUMNS)
+
+        self._ensure_running()
+
+        # Counted before the put, since the worker may write the row right away
+        with self._stats_lock:
+            self._outstanding += 1
+        try:
+            self._queue.put(row, timeout = self.enqueue_timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self._outstanding -= 1
+            logger.warning("INTERNAL - Analytics queue is full, spilling the row to disk")
+            self._spill([row])
+            return False
+
+        with self._stats_lock:
+            self.enqueued += 1
+        return True
+
+    def pending(self) -> bool:
+        '''Whether rows queued with record() are not written (or spilled) yet'''
+
+        with self._stats_lock:
+            return self._outstanding > 0
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        '''Block until every row queued so far is written (or spilled)'''
+
+        self._ensure_running()
+        if not self.alive():
+            return False
+
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout = timeout)
+        except queue.Full:
+            return False
+        return request.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        '''Write out everything still queued and stop the worker'''
+
+        if self._thread is None:
+            return
+
+        # With a full queue the worker sees the stop flag once it has drained it
+        self._stopping.set()
+        try:
+            self._queue.put(None, timeout = self.enqueue_timeout)
+        except queue.Full:
+            logger.warning("INTERNAL - Analytics queue is full at shutdown, the writer stops once it is drained")
+
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("INTERNAL - Analytics writer stopped")
+
+    def _run(self) -> None:
+        batch = []
+        deadline = None
+
+        # Rows spilled before a restart (or by an earlier worker)
+        self._replay_spill()
+
+        while True:
+            # Wake up every flush_interval even when idle, to retry spilled rows
+            timeout = self.flush_interval if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._stopping.is_set():
+                timeout = min(timeout, 0.1)
+
+            try:
+                item = self._queue.get(timeout = timeout)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    item = None
+                elif batch:
+                    item = _FlushRequest()
+                else:
+                    if time.monotonic() >= self._next_replay:
+                        self._replay_spill()
+                    continue
+
+            try:
+                if item is None:
+                    self._write(batch)
+                    return
+
+                if isinstance(item, _FlushRequest):
+                    try:
+                        self._write(batch)
+                    finally:
+                        batch, deadline = [], None
+                        item.done.set()
+                    continue
+
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+                if len(batch) >= self.batch_size:
+                    try:
+                        self._write(batch)
+                    finally:
+                        batch, deadline = [], None
+
+            except Exception as exception:
+                # Keep the worker alive; rows of the failed write were spilled where possible
+                logger.error("Error: AnalyticsWriter worker hit an unexpected error")
+                logger.error(exception)
+                with self._stats_lock:
+                    self.worker_errors += 1
+                if item is None:
+                    return
+
+    def _insert(self, rows: list[tuple]) -> None:
+        columns = ', '.join(ANALYTICS_COLUMNS)
+        placeholders = ', '.join(['%s'] * len(ANALYTICS_COLUMNS))
+
+        conn = db_pool.get_connection()
+        try:
+            with conn.cursor() as cursor:
+                # executemany() rewrites this into a single multi-row INSERT
+                cursor.executemany(f"INSERT INTO analytics ({columns}) VALUES ({placeholders})", rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _insert_each(self, rows: list[tuple]) -> tuple[int, list[tuple]]:
+        '''Write rows one at a time after their batch failed
+
+        Rows refused with an integrity or data error go to the dead-letter
+        file. Any other error (MySQL unreachable, pool exhausted) stops the
+        loop; returns the number of rows written and the rows left unwritten.
+        '''
+
+        written = 0
+        for index, row in enumerate(rows):
+            try:
+                self._insert([row])
+            except (IntegrityError, DataError) as exception:
+                logger.error(f"Error: AnalyticsWriter - MySQL refused the row of run {row[0]}, moving it to the dead-letter file")
+                logger.error(exception)
+                self._dead_letter({'row': list(row), 'error': str(exception)})
+                continue
+            except Exception as exception:
+                logger.error("Error: AnalyticsWriter could not write rows one at a time")
+                logger.error(exception)
+                return written, rows[index:]
+            written += 1
+        return written, []
+
+    def _write(self, rows: list[tuple]) -> None:
+        try:
+            self._write_batch(rows)
+        finally:
+            with self._stats_lock:
+                self._outstanding -= len(rows)
+
+    def _write_batch(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+
+        start = time.perf_counter()
+        try:
+            self._insert(rows)
+            written = len(rows)
+        except Exception as exception:
+            logger.error(f"Error: AnalyticsWriter could not write a batch of {len(rows)} rows, writing them one at a time")
+            logger.error(exception)
+            with self._stats_lock:
+                self.failed_batches += 1
+
+            written, unwritten = self._insert_each(rows)
+            if unwritten:
+                self._spill(unwritten)
+                with self._stats_lock:
+                    self.written += written
+                return
+
+        elapsed = (time.perf_counter() - start) * 1000
+        stage_duration.observe(elapsed / 1000, stage = "analytics_write")
+        with self._stats_lock:
+            self.written += written
+            self.batches += 1
+            self.last_flush_ms = elapsed
+            self.max_flush_ms = max(self.max_flush_ms, elapsed)
+            self._total_flush_ms += elapsed
+        logger.info(f"SQL - Wrote {written} analytics rows in {elapsed:.1f} ms")
+
+        # MySQL is reachable again, so older spilled rows can go in too
+        self._replay_spill()
+
+    def _spill_pending(self) -> bool:
+        return os.path.exists(self.spill_path) or os.path.exists(f"{self.spill_path}.replay")
+
+    def _replay_spill(self) -> None:
+        '''Replay the spill file, if any (never raises)'''
+
+        if not self._spill_pending():
+            return
+
+        self._next_replay = time.monotonic() + self.replay_interval
+        try:
+            self._replay()
+        except Exception as exception:
+            logger.error("Error: AnalyticsWriter could not replay the spill file")
+            logger.error(exception)
+
+    def _append(self, path: str, documents: list[Any]) -> None:
+        with self._spill_lock:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok = True)
+            with open(path, "a", encoding = "utf-8") as file:
+                for document in documents:
+                    file.write(json.dumps(document, default = str) + "\n")
+
+    def _spill(self, rows: list[tuple]) -> None:
+        self._append(self.spill_path, rows)
+        with self._stats_lock:
+            self.spilled += len(rows)
+
+    def _dead_letter(self, entry: dict[str, Any]) -> None:
+        self._append(self.dead_letter_path, [entry])
+        with self._stats_lock:
+            self.dead_lettered += 1
+
+    def _replay(self) -> None:
+        # Move the file aside so rows spilled meanwhile are not replayed twice
+        replay_path = f"{self.spill_path}.replay"
+        with self._spill_lock:
+            if not os.path.exists(replay_path) and os.path.exists(self.spill_path):
+                os.replace(self.spill_path, replay_path)
+
+        # Lines that are not a full row (half-written, or from an older column list) are set aside
+        rows = []
+        with open(replay_path, encoding = "utf-8", errors = "replace") as replay_file:
+            for line in replay_file:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    if not isinstance(row, list) or len(row) != len(ANALYTICS_COLUMNS):
+                        raise ValueError(f"expected a list of {len(ANALYTICS_COLUMNS)} values")
+                except ValueError as exception:
+                    logger.error("Error: AnalyticsWriter - unreadable spill line, moving it to the dead-letter file")
+                    self._dead_letter({'line': line.rstrip("\n"), 'error': str(exception)})
+                    continue
+                rows.append(tuple(row))
+
+        remaining = []
+        for index in range(0, len(rows), self.batch_size):
+            batch = rows[index:index + self.batch_size]
+            try:
+                self._insert(batch)
+                written = len(batch)
+            except Exception as exception:
+                logger.error("Error: AnalyticsWriter could not replay a batch, writing it one row at a time")
+                logger.error(exception)
+                written, unwritten = self._insert_each(batch)
+                if unwritten:
+                    remaining = unwritten + rows[index + self.batch_size:]
+
+            with self._stats_lock:
+                self.replayed += written
+            if remaining:
+                break
+
+        if remaining:
+            # Keep the unwritten rows for the next attempt
+            with open(replay_path, "w", encoding = "utf-8") as replay_file:
+                for row in remaining:
+                    replay_file.write(json.dumps(row, default = str) + "\n")
+            return
+
+        os.remove(replay_path)
+        logger.info(f"SQL - Replayed {len(rows)} spilled analytics rows")
+
+    def stats(self) -> dict[str, Any]:
+        '''Queue depth, throughput and flush latency'''
+
+        with self._stats_lock:
+            return {
+                'queue_depth'       : self._queue.qsize(),
+                'max_queue'         : self.max_queue,
+                'enqueued'          : self.enqueued,
+                'written'           : self.written,
+                'spilled'           : self.spilled,
+                'replayed'          : self.replayed,
+                'batches'           : self.batches,
+                'failed_batches'    : self.failed_batches,
+                'dead_lettered'     : self.dead_lettered,
+                'worker_alive'      : self.alive(),
+                'worker_errors'     : self.worker_errors,
+                'worker_restarts'   : self.worker_restarts,
+                'last_flush_ms'     : round(self.last_flush_ms, 2),
+                'avg_flush_ms'      : round(self._total_flush_ms / self.batches, 2) if self.batches else 0.0,
+                'max_flush_ms'      : round(self.max_flush_ms, 2),
+                'spill_pending'     : self._spill_pending()
+            }
+
+
+# Shared writer for the backend
+analytics_writer = AnalyticsWriter(
+    spill_path          = os.getenv('ANALYTICS_SPILL_FILE', os.path.join('cache', 'analytics_spill.jsonl')),
+    dead_letter_path    = os.getenv('ANALYTICS_DEAD_LETTER_FILE'),
+    batch_size          = int(os.getenv('ANALYTICS_BATCH_SIZE', 50)),
+    flush_interval      = float(os.getenv('ANALYTICS_FLUSH_INTERVAL', 2)),
+    max_queue           = int(os.getenv('ANALYTICS_QUEUE_SIZE', 10000)),
+    enqueue_timeout     = float(os.getenv('ANALYTICS_ENQUEUE_TIMEOUT', 0.5)),
+    replay_interval     = float(os.getenv('ANALYTICS_REPLAY_INTERVAL', 30))
+)
@@ -0,0 +1,165 @@
+import os
+import asyncio
+import hashlib
+from typing import Any, Optional
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+
+# Custom libraries
+from log_setup import get_logger
+from file_cache import DiskStore
+from metrics import time_stage, cache_requests
+from helpers import count_tokens
+from table_extraction import parse_table, format_table
+from attachment_trimming import content_text, split_text, split_rows
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+# Bump whenever the map prompt changes, so stored notes are regenerated
+MAP_PROMPT_VERSION = 1
+
+MAP_SYSTEM_PROMPT = (
+    "You read one part of a long document and take notes for someone who must answer a question about it. "
+    "Copy the facts, numbers, names and short passages from this part that could help answer the question, "
+    "keeping exact values. Do not answer the question. If nothing in this part is relevant, reply with NONE."
+)
+
+
+class AttachmentSummarizer:
+    '''Map-reduce reading of attachments too large for a single GPT request
+
+    Extracted content over `threshold_tokens` is split into chunks of about
+    `chunk_tokens` (whole rows of one sheet for spreadsheets and CSVs, each
+    chunk with the sheet name and header row). Every chunk is sent to
+    `model` with the question, at most `concurrency` requests at a time, and
+    the returned notes are merged in document order to stand in for the
+    attachment in the final request.
+
+    Notes are stored by the hash of the chunk, the question and the model,
+    so a regeneration with updated steps reuses them.
+    '''
+
+    def __init__(self, directory: str, enabled: bool = False, threshold_tokens: int = 100000, chunk_tokens: int = 8000, concurrency: int = 4, model: str = "gpt-4o"):
+        self.store              = DiskStore(directory)
+        self.enabled            = enabled
+        self.threshold_tokens   = threshold_tokens
+        self.chunk_tokens       = chunk_tokens
+        self.concurrency        = concurrency
+        self.model              = model
+
+    def applies(self, tokens: Optional[int]) -> bool:
+        '''Whether an attachment of this many tokens is read with map-reduce'''
+
+        return self.enabled and tokens is not None and tokens > self.threshold_tokens
+
+    def chunks(self, content: Any) -> list[str]:
+        '''Split extracted content into the texts sent to the map requests'''
+
+        sections = parse_table(content)
+        if sections:
+            return [
+                format_table([{**section, 'rows': group}])
+                for section in sections
+                for group in split_rows(section['rows'], self.chunk_tokens)
+            ]
+        return split_text(content_text(content), self.chunk_tokens)
+
+    def key(self, chunk: str, question: str) -> str:
+        digest = hashlib.sha256()
+        for part in (f"v{MAP_PROMPT_VERSION}", self.model, question, chunk):
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def _map(self, client, chunk: str, index: int, total: int, question: str, semaphore: asyncio.Semaphore) -> dict[str, Any]:
+        '''Notes for one chunk, from the store or from GPT'''
+
+        key = self.key(chunk, question)
+        entry = await run_in_threadpool(self.store.get, key)
+        if entry is not None:
+            cache_requests.inc(cache = "map_notes", result = "hit")
+            return {'notes': entry['notes'], 'tokens': 0, 'cached': True}
+
+        cache_requests.inc(cache = "map_notes", result = "miss")
+
+        messages = [
+            {"role": "system", "content": MAP_SYSTEM_PROMPT},
+            {"role": "user", "content": f"Question: {question}\n\nPart {index + 1} of {total} of the document:\n\n{chunk}"}
+        ]
+
+        async with semaphore:
+            try:
+                with time_stage("openai_map"):
+                    response = await client.chat.completions.create(
+                        model = self.model,
+                        temperature = 0,
+                        messages = messages
+                    )
+            except Exception as exception:
+                # The other parts are still useful; this one is retried next time
+                logger.error(f"Error: GPT - map request for part {index + 1} of {total} failed")
+                logger.error(exception)
+                return {'notes': None, 'tokens': 0, 'cached': False}
+
+        notes = (response.choices[0].message.content or "").strip()
+        tokens = await run_in_threadpool(lambda: sum(count_tokens(message['content']) for message in messages))
+
+        await run_in_threadpool(self.store.put, key, {
+            'model'     : self.model,
+            'version'   : MAP_PROMPT_VERSION,
+            'notes'     : notes
+        })
+        return {'notes': notes, 'tokens': tokens, 'cached': False}
+
+    async def summarize(self, client, content: Any, question: str) -> dict[str, Any]:
+        '''Run the map requests over the chunks and merge their notes
+
+        Returns the merged notes, the number of chunks (and how many came
+        from the store), and the input tokens spent on map requests.
+        '''
+
+        with time_stage("map_reduce"):
+            chunks = await run_in_threadpool(self.chunks, content)
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            logger.info(f"GPT - Reading the attachment in {len(chunks)} parts (at most {self.concurrency} at a time)")
+            results = await asyncio.gather(*(
+                self._map(client, chunk, index, len(chunks), question, semaphore)
+                for index, chunk in enumerate(chunks)
+            ))
+
+        parts = []
+        for index, result in enumerate(results):
+            if result['notes'] is None:
+                parts.append(f"[Part {index + 1}] (could not be read)")
+            elif result['notes'].upper() != "NONE":
+                parts.append(f"[Part {index + 1}] {result['notes']}")
+
+        cached = sum(result['cached'] for result in results)
+        logger.info(f"GPT - Attachment read in {len(chunks)} parts, {cached} from stored notes")
+
+        return {
+            'notes'         : "\n\n".join(parts) if parts else "Nothing in the file is relevant to the question.",
+            'chunks'        : len(chunks),
+            'cached_chunks' : cached,
+            'map_tokens'    : sum(result['tokens'] for result in results)
+        }
+
+
+# Shared summarizer for the backend
+attachment_summarizer = AttachmentSummarizer(
+    directory           = os.getenv('MAP_REDUCE_CACHE_DIR', 'cache/map_notes'),
+    enabled             = os.getenv('MAP_REDUCE_ENABLED', 'false').lower() == 'true',
+    threshold_tokens    = int(os.getenv('MAP_REDUCE_THRESHOLD_TOKENS', 100000)),
+    chunk_tokens        = int(os.getenv('MAP_REDUCE_CHUNK_TOKENS', 8000)),
+    concurrency         = int(os.getenv('MAP_REDUCE_CONCURRENCY', 4)),
+    model               = os.getenv('MAP_REDUCE_MODEL', 'gpt-4o')
+)
@@ -0,0 +1,225 @@
+import os
+import re
+import json
+import math
+from collections import Counter
+from typing import Any, Optional
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+from metrics import time_stage
+from helpers import count_tokens
+from table_extraction import DELIMITER, parse_table, format_table
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+# Words too common to say anything about relevance
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or that the their this "
+    "to was were what when where which who why will with does did do many much".split()
+)
+
+_TERM = re.compile(r"[a-z0-9]+")
+
+# Characters per token, used to size chunks before they are counted
+CHARS_PER_TOKEN = 4
+
+
+# Helper function to split text into index terms
+def terms(text: str) -> list[str]:
+    '''Lowercase alphanumeric words without stopwords'''
+
+    return [term for term in _TERM.findall(text.lower()) if term not in STOPWORDS]
+
+
+# Helper function to turn extracted content into text
+def content_text(content: Any) -> str:
+    '''Text as is; JSON-LD (extracted as an object) as indented JSON, one value per line'''
+
+    return content if isinstance(content, str) else json.dumps(content, indent = 1, default = str)
+
+
+# Helper function to chunk text
+def split_text(text: str, chunk_tokens: int) -> list[str]:
+    '''Pack lines into chunks of about chunk_tokens, splitting overlong lines at spaces'''
+
+    limit = chunk_tokens * CHARS_PER_TOKEN
+
+    pieces = []
+    for line in text.splitlines():
+        while len(line) > limit:
+            cut = line.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            pieces.append(line[:cut])
+            line = line[cut:].lstrip()
+        pieces.append(line)
+
+    chunks, current, size = [], [], 0
+    for piece in pieces:
+        if current and size + len(piece) > limit:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+# Helper function to chunk table rows
+def split_rows(rows: list[list[str]], chunk_tokens: int) -> list[list[list[str]]]:
+    '''Group rows of cells into chunks of about chunk_tokens (rows are never split)'''
+
+    limit = chunk_tokens * CHARS_PER_TOKEN
+
+    chunks, current, size = [], [], 0
+    for row in rows:
+        length = len(DELIMITER.join(row)) + 1
+        if current and size + length > limit:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(row)
+        size += length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class BM25:
+    '''Okapi BM25 ranking over a small, in-memory list of documents'''
+
+    def __init__(self, documents: list[list[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1             = k1
+        self.b              = b
+
+        self.frequencies    = [Counter(document) for document in documents]
+        self.lengths        = [len(document) for document in documents]
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if documents else 0.0
+
+        document_frequency = Counter(term for frequency in self.frequencies for term in frequency)
+        count = len(documents)
+        self.idf = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def scores(self, query: list[str]) -> list[float]:
+        '''Score of every document for the query terms'''
+
+        query = set(query)
+        results = []
+        for frequency, length in zip(self.frequencies, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / self.average_length) if self.average_length else self.k1
+            score = 0.0
+            for term in query:
+                tf = frequency.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            results.append(score)
+        return results
+
+
+class AttachmentTrimmer:
+    '''Keeps only the parts of a large attachment that are relevant to the question
+
+    Extracted content over `token_budget` tokens is split into chunks: rows
+    for spreadsheets and CSVs, runs of lines of about `chunk_tokens` tokens
+    for text. Chunks are ranked against the question with BM25 and the best
+    ones are kept, in document order, until the budget is spent.
+    Spreadsheets keep the header row of every sheet rows are kept from.
+    '''
+
+    # Tokens set aside for the excerpt note and the "[...]" gap markers
+    OVERHEAD_TOKENS = 64
+
+    def __init__(self, enabled: bool = False, token_budget: int = 8000, chunk_tokens: int = 300):
+        self.enabled        = enabled
+        self.token_budget   = token_budget
+        self.chunk_tokens   = chunk_tokens
+
+    def select(self, texts: list[str], question: str, budget: int) -> list[int]:
+        '''Indexes (in document order) of the best ranked chunks that fit in the budget'''
+
+        scores = BM25([terms(text) for text in texts]).scores(terms(question))
+
+        # Best first; chunks matching nothing keep document order at the end
+        ranked = sorted(range(len(texts)), key = lambda index: (-scores[index], index))
+
+        # A chunk that does not fit is skipped; lower ranked, smaller ones may still fit
+        chosen, spent = [], 0
+        for index in ranked:
+            if spent >= budget:
+                break
+            tokens = count_tokens(texts[index])
+            if spent + tokens > budget:
+                continue
+            chosen.append(index)
+            spent += tokens
+        return sorted(chosen)
+
+    @time_stage("attachment_trim")
+    def trim(self, content: Any, question: str, tokens: Optional[int] = None) -> tuple[Any, int]:
+        '''Return the (possibly trimmed) content and its token count
+
+        `tokens` is the token count of the untrimmed content, when known.
+        '''
+
+        if tokens is None:
+            tokens = count_tokens(content)
+
+        if not self.enabled or content is None or tokens <= self.token_budget:
+            return content, tokens
+
+        # Spreadsheets and CSVs are extracted as table text, one section per sheet
+        sections = parse_table(content)
+
+        if sections:
+            # Rows of all sheets are ranked one by one, the header rows are always kept
+            rows = [(number, row) for number, section in enumerate(sections) for row in section['rows']]
+            budget = self.token_budget - self.OVERHEAD_TOKENS - count_tokens(format_table([{**section, 'rows': []} for section in sections]))
+
+            chosen = self.select([DELIMITER.join(row) for _, row in rows], question, budget)
+            kept = [{**section, 'rows': []} for section in sections]
+            for index in chosen:
+                number, row = rows[index]
+                kept[number]['rows'].append(row)
+
+            trimmed = format_table(
+                [section for section in kept if section['rows']],
+                notes = [f"Excerpt: {len(chosen)} of {len(rows)} rows most relevant to the question"]
+            )
+        else:
+            chunks = split_text(content_text(content), self.chunk_tokens)
+
+            chosen = self.select(chunks, question, self.token_budget - self.OVERHEAD_TOKENS)
+            parts, previous = [], -1
+            for index in chosen:
+                if index != previous + 1:
+                    parts.append("[...]")
+                parts.append(chunks[index])
+                previous = index
+            if previous != len(chunks) - 1:
+                parts.append("[...]")
+            trimmed = f"[Excerpt: {len(chosen)} of {len(chunks)} sections most relevant to the question]\n" + "\n".join(parts)
+
+        trimmed_tokens = count_tokens(trimmed)
+        logger.info(f"INTERNAL - Attachment trimmed from {tokens} to {trimmed_tokens} tokens")
+        return trimmed, trimmed_tokens
+
+
+# Shared trimmer for the backend
+attachment_trimmer = AttachmentTrimmer(
+    enabled         = os.getenv('ATTACHMENT_TRIM_ENABLED', 'false').lower() == 'true',
+    token_budget    = int(os.getenv('ATTACHMENT_TOKEN_BUDGET', 8000)),
+    chunk_tokens    = int(os.getenv('ATTACHMENT_CHUNK_TOKENS', 300))
+)
@@ -0,0 +1,202 @@
+import os
+import abc
+import uuid
+import shutil
+import asyncio
+import posixpath
+import threading
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+class StorageBackend(abc.ABC):
+    '''Where attachments are fetched from'''
+
+    @abc.abstractmethod
+    def list_files(self) -> list[str]:
+        '''Names of every attachment available in the storage'''
+
+    @abc.abstractmethod
+    def download(self, file_name: str, destination: str) -> None:
+        '''Write the named attachment to the destination path'''
+
+
+class GCSStorage(StorageBackend):
+    '''Attachments stored under a folder of a Google Cloud Storage bucket'''
+
+    def __init__(self, bucket_name: str, folder: str, credentials_file: str):
+        self.bucket_name        = bucket_name
+        self.folder             = folder or ""
+        self.credentials_file   = credentials_file
+
+        self._bucket            = None
+        self._lock              = threading.Lock()
+
+    @property
+    def bucket(self):
+        '''Authenticate and open the bucket once, on first use'''
+
+        if self._bucket is None:
+            with self._lock:
+                if self._bucket is None:
+                    from google.cloud import storage
+                    from google.oauth2 import service_account
+
+                    creds = service_account.Credentials.from_service_account_file(self.credentials_file)
+                    client = storage.Client(credentials = creds)
+                    self._bucket = client.bucket(self.bucket_name)
+        return self._bucket
+
+    def list_files(self) -> list[str]:
+        names = [os.path.basename(blob.name) for blob in self.bucket.list_blobs(prefix = self.folder)]
+
+        # Skip the folder itself
+        return [name for name in names if name]
+
+    def download(self, file_name: str, destination: str) -> None:
+        self.bucket.blob(posixpath.join(self.folder, file_name)).download_to_filename(destination)
+
+
+class LocalDirectoryStorage(StorageBackend):
+    '''Attachments copied from a local directory (tests, offline runs)'''
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def list_files(self) -> list[str]:
+        return sorted(
+            name for name in os.listdir(self.directory)
+            if os.path.isfile(os.path.join(self.directory, name))
+        )
+
+    def download(self, file_name: str, destination: str) -> None:
+        shutil.copyfile(os.path.join(self.directory, file_name), destination)
+
+
+class AttachmentFetcher:
+    '''Lazy, per-file attachment downloads into a local directory
+
+    Downloads run on a bounded thread pool. Each file is written to a
+    temporary name and atomically renamed into place, so readers only ever
+    see complete files. Concurrent requests for the same file share a single
+    in-flight download.
+    '''
+
+    def __init__(self, storage: StorageBackend, download_dir: str, workers: int = 8):
+        self.storage        = storage
+        self.download_dir   = download_dir
+
+        self._executor      = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "attachment-fetch")
+        self._inflight      = {}    # file_name -> Future
+        self._lock          = threading.Lock()
+
+    def local_path(self, file_name: str) -> str:
+        # Never let a file name escape the download directory
+        return os.path.join(self.download_dir, os.path.basename(file_name))
+
+    def _download(self, file_name: str) -> str:
+        path = self.local_path(file_name)
+
+        try:
+            if os.path.exists(path):
+                return path
+
+            os.makedirs(self.download_dir, exist_ok = True)
+            temp_path = f"{path}.{uuid.uuid4().hex}.part"
+
+            logger.info(f"INTERNAL - Downloading attachment {file_name}")
+            try:
+                self.storage.download(os.path.basename(file_name), temp_path)
+                os.replace(temp_path, path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+            logger.info(f"INTERNAL - Attachment {file_name} downloaded")
+            return path
+
+        finally:
+            with self._lock:
+                self._inflight.pop(file_name, None)
+
+    def submit(self, file_name: str) -> Future:
+        '''Start (or join) the download of a file; the future resolves to its local path'''
+
+        path = self.local_path(file_name)
+
+        with self._lock:
+            future = self._inflight.get(file_name)
+            if future is not None:
+                return future
+
+            if os.path.exists(path):
+                future = Future()
+                future.set_result(path)
+                return future
+
+            future = self._executor.submit(self._download, file_name)
+            self._inflight[file_name] = future
+            return future
+
+    async def fetch(self, file_name: str) -> str:
+        '''Local path of an attachment, downloading it first if needed'''
+
+        return await asyncio.wrap_future(self.submit(file_name))
+
+    def prefetch_all(self) -> int:
+        '''Download every attachment in the storage in parallel; returns the number fetched'''
+
+        futures = [self.submit(file_name) for file_name in self.storage.list_files()]
+        fetched = 0
+        for future in futures:
+            try:
+                future.result()
+                fetched += 1
+            except Exception as exception:
+                logger.error("Error: prefetch_all() could not download an attachment")
+                logger.error(exception)
+        return fetched
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait = False, cancel_futures = True)
+
+
+# Helper function to build the storage backend selected in the env
+def storage_from_env() -> StorageBackend:
+    '''GCS by default; ATTACHMENT_STORAGE=local copies from ATTACHMENT_SOURCE_DIR instead'''
+
+    if os.getenv('ATTACHMENT_STORAGE', 'gcs').lower() == 'local':
+        return LocalDirectoryStorage(os.getenv('ATTACHMENT_SOURCE_DIR'))
+
+    return GCSStorage(
+        bucket_name         = os.getenv("BUCKET_NAME"),
+        folder              = os.getenv("GCP_FILES_PATH"),
+        credentials_file    = os.path.join(os.getcwd(), os.getenv("GCS_CREDENTIALS_FILE", ""))
+    )
+
+
+# Shared fetcher for the backend
+attachment_fetcher = AttachmentFetcher(
+    storage         = storage_from_env(),
+    download_dir    = os.path.join(os.getcwd(), os.getenv('DOWNLOAD_DIR', 'files')),
+    workers         = int(os.getenv('ATTACHMENT_FETCH_WORKERS', 8))
+)
+
+
+if __name__ == "__main__":
+
+    # Download every attachment ahead of time: python attachments.py
+    print(f"Fetched {attachment_fetcher.prefetch_all()} attachments into {attachment_fetcher.download_dir}")
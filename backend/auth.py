@@ -0,0 +1,117 @@
+import os
+import hmac
+import time
+import base64
+import hashlib
+import secrets
+from typing import Optional
+from dotenv import load_dotenv
+from passlib.context import CryptContext
+
+# Custom libraries
+from process_pool import ProcessPool
+
+# Load env variables
+load_dotenv()
+
+# The hashing workers start from a fresh interpreter (see process_pool.py) and
+# import this module to run the functions below, so it stays light: no database,
+# OpenAI, document or logging setup.
+
+# Set context for password hashing
+password_context = CryptContext(
+    schemes                         = ["sha256_crypt"],
+    sha256_crypt__default_rounds    = int(os.getenv('SHA256_ROUNDS')),
+    deprecated                      = "auto"
+)
+
+# Helper function to hash passwords
+def get_password_hash(password: str) -> str:
+    '''Helper function to return hashed passwords'''
+
+    return password_context.hash(password)
+
+
+# Helper function to verify passwords
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    '''Helper function to verify passwords'''
+
+    return password_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasher(ProcessPool):
+    '''Runs password hashing and verification on a bounded process pool
+
+    sha256_crypt is deliberately expensive and holds the GIL, so running it
+    in request threads serializes logins on a single core. The pool has
+    `workers` processes (one per core by default) and is started with the
+    application.
+    '''
+
+    def hash(self, password: str) -> str:
+        '''Hash a password in a worker process'''
+
+        return self.executor.submit(get_password_hash, password).result()
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        '''Verify a password in a worker process'''
+
+        return self.executor.submit(verify_password, plain_password, hashed_password).result()
+
+
+# Session tokens: base64url("<user_id>.<expiry>") + "." + base64url(HMAC-SHA256)
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class SessionSigner:
+    '''Issues and checks signed, short-lived session tokens
+
+    Verifying a token is a single HMAC, so routes can trust the user id it
+    carries without another database lookup or password check.
+    '''
+
+    def __init__(self, secret: bytes, ttl: int = 3600):
+        self.secret = secret
+        self.ttl    = ttl
+
+    def _signature(self, payload: str) -> str:
+        return _b64encode(hmac.new(self.secret, payload.encode('ascii'), hashlib.sha256).digest())
+
+    def issue(self, user_id: int) -> tuple[str, int]:
+        '''Return a token for the user and its expiry (unix seconds)'''
+
+        expires_at = int(time.time()) + self.ttl
+        payload = _b64encode(f"{user_id}.{expires_at}".encode('ascii'))
+        return f"{payload}.{self._signature(payload)}", expires_at
+
+    def verify(self, token: str) -> Optional[int]:
+        '''User id of a valid, unexpired token, otherwise None'''
+
+        try:
+            payload, signature = token.split(".")
+            if not hmac.compare_digest(signature, self._signature(payload)):
+                return None
+
+            user_id, expires_at = _b64decode(payload).decode('ascii').split(".")
+            if int(expires_at) < time.time():
+                return None
+            return int(user_id)
+
+        except (ValueError, TypeError, UnicodeDecodeError):
+            return None
+
+
+# Shared hashing pool for the backend
+password_hasher = PasswordHasher(int(os.getenv('PASSWORD_HASH_WORKERS', 0)) or None)
+
+# Without a configured secret, tokens only stay valid for the life of this process
+session_signer = SessionSigner(
+    secret  = os.getenv('SESSION_SECRET', '').encode('utf-8') or secrets.token_bytes(32),
+    ttl     = int(os.getenv('SESSION_TTL', 3600))
+)
@@ -0,0 +1,410 @@
+import os
+import sys
+import csv
+import json
+import time
+import timeit
+import argparse
+import platform
+import datetime
+import statistics
+import subprocess
+import tracemalloc
+import openpyxl
+from typing import Any, Callable, Optional
+
+# Run from the backend directory or anywhere else
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+os.environ.setdefault('LOG_FILE', os.devnull)
+
+# Time PDF extraction itself, not reads of stored pages
+os.environ.setdefault('PDF_PAGE_CACHE_DIR', '')
+
+from helpers import extract_file_content, generate_restriction, build_messages, attachment_message, calculate_tokens, json_serial
+from token_accounting import token_counter
+from table_extraction import format_table, parse_table
+
+
+# Microbenchmarks of the CPU-bound parts of a /querygpt call, run over the
+# synthetic corpus in benchmarks/corpus (see make_corpus.py):
+#
+#   extraction      extract_file_content per format and size
+#   tokenization    count_tokens on the extracted text, cold and memoized
+#   restriction     generate_restriction per answer shape
+#   assembly        message building plus token counting per prompt shape
+#   tables          spreadsheet / CSV extraction, compact table text against
+#                   the JSON list of rows it replaced (after checking that
+#                   cells looking like the format's marks read back unchanged)
+#
+# Each case reports the median and best time, the peak Python heap
+# (tracemalloc, so memory held by C extensions such as lxml is not seen) and
+# the tokens produced. Results are compared with a baseline file:
+#
+#   python benchmarks/bench_extraction.py                      compare with baseline_extraction.json
+#   python benchmarks/bench_extraction.py --save-baseline      record a new baseline
+#   python benchmarks/bench_extraction.py --only extraction --filter pdf
+#
+# Token counts need the o200k_base tiktoken encoding, which tiktoken downloads
+# on first use. Offline, put the encoding file in a directory named as tiktoken
+# caches it (the sha1 of its URL, fb374d419588a4632f3f557e76b4b70aebbca790) and
+# set TIKTOKEN_CACHE_DIR to that directory. A baseline is only saved with token
+# counts, and cases without one on either side are compared on time alone.
+
+CORPUS_DIR = os.path.join(BENCHMARKS_DIR, "corpus")
+BASELINE_PATH = os.path.join(BENCHMARKS_DIR, "baseline_extraction.json")
+
+SIZES = ("small", "medium", "large")
+FORMATS = (".pdf", ".docx", ".xlsx", ".csv", ".jsonld", ".txt", ".py")
+GROUPS = ("extraction", "tokenization", "restriction", "assembly", "tables")
+
+QUESTION = (
+    "In the 2015 census of the river district, which station recorded the highest average "
+    "temperature, and by how many degrees did it exceed the second highest station?"
+)
+UPDATED_STEPS = (
+    "1. Open the census report. 2. Find the table of stations. 3. Sort the stations by average "
+    "temperature. 4. Subtract the second highest value from the highest value."
+)
+
+# Answer shapes handled differently by generate_restriction
+ANSWERS = {
+    'short_words'   : "Seville station",
+    'numeric'       : "1 234 567 890 123 456",
+    'long_text'     : "The station by the river recorded the highest average temperature in the district that year by a wide margin"
+}
+
+
+def tokenizer_available() -> bool:
+    '''The tiktoken encoding is downloaded on first use; offline machines may not have it'''
+
+    try:
+        token_counter.encoding
+        return True
+    except Exception as exception:
+        print(f"Token counts skipped, tiktoken encoding unavailable (see TIKTOKEN_CACHE_DIR above): {exception}", file = sys.stderr)
+        return False
+
+
+def measure(function: Callable[[], Any], repeat: int, setup: Optional[Callable[[], None]] = None) -> dict[str, Any]:
+    '''Median and best wall time over `repeat` runs, then one traced run for peak memory'''
+
+    # Warm-up (imports, lazy initialization)
+    if setup:
+        setup()
+    function()
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'median_ms' : round(statistics.median(samples) * 1000, 3),
+        'min_ms'    : round(min(samples) * 1000, 3),
+        'peak_kb'   : round(peak / 1024, 1)
+    }
+
+
+def measure_fast(function: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    '''Timing for sub-microsecond calls: best of `repeat` timeit batches'''
+
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    samples = [elapsed / loops for elapsed in timer.repeat(repeat = repeat, number = loops)]
+    return {
+        'median_ms' : round(statistics.median(samples) * 1000, 6),
+        'min_ms'    : round(min(samples) * 1000, 6),
+        'peak_kb'   : 0.0
+    }
+
+
+def corpus_files(name_filter: Optional[str]) -> list[str]:
+    files = []
+    for size in SIZES:
+        for extension in FORMATS:
+            name = f"{size}{extension}"
+            if name_filter and name_filter not in name:
+                continue
+            path = os.path.join(CORPUS_DIR, name)
+            if os.path.exists(path):
+                files.append(path)
+    return files
+
+
+def bench_extraction(files: list[str], repeat: int, tokens: bool) -> dict[str, dict[str, Any]]:
+    results = {}
+    for path in files:
+        name = os.path.basename(path)
+        content = extract_file_content(path)
+
+        result = measure(lambda: extract_file_content(path), repeat)
+        result['input_kb'] = round(os.path.getsize(path) / 1024, 1)
+        result['chars'] = len(str(content)) if content is not None else 0
+        result['tokens'] = token_counter.count(content) if tokens else None
+
+        results[name] = result
+        print(f"extraction    {name:<14} {result['median_ms']:>10.2f} ms  {result['peak_kb']:>10.1f} KB  {result['tokens']} tokens", file = sys.stderr)
+    return results
+
+
+def legacy_table(file_path: str) -> str:
+    '''Spreadsheet / CSV extraction before table_extraction.py: the active sheet, loaded whole, as a JSON list of rows'''
+
+    if file_path.endswith(".xlsx"):
+        workbook = openpyxl.load_workbook(file_path)
+        data = [[json_serial(cell.value) for cell in row] for row in workbook.active.iter_rows()]
+    else:
+        with open(file_path, 'r') as file:
+            data = [[json_serial(value) for value in row] for row in csv.reader(file)]
+    return json.dumps(data)
+
+
+# Cells that look like the marks of the compact table format
+ROUND_TRIP_SECTIONS = [
+    {
+        'title'     : "Marks",
+        'header'    : ["## name", "value", "\\escaped"],
+        'rows'      : [
+            ['"', '"', "said"],
+            ['"', "x", "said"],
+            ["## Sheet: not a sheet", '"', "\\"],
+            ["## not a note", "\\x", ""],
+            ["## not a note", "\\x", '""']
+        ]
+    },
+    {
+        'title'     : "## Sheet: Second",
+        'header'    : ['"', "a"],
+        'rows'      : [['"', '"'], ["\\", "\\"]]
+    }
+]
+
+
+def check_table_round_trip() -> None:
+    '''Exit when table text does not read back into the cells it was written from'''
+
+    sections = parse_table(format_table(ROUND_TRIP_SECTIONS))
+    if sections != ROUND_TRIP_SECTIONS:
+        sys.exit(f"Table text does not round trip:\n{ROUND_TRIP_SECTIONS}\n{sections}")
+
+
+def bench_tables(files: list[str], repeat: int, tokens: bool) -> dict[str, dict[str, Any]]:
+    check_table_round_trip()
+
+    results = {}
+    for path in files:
+        if not path.endswith((".xlsx", ".csv")):
+            continue
+        name = os.path.basename(path)
+
+        for label, extract in (("json", legacy_table), ("compact", extract_file_content)):
+            content = extract(path)
+            result = measure(lambda: extract(path), repeat)
+            result['chars'] = len(content)
+            result['tokens'] = token_counter.count(content) if tokens else None
+            results[f"{name} {label}"] = result
+
+        json_result, compact_result = results[f"{name} json"], results[f"{name} compact"]
+        print(
+            f"tables        {name:<14} {json_result['tokens']} -> {compact_result['tokens']} tokens  "
+            f"{json_result['peak_kb']:.1f} -> {compact_result['peak_kb']:.1f} KB",
+            file = sys.stderr
+        )
+    return results
+
+
+def bench_tokenization(files: list[str], repeat: int) -> dict[str, dict[str, Any]]:
+    results = {}
+    for path in files:
+        name = os.path.basename(path)
+        text = extract_file_content(path)
+        if text is None:
+            continue
+
+        # Cold: nothing memoized, the text is encoded
+        cold = measure(lambda: token_counter.count(text), repeat, setup = token_counter.clear)
+        cold['tokens'] = token_counter.count(text)
+        results[f"{name} cold"] = cold
+
+        # Memoized: digest of the text plus an LRU lookup
+        warm = measure(lambda: token_counter.count(text), repeat)
+        warm['tokens'] = cold['tokens']
+        results[f"{name} memoized"] = warm
+
+        print(f"tokenization  {name:<14} {cold['median_ms']:>10.2f} ms cold  {warm['median_ms']:>8.3f} ms memoized", file = sys.stderr)
+    return results
+
+
+def bench_restriction(repeat: int) -> dict[str, dict[str, Any]]:
+    results = {}
+    for shape, answer in ANSWERS.items():
+        results[shape] = measure_fast(lambda: generate_restriction(answer), repeat)
+        print(f"restriction   {shape:<14} {results[shape]['median_ms'] * 1000:>10.3f} us", file = sys.stderr)
+    return results
+
+
+def assemble(question: str, final_answer: str, updated_steps: Optional[str], file_content: Optional[Any], count: bool = True) -> Optional[tuple[int, int]]:
+    '''The CPU part of assemble_prompt in main.py, for an already extracted attachment'''
+
+    _, messages = build_messages(question, final_answer, updated_steps)
+    if file_content is not None:
+        messages.append(attachment_message("document", file_content))
+    return calculate_tokens(messages, file_content) if count else None
+
+
+def bench_assembly(repeat: int, tokens: bool) -> dict[str, dict[str, Any]]:
+    shapes = {
+        'question'              : (None, None),
+        'rectification'         : (UPDATED_STEPS, None)
+    }
+    for size in SIZES:
+        for extension in (".txt", ".pdf", ".xlsx"):
+            path = os.path.join(CORPUS_DIR, f"{size}{extension}")
+            if os.path.exists(path):
+                shapes[f"document {size}{extension}"] = (None, extract_file_content(path))
+
+    results = {}
+    for shape, (updated_steps, file_content) in shapes.items():
+        run = lambda: assemble(QUESTION, ANSWERS['long_text'], updated_steps, file_content, tokens)
+
+        if tokens:
+            # First request for a prompt (nothing memoized) and a repeat of it
+            cold = measure(run, repeat, setup = token_counter.clear)
+            prompt_tokens, file_tokens = run()
+            cold['tokens'] = prompt_tokens
+            cold['file_tokens'] = file_tokens
+            results[f"{shape} cold"] = cold
+
+            warm = measure(run, repeat)
+            warm['tokens'] = prompt_tokens
+            warm['file_tokens'] = file_tokens
+            results[f"{shape} memoized"] = warm
+        else:
+            # Message building only
+            results[shape] = measure(run, repeat)
+
+        print(f"assembly      {shape:<24} done", file = sys.stderr)
+    return results
+
+
+def environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd = BENCHMARKS_DIR, capture_output = True, text = True, check = True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit'    : commit,
+        'time'      : datetime.datetime.now(datetime.timezone.utc).isoformat(timespec = 'seconds'),
+        'python'    : platform.python_version(),
+        'platform'  : platform.platform(),
+        'cpus'      : os.cpu_count()
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float, noise_ms: float) -> int:
+    '''Print the change per case; returns the number of slowdowns beyond `tolerance` and `noise_ms`'''
+
+    regressions = 0
+    print(f"baseline {baseline['environment'].get('commit')} -> current {current['environment'].get('commit')} (tolerance {tolerance:.0%})")
+    print(f"{'case':<48} {'base ms':>10} {'now ms':>10} {'change':>8} {'base KB':>10} {'now KB':>10}  ")
+
+    for group, cases in current['results'].items():
+        for case, now in cases.items():
+            before = baseline['results'].get(group, {}).get(case)
+            label = f"{group}/{case}"
+            if before is None:
+                print(f"{label:<48} {'-':>10} {now['median_ms']:>10} {'new':>8} {'-':>10} {now['peak_kb']:>10}")
+                continue
+
+            delta = now['median_ms'] - before['median_ms']
+            change = delta / before['median_ms'] if before['median_ms'] else 0.0
+            flag = ""
+            if change > tolerance and delta > noise_ms:
+                flag = "REGRESSION"
+                regressions += 1
+            elif change < -tolerance and -delta > noise_ms:
+                flag = "faster"
+            # Token counts are only compared when both runs have them
+            if before.get('tokens') is not None and now.get('tokens') is not None and before['tokens'] != now['tokens']:
+                flag += f" tokens {before['tokens']} -> {now['tokens']}"
+
+            print(f"{label:<48} {before['median_ms']:>10} {now['median_ms']:>10} {change:>+8.1%} {before['peak_kb']:>10} {now['peak_kb']:>10}  {flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Microbenchmarks for attachment extraction, tokenization and prompt assembly")
+    parser.add_argument("--repeat", type = int, default = 5, help = "Timed runs per case")
+    parser.add_argument("--only", nargs = "+", choices = GROUPS, default = list(GROUPS), help = "Benchmark groups to run")
+    parser.add_argument("--filter", default = None, help = "Only corpus files whose name contains this (e.g. 'pdf', 'large')")
+    parser.add_argument("--output", default = None, help = "Write the results to this JSON file")
+    parser.add_argument("--baseline", default = BASELINE_PATH, help = "Baseline to compare with")
+    parser.add_argument("--save-baseline", action = "store_true", help = "Overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type = float, default = 0.25, help = "Relative slowdown reported as a regression")
+    parser.add_argument("--noise-ms", type = float, default = 0.05, help = "Smallest absolute change (ms) reported as a regression")
+    parser.add_argument("--fail-on-regression", action = "store_true", help = "Exit with status 1 when a case regressed")
+    args = parser.parse_args()
+
+    tokens = tokenizer_available()
+    if args.save_baseline and not tokens:
+        parser.error("a baseline needs token counts; make the tiktoken encoding available first")
+    files = corpus_files(args.filter)
+
+    results = {}
+    if "extraction" in args.only:
+        results['extraction'] = bench_extraction(files, args.repeat, tokens)
+    if "tokenization" in args.only and tokens:
+        results['tokenization'] = bench_tokenization(files, args.repeat)
+    if "restriction" in args.only:
+        results['restriction'] = bench_restriction(args.repeat)
+    if "assembly" in args.only:
+        results['assembly'] = bench_assembly(args.repeat, tokens)
+    if "tables" in args.only:
+        results['tables'] = bench_tables(files, args.repeat, tokens)
+
+    current = {'environment': environment(), 'results': results}
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent = 2)
+            file.write("\n")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(current, file, indent = 2)
+            file.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(current, indent = 2))
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(baseline, current, args.tolerance, args.noise_ms)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from passlib.hash import sha256_crypt
+
+# Run from the backend directory or anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SHA256_ROUNDS', "1000")
+
+from auth import PasswordHasher, verify_password
+
+
+# Logins per second at several sha256_crypt round counts, comparing
+# verification inline in the request threads (the old behavior) with the
+# process pool used by /login:
+#   python benchmarks/bench_password_hashing.py --rounds 5000 50000 535000
+
+PASSWORD = "correct horse battery staple"
+
+
+def logins_per_second(verify, hashed: str, logins: int, concurrency: int) -> float:
+    '''Run `logins` verifications from `concurrency` request threads'''
+
+    with ThreadPoolExecutor(max_workers = concurrency) as requests:
+        start = time.perf_counter()
+        results = list(requests.map(lambda _: verify(PASSWORD, hashed), range(logins)))
+        elapsed = time.perf_counter() - start
+
+    assert all(results)
+    return logins / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Benchmark password verification throughput")
+    parser.add_argument("--rounds", type = int, nargs = "+", default = [5000, 50000, 200000, 535000])
+    parser.add_argument("--logins", type = int, default = 64, help = "Logins per measurement")
+    parser.add_argument("--concurrency", type = int, default = 16, help = "Simultaneous login requests")
+    parser.add_argument("--workers", type = int, default = os.cpu_count(), help = "Hashing processes")
+    args = parser.parse_args()
+
+    hasher = PasswordHasher(args.workers)
+
+    # Start the worker processes before measuring
+    hasher.verify(PASSWORD, sha256_crypt.using(rounds = 1000).hash(PASSWORD))
+
+    print(f"{'rounds':>8}  {'inline/s':>10}  {'pool/s':>10}  {'speedup':>8}")
+    try:
+        for rounds in args.rounds:
+            hashed = sha256_crypt.using(rounds = rounds).hash(PASSWORD)
+
+            inline = logins_per_second(verify_password, hashed, args.logins, args.concurrency)
+            pooled = logins_per_second(hasher.verify, hashed, args.logins, args.concurrency)
+
+            print(f"{rounds:>8}  {inline:>10.1f}  {pooled:>10.1f}  {pooled / inline:>7.2f}x")
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
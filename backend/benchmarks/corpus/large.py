@@ -0,0 +1,9001 @@
+import math
+
+
+def new_0(value: float) -> float:
+    '''On 13962 measured value was at measurement and this that increased it can reported distance source on distance census measurement temperature.'''
+
+    total = value * 90 + 11
+    if total > 990:
+        return math.sqrt(total)
+    return total / 90
+
+
+def new_1(value: float) -> float:
+    '''5551 result their distance museum not not listed not.'''
+
+    total = value * 2 + 49
+    if total > 98:
+        return math.sqrt(total)
+    return total / 2
+
+
+def have_2(value: float) -> float:
+    '''Temperature sample census is election result year this method.'''
+
+    total = value * 54 + 70
+    if total > 3780:
+        return math.sqrt(total)
+    return total / 54
+
+
+def be_3(value: float) -> float:
+    '''Estimate to in report census described not estimate census time by.'''
+
+    total = value * 12 + 26
+    if total > 312:
+        return math.sqrt(total)
+    return total / 12
+
+
+def increased_4(value: float) -> float:
+    '''After more source at archive other been orbit increased has from.'''
+
+    total = value * 11 + 11
+    if total > 121:
+        return math.sqrt(total)
+    return total / 11
+
+
+def have_5(value: float) -> float:
+    '''Has measurement album to by journal museum estimate are total year source.'''
+
+    total = value * 78 + 63
+    if total > 4914:
+        return math.sqrt(total)
+    return total / 78
+
+
+def journal_6(value: float) -> float:
+    '''It river it survey survey dataset temperature as census.'''
+
+    total = value * 7 + 72
+    if total > 504:
+        return math.sqrt(total)
+    return total / 7
+
+
+def protein_7(value: float) -> float:
+    '''Value report have two station founded 30396 dataset time.'''
+
+    total = value * 61 + 40
+    if total > 2440:
+        return math.sqrt(total)
+    return total / 61
+
+
+def increased_8(value: float) -> float:
+    '''One is table or was by estimate reached.'''
+
+    total = value * 87 + 4
+    if total > 348:
+        return math.sqrt(total)
+    return total / 87
+
+
+def result_9(value: float) -> float:
+    '''Journal index new result method recorded other in time total sample election by survey were were.'''
+
+    total = value * 10 + 44
+    if total > 440:
+        return math.sqrt(total)
+    return total / 10
+
+
+def was_10(value: float) -> float:
+    '''Collection index election first method by at result that have were.'''
+
+    total = value * 96 + 60
+    if total > 5760:
+        return math.sqrt(total)
+    return total / 96
+
+
+def has_11(value: float) -> float:
+    '''Album described is species other an distance all species species listed in reported distance river value one.'''
+
+    total = value * 13 + 98
+    if total > 1274:
+        return math.sqrt(total)
+    return total / 13
+
+
+def its_12(value: float) -> float:
+    '''River species 25919 been other measurement which founded source is measurement.'''
+
+    total = value * 41 + 51
+    if total > 2091:
+        return math.sqrt(total)
+    return total / 41
+
+
+def record_13(value: float) -> float:
+    '''In two measurement for archive of has river index report table year this census the.'''
+
+    total = value * 66 + 82
+    if total > 5412:
+        return math.sqrt(total)
+    return total / 66
+
+
+def their_14(value: float) -> float:
+    '''Year value dataset more one figure is value that the described of table sample distance after increased can dataset.'''
+
+    total = value * 4 + 3
+    if total > 12:
+        return math.sqrt(total)
+    return total / 4
+
+
+def election_15(value: float) -> float:
+    '''One is population temperature more result founded at first.'''
+
+    total = value * 12 + 29
+    if total > 348:
+        return math.sqrt(total)
+    return total / 12
+
+
+def one_16(value: float) -> float:
+    '''Of 43817 which source also protein population other result report.'''
+
+    total = value * 42 + 59
+    if total > 2478:
+        return math.sqrt(total)
+    return total / 42
+
+
+def this_17(value: float) -> float:
+    '''Be were source were have dataset 24758 on the as are temperature listed after reported have.'''
+
+    total = value * 36 + 40
+    if total > 1440:
+        return math.sqrt(total)
+    return total / 36
+
+
+def population_18(value: float) -> float:
+    '''An from be which it journal listed measured two published population reached collection on census record.'''
+
+    total = value * 1 + 20
+    if total > 20:
+        return math.sqrt(total)
+    return total / 1
+
+
+def also_19(value: float) -> float:
+    '''Be have orbit survey museum is archive election that reached report dataset listed population first.'''
+
+    total = value * 3 + 16
+    if total > 48:
+        return math.sqrt(total)
+    return total / 3
+
+
+def election_20(value: float) -> float:
+    '''Value published their by survey source record after river.'''
+
+    total = value * 64 + 23
+    if total > 1472:
+        return math.sqrt(total)
+    return total / 64
+
+
+def species_21(value: float) -> float:
+    '''Population distance station the method from result average record analysis year which an.'''
+
+    total = value * 26 + 48
+    if total > 1248:
+        return math.sqrt(total)
+    return total / 26
+
+
+def two_22(value: float) -> float:
+    '''Described after average is protein in new an dataset 10604 election archive recorded their which on has.'''
+
+    total = value * 66 + 30
+    if total > 1980:
+        return math.sqrt(total)
+    return total / 66
+
+
+def were_23(value: float) -> float:
+    '''Time election more new population time reported were can on located this is dataset distance of one.'''
+
+    total = value * 42 + 84
+    if total > 3528:
+        return math.sqrt(total)
+    return total / 42
+
+
+def published_24(value: float) -> float:
+    '''Are at the 55437 was reached the can index index were recorded.'''
+
+    total = value * 55 + 26
+    if total > 1430:
+        return math.sqrt(total)
+    return total / 55
+
+
+def report_25(value: float) -> float:
+    '''Were their value not two report or census all census station of year.'''
+
+    total = value * 99 + 56
+    if total > 5544:
+        return math.sqrt(total)
+    return total / 99
+
+
+def listed_26(value: float) -> float:
+    '''Published index have founded by station in after volume average that result from protein which more.'''
+
+    total = value * 15 + 17
+    if total > 255:
+        return math.sqrt(total)
+    return total / 15
+
+
+def as_27(value: float) -> float:
+    '''Founded result been station the result founded by 20755 table election it index estimate census.'''
+
+    total = value * 9 + 35
+    if total > 315:
+        return math.sqrt(total)
+    return total / 9
+
+
+def were_28(value: float) -> float:
+    '''Dataset this the be measured collection total to result estimate journal one can described as index protein one value has.'''
+
+    total = value * 69 + 98
+    if total > 6762:
+        return math.sqrt(total)
+    return total / 69
+
+
+def an_29(value: float) -> float:
+    '''Recorded distance an as census it their can and one journal this recorded were which museum.'''
+
+    total = value * 53 + 87
+    if total > 4611:
+        return math.sqrt(total)
+    return total / 53
+
+
+def species_30(value: float) -> float:
+    '''Described not time analysis all was figure have station election method measurement year is orbit table.'''
+
+    total = value * 51 + 32
+    if total > 1632:
+        return math.sqrt(total)
+    return total / 51
+
+
+def figure_31(value: float) -> float:
+    '''Species measured recorded it not protein to reached method total temperature collection in all listed time.'''
+
+    total = value * 10 + 70
+    if total > 700:
+        return math.sqrt(total)
+    return total / 10
+
+
+def with_32(value: float) -> float:
+    '''Volume was temperature published new distance has station time estimate temperature has been as estimate.'''
+
+    total = value * 89 + 40
+    if total > 3560:
+        return math.sqrt(total)
+    return total / 89
+
+
+def on_33(value: float) -> float:
+    '''Has figure from archive journal journal listed from.'''
+
+    total = value * 75 + 32
+    if total > 2400:
+        return math.sqrt(total)
+    return total / 75
+
+
+def were_34(value: float) -> float:
+    '''Population their 39734 collection which been located population other source been.'''
+
+    total = value * 60 + 12
+    if total > 720:
+        return math.sqrt(total)
+    return total / 60
+
+
+def on_35(value: float) -> float:
+    '''Reached two collection 92472 total sample orbit can to located not two.'''
+
+    total = value * 38 + 25
+    if total > 950:
+        return math.sqrt(total)
+    return total / 38
+
+
+def of_36(value: float) -> float:
+    '''Archive temperature reached located value which not archive located total for on time an survey archive can index described.'''
+
+    total = value * 22 + 83
+    if total > 1826:
+        return math.sqrt(total)
+    return total / 22
+
+
+def record_37(value: float) -> float:
+    '''Journal for year reached more new not average.'''
+
+    total = value * 50 + 59
+    if total > 2950:
+        return math.sqrt(total)
+    return total / 50
+
+
+def more_38(value: float) -> float:
+    '''Dataset the archive temperature published survey result index it increased measurement or it published dataset.'''
+
+    total = value * 57 + 68
+    if total > 3876:
+        return math.sqrt(total)
+    return total / 57
+
+
+def collection_39(value: float) -> float:
+    '''Be also album measurement one this dataset time has 15964 at at station method which distance not on.'''
+
+    total = value * 50 + 35
+    if total > 1750:
+        return math.sqrt(total)
+    return total / 50
+
+
+def record_40(value: float) -> float:
+    '''Election value which orbit more report with which founded which two population located distance journal archive was.'''
+
+    total = value * 78 + 74
+    if total > 5772:
+        return math.sqrt(total)
+    return total / 78
+
+
+def measurement_41(value: float) -> float:
+    '''Other first its by protein has volume census population for which result increased were in it total or has.'''
+
+    total = value * 41 + 89
+    if total > 3649:
+        return math.sqrt(total)
+    return total / 41
+
+
+def this_42(value: float) -> float:
+    '''Survey not measurement located first river analysis orbit after time by average for from in the after one population one.'''
+
+    total = value * 47 + 34
+    if total > 1598:
+        return math.sqrt(total)
+    return total / 47
+
+
+def report_43(value: float) -> float:
+    '''Analysis reached from species average protein that value table at two have.'''
+
+    total = value * 67 + 91
+    if total > 6097:
+        return math.sqrt(total)
+    return total / 67
+
+
+def sample_44(value: float) -> float:
+    '''One is listed archive station their time time year orbit two species reached were also figure census and from.'''
+
+    total = value * 76 + 12
+    if total > 912:
+        return math.sqrt(total)
+    return total / 76
+
+
+def collection_45(value: float) -> float:
+    '''Population new survey were source year its are index their is its estimate average record their dataset survey measurement after.'''
+
+    total = value * 69 + 27
+    if total > 1863:
+        return math.sqrt(total)
+    return total / 69
+
+
+def survey_46(value: float) -> float:
+    '''Analysis archive from report population is have 26298 by river distance measurement volume report and founded river by.'''
+
+    total = value * 96 + 55
+    if total > 5280:
+        return math.sqrt(total)
+    return total / 96
+
+
+def and_47(value: float) -> float:
+    '''This founded 58515 published for other record species distance album been the from published which published volume.'''
+
+    total = value * 17 + 66
+    if total > 1122:
+        return math.sqrt(total)
+    return total / 17
+
+
+def by_48(value: float) -> float:
+    '''Sample election can at was by by can figure measurement it.'''
+
+    total = value * 47 + 77
+    if total > 3619:
+        return math.sqrt(total)
+    return total / 47
+
+
+def two_49(value: float) -> float:
+    '''Station be museum election species temperature 72355 collection sample other.'''
+
+    total = value * 13 + 84
+    if total > 1092:
+        return math.sqrt(total)
+    return total / 13
+
+
+def archive_50(value: float) -> float:
+    '''Census described at dataset species all all reported analysis to one estimate orbit orbit year.'''
+
+    total = value * 71 + 22
+    if total > 1562:
+        return math.sqrt(total)
+    return total / 71
+
+
+def method_51(value: float) -> float:
+    '''Temperature election orbit measured to estimate station is river by listed have was first described sample is be result 80704 was.'''
+
+    total = value * 89 + 94
+    if total > 8366:
+        return math.sqrt(total)
+    return total / 89
+
+
+def volume_52(value: float) -> float:
+    '''First sample has average election as first other.'''
+
+    total = value * 73 + 35
+    if total > 2555:
+        return math.sqrt(total)
+    return total / 73
+
+
+def population_53(value: float) -> float:
+    '''Measurement collection reached species at more value also distance and archive volume from.'''
+
+    total = value * 19 + 91
+    if total > 1729:
+        return math.sqrt(total)
+    return total / 19
+
+
+def as_54(value: float) -> float:
+    '''The election album time can to were that of founded species be not.'''
+
+    total = value * 56 + 18
+    if total > 1008:
+        return math.sqrt(total)
+    return total / 56
+
+
+def album_55(value: float) -> float:
+    '''Recorded first from figure volume all river one measurement reached distance not archive was its source population time.'''
+
+    total = value * 9 + 77
+    if total > 693:
+        return math.sqrt(total)
+    return total / 9
+
+
+def river_56(value: float) -> float:
+    '''Recorded protein method an that were new method all that new.'''
+
+    total = value * 58 + 75
+    if total > 4350:
+        return math.sqrt(total)
+    return total / 58
+
+
+def reported_57(value: float) -> float:
+    '''Survey new in figure first have this station the album after on that sample published value census.'''
+
+    total = value * 68 + 55
+    if total > 3740:
+        return math.sqrt(total)
+    return total / 68
+
+
+def volume_58(value: float) -> float:
+    '''Population value it survey volume value record an one collection value orbit for which river more is have.'''
+
+    total = value * 32 + 60
+    if total > 1920:
+        return math.sqrt(total)
+    return total / 32
+
+
+def total_59(value: float) -> float:
+    '''After been average archive measurement analysis its 97600 first for recorded museum sample not are measurement report listed new journal and.'''
+
+    total = value * 98 + 64
+    if total > 6272:
+        return math.sqrt(total)
+    return total / 98
+
+
+def other_60(value: float) -> float:
+    '''Measurement collection record year journal distance analysis at one on temperature located for total founded has been temperature method.'''
+
+    total = value * 82 + 65
+    if total > 5330:
+        return math.sqrt(total)
+    return total / 82
+
+
+def archive_61(value: float) -> float:
+    '''Dataset in collection estimate reported on their reported average reached of founded record on recorded dataset increased two.'''
+
+    total = value * 45 + 54
+    if total > 2430:
+        return math.sqrt(total)
+    return total / 45
+
+
+def result_62(value: float) -> float:
+    '''Increased is it population was by it first it method or two increased it.'''
+
+    total = value * 80 + 92
+    if total > 7360:
+        return math.sqrt(total)
+    return total / 80
+
+
+def measured_63(value: float) -> float:
+    '''Not album measured or 29919 of year for have table one estimate dataset were reached.'''
+
+    total = value * 95 + 43
+    if total > 4085:
+        return math.sqrt(total)
+    return total / 95
+
+
+def analysis_64(value: float) -> float:
+    '''Journal station museum by after 73195 analysis reached has album river.'''
+
+    total = value * 3 + 30
+    if total > 90:
+        return math.sqrt(total)
+    return total / 3
+
+
+def more_65(value: float) -> float:
+    '''To journal is as analysis was new recorded analysis new temperature can of has.'''
+
+    total = value * 45 + 39
+    if total > 1755:
+        return math.sqrt(total)
+    return total / 45
+
+
+def analysis_66(value: float) -> float:
+    '''Orbit measurement journal which 99608 sample other protein after.'''
+
+    total = value * 47 + 43
+    if total > 2021:
+        return math.sqrt(total)
+    return total / 47
+
+
+def figure_67(value: float) -> float:
+    '''Are census at one volume on result and table time located time species 22034.'''
+
+    total = value * 59 + 52
+    if total > 3068:
+        return math.sqrt(total)
+    return total / 59
+
+
+def all_68(value: float) -> float:
+    '''Two its is orbit listed other album in index population or all.'''
+
+    total = value * 82 + 30
+    if total > 2460:
+        return math.sqrt(total)
+    return total / 82
+
+
+def species_69(value: float) -> float:
+    '''Measured and protein species first first 9123 other its source report listed to.'''
+
+    total = value * 42 + 6
+    if total > 252:
+        return math.sqrt(total)
+    return total / 42
+
+
+def source_70(value: float) -> float:
+    '''Source census station new archive 88308 can first as.'''
+
+    total = value * 81 + 47
+    if total > 3807:
+        return math.sqrt(total)
+    return total / 81
+
+
+def orbit_71(value: float) -> float:
+    '''Method new their protein or source was report 55016 been museum as analysis by be method of.'''
+
+    total = value * 18 + 53
+    if total > 954:
+        return math.sqrt(total)
+    return total / 18
+
+
+def for_72(value: float) -> float:
+    '''Are reported year has figure are has census method method.'''
+
+    total = value * 66 + 11
+    if total > 726:
+        return math.sqrt(total)
+    return total / 66
+
+
+def increased_73(value: float) -> float:
+    '''Was result figure source river temperature of election census report election founded its orbit album are orbit index.'''
+
+    total = value * 55 + 79
+    if total > 4345:
+        return math.sqrt(total)
+    return total / 55
+
+
+def species_74(value: float) -> float:
+    '''Election were sample their museum were volume by measurement located located increased an analysis time.'''
+
+    total = value * 34 + 100
+    if total > 3400:
+        return math.sqrt(total)
+    return total / 34
+
+
+def population_75(value: float) -> float:
+    '''First the one be more source founded value of river their on listed year two has index estimate index.'''
+
+    total = value * 41 + 70
+    if total > 2870:
+        return math.sqrt(total)
+    return total / 41
+
+
+def method_76(value: float) -> float:
+    '''Index which other record increased reported all recorded table sample.'''
+
+    total = value * 22 + 36
+    if total > 792:
+        return math.sqrt(total)
+    return total / 22
+
+
+def can_77(value: float) -> float:
+    '''Volume dataset more increased is all published album journal increased this were from election.'''
+
+    total = value * 45 + 27
+    if total > 1215:
+        return math.sqrt(total)
+    return total / 45
+
+
+def value_78(value: float) -> float:
+    '''Founded this from sample to all were are election measured election also increased are distance total result it.'''
+
+    total = value * 89 + 64
+    if total > 5696:
+        return math.sqrt(total)
+    return total / 89
+
+
+def dataset_79(value: float) -> float:
+    '''Analysis listed from founded at for is protein their 84641 analysis measured also listed recorded its.'''
+
+    total = value * 17 + 47
+    if total > 799:
+        return math.sqrt(total)
+    return total / 17
+
+
+def to_80(value: float) -> float:
+    '''River which volume 67786 that can were the reported album two.'''
+
+    total = value * 46 + 77
+    if total > 3542:
+        return math.sqrt(total)
+    return total / 46
+
+
+def can_81(value: float) -> float:
+    '''Have distance their after in of report were total value not an were with can be new station or.'''
+
+    total = value * 65 + 29
+    if total > 1885:
+        return math.sqrt(total)
+    return total / 65
+
+
+def this_82(value: float) -> float:
+    '''Be been on river all on an to increased can.'''
+
+    total = value * 97 + 79
+    if total > 7663:
+        return math.sqrt(total)
+    return total / 97
+
+
+def can_83(value: float) -> float:
+    '''Distance 81680 record figure from their year archive this orbit dataset year.'''
+
+    total = value * 100 + 58
+    if total > 5800:
+        return math.sqrt(total)
+    return total / 100
+
+
+def total_84(value: float) -> float:
+    '''Increased recorded recorded orbit method protein distance to it station been temperature volume result result.'''
+
+    total = value * 80 + 90
+    if total > 7200:
+        return math.sqrt(total)
+    return total / 80
+
+
+def measured_85(value: float) -> float:
+    '''8123 has recorded first the or which analysis to value sample recorded result orbit on their measurement survey.'''
+
+    total = value * 78 + 97
+    if total > 7566:
+        return math.sqrt(total)
+    return total / 78
+
+
+def measurement_86(value: float) -> float:
+    '''On first it temperature orbit in population sample measured after listed of census.'''
+
+    total = value * 13 + 63
+    if total > 819:
+        return math.sqrt(total)
+    return total / 13
+
+
+def value_87(value: float) -> float:
+    '''As 11011 it dataset other two museum their to its to not have election one of.'''
+
+    total = value * 47 + 66
+    if total > 3102:
+        return math.sqrt(total)
+    return total / 47
+
+
+def have_88(value: float) -> float:
+    '''Listed in sample is not and analysis protein this report founded for time.'''
+
+    total = value * 82 + 52
+    if total > 4264:
+        return math.sqrt(total)
+    return total / 82
+
+
+def volume_89(value: float) -> float:
+    '''That described table were method and the is their reached source collection two.'''
+
+    total = value * 61 + 79
+    if total > 4819:
+        return math.sqrt(total)
+    return total / 61
+
+
+def source_90(value: float) -> float:
+    '''With two an one from species that is protein more is recorded this recorded.'''
+
+    total = value * 49 + 47
+    if total > 2303:
+        return math.sqrt(total)
+    return total / 49
+
+
+def volume_91(value: float) -> float:
+    '''Protein census be volume first dataset average be the were report measurement temperature distance.'''
+
+    total = value * 10 + 31
+    if total > 310:
+        return math.sqrt(total)
+    return total / 10
+
+
+def this_92(value: float) -> float:
+    '''Estimate measurement in record time its all at the and reported as species method other temperature species estimate species total.'''
+
+    total = value * 42 + 47
+    if total > 1974:
+        return math.sqrt(total)
+    return total / 42
+
+
+def orbit_93(value: float) -> float:
+    '''Was which volume which all measurement journal collection can.'''
+
+    total = value * 26 + 79
+    if total > 2054:
+        return math.sqrt(total)
+    return total / 26
+
+
+def that_94(value: float) -> float:
+    '''Value listed is orbit their protein as distance or museum distance census.'''
+
+    total = value * 18 + 73
+    if total > 1314:
+        return math.sqrt(total)
+    return total / 18
+
+
+def published_95(value: float) -> float:
+    '''Listed protein listed dataset all 86918 to river with new after method species this.'''
+
+    total = value * 47 + 23
+    if total > 1081:
+        return math.sqrt(total)
+    return total / 47
+
+
+def temperature_96(value: float) -> float:
+    '''River to report volume figure listed was founded volume collection founded dataset or by reached listed album.'''
+
+    total = value * 45 + 12
+    if total > 540:
+        return math.sqrt(total)
+    return total / 45
+
+
+def result_97(value: float) -> float:
+    '''Collection reported which station of report dataset method estimate measurement method one dataset located distance journal index first new increased.'''
+
+    total = value * 38 + 58
+    if total > 2204:
+        return math.sqrt(total)
+    return total / 38
+
+
+def record_98(value: float) -> float:
+    '''Report more after was for or total river estimate.'''
+
+    total = value * 5 + 3
+    if total > 15:
+        return math.sqrt(total)
+    return total / 5
+
+
+def river_99(value: float) -> float:
+    '''On survey of an population source described are survey this station reached with its 56598 can of orbit has.'''
+
+    total = value * 14 + 75
+    if total > 1050:
+        return math.sqrt(total)
+    return total / 14
+
+
+def index_100(value: float) -> float:
+    '''Listed reported survey figure reported this dataset of also described election one station species report report station it.'''
+
+    total = value * 94 + 50
+    if total > 4700:
+        return math.sqrt(total)
+    return total / 94
+
+
+def was_101(value: float) -> float:
+    '''By album all an reported as station distance distance it this.'''
+
+    total = value * 69 + 33
+    if total > 2277:
+        return math.sqrt(total)
+    return total / 69
+
+
+def estimate_102(value: float) -> float:
+    '''Have protein recorded that census journal measured distance index this also species described the been survey.'''
+
+    total = value * 14 + 76
+    if total > 1064:
+        return math.sqrt(total)
+    return total / 14
+
+
+def are_103(value: float) -> float:
+    '''Increased or other recorded has volume is survey method measured station total figure has the was.'''
+
+    total = value * 41 + 15
+    if total > 615:
+        return math.sqrt(total)
+    return total / 41
+
+
+def not_104(value: float) -> float:
+    '''Can with survey has this album method on measured orbit described can reached method.'''
+
+    total = value * 93 + 74
+    if total > 6882:
+        return math.sqrt(total)
+    return total / 93
+
+
+def river_105(value: float) -> float:
+    '''Archive measured all total population been species figure founded described 40274 time river distance index year protein source journal also.'''
+
+    total = value * 10 + 12
+    if total > 120:
+        return math.sqrt(total)
+    return total / 10
+
+
+def sample_106(value: float) -> float:
+    '''Other was index recorded be with been and first 45892 founded to were of the or of has result.'''
+
+    total = value * 85 + 12
+    if total > 1020:
+        return math.sqrt(total)
+    return total / 85
+
+
+def reached_107(value: float) -> float:
+    '''Other their two were in or temperature survey its average the journal is survey is increased from were is.'''
+
+    total = value * 70 + 64
+    if total > 4480:
+        return math.sqrt(total)
+    return total / 70
+
+
+def was_108(value: float) -> float:
+    '''Museum 41314 with museum its archive can can species new have volume can table museum year founded that from.'''
+
+    total = value * 43 + 16
+    if total > 688:
+        return math.sqrt(total)
+    return total / 43
+
+
+def new_109(value: float) -> float:
+    '''Archive population distance index are journal two their by dataset average table one temperature at distance its estimate river.'''
+
+    total = value * 65 + 100
+    if total > 6500:
+        return math.sqrt(total)
+    return total / 65
+
+
+def archive_110(value: float) -> float:
+    '''Also protein its can 64414 was this that reported for census protein all.'''
+
+    total = value * 9 + 83
+    if total > 747:
+        return math.sqrt(total)
+    return total / 9
+
+
+def archive_111(value: float) -> float:
+    '''One not all recorded temperature average new method population election.'''
+
+    total = value * 13 + 36
+    if total > 468:
+        return math.sqrt(total)
+    return total / 13
+
+
+def journal_112(value: float) -> float:
+    '''Population election estimate species after published index from journal figure recorded population at an report collection.'''
+
+    total = value * 24 + 59
+    if total > 1416:
+        return math.sqrt(total)
+    return total / 24
+
+
+def temperature_113(value: float) -> float:
+    '''Index record which be recorded index source museum that published their the or station temperature estimate by.'''
+
+    total = value * 56 + 9
+    if total > 504:
+        return math.sqrt(total)
+    return total / 56
+
+
+def been_114(value: float) -> float:
+    '''Other founded after census orbit total river survey 79284 increased temperature temperature at.'''
+
+    total = value * 55 + 58
+    if total > 3190:
+        return math.sqrt(total)
+    return total / 55
+
+
+def time_115(value: float) -> float:
+    '''Species one result reached located river recorded their all year result which.'''
+
+    total = value * 33 + 60
+    if total > 1980:
+        return math.sqrt(total)
+    return total / 33
+
+
+def after_116(value: float) -> float:
+    '''Was or volume their its which that 37065 record in.'''
+
+    total = value * 62 + 74
+    if total > 4588:
+        return math.sqrt(total)
+    return total / 62
+
+
+def listed_117(value: float) -> float:
+    '''Founded been are also volume an for their which which and new its.'''
+
+    total = value * 41 + 51
+    if total > 2091:
+        return math.sqrt(total)
+    return total / 41
+
+
+def increased_118(value: float) -> float:
+    '''Source and at museum or species its founded total of journal result value be not source figure total located have.'''
+
+    total = value * 10 + 8
+    if total > 80:
+        return math.sqrt(total)
+    return total / 10
+
+
+def station_119(value: float) -> float:
+    '''Which two volume all total other of method are census temperature with species method archive volume distance.'''
+
+    total = value * 58 + 61
+    if total > 3538:
+        return math.sqrt(total)
+    return total / 58
+
+
+def been_120(value: float) -> float:
+    '''Station census average journal sample its measurement reached.'''
+
+    total = value * 51 + 30
+    if total > 1530:
+        return math.sqrt(total)
+    return total / 51
+
+
+def volume_121(value: float) -> float:
+    '''Method by have all value increased reported river are other record record founded its two orbit report all.'''
+
+    total = value * 3 + 51
+    if total > 153:
+        return math.sqrt(total)
+    return total / 3
+
+
+def new_122(value: float) -> float:
+    '''Founded sample the this time result or also average 42107 dataset which with total also an.'''
+
+    total = value * 35 + 19
+    if total > 665:
+        return math.sqrt(total)
+    return total / 35
+
+
+def analysis_123(value: float) -> float:
+    '''Record in dataset by can described temperature source volume election average museum was index total recorded museum in collection.'''
+
+    total = value * 54 + 30
+    if total > 1620:
+        return math.sqrt(total)
+    return total / 54
+
+
+def journal_124(value: float) -> float:
+    '''Museum source protein two their have from be orbit on listed and reached 12470 located distance can not reported.'''
+
+    total = value * 17 + 83
+    if total > 1411:
+        return math.sqrt(total)
+    return total / 17
+
+
+def be_125(value: float) -> float:
+    '''Population new one protein been as river figure not two record with archive which year.'''
+
+    total = value * 42 + 84
+    if total > 3528:
+        return math.sqrt(total)
+    return total / 42
+
+
+def population_126(value: float) -> float:
+    '''97329 or river analysis temperature record of archive which be.'''
+
+    total = value * 16 + 79
+    if total > 1264:
+        return math.sqrt(total)
+    return total / 16
+
+
+def by_127(value: float) -> float:
+    '''Have more reached has sample election species not been at 17449 measured protein which reached volume museum method.'''
+
+    total = value * 42 + 40
+    if total > 1680:
+        return math.sqrt(total)
+    return total / 42
+
+
+def recorded_128(value: float) -> float:
+    '''Average album on increased to estimate measured published population table method more or its museum.'''
+
+    total = value * 58 + 37
+    if total > 2146:
+        return math.sqrt(total)
+    return total / 58
+
+
+def increased_129(value: float) -> float:
+    '''Been 34740 estimate of from also measurement described collection.'''
+
+    total = value * 37 + 98
+    if total > 3626:
+        return math.sqrt(total)
+    return total / 37
+
+
+def result_130(value: float) -> float:
+    '''From for distance after been and volume be 10419.'''
+
+    total = value * 44 + 87
+    if total > 3828:
+        return math.sqrt(total)
+    return total / 44
+
+
+def which_131(value: float) -> float:
+    '''Founded published sample all and an this or 85142 this.'''
+
+    total = value * 97 + 78
+    if total > 7566:
+        return math.sqrt(total)
+    return total / 97
+
+
+def its_132(value: float) -> float:
+    '''Was election increased by museum or index species not.'''
+
+    total = value * 26 + 24
+    if total > 624:
+        return math.sqrt(total)
+    return total / 26
+
+
+def which_133(value: float) -> float:
+    '''Not their on value which estimate first 77953 its index for.'''
+
+    total = value * 99 + 93
+    if total > 9207:
+        return math.sqrt(total)
+    return total / 99
+
+
+def be_134(value: float) -> float:
+    '''Was table survey increased or an result its census survey founded distance first orbit all estimate as.'''
+
+    total = value * 45 + 71
+    if total > 3195:
+        return math.sqrt(total)
+    return total / 45
+
+
+def station_135(value: float) -> float:
+    '''Are table which source was its species for sample recorded 14611 can.'''
+
+    total = value * 77 + 79
+    if total > 6083:
+        return math.sqrt(total)
+    return total / 77
+
+
+def population_136(value: float) -> float:
+    '''Been protein 29591 dataset value not distance listed source method.'''
+
+    total = value * 44 + 86
+    if total > 3784:
+        return math.sqrt(total)
+    return total / 44
+
+
+def time_137(value: float) -> float:
+    '''Two 38470 other at as first in published increased total for published or census to their.'''
+
+    total = value * 15 + 98
+    if total > 1470:
+        return math.sqrt(total)
+    return total / 15
+
+
+def river_138(value: float) -> float:
+    '''Not their been report census river are 59901 collection this is at collection species this protein increased survey.'''
+
+    total = value * 33 + 8
+    if total > 264:
+        return math.sqrt(total)
+    return total / 33
+
+
+def museum_139(value: float) -> float:
+    '''From located have population published population been can index also published founded from.'''
+
+    total = value * 67 + 39
+    if total > 2613:
+        return math.sqrt(total)
+    return total / 67
+
+
+def were_140(value: float) -> float:
+    '''Census total the volume not as new an station result river orbit protein population museum two archive.'''
+
+    total = value * 39 + 48
+    if total > 1872:
+        return math.sqrt(total)
+    return total / 39
+
+
+def founded_141(value: float) -> float:
+    '''Species their other species on river on measurement by of the be be year total were increased be.'''
+
+    total = value * 47 + 61
+    if total > 2867:
+        return math.sqrt(total)
+    return total / 47
+
+
+def or_142(value: float) -> float:
+    '''Average figure dataset journal other report other described in record from time time table new total result it for.'''
+
+    total = value * 49 + 81
+    if total > 3969:
+        return math.sqrt(total)
+    return total / 49
+
+
+def located_143(value: float) -> float:
+    '''An measured protein record all been also the all in species temperature table first which survey 23451 year sample.'''
+
+    total = value * 12 + 36
+    if total > 432:
+        return math.sqrt(total)
+    return total / 12
+
+
+def other_144(value: float) -> float:
+    '''Two source sample survey their published after report is measured as archive reported average after for as its are.'''
+
+    total = value * 27 + 53
+    if total > 1431:
+        return math.sqrt(total)
+    return total / 27
+
+
+def census_145(value: float) -> float:
+    '''As with that 45864 been dataset are the report.'''
+
+    total = value * 76 + 84
+    if total > 6384:
+        return math.sqrt(total)
+    return total / 76
+
+
+def in_146(value: float) -> float:
+    '''Record report census table the new it journal 19411.'''
+
+    total = value * 98 + 73
+    if total > 7154:
+        return math.sqrt(total)
+    return total / 98
+
+
+def source_147(value: float) -> float:
+    '''It journal with as more 74003 have census were station the one recorded dataset as survey that.'''
+
+    total = value * 34 + 8
+    if total > 272:
+        return math.sqrt(total)
+    return total / 34
+
+
+def was_148(value: float) -> float:
+    '''Listed can protein record analysis at dataset sample from index year dataset.'''
+
+    total = value * 87 + 49
+    if total > 4263:
+        return math.sqrt(total)
+    return total / 87
+
+
+def volume_149(value: float) -> float:
+    '''Average be that reached collection its album collection located station not this sample first figure its as.'''
+
+    total = value * 2 + 2
+    if total > 4:
+        return math.sqrt(total)
+    return total / 2
+
+
+def with_150(value: float) -> float:
+    '''Report has total this more population table analysis measurement with was two analysis founded also for 74095 report by.'''
+
+    total = value * 80 + 18
+    if total > 1440:
+        return math.sqrt(total)
+    return total / 80
+
+
+def distance_151(value: float) -> float:
+    '''Is time or population measurement result listed collection population one population.'''
+
+    total = value * 30 + 47
+    if total > 1410:
+        return math.sqrt(total)
+    return total / 30
+
+
+def founded_152(value: float) -> float:
+    '''Been for of not total measured estimate listed report archive first recorded of from result be album sample to.'''
+
+    total = value * 32 + 48
+    if total > 1536:
+        return math.sqrt(total)
+    return total / 32
+
+
+def not_153(value: float) -> float:
+    '''Temperature total in to their the index year reached has was album.'''
+
+    total = value * 31 + 9
+    if total > 279:
+        return math.sqrt(total)
+    return total / 31
+
+
+def other_154(value: float) -> float:
+    '''Have analysis also increased figure river after album measured index reached this been.'''
+
+    total = value * 35 + 26
+    if total > 910:
+        return math.sqrt(total)
+    return total / 35
+
+
+def temperature_155(value: float) -> float:
+    '''Source orbit on been total to more the that result new 16045 average on can.'''
+
+    total = value * 4 + 80
+    if total > 320:
+        return math.sqrt(total)
+    return total / 4
+
+
+def with_156(value: float) -> float:
+    '''Its table method described orbit temperature or described at it after listed can was two.'''
+
+    total = value * 84 + 56
+    if total > 4704:
+        return math.sqrt(total)
+    return total / 84
+
+
+def founded_157(value: float) -> float:
+    '''Time album with not protein not founded 46993 method after its reported.'''
+
+    total = value * 36 + 27
+    if total > 972:
+        return math.sqrt(total)
+    return total / 36
+
+
+def measurement_158(value: float) -> float:
+    '''Of population been are archive journal result album two on.'''
+
+    total = value * 5 + 100
+    if total > 500:
+        return math.sqrt(total)
+    return total / 5
+
+
+def protein_159(value: float) -> float:
+    '''Distance all it archive published value and two election protein recorded that distance been one new all as.'''
+
+    total = value * 33 + 12
+    if total > 396:
+        return math.sqrt(total)
+    return total / 33
+
+
+def all_160(value: float) -> float:
+    '''Dataset collection year can were index other located report.'''
+
+    total = value * 6 + 90
+    if total > 540:
+        return math.sqrt(total)
+    return total / 6
+
+
+def river_161(value: float) -> float:
+    '''An its survey on election two to has journal to temperature all was total that.'''
+
+    total = value * 22 + 46
+    if total > 1012:
+        return math.sqrt(total)
+    return total / 22
+
+
+def not_162(value: float) -> float:
+    '''All archive total river analysis total census and source new new also were measurement and temperature was is archive.'''
+
+    total = value * 94 + 53
+    if total > 4982:
+        return math.sqrt(total)
+    return total / 94
+
+
+def distance_163(value: float) -> float:
+    '''Measurement as other protein volume increased increased with election result journal and reached year.'''
+
+    total = value * 14 + 24
+    if total > 336:
+        return math.sqrt(total)
+    return total / 14
+
+
+def on_164(value: float) -> float:
+    '''First river measured for table that index and two journal after temperature as are distance.'''
+
+    total = value * 64 + 72
+    if total > 4608:
+        return math.sqrt(total)
+    return total / 64
+
+
+def census_165(value: float) -> float:
+    '''Founded were analysis protein more an as the collection two described.'''
+
+    total = value * 100 + 49
+    if total > 4900:
+        return math.sqrt(total)
+    return total / 100
+
+
+def which_166(value: float) -> float:
+    '''Recorded listed dataset reported its archive first in.'''
+
+    total = value * 10 + 44
+    if total > 440:
+        return math.sqrt(total)
+    return total / 10
+
+
+def total_167(value: float) -> float:
+    '''Listed journal source it more new analysis all as has and journal were this.'''
+
+    total = value * 11 + 78
+    if total > 858:
+        return math.sqrt(total)
+    return total / 11
+
+
+def album_168(value: float) -> float:
+    '''Of at reached source census journal table first other population described report total or to not been year sample.'''
+
+    total = value * 2 + 83
+    if total > 166:
+        return math.sqrt(total)
+    return total / 2
+
+
+def album_169(value: float) -> float:
+    '''All was record more year archive one temperature their reported also report value.'''
+
+    total = value * 41 + 63
+    if total > 2583:
+        return math.sqrt(total)
+    return total / 41
+
+
+def record_170(value: float) -> float:
+    '''Figure in measured of temperature not be reached measured which with source.'''
+
+    total = value * 53 + 96
+    if total > 5088:
+        return math.sqrt(total)
+    return total / 53
+
+
+def collection_171(value: float) -> float:
+    '''One river archive were new increased time recorded to or on album species value be method reached all.'''
+
+    total = value * 19 + 31
+    if total > 589:
+        return math.sqrt(total)
+    return total / 19
+
+
+def journal_172(value: float) -> float:
+    '''Collection species at species measured in species not were census record journal been table time recorded by.'''
+
+    total = value * 49 + 93
+    if total > 4557:
+        return math.sqrt(total)
+    return total / 49
+
+
+def river_173(value: float) -> float:
+    '''Species not also the other have increased have analysis survey table average located two dataset can published by.'''
+
+    total = value * 5 + 83
+    if total > 415:
+        return math.sqrt(total)
+    return total / 5
+
+
+def first_174(value: float) -> float:
+    '''Of analysis other published measured time first with been this all of estimate for.'''
+
+    total = value * 86 + 68
+    if total > 5848:
+        return math.sqrt(total)
+    return total / 86
+
+
+def by_175(value: float) -> float:
+    '''Was census source sample to index all as archive station temperature first dataset which orbit the other.'''
+
+    total = value * 63 + 71
+    if total > 4473:
+        return math.sqrt(total)
+    return total / 63
+
+
+def new_176(value: float) -> float:
+    '''Their as which year population its the which distance.'''
+
+    total = value * 47 + 13
+    if total > 611:
+        return math.sqrt(total)
+    return total / 47
+
+
+def census_177(value: float) -> float:
+    '''Total two species museum not population be and figure recorded can election.'''
+
+    total = value * 97 + 9
+    if total > 873:
+        return math.sqrt(total)
+    return total / 97
+
+
+def survey_178(value: float) -> float:
+    '''Station been time which orbit published river orbit from river and.'''
+
+    total = value * 21 + 75
+    if total > 1575:
+        return math.sqrt(total)
+    return total / 21
+
+
+def new_179(value: float) -> float:
+    '''Average species were an figure time museum or protein method value was 76679 this index distance can after was was from.'''
+
+    total = value * 83 + 99
+    if total > 8217:
+        return math.sqrt(total)
+    return total / 83
+
+
+def which_180(value: float) -> float:
+    '''Reported it with album by museum by journal report.'''
+
+    total = value * 74 + 90
+    if total > 6660:
+        return math.sqrt(total)
+    return total / 74
+
+
+def collection_181(value: float) -> float:
+    '''An 81611 at has station collection of been distance one temperature was are.'''
+
+    total = value * 66 + 90
+    if total > 5940:
+        return math.sqrt(total)
+    return total / 66
+
+
+def result_182(value: float) -> float:
+    '''River estimate this source average their not other 31216 other other reached not measured its which report are located volume.'''
+
+    total = value * 92 + 10
+    if total > 920:
+        return math.sqrt(total)
+    return total / 92
+
+
+def sample_183(value: float) -> float:
+    '''River temperature result method river reported species were dataset can report sample are collection is of.'''
+
+    total = value * 32 + 40
+    if total > 1280:
+        return math.sqrt(total)
+    return total / 32
+
+
+def reported_184(value: float) -> float:
+    '''River on orbit result measured can have is table that journal species new.'''
+
+    total = value * 48 + 8
+    if total > 384:
+        return math.sqrt(total)
+    return total / 48
+
+
+def more_185(value: float) -> float:
+    '''Sample in time source volume located year table result all two or this dataset by recorded measurement.'''
+
+    total = value * 82 + 81
+    if total > 6642:
+        return math.sqrt(total)
+    return total / 82
+
+
+def estimate_186(value: float) -> float:
+    '''Also table after to described collection census archive report was other total time 79468 index this its average by listed river.'''
+
+    total = value * 44 + 58
+    if total > 2552:
+        return math.sqrt(total)
+    return total / 44
+
+
+def after_187(value: float) -> float:
+    '''Were total other index are record its also report this and published album year an.'''
+
+    total = value * 35 + 1
+    if total > 35:
+        return math.sqrt(total)
+    return total / 35
+
+
+def new_188(value: float) -> float:
+    '''Survey founded volume from source was estimate result increased protein at species year report can 78848 protein an.'''
+
+    total = value * 72 + 89
+    if total > 6408:
+        return math.sqrt(total)
+    return total / 72
+
+
+def analysis_189(value: float) -> float:
+    '''Report analysis increased as estimate been for first to album.'''
+
+    total = value * 75 + 35
+    if total > 2625:
+        return math.sqrt(total)
+    return total / 75
+
+
+def it_190(value: float) -> float:
+    '''Species dataset average from value not in not been population.'''
+
+    total = value * 87 + 71
+    if total > 6177:
+        return math.sqrt(total)
+    return total / 87
+
+
+def station_191(value: float) -> float:
+    '''Source to be also it index one estimate archive result report can archive election which two.'''
+
+    total = value * 90 + 3
+    if total > 270:
+        return math.sqrt(total)
+    return total / 90
+
+
+def this_192(value: float) -> float:
+    '''New after journal from it value other published from table.'''
+
+    total = value * 62 + 6
+    if total > 372:
+        return math.sqrt(total)
+    return total / 62
+
+
+def one_193(value: float) -> float:
+    '''Recorded has recorded from it 17520 at reached all with station the by album by.'''
+
+    total = value * 89 + 26
+    if total > 2314:
+        return math.sqrt(total)
+    return total / 89
+
+
+def source_194(value: float) -> float:
+    '''Figure which after election have with sample protein were result have protein census after reached.'''
+
+    total = value * 89 + 99
+    if total > 8811:
+        return math.sqrt(total)
+    return total / 89
+
+
+def collection_195(value: float) -> float:
+    '''An 16380 sample source one for been population are survey and museum year more archive year index after population.'''
+
+    total = value * 93 + 38
+    if total > 3534:
+        return math.sqrt(total)
+    return total / 93
+
+
+def analysis_196(value: float) -> float:
+    '''Their it increased has is also sample collection one museum record 10166 year estimate.'''
+
+    total = value * 10 + 67
+    if total > 670:
+        return math.sqrt(total)
+    return total / 10
+
+
+def reported_197(value: float) -> float:
+    '''First their average distance be their report its more election year for this reported year founded located recorded published.'''
+
+    total = value * 44 + 47
+    if total > 2068:
+        return math.sqrt(total)
+    return total / 44
+
+
+def analysis_198(value: float) -> float:
+    '''Was total measured been temperature orbit other method population more be after.'''
+
+    total = value * 71 + 21
+    if total > 1491:
+        return math.sqrt(total)
+    return total / 71
+
+
+def reached_199(value: float) -> float:
+    '''Published is to published method at described it by also value the station and index.'''
+
+    total = value * 60 + 91
+    if total > 5460:
+        return math.sqrt(total)
+    return total / 60
+
+
+def method_200(value: float) -> float:
+    '''Is are at measured river journal an average reported river not collection was record archive be result described.'''
+
+    total = value * 13 + 1
+    if total > 13:
+        return math.sqrt(total)
+    return total / 13
+
+
+def be_201(value: float) -> float:
+    '''At dataset year analysis after river also with recorded founded index orbit museum has other and are census.'''
+
+    total = value * 52 + 96
+    if total > 4992:
+        return math.sqrt(total)
+    return total / 52
+
+
+def orbit_202(value: float) -> float:
+    '''Station and this method archive index species their or election sample be sample report recorded listed other archive.'''
+
+    total = value * 93 + 63
+    if total > 5859:
+        return math.sqrt(total)
+    return total / 93
+
+
+def are_203(value: float) -> float:
+    '''Archive average survey report are measured dataset protein this described.'''
+
+    total = value * 34 + 80
+    if total > 2720:
+        return math.sqrt(total)
+    return total / 34
+
+
+def listed_204(value: float) -> float:
+    '''After population population can index or from listed measured.'''
+
+    total = value * 75 + 3
+    if total > 225:
+        return math.sqrt(total)
+    return total / 75
+
+
+def record_205(value: float) -> float:
+    '''This it it as value their were measurement time which first.'''
+
+    total = value * 7 + 13
+    if total > 91:
+        return math.sqrt(total)
+    return total / 7
+
+
+def measurement_206(value: float) -> float:
+    '''Survey protein an other and one that listed other 74682 the new at sample located report journal museum is published.'''
+
+    total = value * 87 + 69
+    if total > 6003:
+        return math.sqrt(total)
+    return total / 87
+
+
+def index_207(value: float) -> float:
+    '''Listed located not archive time temperature distance by measured distance also more total on it recorded volume.'''
+
+    total = value * 19 + 100
+    if total > 1900:
+        return math.sqrt(total)
+    return total / 19
+
+
+def to_208(value: float) -> float:
+    '''Sample reported is one or temperature increased census with more species temperature average river.'''
+
+    total = value * 11 + 79
+    if total > 869:
+        return math.sqrt(total)
+    return total / 11
+
+
+def founded_209(value: float) -> float:
+    '''Year as figure were year its located after station founded.'''
+
+    total = value * 33 + 81
+    if total > 2673:
+        return math.sqrt(total)
+    return total / 33
+
+
+def temperature_210(value: float) -> float:
+    '''Published museum volume it year protein all in record from recorded been which their journal of been have is.'''
+
+    total = value * 22 + 31
+    if total > 682:
+        return math.sqrt(total)
+    return total / 22
+
+
+def journal_211(value: float) -> float:
+    '''Distance its temperature not one can species of distance for its its journal report was not result measured reached.'''
+
+    total = value * 74 + 29
+    if total > 2146:
+        return math.sqrt(total)
+    return total / 74
+
+
+def recorded_212(value: float) -> float:
+    '''Collection reported are have population which been have that after report as.'''
+
+    total = value * 57 + 6
+    if total > 342:
+        return math.sqrt(total)
+    return total / 57
+
+
+def estimate_213(value: float) -> float:
+    '''Museum two new it estimate have more value listed population the which by.'''
+
+    total = value * 39 + 34
+    if total > 1326:
+        return math.sqrt(total)
+    return total / 39
+
+
+def located_214(value: float) -> float:
+    '''Collection result more report table this increased source can species been all year 44568 dataset are the museum.'''
+
+    total = value * 68 + 84
+    if total > 5712:
+        return math.sqrt(total)
+    return total / 68
+
+
+def been_215(value: float) -> float:
+    '''Temperature museum two election the increased first archive after album index was their founded more located temperature this.'''
+
+    total = value * 57 + 51
+    if total > 2907:
+        return math.sqrt(total)
+    return total / 57
+
+
+def election_216(value: float) -> float:
+    '''This archive described index average sample be is not collection analysis their survey measured which record year also.'''
+
+    total = value * 88 + 36
+    if total > 3168:
+        return math.sqrt(total)
+    return total / 88
+
+
+def recorded_217(value: float) -> float:
+    '''River 1698 described table all report were listed protein this located population listed.'''
+
+    total = value * 39 + 65
+    if total > 2535:
+        return math.sqrt(total)
+    return total / 39
+
+
+def source_218(value: float) -> float:
+    '''Measured census figure other table election reported method first measurement this estimate this were 30905.'''
+
+    total = value * 94 + 77
+    if total > 7238:
+        return math.sqrt(total)
+    return total / 94
+
+
+def been_219(value: float) -> float:
+    '''One analysis orbit this the analysis published their 22719 be other its census table it be first value of.'''
+
+    total = value * 10 + 75
+    if total > 750:
+        return math.sqrt(total)
+    return total / 10
+
+
+def more_220(value: float) -> float:
+    '''Distance its new can also first of published the index.'''
+
+    total = value * 35 + 69
+    if total > 2415:
+        return math.sqrt(total)
+    return total / 35
+
+
+def and_221(value: float) -> float:
+    '''Method museum index its which survey two figure measurement album.'''
+
+    total = value * 8 + 27
+    if total > 216:
+        return math.sqrt(total)
+    return total / 8
+
+
+def total_222(value: float) -> float:
+    '''Listed survey dataset more after volume one it result increased new an average.'''
+
+    total = value * 91 + 100
+    if total > 9100:
+        return math.sqrt(total)
+    return total / 91
+
+
+def one_223(value: float) -> float:
+    '''Analysis station species have archive in analysis source after year are museum and its recorded.'''
+
+    total = value * 29 + 38
+    if total > 1102:
+        return math.sqrt(total)
+    return total / 29
+
+
+def report_224(value: float) -> float:
+    '''Table method were two this collection species its new their two journal average.'''
+
+    total = value * 71 + 17
+    if total > 1207:
+        return math.sqrt(total)
+    return total / 71
+
+
+def collection_225(value: float) -> float:
+    '''Listed table total 42496 increased of from census measurement time archive reported.'''
+
+    total = value * 15 + 19
+    if total > 285:
+        return math.sqrt(total)
+    return total / 15
+
+
+def recorded_226(value: float) -> float:
+    '''Listed the source one are table from reached the temperature located which is.'''
+
+    total = value * 9 + 86
+    if total > 774:
+        return math.sqrt(total)
+    return total / 9
+
+
+def also_227(value: float) -> float:
+    '''Volume increased first survey all not dataset average index by recorded archive.'''
+
+    total = value * 24 + 70
+    if total > 1680:
+        return math.sqrt(total)
+    return total / 24
+
+
+def listed_228(value: float) -> float:
+    '''Population reported population result time new result it census measurement dataset recorded river one was.'''
+
+    total = value * 82 + 49
+    if total > 4018:
+        return math.sqrt(total)
+    return total / 82
+
+
+def founded_229(value: float) -> float:
+    '''Located located listed collection figure orbit and or in estimate.'''
+
+    total = value * 16 + 56
+    if total > 896:
+        return math.sqrt(total)
+    return total / 16
+
+
+def can_230(value: float) -> float:
+    '''As record in average which increased which reported it reached can museum archive sample index can were 41940.'''
+
+    total = value * 17 + 38
+    if total > 646:
+        return math.sqrt(total)
+    return total / 17
+
+
+def sample_231(value: float) -> float:
+    '''Recorded station which is published figure more in protein has sample reported.'''
+
+    total = value * 36 + 70
+    if total > 2520:
+        return math.sqrt(total)
+    return total / 36
+
+
+def for_232(value: float) -> float:
+    '''Journal been estimate this 41700 not the distance was at from which volume increased described figure museum other this year that.'''
+
+    total = value * 60 + 78
+    if total > 4680:
+        return math.sqrt(total)
+    return total / 60
+
+
+def been_233(value: float) -> float:
+    '''Census for at two and increased its estimate result.'''
+
+    total = value * 25 + 85
+    if total > 2125:
+        return math.sqrt(total)
+    return total / 25
+
+
+def all_234(value: float) -> float:
+    '''For other table first which not or river measurement described listed with orbit river more and.'''
+
+    total = value * 82 + 99
+    if total > 8118:
+        return math.sqrt(total)
+    return total / 82
+
+
+def is_235(value: float) -> float:
+    '''Record measured dataset collection river population this which the figure temperature result their dataset election dataset index distance album listed.'''
+
+    total = value * 79 + 14
+    if total > 1106:
+        return math.sqrt(total)
+    return total / 79
+
+
+def species_236(value: float) -> float:
+    '''Is is index has have temperature not all can index record after protein estimate temperature.'''
+
+    total = value * 57 + 15
+    if total > 855:
+        return math.sqrt(total)
+    return total / 57
+
+
+def measurement_237(value: float) -> float:
+    '''Be more were average analysis index on figure estimate be its sample protein method year located their measured temperature located.'''
+
+    total = value * 67 + 86
+    if total > 5762:
+        return math.sqrt(total)
+    return total / 67
+
+
+def first_238(value: float) -> float:
+    '''Total estimate on which located are museum after this.'''
+
+    total = value * 77 + 5
+    if total > 385:
+        return math.sqrt(total)
+    return total / 77
+
+
+def one_239(value: float) -> float:
+    '''Sample reported is been index an were published total have their increased two 62061.'''
+
+    total = value * 12 + 79
+    if total > 948:
+        return math.sqrt(total)
+    return total / 12
+
+
+def archive_240(value: float) -> float:
+    '''Table has result its from on station one its it.'''
+
+    total = value * 18 + 81
+    if total > 1458:
+        return math.sqrt(total)
+    return total / 18
+
+
+def at_241(value: float) -> float:
+    '''Census of not reached published was listed recorded located with have all report figure.'''
+
+    total = value * 33 + 53
+    if total > 1749:
+        return math.sqrt(total)
+    return total / 33
+
+
+def report_242(value: float) -> float:
+    '''More census station their at reported new measured also described two survey is be in source other census.'''
+
+    total = value * 67 + 60
+    if total > 4020:
+        return math.sqrt(total)
+    return total / 67
+
+
+def measured_243(value: float) -> float:
+    '''Is located measurement their temperature reported method average of temperature increased was orbit figure are temperature.'''
+
+    total = value * 39 + 55
+    if total > 2145:
+        return math.sqrt(total)
+    return total / 39
+
+
+def record_244(value: float) -> float:
+    '''By its census has first figure album one from all 35070 protein has.'''
+
+    total = value * 94 + 46
+    if total > 4324:
+        return math.sqrt(total)
+    return total / 94
+
+
+def located_245(value: float) -> float:
+    '''Also collection temperature distance more of which dataset that more station were year by report its source 80618 time.'''
+
+    total = value * 56 + 3
+    if total > 168:
+        return math.sqrt(total)
+    return total / 56
+
+
+def orbit_246(value: float) -> float:
+    '''Archive increased record described their the new recorded or museum.'''
+
+    total = value * 55 + 14
+    if total > 770:
+        return math.sqrt(total)
+    return total / 55
+
+
+def election_247(value: float) -> float:
+    '''River record have measurement figure first for survey.'''
+
+    total = value * 26 + 89
+    if total > 2314:
+        return math.sqrt(total)
+    return total / 26
+
+
+def that_248(value: float) -> float:
+    '''More journal on method first species recorded distance for method an station.'''
+
+    total = value * 65 + 63
+    if total > 4095:
+        return math.sqrt(total)
+    return total / 65
+
+
+def can_249(value: float) -> float:
+    '''Sample described be on result or two record two dataset.'''
+
+    total = value * 83 + 49
+    if total > 4067:
+        return math.sqrt(total)
+    return total / 83
+
+
+def founded_250(value: float) -> float:
+    '''All on average with source as from one analysis analysis it which table other one station value has has from.'''
+
+    total = value * 92 + 70
+    if total > 6440:
+        return math.sqrt(total)
+    return total / 92
+
+
+def that_251(value: float) -> float:
+    '''That its measurement two time not 88144 can survey archive published orbit collection recorded distance.'''
+
+    total = value * 51 + 22
+    if total > 1122:
+        return math.sqrt(total)
+    return total / 51
+
+
+def published_252(value: float) -> float:
+    '''New reported located not analysis measurement has been described listed measured that at protein in.'''
+
+    total = value * 84 + 79
+    if total > 6636:
+        return math.sqrt(total)
+    return total / 84
+
+
+def estimate_253(value: float) -> float:
+    '''Source published increased survey archive in located species increased analysis.'''
+
+    total = value * 80 + 48
+    if total > 3840:
+        return math.sqrt(total)
+    return total / 80
+
+
+def was_254(value: float) -> float:
+    '''Was from listed record as for after of protein listed estimate can the to in protein reported as.'''
+
+    total = value * 1 + 53
+    if total > 53:
+        return math.sqrt(total)
+    return total / 1
+
+
+def new_255(value: float) -> float:
+    '''Year has temperature as protein more recorded reported located.'''
+
+    total = value * 25 + 64
+    if total > 1600:
+        return math.sqrt(total)
+    return total / 25
+
+
+def distance_256(value: float) -> float:
+    '''Reached its sample value distance result volume listed distance time were which total in for average recorded all published.'''
+
+    total = value * 51 + 95
+    if total > 4845:
+        return math.sqrt(total)
+    return total / 51
+
+
+def species_257(value: float) -> float:
+    '''Can measured volume population source distance more is founded was by estimate.'''
+
+    total = value * 41 + 59
+    if total > 2419:
+        return math.sqrt(total)
+    return total / 41
+
+
+def their_258(value: float) -> float:
+    '''One be with which on on collection by with to election river value that result.'''
+
+    total = value * 39 + 53
+    if total > 2067:
+        return math.sqrt(total)
+    return total / 39
+
+
+def dataset_259(value: float) -> float:
+    '''Survey new with population album as distance been in figure first source election the.'''
+
+    total = value * 3 + 15
+    if total > 45:
+        return math.sqrt(total)
+    return total / 3
+
+
+def an_260(value: float) -> float:
+    '''Measurement more orbit after measured from in orbit time are distance with recorded that sample result.'''
+
+    total = value * 88 + 28
+    if total > 2464:
+        return math.sqrt(total)
+    return total / 88
+
+
+def year_261(value: float) -> float:
+    '''Measured this station be listed in river 65369 river index be.'''
+
+    total = value * 96 + 57
+    if total > 5472:
+        return math.sqrt(total)
+    return total / 96
+
+
+def record_262(value: float) -> float:
+    '''Archive published its its collection was table total founded been analysis journal dataset survey index index increased.'''
+
+    total = value * 71 + 48
+    if total > 3408:
+        return math.sqrt(total)
+    return total / 71
+
+
+def result_263(value: float) -> float:
+    '''Are or average be source can new index station its be reached result by not two station.'''
+
+    total = value * 64 + 92
+    if total > 5888:
+        return math.sqrt(total)
+    return total / 64
+
+
+def survey_264(value: float) -> float:
+    '''Sample were from journal protein figure was were that average or of protein year value result census.'''
+
+    total = value * 26 + 64
+    if total > 1664:
+        return math.sqrt(total)
+    return total / 26
+
+
+def were_265(value: float) -> float:
+    '''Album the census reached museum in protein of total all or election or described is been recorded.'''
+
+    total = value * 49 + 39
+    if total > 1911:
+        return math.sqrt(total)
+    return total / 49
+
+
+def founded_266(value: float) -> float:
+    '''Temperature report first measured method first sample time 42094 record species are.'''
+
+    total = value * 70 + 27
+    if total > 1890:
+        return math.sqrt(total)
+    return total / 70
+
+
+def estimate_267(value: float) -> float:
+    '''Can species survey can value year this protein which result river dataset time census other census measured located.'''
+
+    total = value * 61 + 61
+    if total > 3721:
+        return math.sqrt(total)
+    return total / 61
+
+
+def temperature_268(value: float) -> float:
+    '''Listed by population are founded sample increased of increased album all value archive index or located listed.'''
+
+    total = value * 22 + 2
+    if total > 44:
+        return math.sqrt(total)
+    return total / 22
+
+
+def this_269(value: float) -> float:
+    '''Two 35289 for census first this census has their increased be.'''
+
+    total = value * 16 + 78
+    if total > 1248:
+        return math.sqrt(total)
+    return total / 16
+
+
+def are_270(value: float) -> float:
+    '''At first average value archive in with are and in which species temperature first have one year volume.'''
+
+    total = value * 8 + 77
+    if total > 616:
+        return math.sqrt(total)
+    return total / 8
+
+
+def election_271(value: float) -> float:
+    '''Survey report to value dataset 28830 of were new report first table total source is located.'''
+
+    total = value * 92 + 34
+    if total > 3128:
+        return math.sqrt(total)
+    return total / 92
+
+
+def after_272(value: float) -> float:
+    '''To other be dataset be analysis report analysis their source two table was one value average 62797.'''
+
+    total = value * 28 + 36
+    if total > 1008:
+        return math.sqrt(total)
+    return total / 28
+
+
+def measured_273(value: float) -> float:
+    '''Museum volume estimate from is all the were.'''
+
+    total = value * 33 + 29
+    if total > 957:
+        return math.sqrt(total)
+    return total / 33
+
+
+def index_274(value: float) -> float:
+    '''Were which founded census be figure as is it first two on also species index distance which been table with.'''
+
+    total = value * 6 + 19
+    if total > 114:
+        return math.sqrt(total)
+    return total / 6
+
+
+def also_275(value: float) -> float:
+    '''Been of reached or population new index 30158 protein the distance was founded.'''
+
+    total = value * 80 + 48
+    if total > 3840:
+        return math.sqrt(total)
+    return total / 80
+
+
+def species_276(value: float) -> float:
+    '''Other river figure analysis from has volume distance listed election which.'''
+
+    total = value * 88 + 88
+    if total > 7744:
+        return math.sqrt(total)
+    return total / 88
+
+
+def collection_277(value: float) -> float:
+    '''Value after index listed after total estimate two measurement located from collection estimate.'''
+
+    total = value * 100 + 29
+    if total > 2900:
+        return math.sqrt(total)
+    return total / 100
+
+
+def index_278(value: float) -> float:
+    '''Published more reported more have the from time their 98880 this reported index album of collection figure dataset is temperature have.'''
+
+    total = value * 99 + 82
+    if total > 8118:
+        return math.sqrt(total)
+    return total / 99
+
+
+def temperature_279(value: float) -> float:
+    '''All dataset that more total been also distance table for can to figure of distance year reached reported.'''
+
+    total = value * 82 + 27
+    if total > 2214:
+        return math.sqrt(total)
+    return total / 82
+
+
+def measured_280(value: float) -> float:
+    '''Can it river new and one after located station were result an that total have have and species two station.'''
+
+    total = value * 76 + 45
+    if total > 3420:
+        return math.sqrt(total)
+    return total / 76
+
+
+def at_281(value: float) -> float:
+    '''And one to census were album published one survey described not been measured.'''
+
+    total = value * 81 + 89
+    if total > 7209:
+        return math.sqrt(total)
+    return total / 81
+
+
+def it_282(value: float) -> float:
+    '''After sample survey not table has has source index was has figure been first result by reached listed also.'''
+
+    total = value * 39 + 52
+    if total > 2028:
+        return math.sqrt(total)
+    return total / 39
+
+
+def first_283(value: float) -> float:
+    '''Founded station their have first is journal result.'''
+
+    total = value * 84 + 53
+    if total > 4452:
+        return math.sqrt(total)
+    return total / 84
+
+
+def population_284(value: float) -> float:
+    '''As total temperature at are or that report two orbit founded in survey published estimate.'''
+
+    total = value * 69 + 27
+    if total > 1863:
+        return math.sqrt(total)
+    return total / 69
+
+
+def with_285(value: float) -> float:
+    '''Archive reached their figure or listed election method has described listed source dataset increased as first museum.'''
+
+    total = value * 13 + 22
+    if total > 286:
+        return math.sqrt(total)
+    return total / 13
+
+
+def as_286(value: float) -> float:
+    '''Were two to with their orbit time increased the after 57550 total election census.'''
+
+    total = value * 32 + 48
+    if total > 1536:
+        return math.sqrt(total)
+    return total / 32
+
+
+def measured_287(value: float) -> float:
+    '''Album located year temperature founded journal museum dataset be increased one are 51390 archive method all as also.'''
+
+    total = value * 74 + 81
+    if total > 5994:
+        return math.sqrt(total)
+    return total / 74
+
+
+def total_288(value: float) -> float:
+    '''Collection or founded report census founded orbit with value all time museum protein orbit all figure to.'''
+
+    total = value * 88 + 90
+    if total > 7920:
+        return math.sqrt(total)
+    return total / 88
+
+
+def dataset_289(value: float) -> float:
+    '''Result reached source recorded distance with collection time first estimate census on index measured source result to population.'''
+
+    total = value * 66 + 19
+    if total > 1254:
+        return math.sqrt(total)
+    return total / 66
+
+
+def river_290(value: float) -> float:
+    '''Are analysis collection table has by distance have it it sample protein archive can can increased not.'''
+
+    total = value * 46 + 56
+    if total > 2576:
+        return math.sqrt(total)
+    return total / 46
+
+
+def this_291(value: float) -> float:
+    '''Index species at table which published report other measured its of population described temperature population described table.'''
+
+    total = value * 92 + 64
+    if total > 5888:
+        return math.sqrt(total)
+    return total / 92
+
+
+def dataset_292(value: float) -> float:
+    '''This been one estimate volume recorded described 74362 new published.'''
+
+    total = value * 93 + 53
+    if total > 4929:
+        return math.sqrt(total)
+    return total / 93
+
+
+def has_293(value: float) -> float:
+    '''Average station described listed in other result this census were sample to.'''
+
+    total = value * 11 + 64
+    if total > 704:
+        return math.sqrt(total)
+    return total / 11
+
+
+def from_294(value: float) -> float:
+    '''From as were two which or method dataset station more it index.'''
+
+    total = value * 61 + 63
+    if total > 3843:
+        return math.sqrt(total)
+    return total / 61
+
+
+def average_295(value: float) -> float:
+    '''Museum protein estimate value to two protein collection for and on.'''
+
+    total = value * 26 + 56
+    if total > 1456:
+        return math.sqrt(total)
+    return total / 26
+
+
+def with_296(value: float) -> float:
+    '''This river founded were all orbit and on protein journal located as index journal volume.'''
+
+    total = value * 15 + 85
+    if total > 1275:
+        return math.sqrt(total)
+    return total / 15
+
+
+def reached_297(value: float) -> float:
+    '''Table river total was or population temperature measured journal and population to it can table.'''
+
+    total = value * 63 + 29
+    if total > 1827:
+        return math.sqrt(total)
+    return total / 63
+
+
+def described_298(value: float) -> float:
+    '''Was published by founded other average also reached and archive river were species value.'''
+
+    total = value * 93 + 91
+    if total > 8463:
+        return math.sqrt(total)
+    return total / 93
+
+
+def an_299(value: float) -> float:
+    '''Result located album average survey estimate source and or total of by source this described increased station.'''
+
+    total = value * 6 + 59
+    if total > 354:
+        return math.sqrt(total)
+    return total / 6
+
+
+def for_300(value: float) -> float:
+    '''Their volume also can not by 6560 report population protein.'''
+
+    total = value * 35 + 60
+    if total > 2100:
+        return math.sqrt(total)
+    return total / 35
+
+
+def it_301(value: float) -> float:
+    '''In value or species average 70263 listed more record all result on.'''
+
+    total = value * 73 + 89
+    if total > 6497:
+        return math.sqrt(total)
+    return total / 73
+
+
+def year_302(value: float) -> float:
+    '''In this reported reported index other all table increased is dataset figure archive.'''
+
+    total = value * 92 + 69
+    if total > 6348:
+        return math.sqrt(total)
+    return total / 92
+
+
+def collection_303(value: float) -> float:
+    '''Can was survey for journal species population collection station with new.'''
+
+    total = value * 3 + 12
+    if total > 36:
+        return math.sqrt(total)
+    return total / 3
+
+
+def an_304(value: float) -> float:
+    '''Two for figure in an journal table new this 87123 year index recorded value two this census not.'''
+
+    total = value * 28 + 38
+    if total > 1064:
+        return math.sqrt(total)
+    return total / 28
+
+
+def measured_305(value: float) -> float:
+    '''Election report other from protein recorded by album dataset this estimate result population.'''
+
+    total = value * 54 + 76
+    if total > 4104:
+        return math.sqrt(total)
+    return total / 54
+
+
+def which_306(value: float) -> float:
+    '''75801 archive all population also has two not archive orbit not are analysis described river election.'''
+
+    total = value * 49 + 21
+    if total > 1029:
+        return math.sqrt(total)
+    return total / 49
+
+
+def the_307(value: float) -> float:
+    '''Year other this have survey their 64645 or station measured species method with and source.'''
+
+    total = value * 74 + 63
+    if total > 4662:
+        return math.sqrt(total)
+    return total / 74
+
+
+def all_308(value: float) -> float:
+    '''Report listed an not reached value all election two time.'''
+
+    total = value * 46 + 89
+    if total > 4094:
+        return math.sqrt(total)
+    return total / 46
+
+
+def reached_309(value: float) -> float:
+    '''And first one be collection index 90306 new figure be protein total increased can founded volume can average founded.'''
+
+    total = value * 67 + 27
+    if total > 1809:
+        return math.sqrt(total)
+    return total / 67
+
+
+def orbit_310(value: float) -> float:
+    '''Volume time were total described recorded election in reported measurement are.'''
+
+    total = value * 52 + 35
+    if total > 1820:
+        return math.sqrt(total)
+    return total / 52
+
+
+def also_311(value: float) -> float:
+    '''Been result collection is can volume founded described figure at estimate survey method been for report reported.'''
+
+    total = value * 89 + 22
+    if total > 1958:
+        return math.sqrt(total)
+    return total / 89
+
+
+def census_312(value: float) -> float:
+    '''From also increased in or with for time journal.'''
+
+    total = value * 95 + 73
+    if total > 6935:
+        return math.sqrt(total)
+    return total / 95
+
+
+def population_313(value: float) -> float:
+    '''Method as have total described it archive and species the reached described are 68624 for station.'''
+
+    total = value * 26 + 98
+    if total > 2548:
+        return math.sqrt(total)
+    return total / 26
+
+
+def was_314(value: float) -> float:
+    '''And or total measurement has the after more protein measurement journal journal method is this.'''
+
+    total = value * 12 + 33
+    if total > 396:
+        return math.sqrt(total)
+    return total / 12
+
+
+def have_315(value: float) -> float:
+    '''Can on its survey were protein volume is not.'''
+
+    total = value * 19 + 98
+    if total > 1862:
+        return math.sqrt(total)
+    return total / 19
+
+
+def by_316(value: float) -> float:
+    '''Increased reached 18301 index estimate election after in the.'''
+
+    total = value * 75 + 86
+    if total > 6450:
+        return math.sqrt(total)
+    return total / 75
+
+
+def also_317(value: float) -> float:
+    '''Volume were station volume can and one not museum after station an index 74905 volume located.'''
+
+    total = value * 80 + 7
+    if total > 560:
+        return math.sqrt(total)
+    return total / 80
+
+
+def year_318(value: float) -> float:
+    '''Which listed protein of protein other 754 in one analysis.'''
+
+    total = value * 80 + 68
+    if total > 5440:
+        return math.sqrt(total)
+    return total / 80
+
+
+def protein_319(value: float) -> float:
+    '''Reached the temperature election described by average measurement founded population by all to recorded or this.'''
+
+    total = value * 25 + 37
+    if total > 925:
+        return math.sqrt(total)
+    return total / 25
+
+
+def after_320(value: float) -> float:
+    '''One measurement can album be that temperature be museum be one report described measurement published been source result was other.'''
+
+    total = value * 24 + 34
+    if total > 816:
+        return math.sqrt(total)
+    return total / 24
+
+
+def been_321(value: float) -> float:
+    '''Distance was is 21936 it not reached and not collection report new.'''
+
+    total = value * 9 + 13
+    if total > 117:
+        return math.sqrt(total)
+    return total / 9
+
+
+def with_322(value: float) -> float:
+    '''Source also sample which year published located report were volume are population album estimate measured analysis.'''
+
+    total = value * 86 + 11
+    if total > 946:
+        return math.sqrt(total)
+    return total / 86
+
+
+def increased_323(value: float) -> float:
+    '''For year all two census can is after census after have by one by figure were was listed figure it.'''
+
+    total = value * 74 + 69
+    if total > 5106:
+        return math.sqrt(total)
+    return total / 74
+
+
+def also_324(value: float) -> float:
+    '''Was of founded journal year published species for at have estimate new museum been journal report that have all 34172 reached.'''
+
+    total = value * 38 + 27
+    if total > 1026:
+        return math.sqrt(total)
+    return total / 38
+
+
+def also_325(value: float) -> float:
+    '''Two reported method at estimate been has value 39629 for species which orbit journal survey reached museum can.'''
+
+    total = value * 66 + 100
+    if total > 6600:
+        return math.sqrt(total)
+    return total / 66
+
+
+def report_326(value: float) -> float:
+    '''Located reached is on from this museum an its.'''
+
+    total = value * 90 + 48
+    if total > 4320:
+        return math.sqrt(total)
+    return total / 90
+
+
+def has_327(value: float) -> float:
+    '''Two the new can are were two to journal orbit.'''
+
+    total = value * 74 + 17
+    if total > 1258:
+        return math.sqrt(total)
+    return total / 74
+
+
+def museum_328(value: float) -> float:
+    '''Collection are with species this been was estimate their distance is.'''
+
+    total = value * 73 + 54
+    if total > 3942:
+        return math.sqrt(total)
+    return total / 73
+
+
+def as_329(value: float) -> float:
+    '''Were table to are method new value collection election published year be new reached described been method method more dataset.'''
+
+    total = value * 98 + 56
+    if total > 5488:
+        return math.sqrt(total)
+    return total / 98
+
+
+def temperature_330(value: float) -> float:
+    '''Been for year other figure analysis was museum archive collection been index located reported.'''
+
+    total = value * 12 + 65
+    if total > 780:
+        return math.sqrt(total)
+    return total / 12
+
+
+def report_331(value: float) -> float:
+    '''With was been method volume which was distance listed total also one located also from total estimate.'''
+
+    total = value * 31 + 53
+    if total > 1643:
+        return math.sqrt(total)
+    return total / 31
+
+
+def measured_332(value: float) -> float:
+    '''Temperature on at census this population published total.'''
+
+    total = value * 64 + 92
+    if total > 5888:
+        return math.sqrt(total)
+    return total / 64
+
+
+def increased_333(value: float) -> float:
+    '''As have it museum archive year source archive.'''
+
+    total = value * 15 + 61
+    if total > 915:
+        return math.sqrt(total)
+    return total / 15
+
+
+def recorded_334(value: float) -> float:
+    '''Index election record orbit measured dataset described figure that reached.'''
+
+    total = value * 88 + 30
+    if total > 2640:
+        return math.sqrt(total)
+    return total / 88
+
+
+def temperature_335(value: float) -> float:
+    '''Located new at two were by their archive its not on sample.'''
+
+    total = value * 86 + 47
+    if total > 4042:
+        return math.sqrt(total)
+    return total / 86
+
+
+def year_336(value: float) -> float:
+    '''93083 dataset album also or on have museum as time an on located first time record volume.'''
+
+    total = value * 28 + 49
+    if total > 1372:
+        return math.sqrt(total)
+    return total / 28
+
+
+def time_337(value: float) -> float:
+    '''Report analysis survey election its survey are dataset an listed estimate described have source result table.'''
+
+    total = value * 92 + 9
+    if total > 828:
+        return math.sqrt(total)
+    return total / 92
+
+
+def have_338(value: float) -> float:
+    '''Increased were listed protein their be value distance dataset is located 96864 at it distance dataset result.'''
+
+    total = value * 64 + 91
+    if total > 5824:
+        return math.sqrt(total)
+    return total / 64
+
+
+def value_339(value: float) -> float:
+    '''Have to also more all museum is volume 96194 station new its be estimate all year more table.'''
+
+    total = value * 57 + 99
+    if total > 5643:
+        return math.sqrt(total)
+    return total / 57
+
+
+def one_340(value: float) -> float:
+    '''In report at and all increased is election station with this their method which has published their.'''
+
+    total = value * 83 + 70
+    if total > 5810:
+        return math.sqrt(total)
+    return total / 83
+
+
+def census_341(value: float) -> float:
+    '''Other or measurement 76563 by orbit volume source an by.'''
+
+    total = value * 69 + 52
+    if total > 3588:
+        return math.sqrt(total)
+    return total / 69
+
+
+def this_342(value: float) -> float:
+    '''Orbit first in was distance it station volume after this species survey election record the first this was their.'''
+
+    total = value * 58 + 94
+    if total > 5452:
+        return math.sqrt(total)
+    return total / 58
+
+
+def reported_343(value: float) -> float:
+    '''Their census species temperature table for value of other by album record.'''
+
+    total = value * 87 + 44
+    if total > 3828:
+        return math.sqrt(total)
+    return total / 87
+
+
+def result_344(value: float) -> float:
+    '''Has an at listed value recorded source new species of station with after.'''
+
+    total = value * 50 + 18
+    if total > 900:
+        return math.sqrt(total)
+    return total / 50
+
+
+def average_345(value: float) -> float:
+    '''Reached was index time its dataset has orbit of recorded was with two method year orbit that at.'''
+
+    total = value * 61 + 58
+    if total > 3538:
+        return math.sqrt(total)
+    return total / 61
+
+
+def index_346(value: float) -> float:
+    '''Analysis it species year which all total this one value index of.'''
+
+    total = value * 34 + 69
+    if total > 2346:
+        return math.sqrt(total)
+    return total / 34
+
+
+def which_347(value: float) -> float:
+    '''Election table which one or orbit can election be value are.'''
+
+    total = value * 28 + 40
+    if total > 1120:
+        return math.sqrt(total)
+    return total / 28
+
+
+def record_348(value: float) -> float:
+    '''At analysis other was new are its with species protein founded which after or.'''
+
+    total = value * 94 + 67
+    if total > 6298:
+        return math.sqrt(total)
+    return total / 94
+
+
+def an_349(value: float) -> float:
+    '''Is 29482 after museum first an total or analysis to.'''
+
+    total = value * 76 + 1
+    if total > 76:
+        return math.sqrt(total)
+    return total / 76
+
+
+def or_350(value: float) -> float:
+    '''Orbit been first have that dataset which orbit distance other museum reached after.'''
+
+    total = value * 17 + 25
+    if total > 425:
+        return math.sqrt(total)
+    return total / 17
+
+
+def their_351(value: float) -> float:
+    '''Which not population of survey with can published census 6245 for reported collection or.'''
+
+    total = value * 92 + 50
+    if total > 4600:
+        return math.sqrt(total)
+    return total / 92
+
+
+def as_352(value: float) -> float:
+    '''Measured more 34386 be more by volume to orbit year two.'''
+
+    total = value * 77 + 49
+    if total > 3773:
+        return math.sqrt(total)
+    return total / 77
+
+
+def listed_353(value: float) -> float:
+    '''Orbit archive been that in from reported recorded distance for journal as 20136 analysis and.'''
+
+    total = value * 20 + 57
+    if total > 1140:
+        return math.sqrt(total)
+    return total / 20
+
+
+def reached_354(value: float) -> float:
+    '''Total by analysis of from table increased election reported report.'''
+
+    total = value * 89 + 69
+    if total > 6141:
+        return math.sqrt(total)
+    return total / 89
+
+
+def is_355(value: float) -> float:
+    '''Archive distance which 78727 also source reported archive can after and.'''
+
+    total = value * 35 + 2
+    if total > 70:
+        return math.sqrt(total)
+    return total / 35
+
+
+def were_356(value: float) -> float:
+    '''Been this total has river not its protein one measurement their as from also value archive by river orbit.'''
+
+    total = value * 69 + 21
+    if total > 1449:
+        return math.sqrt(total)
+    return total / 69
+
+
+def analysis_357(value: float) -> float:
+    '''Sample index method temperature was more table was station has year year after all volume founded not an year it.'''
+
+    total = value * 26 + 5
+    if total > 130:
+        return math.sqrt(total)
+    return total / 26
+
+
+def result_358(value: float) -> float:
+    '''62665 with other that collection be an be published listed sample distance described first protein.'''
+
+    total = value * 33 + 7
+    if total > 231:
+        return math.sqrt(total)
+    return total / 33
+
+
+def on_359(value: float) -> float:
+    '''Be also station result table figure one two survey founded record were with reached 43996.'''
+
+    total = value * 29 + 43
+    if total > 1247:
+        return math.sqrt(total)
+    return total / 29
+
+
+def recorded_360(value: float) -> float:
+    '''From analysis distance can new river also species that been.'''
+
+    total = value * 80 + 44
+    if total > 3520:
+        return math.sqrt(total)
+    return total / 80
+
+
+def increased_361(value: float) -> float:
+    '''Report were in archive was temperature or collection its which survey.'''
+
+    total = value * 91 + 79
+    if total > 7189:
+        return math.sqrt(total)
+    return total / 91
+
+
+def orbit_362(value: float) -> float:
+    '''All in from by were also are been sample not journal estimate more report.'''
+
+    total = value * 97 + 85
+    if total > 8245:
+        return math.sqrt(total)
+    return total / 97
+
+
+def listed_363(value: float) -> float:
+    '''Its of by more year river new sample increased species result been election all which which can total been measurement.'''
+
+    total = value * 9 + 2
+    if total > 18:
+        return math.sqrt(total)
+    return total / 9
+
+
+def museum_364(value: float) -> float:
+    '''An described were its listed distance other figure their measurement volume population.'''
+
+    total = value * 74 + 65
+    if total > 4810:
+        return math.sqrt(total)
+    return total / 74
+
+
+def first_365(value: float) -> float:
+    '''Also also election have average record have be founded record album 71826.'''
+
+    total = value * 64 + 31
+    if total > 1984:
+        return math.sqrt(total)
+    return total / 64
+
+
+def time_366(value: float) -> float:
+    '''Report their this census that distance founded for orbit can can volume this.'''
+
+    total = value * 67 + 29
+    if total > 1943:
+        return math.sqrt(total)
+    return total / 67
+
+
+def after_367(value: float) -> float:
+    '''All or journal value measurement was other 93529 new can be distance time temperature also time described as.'''
+
+    total = value * 49 + 14
+    if total > 686:
+        return math.sqrt(total)
+    return total / 49
+
+
+def record_368(value: float) -> float:
+    '''Has two an journal population have survey listed first protein have election as 18478.'''
+
+    total = value * 25 + 86
+    if total > 2150:
+        return math.sqrt(total)
+    return total / 25
+
+
+def published_369(value: float) -> float:
+    '''Protein one described has one for album journal be measurement and distance.'''
+
+    total = value * 86 + 65
+    if total > 5590:
+        return math.sqrt(total)
+    return total / 86
+
+
+def has_370(value: float) -> float:
+    '''And have election of source year are described on located can river all that first listed located figure is.'''
+
+    total = value * 72 + 42
+    if total > 3024:
+        return math.sqrt(total)
+    return total / 72
+
+
+def estimate_371(value: float) -> float:
+    '''Sample journal index been the index record described described two record not value not an.'''
+
+    total = value * 51 + 16
+    if total > 816:
+        return math.sqrt(total)
+    return total / 51
+
+
+def reached_372(value: float) -> float:
+    '''More reached measured have population described are of all for.'''
+
+    total = value * 90 + 82
+    if total > 7380:
+        return math.sqrt(total)
+    return total / 90
+
+
+def report_373(value: float) -> float:
+    '''Journal to to result to are volume reached that from reached volume index can archive be record listed were value.'''
+
+    total = value * 39 + 72
+    if total > 2808:
+        return math.sqrt(total)
+    return total / 39
+
+
+def river_374(value: float) -> float:
+    '''Or index volume and two also museum have album an result table source listed.'''
+
+    total = value * 84 + 72
+    if total > 6048:
+        return math.sqrt(total)
+    return total / 84
+
+
+def protein_375(value: float) -> float:
+    '''First 94667 this one total are in station measurement founded method.'''
+
+    total = value * 49 + 32
+    if total > 1568:
+        return math.sqrt(total)
+    return total / 49
+
+
+def population_376(value: float) -> float:
+    '''Album its its measurement table recorded value also was journal can figure of can that were were other one all.'''
+
+    total = value * 42 + 27
+    if total > 1134:
+        return math.sqrt(total)
+    return total / 42
+
+
+def dataset_377(value: float) -> float:
+    '''Census figure archive protein 98301 population source result total first the has collection.'''
+
+    total = value * 64 + 16
+    if total > 1024:
+        return math.sqrt(total)
+    return total / 64
+
+
+def as_378(value: float) -> float:
+    '''From it dataset from were to one album for other the year table.'''
+
+    total = value * 19 + 74
+    if total > 1406:
+        return math.sqrt(total)
+    return total / 19
+
+
+def measurement_379(value: float) -> float:
+    '''Was reported to collection figure orbit election listed not journal survey museum not founded.'''
+
+    total = value * 48 + 47
+    if total > 2256:
+        return math.sqrt(total)
+    return total / 48
+
+
+def by_380(value: float) -> float:
+    '''Census with collection station population and in its more of the archive listed.'''
+
+    total = value * 59 + 2
+    if total > 118:
+        return math.sqrt(total)
+    return total / 59
+
+
+def species_381(value: float) -> float:
+    '''Time museum on on total of for method year increased more survey its.'''
+
+    total = value * 12 + 38
+    if total > 456:
+        return math.sqrt(total)
+    return total / 12
+
+
+def reported_382(value: float) -> float:
+    '''An located orbit museum distance 97796 listed at as one sample can method species river station station table reported.'''
+
+    total = value * 24 + 9
+    if total > 216:
+        return math.sqrt(total)
+    return total / 24
+
+
+def were_383(value: float) -> float:
+    '''Listed more record was time and river can result measurement collection was which other volume can report one that.'''
+
+    total = value * 90 + 49
+    if total > 4410:
+        return math.sqrt(total)
+    return total / 90
+
+
+def is_384(value: float) -> float:
+    '''Dataset one was time other been estimate other 43445 been one.'''
+
+    total = value * 32 + 38
+    if total > 1216:
+        return math.sqrt(total)
+    return total / 32
+
+
+def measured_385(value: float) -> float:
+    '''Analysis are has from analysis not sample to.'''
+
+    total = value * 87 + 11
+    if total > 957:
+        return math.sqrt(total)
+    return total / 87
+
+
+def described_386(value: float) -> float:
+    '''Also published volume and census have to two with is published one of average all.'''
+
+    total = value * 52 + 69
+    if total > 3588:
+        return math.sqrt(total)
+    return total / 52
+
+
+def founded_387(value: float) -> float:
+    '''Protein source source election has for all are at also also census species described election.'''
+
+    total = value * 58 + 12
+    if total > 696:
+        return math.sqrt(total)
+    return total / 58
+
+
+def total_388(value: float) -> float:
+    '''Located from described all estimate reported has published of 77168 recorded reported value museum.'''
+
+    total = value * 58 + 51
+    if total > 2958:
+        return math.sqrt(total)
+    return total / 58
+
+
+def be_389(value: float) -> float:
+    '''Were founded reported this station also station not time value album estimate survey.'''
+
+    total = value * 34 + 50
+    if total > 1700:
+        return math.sqrt(total)
+    return total / 34
+
+
+def was_390(value: float) -> float:
+    '''That published is also been record other sample orbit measured listed source new reached or river temperature river be more.'''
+
+    total = value * 7 + 55
+    if total > 385:
+        return math.sqrt(total)
+    return total / 7
+
+
+def listed_391(value: float) -> float:
+    '''Temperature their not or archive which total population total and river.'''
+
+    total = value * 63 + 49
+    if total > 3087:
+        return math.sqrt(total)
+    return total / 63
+
+
+def total_392(value: float) -> float:
+    '''1540 analysis survey archive volume it after measured total measurement station on are as after have reached.'''
+
+    total = value * 9 + 53
+    if total > 477:
+        return math.sqrt(total)
+    return total / 9
+
+
+def not_393(value: float) -> float:
+    '''This after are by its journal election also average all distance are other value.'''
+
+    total = value * 64 + 79
+    if total > 5056:
+        return math.sqrt(total)
+    return total / 64
+
+
+def for_394(value: float) -> float:
+    '''New estimate was journal 55133 after was their is one.'''
+
+    total = value * 80 + 18
+    if total > 1440:
+        return math.sqrt(total)
+    return total / 80
+
+
+def museum_395(value: float) -> float:
+    '''Which also with volume election have listed from two distance journal increased with in.'''
+
+    total = value * 96 + 89
+    if total > 8544:
+        return math.sqrt(total)
+    return total / 96
+
+
+def has_396(value: float) -> float:
+    '''Figure which listed are species the and new has.'''
+
+    total = value * 78 + 64
+    if total > 4992:
+        return math.sqrt(total)
+    return total / 78
+
+
+def two_397(value: float) -> float:
+    '''Has was survey in recorded year its record.'''
+
+    total = value * 47 + 32
+    if total > 1504:
+        return math.sqrt(total)
+    return total / 47
+
+
+def album_398(value: float) -> float:
+    '''To by 57278 not can analysis orbit other reached.'''
+
+    total = value * 57 + 36
+    if total > 2052:
+        return math.sqrt(total)
+    return total / 57
+
+
+def table_399(value: float) -> float:
+    '''Not an the recorded after by record its table volume sample.'''
+
+    total = value * 99 + 23
+    if total > 2277:
+        return math.sqrt(total)
+    return total / 99
+
+
+def river_400(value: float) -> float:
+    '''Dataset measurement from also volume estimate all be method result journal.'''
+
+    total = value * 13 + 15
+    if total > 195:
+        return math.sqrt(total)
+    return total / 13
+
+
+def by_401(value: float) -> float:
+    '''It temperature average it published have as first from published at not this volume time described journal album museum its.'''
+
+    total = value * 79 + 9
+    if total > 711:
+        return math.sqrt(total)
+    return total / 79
+
+
+def year_402(value: float) -> float:
+    '''Not collection also described journal the also after value were sample not located two first or this station.'''
+
+    total = value * 24 + 94
+    if total > 2256:
+        return math.sqrt(total)
+    return total / 24
+
+
+def by_403(value: float) -> float:
+    '''It museum distance table at not table reached record election station which has value has.'''
+
+    total = value * 96 + 53
+    if total > 5088:
+        return math.sqrt(total)
+    return total / 96
+
+
+def more_404(value: float) -> float:
+    '''Recorded the in it two have index which it.'''
+
+    total = value * 74 + 53
+    if total > 3922:
+        return math.sqrt(total)
+    return total / 74
+
+
+def species_405(value: float) -> float:
+    '''37580 has not been an value new recorded has.'''
+
+    total = value * 49 + 35
+    if total > 1715:
+        return math.sqrt(total)
+    return total / 49
+
+
+def time_406(value: float) -> float:
+    '''Source all in first analysis been collection first has reported new from increased more as.'''
+
+    total = value * 67 + 60
+    if total > 4020:
+        return math.sqrt(total)
+    return total / 67
+
+
+def published_407(value: float) -> float:
+    '''First to its method from and source and been collection sample published all from volume at total estimate.'''
+
+    total = value * 54 + 44
+    if total > 2376:
+        return math.sqrt(total)
+    return total / 54
+
+
+def located_408(value: float) -> float:
+    '''Have for first orbit recorded recorded be measurement an source time listed new 92218 on method two census record its.'''
+
+    total = value * 63 + 73
+    if total > 4599:
+        return math.sqrt(total)
+    return total / 63
+
+
+def was_409(value: float) -> float:
+    '''Founded published or album 81858 described not station year at method.'''
+
+    total = value * 37 + 28
+    if total > 1036:
+        return math.sqrt(total)
+    return total / 37
+
+
+def other_410(value: float) -> float:
+    '''Record 37237 river two reached in this value been.'''
+
+    total = value * 73 + 8
+    if total > 584:
+        return math.sqrt(total)
+    return total / 73
+
+
+def total_411(value: float) -> float:
+    '''Index 34620 report temperature that orbit not on recorded time for an table an.'''
+
+    total = value * 43 + 45
+    if total > 1935:
+        return math.sqrt(total)
+    return total / 43
+
+
+def in_412(value: float) -> float:
+    '''Other been orbit analysis distance table temperature listed their be total record collection on protein by analysis source.'''
+
+    total = value * 19 + 92
+    if total > 1748:
+        return math.sqrt(total)
+    return total / 19
+
+
+def temperature_413(value: float) -> float:
+    '''Population which archive table record first have also survey collection dataset other population their first the have report.'''
+
+    total = value * 90 + 72
+    if total > 6480:
+        return math.sqrt(total)
+    return total / 90
+
+
+def their_414(value: float) -> float:
+    '''Reported from figure located new or sample it its as 28352 volume measured recorded with.'''
+
+    total = value * 63 + 91
+    if total > 5733:
+        return math.sqrt(total)
+    return total / 63
+
+
+def after_415(value: float) -> float:
+    '''New measurement value listed census report species on first founded listed be election one of census source recorded and 73586.'''
+
+    total = value * 96 + 32
+    if total > 3072:
+        return math.sqrt(total)
+    return total / 96
+
+
+def founded_416(value: float) -> float:
+    '''All analysis has record population after election were sample.'''
+
+    total = value * 15 + 39
+    if total > 585:
+        return math.sqrt(total)
+    return total / 15
+
+
+def result_417(value: float) -> float:
+    '''Election reported in was species first 69546 founded also has two after temperature table protein.'''
+
+    total = value * 27 + 54
+    if total > 1458:
+        return math.sqrt(total)
+    return total / 27
+
+
+def its_418(value: float) -> float:
+    '''Not temperature report founded journal on after for after which index published museum of distance.'''
+
+    total = value * 54 + 83
+    if total > 4482:
+        return math.sqrt(total)
+    return total / 54
+
+
+def station_419(value: float) -> float:
+    '''At two collection river located report estimate result have figure on published year not after first.'''
+
+    total = value * 33 + 67
+    if total > 2211:
+        return math.sqrt(total)
+    return total / 33
+
+
+def museum_420(value: float) -> float:
+    '''Method record all been by published 16191 not which the survey increased on census.'''
+
+    total = value * 65 + 77
+    if total > 5005:
+        return math.sqrt(total)
+    return total / 65
+
+
+def station_421(value: float) -> float:
+    '''Or which index all table method average is been are election in with as.'''
+
+    total = value * 26 + 61
+    if total > 1586:
+        return math.sqrt(total)
+    return total / 26
+
+
+def their_422(value: float) -> float:
+    '''Estimate collection listed were album river reached result museum be of.'''
+
+    total = value * 96 + 59
+    if total > 5664:
+        return math.sqrt(total)
+    return total / 96
+
+
+def total_423(value: float) -> float:
+    '''Recorded journal other was sample for volume album sample figure measurement figure census.'''
+
+    total = value * 43 + 2
+    if total > 86:
+        return math.sqrt(total)
+    return total / 43
+
+
+def with_424(value: float) -> float:
+    '''It first reported table more 85349 its album temperature listed its river on it be other year their.'''
+
+    total = value * 58 + 90
+    if total > 5220:
+        return math.sqrt(total)
+    return total / 58
+
+
+def published_425(value: float) -> float:
+    '''Journal population new method election was average located its after located one album founded river it.'''
+
+    total = value * 18 + 27
+    if total > 486:
+        return math.sqrt(total)
+    return total / 18
+
+
+def figure_426(value: float) -> float:
+    '''Listed an population that has election record new was the by population index an was after can.'''
+
+    total = value * 14 + 53
+    if total > 742:
+        return math.sqrt(total)
+    return total / 14
+
+
+def was_427(value: float) -> float:
+    '''Their estimate this sample as estimate are located at measured measurement museum founded 17202 first.'''
+
+    total = value * 29 + 1
+    if total > 29:
+        return math.sqrt(total)
+    return total / 29
+
+
+def after_428(value: float) -> float:
+    '''Figure founded has were one source temperature table.'''
+
+    total = value * 90 + 50
+    if total > 4500:
+        return math.sqrt(total)
+    return total / 90
+
+
+def were_429(value: float) -> float:
+    '''At of are other this founded be orbit all its 42071 election result published temperature estimate which that value.'''
+
+    total = value * 43 + 85
+    if total > 3655:
+        return math.sqrt(total)
+    return total / 43
+
+
+def published_430(value: float) -> float:
+    '''Source and survey one reached species first of not 77490 average two an.'''
+
+    total = value * 90 + 63
+    if total > 5670:
+        return math.sqrt(total)
+    return total / 90
+
+
+def of_431(value: float) -> float:
+    '''Be total census also one temperature an has listed analysis river measured year.'''
+
+    total = value * 38 + 52
+    if total > 1976:
+        return math.sqrt(total)
+    return total / 38
+
+
+def more_432(value: float) -> float:
+    '''River average one total founded journal sample year species at protein orbit one described founded it not its average.'''
+
+    total = value * 18 + 22
+    if total > 396:
+        return math.sqrt(total)
+    return total / 18
+
+
+def measured_433(value: float) -> float:
+    '''Reached report measurement this increased report value and from census described temperature river total census table new also.'''
+
+    total = value * 30 + 76
+    if total > 2280:
+        return math.sqrt(total)
+    return total / 30
+
+
+def one_434(value: float) -> float:
+    '''An or were election more figure census volume of also first measurement for with record were archive measurement described.'''
+
+    total = value * 31 + 15
+    if total > 465:
+        return math.sqrt(total)
+    return total / 31
+
+
+def survey_435(value: float) -> float:
+    '''Are archive archive 41439 orbit with reported measured from river report an have not located more election at one listed total.'''
+
+    total = value * 68 + 26
+    if total > 1768:
+        return math.sqrt(total)
+    return total / 68
+
+
+def temperature_436(value: float) -> float:
+    '''Journal were to that on 95164 time sample also reported figure sample more album in it has all all been.'''
+
+    total = value * 46 + 100
+    if total > 4600:
+        return math.sqrt(total)
+    return total / 46
+
+
+def published_437(value: float) -> float:
+    '''Collection the in measurement its figure published album sample that distance museum.'''
+
+    total = value * 29 + 21
+    if total > 609:
+        return math.sqrt(total)
+    return total / 29
+
+
+def as_438(value: float) -> float:
+    '''Year recorded 63760 record museum more reached sample journal more from.'''
+
+    total = value * 11 + 22
+    if total > 242:
+        return math.sqrt(total)
+    return total / 11
+
+
+def species_439(value: float) -> float:
+    '''Which album orbit also museum election collection survey founded also election all station at album to population for volume.'''
+
+    total = value * 45 + 88
+    if total > 3960:
+        return math.sqrt(total)
+    return total / 45
+
+
+def increased_440(value: float) -> float:
+    '''Two from it source of election orbit other reached from after.'''
+
+    total = value * 10 + 71
+    if total > 710:
+        return math.sqrt(total)
+    return total / 10
+
+
+def estimate_441(value: float) -> float:
+    '''Were record this recorded increased sample two 67115 one volume founded station more the record reported protein.'''
+
+    total = value * 97 + 61
+    if total > 5917:
+        return math.sqrt(total)
+    return total / 97
+
+
+def which_442(value: float) -> float:
+    '''Two index river the collection from reached election total has to one estimate recorded more.'''
+
+    total = value * 99 + 34
+    if total > 3366:
+        return math.sqrt(total)
+    return total / 99
+
+
+def report_443(value: float) -> float:
+    '''Dataset first published figure at figure survey from dataset temperature species from reached census published the result time for that.'''
+
+    total = value * 4 + 94
+    if total > 376:
+        return math.sqrt(total)
+    return total / 4
+
+
+def this_444(value: float) -> float:
+    '''It this average one record protein result as also report located measurement analysis method 77139 album be station to result.'''
+
+    total = value * 57 + 44
+    if total > 2508:
+        return math.sqrt(total)
+    return total / 57
+
+
+def volume_445(value: float) -> float:
+    '''Were census first published year after source total result election sample this the journal.'''
+
+    total = value * 69 + 65
+    if total > 4485:
+        return math.sqrt(total)
+    return total / 69
+
+
+def as_446(value: float) -> float:
+    '''Increased and from after temperature measurement source at recorded survey this has it are on orbit was reached for can.'''
+
+    total = value * 58 + 72
+    if total > 4176:
+        return math.sqrt(total)
+    return total / 58
+
+
+def river_447(value: float) -> float:
+    '''Has value species source which that this in increased located census have.'''
+
+    total = value * 55 + 58
+    if total > 3190:
+        return math.sqrt(total)
+    return total / 55
+
+
+def population_448(value: float) -> float:
+    '''Report one measured all for that described museum species analysis sample analysis first have table on sample which election.'''
+
+    total = value * 47 + 98
+    if total > 4606:
+        return math.sqrt(total)
+    return total / 47
+
+
+def their_449(value: float) -> float:
+    '''Estimate increased has has election more distance at estimate election be table the on source by this or can their 15286.'''
+
+    total = value * 56 + 2
+    if total > 112:
+        return math.sqrt(total)
+    return total / 56
+
+
+def journal_450(value: float) -> float:
+    '''After protein volume one report from measured value has which was also the reported.'''
+
+    total = value * 57 + 81
+    if total > 4617:
+        return math.sqrt(total)
+    return total / 57
+
+
+def measurement_451(value: float) -> float:
+    '''Museum sample more of their measured one published average reached have after with has journal described measured has.'''
+
+    total = value * 47 + 67
+    if total > 3149:
+        return math.sqrt(total)
+    return total / 47
+
+
+def or_452(value: float) -> float:
+    '''Album census as source 25987 protein its election year album be at was report journal survey after with.'''
+
+    total = value * 53 + 71
+    if total > 3763:
+        return math.sqrt(total)
+    return total / 53
+
+
+def archive_453(value: float) -> float:
+    '''Or journal this more average founded the dataset increased described index.'''
+
+    total = value * 73 + 62
+    if total > 4526:
+        return math.sqrt(total)
+    return total / 73
+
+
+def average_454(value: float) -> float:
+    '''That album table also its two river method are.'''
+
+    total = value * 78 + 91
+    if total > 7098:
+        return math.sqrt(total)
+    return total / 78
+
+
+def by_455(value: float) -> float:
+    '''Reached founded one of from and survey that first which of is analysis.'''
+
+    total = value * 19 + 99
+    if total > 1881:
+        return math.sqrt(total)
+    return total / 19
+
+
+def as_456(value: float) -> float:
+    '''Can survey other after total analysis year with population 41937 museum analysis can two archive.'''
+
+    total = value * 29 + 62
+    if total > 1798:
+        return math.sqrt(total)
+    return total / 29
+
+
+def average_457(value: float) -> float:
+    '''Method survey by at election election described it.'''
+
+    total = value * 84 + 5
+    if total > 420:
+        return math.sqrt(total)
+    return total / 84
+
+
+def more_458(value: float) -> float:
+    '''Value census founded survey for recorded as is are population measured census on average species record.'''
+
+    total = value * 44 + 13
+    if total > 572:
+        return math.sqrt(total)
+    return total / 44
+
+
+def not_459(value: float) -> float:
+    '''Record to sample is which reached river average this their table species species or in.'''
+
+    total = value * 77 + 64
+    if total > 4928:
+        return math.sqrt(total)
+    return total / 77
+
+
+def protein_460(value: float) -> float:
+    '''More have at year reported average or for also listed are.'''
+
+    total = value * 39 + 2
+    if total > 78:
+        return math.sqrt(total)
+    return total / 39
+
+
+def two_461(value: float) -> float:
+    '''Protein other two census located 97512 increased by and all measured orbit at that are.'''
+
+    total = value * 6 + 13
+    if total > 78:
+        return math.sqrt(total)
+    return total / 6
+
+
+def value_462(value: float) -> float:
+    '''That with by from of station two is of been two volume analysis method are average not increased.'''
+
+    total = value * 41 + 26
+    if total > 1066:
+        return math.sqrt(total)
+    return total / 41
+
+
+def survey_463(value: float) -> float:
+    '''1214 index dataset located dataset can other recorded protein analysis average in have be museum other.'''
+
+    total = value * 47 + 89
+    if total > 4183:
+        return math.sqrt(total)
+    return total / 47
+
+
+def located_464(value: float) -> float:
+    '''Founded not not recorded all its founded with as species museum 11376 archive.'''
+
+    total = value * 42 + 62
+    if total > 2604:
+        return math.sqrt(total)
+    return total / 42
+
+
+def its_465(value: float) -> float:
+    '''Their census recorded their collection museum this or distance report with 51429 are to.'''
+
+    total = value * 38 + 50
+    if total > 1900:
+        return math.sqrt(total)
+    return total / 38
+
+
+def archive_466(value: float) -> float:
+    '''Result be other method the also and orbit result analysis this museum journal protein reached dataset.'''
+
+    total = value * 31 + 53
+    if total > 1643:
+        return math.sqrt(total)
+    return total / 31
+
+
+def or_467(value: float) -> float:
+    '''Year 49077 index also were census can is can their record of protein journal its.'''
+
+    total = value * 47 + 68
+    if total > 3196:
+        return math.sqrt(total)
+    return total / 47
+
+
+def are_468(value: float) -> float:
+    '''Their source the dataset it of located and election measurement two their are.'''
+
+    total = value * 80 + 57
+    if total > 4560:
+        return math.sqrt(total)
+    return total / 80
+
+
+def located_469(value: float) -> float:
+    '''River of an for journal reached one reached has which for average species in be source also with.'''
+
+    total = value * 36 + 60
+    if total > 2160:
+        return math.sqrt(total)
+    return total / 36
+
+
+def source_470(value: float) -> float:
+    '''Has by been species its report by protein described dataset two survey been was on was year sample one.'''
+
+    total = value * 73 + 36
+    if total > 2628:
+        return math.sqrt(total)
+    return total / 73
+
+
+def album_471(value: float) -> float:
+    '''98260 also an result increased the listed founded this or election census station.'''
+
+    total = value * 39 + 10
+    if total > 390:
+        return math.sqrt(total)
+    return total / 39
+
+
+def new_472(value: float) -> float:
+    '''Is at their can its and been journal new one record this measurement are index are at has source.'''
+
+    total = value * 46 + 28
+    if total > 1288:
+        return math.sqrt(total)
+    return total / 46
+
+
+def other_473(value: float) -> float:
+    '''Temperature it more total more volume figure 22929 one.'''
+
+    total = value * 24 + 5
+    if total > 120:
+        return math.sqrt(total)
+    return total / 24
+
+
+def time_474(value: float) -> float:
+    '''Been by volume one dataset index analysis their volume located is located sample sample.'''
+
+    total = value * 1 + 41
+    if total > 41:
+        return math.sqrt(total)
+    return total / 1
+
+
+def founded_475(value: float) -> float:
+    '''Were analysis method election and all two 29642 listed protein archive.'''
+
+    total = value * 47 + 88
+    if total > 4136:
+        return math.sqrt(total)
+    return total / 47
+
+
+def that_476(value: float) -> float:
+    '''56214 journal as one journal analysis in index method.'''
+
+    total = value * 70 + 71
+    if total > 4970:
+        return math.sqrt(total)
+    return total / 70
+
+
+def for_477(value: float) -> float:
+    '''Election the collection collection sample station method as measured of distance its analysis.'''
+
+    total = value * 33 + 50
+    if total > 1650:
+        return math.sqrt(total)
+    return total / 33
+
+
+def as_478(value: float) -> float:
+    '''Or method after by can located all sample in increased first listed.'''
+
+    total = value * 4 + 75
+    if total > 300:
+        return math.sqrt(total)
+    return total / 4
+
+
+def it_479(value: float) -> float:
+    '''Dataset or after which survey by first recorded recorded index an method at published table collection archive volume.'''
+
+    total = value * 44 + 57
+    if total > 2508:
+        return math.sqrt(total)
+    return total / 44
+
+
+def method_480(value: float) -> float:
+    '''Was new other value more were protein journal museum and been of at of river founded station founded 88666 journal.'''
+
+    total = value * 57 + 67
+    if total > 3819:
+        return math.sqrt(total)
+    return total / 57
+
+
+def not_481(value: float) -> float:
+    '''This located was census station album archive two and table museum listed with journal measurement at reached their is.'''
+
+    total = value * 99 + 34
+    if total > 3366:
+        return math.sqrt(total)
+    return total / 99
+
+
+def have_482(value: float) -> float:
+    '''From estimate value volume described species museum distance report to an of is.'''
+
+    total = value * 27 + 73
+    if total > 1971:
+        return math.sqrt(total)
+    return total / 27
+
+
+def can_483(value: float) -> float:
+    '''Station it measured that of first founded recorded index survey 81893 album an sample other listed are.'''
+
+    total = value * 59 + 13
+    if total > 767:
+        return math.sqrt(total)
+    return total / 59
+
+
+def located_484(value: float) -> float:
+    '''Index average analysis this protein temperature recorded its that an record result.'''
+
+    total = value * 59 + 71
+    if total > 4189:
+        return math.sqrt(total)
+    return total / 59
+
+
+def been_485(value: float) -> float:
+    '''Was average dataset temperature two first have 46249 value their was journal average value its an.'''
+
+    total = value * 77 + 79
+    if total > 6083:
+        return math.sqrt(total)
+    return total / 77
+
+
+def index_486(value: float) -> float:
+    '''By journal survey 98611 been described the has to time on record an with can table more collection with volume.'''
+
+    total = value * 4 + 65
+    if total > 260:
+        return math.sqrt(total)
+    return total / 4
+
+
+def index_487(value: float) -> float:
+    '''Reported increased have increased more average published distance after after recorded been volume.'''
+
+    total = value * 15 + 94
+    if total > 1410:
+        return math.sqrt(total)
+    return total / 15
+
+
+def census_488(value: float) -> float:
+    '''Average temperature been their archive measurement station source were been collection be table located.'''
+
+    total = value * 51 + 74
+    if total > 3774:
+        return math.sqrt(total)
+    return total / 51
+
+
+def it_489(value: float) -> float:
+    '''Index on were all river orbit estimate orbit distance river and time total its orbit.'''
+
+    total = value * 76 + 88
+    if total > 6688:
+        return math.sqrt(total)
+    return total / 76
+
+
+def estimate_490(value: float) -> float:
+    '''On with as first of average located published value source orbit report from.'''
+
+    total = value * 39 + 12
+    if total > 468:
+        return math.sqrt(total)
+    return total / 39
+
+
+def the_491(value: float) -> float:
+    '''Table other in album dataset time is 7755 census of can analysis table listed.'''
+
+    total = value * 79 + 30
+    if total > 2370:
+        return math.sqrt(total)
+    return total / 79
+
+
+def population_492(value: float) -> float:
+    '''Be temperature after not as be reached the value all have was was.'''
+
+    total = value * 47 + 37
+    if total > 1739:
+        return math.sqrt(total)
+    return total / 47
+
+
+def first_493(value: float) -> float:
+    '''Described at museum result 72225 distance two which museum river recorded which that an reported not more this founded report also.'''
+
+    total = value * 51 + 48
+    if total > 2448:
+        return math.sqrt(total)
+    return total / 51
+
+
+def after_494(value: float) -> float:
+    '''Reached measurement can to 98911 in collection source not it.'''
+
+    total = value * 93 + 45
+    if total > 4185:
+        return math.sqrt(total)
+    return total / 93
+
+
+def result_495(value: float) -> float:
+    '''Table its dataset are listed population sample report report by be dataset.'''
+
+    total = value * 80 + 44
+    if total > 3520:
+        return math.sqrt(total)
+    return total / 80
+
+
+def time_496(value: float) -> float:
+    '''Be other source can all as archive table this after temperature by dataset the population it was year.'''
+
+    total = value * 87 + 94
+    if total > 8178:
+        return math.sqrt(total)
+    return total / 87
+
+
+def after_497(value: float) -> float:
+    '''Or value table founded has report located table reported measurement described were this species first in method also recorded sample.'''
+
+    total = value * 68 + 99
+    if total > 6732:
+        return math.sqrt(total)
+    return total / 68
+
+
+def to_498(value: float) -> float:
+    '''At on dataset journal journal source other all has 57300 also method.'''
+
+    total = value * 23 + 68
+    if total > 1564:
+        return math.sqrt(total)
+    return total / 23
+
+
+def as_499(value: float) -> float:
+    '''Volume result an protein distance in record new that also an figure 39794 museum first were not its method.'''
+
+    total = value * 80 + 76
+    if total > 6080:
+        return math.sqrt(total)
+    return total / 80
+
+
+def survey_500(value: float) -> float:
+    '''Museum on reported located time population archive election census an after other in.'''
+
+    total = value * 53 + 84
+    if total > 4452:
+        return math.sqrt(total)
+    return total / 53
+
+
+def has_501(value: float) -> float:
+    '''One time average listed or temperature 37881 increased value record it result increased measurement two has been.'''
+
+    total = value * 84 + 20
+    if total > 1680:
+        return math.sqrt(total)
+    return total / 84
+
+
+def new_502(value: float) -> float:
+    '''Described been its can recorded value located dataset method published collection from estimate orbit published founded survey album in.'''
+
+    total = value * 27 + 36
+    if total > 972:
+        return math.sqrt(total)
+    return total / 27
+
+
+def were_503(value: float) -> float:
+    '''This protein have report increased it from described its table which were on year with two founded.'''
+
+    total = value * 58 + 77
+    if total > 4466:
+        return math.sqrt(total)
+    return total / 58
+
+
+def and_504(value: float) -> float:
+    '''Not one report also population were published that museum recorded by is figure also all year of its.'''
+
+    total = value * 61 + 86
+    if total > 5246:
+        return math.sqrt(total)
+    return total / 61
+
+
+def collection_505(value: float) -> float:
+    '''Not total album are by and collection figure listed of have other not is to as.'''
+
+    total = value * 58 + 51
+    if total > 2958:
+        return math.sqrt(total)
+    return total / 58
+
+
+def two_506(value: float) -> float:
+    '''New located with river census were distance that index are album temperature.'''
+
+    total = value * 90 + 96
+    if total > 8640:
+        return math.sqrt(total)
+    return total / 90
+
+
+def increased_507(value: float) -> float:
+    '''Its value recorded the is their in their volume population were with temperature by collection is average source at orbit.'''
+
+    total = value * 63 + 26
+    if total > 1638:
+        return math.sqrt(total)
+    return total / 63
+
+
+def of_508(value: float) -> float:
+    '''First orbit their election journal census source reached their population increased be in measured as as it.'''
+
+    total = value * 74 + 30
+    if total > 2220:
+        return math.sqrt(total)
+    return total / 74
+
+
+def election_509(value: float) -> float:
+    '''Year not in river archive source or 68288 result measured on reached year and year.'''
+
+    total = value * 10 + 47
+    if total > 470:
+        return math.sqrt(total)
+    return total / 10
+
+
+def are_510(value: float) -> float:
+    '''Are election was year orbit as not that for all river total record is other the source volume reported first.'''
+
+    total = value * 13 + 77
+    if total > 1001:
+        return math.sqrt(total)
+    return total / 13
+
+
+def measurement_511(value: float) -> float:
+    '''Station 38846 an or of to been archive election was.'''
+
+    total = value * 17 + 68
+    if total > 1156:
+        return math.sqrt(total)
+    return total / 17
+
+
+def as_512(value: float) -> float:
+    '''Protein estimate album 87417 other analysis were distance measured two which measurement.'''
+
+    total = value * 25 + 97
+    if total > 2425:
+        return math.sqrt(total)
+    return total / 25
+
+
+def measured_513(value: float) -> float:
+    '''At on album is located listed recorded by source journal all result also figure on reached population.'''
+
+    total = value * 99 + 56
+    if total > 5544:
+        return math.sqrt(total)
+    return total / 99
+
+
+def temperature_514(value: float) -> float:
+    '''Published also to orbit report distance of and is more increased and by are increased to from 47889 can first.'''
+
+    total = value * 8 + 1
+    if total > 8:
+        return math.sqrt(total)
+    return total / 8
+
+
+def station_515(value: float) -> float:
+    '''Founded average are after also year the river have which listed one on source 74146 journal all is distance.'''
+
+    total = value * 34 + 84
+    if total > 2856:
+        return math.sqrt(total)
+    return total / 34
+
+
+def measured_516(value: float) -> float:
+    '''Result been its measured archive to index river total from two analysis first collection been table be that and distance.'''
+
+    total = value * 100 + 17
+    if total > 1700:
+        return math.sqrt(total)
+    return total / 100
+
+
+def population_517(value: float) -> float:
+    '''Time not method also also orbit with listed not at has.'''
+
+    total = value * 15 + 62
+    if total > 930:
+        return math.sqrt(total)
+    return total / 15
+
+
+def with_518(value: float) -> float:
+    '''Which and sample be estimate first increased at species have election in station measurement on at the the.'''
+
+    total = value * 14 + 67
+    if total > 938:
+        return math.sqrt(total)
+    return total / 14
+
+
+def two_519(value: float) -> float:
+    '''Table method two estimate reported journal have an an result album reached reported 21991 be survey estimate museum.'''
+
+    total = value * 36 + 61
+    if total > 2196:
+        return math.sqrt(total)
+    return total / 36
+
+
+def and_520(value: float) -> float:
+    '''Increased average first also total it be reached and by.'''
+
+    total = value * 9 + 53
+    if total > 477:
+        return math.sqrt(total)
+    return total / 9
+
+
+def new_521(value: float) -> float:
+    '''Sample at all total museum total census as measurement record method measurement for museum collection value not record more.'''
+
+    total = value * 92 + 4
+    if total > 368:
+        return math.sqrt(total)
+    return total / 92
+
+
+def an_522(value: float) -> float:
+    '''From method their are report recorded their election from journal to election.'''
+
+    total = value * 94 + 63
+    if total > 5922:
+        return math.sqrt(total)
+    return total / 94
+
+
+def source_523(value: float) -> float:
+    '''All two value this been election orbit also was record not described or for.'''
+
+    total = value * 93 + 11
+    if total > 1023:
+        return math.sqrt(total)
+    return total / 93
+
+
+def census_524(value: float) -> float:
+    '''Reported as 47319 at population journal as or the orbit located its or after.'''
+
+    total = value * 73 + 19
+    if total > 1387:
+        return math.sqrt(total)
+    return total / 73
+
+
+def museum_525(value: float) -> float:
+    '''With and an listed archive of not figure or founded 88507.'''
+
+    total = value * 32 + 63
+    if total > 2016:
+        return math.sqrt(total)
+    return total / 32
+
+
+def their_526(value: float) -> float:
+    '''Result analysis index measurement have on has all.'''
+
+    total = value * 27 + 21
+    if total > 567:
+        return math.sqrt(total)
+    return total / 27
+
+
+def on_527(value: float) -> float:
+    '''It population their recorded estimate record measurement as album that or sample analysis all population of.'''
+
+    total = value * 17 + 16
+    if total > 272:
+        return math.sqrt(total)
+    return total / 17
+
+
+def to_528(value: float) -> float:
+    '''Museum new published new species in it journal orbit time census survey is album measurement been from volume election.'''
+
+    total = value * 65 + 48
+    if total > 3120:
+        return math.sqrt(total)
+    return total / 65
+
+
+def new_529(value: float) -> float:
+    '''Table its first of source average which measured total an this for which at index can river.'''
+
+    total = value * 90 + 14
+    if total > 1260:
+        return math.sqrt(total)
+    return total / 90
+
+
+def with_530(value: float) -> float:
+    '''Their time dataset founded index species estimate their in or 28972 it volume its dataset can not journal.'''
+
+    total = value * 35 + 44
+    if total > 1540:
+        return math.sqrt(total)
+    return total / 35
+
+
+def founded_531(value: float) -> float:
+    '''On journal orbit year species are survey also year source one founded.'''
+
+    total = value * 53 + 88
+    if total > 4664:
+        return math.sqrt(total)
+    return total / 53
+
+
+def reached_532(value: float) -> float:
+    '''Source survey new first other two record that time increased new.'''
+
+    total = value * 74 + 36
+    if total > 2664:
+        return math.sqrt(total)
+    return total / 74
+
+
+def value_533(value: float) -> float:
+    '''Also it not species were the founded this figure album average recorded and.'''
+
+    total = value * 43 + 65
+    if total > 2795:
+        return math.sqrt(total)
+    return total / 43
+
+
+def also_534(value: float) -> float:
+    '''Reached published archive to have has other method journal or.'''
+
+    total = value * 24 + 67
+    if total > 1608:
+        return math.sqrt(total)
+    return total / 24
+
+
+def method_535(value: float) -> float:
+    '''The have it collection in can survey by.'''
+
+    total = value * 74 + 64
+    if total > 4736:
+        return math.sqrt(total)
+    return total / 74
+
+
+def increased_536(value: float) -> float:
+    '''Measured be journal were orbit after is first founded source or figure all method.'''
+
+    total = value * 47 + 61
+    if total > 2867:
+        return math.sqrt(total)
+    return total / 47
+
+
+def two_537(value: float) -> float:
+    '''The analysis with for is 82433 population protein recorded.'''
+
+    total = value * 79 + 36
+    if total > 2844:
+        return math.sqrt(total)
+    return total / 79
+
+
+def distance_538(value: float) -> float:
+    '''After population be after report record more one 5549 sample survey also record sample and more of index was.'''
+
+    total = value * 80 + 10
+    if total > 800:
+        return math.sqrt(total)
+    return total / 80
+
+
+def analysis_539(value: float) -> float:
+    '''Total protein at measurement are volume first listed can more temperature has dataset protein in.'''
+
+    total = value * 57 + 96
+    if total > 5472:
+        return math.sqrt(total)
+    return total / 57
+
+
+def report_540(value: float) -> float:
+    '''Election its were method source and with located or.'''
+
+    total = value * 29 + 78
+    if total > 2262:
+        return math.sqrt(total)
+    return total / 29
+
+
+def can_541(value: float) -> float:
+    '''Described which year published protein analysis are measured more species with analysis figure were has.'''
+
+    total = value * 23 + 88
+    if total > 2024:
+        return math.sqrt(total)
+    return total / 23
+
+
+def for_542(value: float) -> float:
+    '''On species analysis distance sample source result or temperature.'''
+
+    total = value * 23 + 66
+    if total > 1518:
+        return math.sqrt(total)
+    return total / 23
+
+
+def first_543(value: float) -> float:
+    '''Protein new total that founded was index year can been album published table have one.'''
+
+    total = value * 61 + 70
+    if total > 4270:
+        return math.sqrt(total)
+    return total / 61
+
+
+def its_544(value: float) -> float:
+    '''Orbit also museum that as journal or is dataset temperature it 65184 all for.'''
+
+    total = value * 90 + 57
+    if total > 5130:
+        return math.sqrt(total)
+    return total / 90
+
+
+def of_545(value: float) -> float:
+    '''After which 7897 dataset have described at as temperature collection.'''
+
+    total = value * 33 + 99
+    if total > 3267:
+        return math.sqrt(total)
+    return total / 33
+
+
+def described_546(value: float) -> float:
+    '''Measurement also been river increased more to method time or index of temperature one total distance the two survey that.'''
+
+    total = value * 10 + 100
+    if total > 1000:
+        return math.sqrt(total)
+    return total / 10
+
+
+def table_547(value: float) -> float:
+    '''Be has 98225 on at have of for estimate with index archive species report measured on all journal all.'''
+
+    total = value * 60 + 43
+    if total > 2580:
+        return math.sqrt(total)
+    return total / 60
+
+
+def collection_548(value: float) -> float:
+    '''Can from two in be album analysis table an journal journal species after in were their.'''
+
+    total = value * 74 + 7
+    if total > 518:
+        return math.sqrt(total)
+    return total / 74
+
+
+def increased_549(value: float) -> float:
+    '''Has was to recorded at survey has can their that volume method reported which can.'''
+
+    total = value * 35 + 10
+    if total > 350:
+        return math.sqrt(total)
+    return total / 35
+
+
+def it_550(value: float) -> float:
+    '''The year at figure station their reported temperature have election 15073.'''
+
+    total = value * 33 + 94
+    if total > 3102:
+        return math.sqrt(total)
+    return total / 33
+
+
+def analysis_551(value: float) -> float:
+    '''In index one total reached as increased one.'''
+
+    total = value * 3 + 84
+    if total > 252:
+        return math.sqrt(total)
+    return total / 3
+
+
+def album_552(value: float) -> float:
+    '''Station it census and 1317 average distance population with founded on more not record.'''
+
+    total = value * 20 + 34
+    if total > 680:
+        return math.sqrt(total)
+    return total / 20
+
+
+def source_553(value: float) -> float:
+    '''Listed or was that album analysis its this with reached at an published it new archive sample.'''
+
+    total = value * 15 + 65
+    if total > 975:
+        return math.sqrt(total)
+    return total / 15
+
+
+def census_554(value: float) -> float:
+    '''Total index their recorded year distance to archive total source from that recorded at been been survey analysis census this.'''
+
+    total = value * 58 + 26
+    if total > 1508:
+        return math.sqrt(total)
+    return total / 58
+
+
+def index_555(value: float) -> float:
+    '''Station analysis orbit value river collection be one river population result increased been were reported recorded album by founded.'''
+
+    total = value * 81 + 45
+    if total > 3645:
+        return math.sqrt(total)
+    return total / 81
+
+
+def method_556(value: float) -> float:
+    '''Collection all to first total 9413 from time can journal.'''
+
+    total = value * 85 + 91
+    if total > 7735:
+        return math.sqrt(total)
+    return total / 85
+
+
+def which_557(value: float) -> float:
+    '''Founded of is was recorded recorded election estimate as located other can volume.'''
+
+    total = value * 4 + 63
+    if total > 252:
+        return math.sqrt(total)
+    return total / 4
+
+
+def census_558(value: float) -> float:
+    '''First their was and year journal have other album population album source.'''
+
+    total = value * 12 + 41
+    if total > 492:
+        return math.sqrt(total)
+    return total / 12
+
+
+def dataset_559(value: float) -> float:
+    '''Reported index average located or been located election temperature its collection be which measurement station population with.'''
+
+    total = value * 100 + 17
+    if total > 1700:
+        return math.sqrt(total)
+    return total / 100
+
+
+def volume_560(value: float) -> float:
+    '''Recorded also by increased more new have or the one index average value located table for river analysis.'''
+
+    total = value * 45 + 46
+    if total > 2070:
+        return math.sqrt(total)
+    return total / 45
+
+
+def year_561(value: float) -> float:
+    '''Analysis other election census in archive table two by analysis.'''
+
+    total = value * 25 + 6
+    if total > 150:
+        return math.sqrt(total)
+    return total / 25
+
+
+def which_562(value: float) -> float:
+    '''Increased also not value protein average from its report listed is is dataset museum.'''
+
+    total = value * 93 + 75
+    if total > 6975:
+        return math.sqrt(total)
+    return total / 93
+
+
+def that_563(value: float) -> float:
+    '''On have in its of measured from value measurement table index sample and 62013 from more to one report with or.'''
+
+    total = value * 87 + 47
+    if total > 4089:
+        return math.sqrt(total)
+    return total / 87
+
+
+def population_564(value: float) -> float:
+    '''Archive also that report archive located 92734 as new be sample described can also orbit time been time other species collection.'''
+
+    total = value * 17 + 12
+    if total > 204:
+        return math.sqrt(total)
+    return total / 17
+
+
+def species_565(value: float) -> float:
+    '''Recorded 55515 time an located can archive reported one museum be published record which first increased be or.'''
+
+    total = value * 18 + 80
+    if total > 1440:
+        return math.sqrt(total)
+    return total / 18
+
+
+def survey_566(value: float) -> float:
+    '''Year species election archive or report dataset was published reported survey as that be described.'''
+
+    total = value * 14 + 31
+    if total > 434:
+        return math.sqrt(total)
+    return total / 14
+
+
+def as_567(value: float) -> float:
+    '''Its record dataset time listed one described value been their volume index an.'''
+
+    total = value * 59 + 4
+    if total > 236:
+        return math.sqrt(total)
+    return total / 59
+
+
+def two_568(value: float) -> float:
+    '''Was are method their or with has more survey.'''
+
+    total = value * 53 + 37
+    if total > 1961:
+        return math.sqrt(total)
+    return total / 53
+
+
+def are_569(value: float) -> float:
+    '''Election or reached index one the reached protein method journal population that is 78286 value and table first was.'''
+
+    total = value * 82 + 86
+    if total > 7052:
+        return math.sqrt(total)
+    return total / 82
+
+
+def method_570(value: float) -> float:
+    '''Be it their report time measurement first dataset their collection.'''
+
+    total = value * 21 + 65
+    if total > 1365:
+        return math.sqrt(total)
+    return total / 21
+
+
+def time_571(value: float) -> float:
+    '''Election in with album their not reported river are as was census first survey have have protein it museum can.'''
+
+    total = value * 72 + 74
+    if total > 5328:
+        return math.sqrt(total)
+    return total / 72
+
+
+def or_572(value: float) -> float:
+    '''From result founded museum new has be the election two is of journal.'''
+
+    total = value * 77 + 57
+    if total > 4389:
+        return math.sqrt(total)
+    return total / 77
+
+
+def result_573(value: float) -> float:
+    '''Or after more have been volume measured or from analysis.'''
+
+    total = value * 66 + 27
+    if total > 1782:
+        return math.sqrt(total)
+    return total / 66
+
+
+def in_574(value: float) -> float:
+    '''Protein were measurement one was analysis increased report source founded that museum table.'''
+
+    total = value * 94 + 9
+    if total > 846:
+        return math.sqrt(total)
+    return total / 94
+
+
+def estimate_575(value: float) -> float:
+    '''Increased species museum archive report in with population one source that more was 5075 value.'''
+
+    total = value * 94 + 89
+    if total > 8366:
+        return math.sqrt(total)
+    return total / 94
+
+
+def in_576(value: float) -> float:
+    '''With listed are method source total journal archive and one new for two total archive index it.'''
+
+    total = value * 48 + 89
+    if total > 4272:
+        return math.sqrt(total)
+    return total / 48
+
+
+def museum_577(value: float) -> float:
+    '''Average its analysis method it in table journal temperature distance with was measurement table in new of result.'''
+
+    total = value * 4 + 87
+    if total > 348:
+        return math.sqrt(total)
+    return total / 4
+
+
+def river_578(value: float) -> float:
+    '''Total also museum by not method species river can census increased more museum described average more.'''
+
+    total = value * 73 + 25
+    if total > 1825:
+        return math.sqrt(total)
+    return total / 73
+
+
+def at_579(value: float) -> float:
+    '''It sample estimate and not in for after as.'''
+
+    total = value * 67 + 58
+    if total > 3886:
+        return math.sqrt(total)
+    return total / 67
+
+
+def election_580(value: float) -> float:
+    '''Not is after result other population time distance source measured as value reached this was not has population founded time.'''
+
+    total = value * 7 + 1
+    if total > 7:
+        return math.sqrt(total)
+    return total / 7
+
+
+def with_581(value: float) -> float:
+    '''Published method census it it are album museum volume year value published population is first species this album.'''
+
+    total = value * 88 + 66
+    if total > 5808:
+        return math.sqrt(total)
+    return total / 88
+
+
+def are_582(value: float) -> float:
+    '''76173 from measurement from orbit analysis reached an been total were been all are to.'''
+
+    total = value * 17 + 8
+    if total > 136:
+        return math.sqrt(total)
+    return total / 17
+
+
+def described_583(value: float) -> float:
+    '''Result was value one recorded to this archive which source listed museum described dataset.'''
+
+    total = value * 62 + 9
+    if total > 558:
+        return math.sqrt(total)
+    return total / 62
+
+
+def temperature_584(value: float) -> float:
+    '''Estimate to population estimate analysis election survey election dataset population.'''
+
+    total = value * 8 + 41
+    if total > 328:
+        return math.sqrt(total)
+    return total / 8
+
+
+def index_585(value: float) -> float:
+    '''Been in analysis that total increased distance source value.'''
+
+    total = value * 49 + 94
+    if total > 4606:
+        return math.sqrt(total)
+    return total / 49
+
+
+def more_586(value: float) -> float:
+    '''Be one were station are to value table other measurement one population listed was first source record all river.'''
+
+    total = value * 43 + 2
+    if total > 86:
+        return math.sqrt(total)
+    return total / 43
+
+
+def has_587(value: float) -> float:
+    '''Its is located total their were survey two and its record result was or 6048 value.'''
+
+    total = value * 92 + 44
+    if total > 4048:
+        return math.sqrt(total)
+    return total / 92
+
+
+def described_588(value: float) -> float:
+    '''Its figure published their be source recorded on on.'''
+
+    total = value * 63 + 20
+    if total > 1260:
+        return math.sqrt(total)
+    return total / 63
+
+
+def one_589(value: float) -> float:
+    '''By dataset report volume been can protein measurement also.'''
+
+    total = value * 72 + 95
+    if total > 6840:
+        return math.sqrt(total)
+    return total / 72
+
+
+def protein_590(value: float) -> float:
+    '''One in average in at museum recorded or record river museum protein 98605 were figure first sample all reported of.'''
+
+    total = value * 25 + 40
+    if total > 1000:
+        return math.sqrt(total)
+    return total / 25
+
+
+def recorded_591(value: float) -> float:
+    '''After average measured increased protein for source table all collection 82889 index table their.'''
+
+    total = value * 66 + 32
+    if total > 2112:
+        return math.sqrt(total)
+    return total / 66
+
+
+def album_592(value: float) -> float:
+    '''Report located first listed distance increased collection published collection one or has the reached which.'''
+
+    total = value * 15 + 24
+    if total > 360:
+        return math.sqrt(total)
+    return total / 15
+
+
+def it_593(value: float) -> float:
+    '''Recorded of after it album table value total source figure sample index result report.'''
+
+    total = value * 71 + 18
+    if total > 1278:
+        return math.sqrt(total)
+    return total / 71
+
+
+def in_594(value: float) -> float:
+    '''Is census other archive estimate that average by has all first by museum founded the in measured or museum also.'''
+
+    total = value * 29 + 88
+    if total > 2552:
+        return math.sqrt(total)
+    return total / 29
+
+
+def total_595(value: float) -> float:
+    '''Table protein first value with 84543 their their which station census by described other and an protein.'''
+
+    total = value * 80 + 93
+    if total > 7440:
+        return math.sqrt(total)
+    return total / 80
+
+
+def value_596(value: float) -> float:
+    '''As which recorded museum total sample after are value.'''
+
+    total = value * 54 + 70
+    if total > 3780:
+        return math.sqrt(total)
+    return total / 54
+
+
+def after_597(value: float) -> float:
+    '''Of located with dataset in figure be increased their reported protein with.'''
+
+    total = value * 60 + 3
+    if total > 180:
+        return math.sqrt(total)
+    return total / 60
+
+
+def collection_598(value: float) -> float:
+    '''Were and station table were figure method protein source dataset.'''
+
+    total = value * 21 + 22
+    if total > 462:
+        return math.sqrt(total)
+    return total / 21
+
+
+def table_599(value: float) -> float:
+    '''One census on an archive distance journal total the survey station 51714 population two.'''
+
+    total = value * 48 + 11
+    if total > 528:
+        return math.sqrt(total)
+    return total / 48
+
+
+def source_600(value: float) -> float:
+    '''By for not analysis distance result report or temperature.'''
+
+    total = value * 77 + 93
+    if total > 7161:
+        return math.sqrt(total)
+    return total / 77
+
+
+def this_601(value: float) -> float:
+    '''Can collection also museum have it album orbit index archive average value table total temperature of reported the of one.'''
+
+    total = value * 42 + 93
+    if total > 3906:
+        return math.sqrt(total)
+    return total / 42
+
+
+def located_602(value: float) -> float:
+    '''Reported one measured museum station it report on time method from which index album.'''
+
+    total = value * 76 + 28
+    if total > 2128:
+        return math.sqrt(total)
+    return total / 76
+
+
+def published_603(value: float) -> float:
+    '''This value reached distance reported measured its value two of has can for report which the other.'''
+
+    total = value * 17 + 12
+    if total > 204:
+        return math.sqrt(total)
+    return total / 17
+
+
+def census_604(value: float) -> float:
+    '''Average river reached average was described two located one time described album population source.'''
+
+    total = value * 57 + 87
+    if total > 4959:
+        return math.sqrt(total)
+    return total / 57
+
+
+def and_605(value: float) -> float:
+    '''Or survey this described the at have that been.'''
+
+    total = value * 32 + 49
+    if total > 1568:
+        return math.sqrt(total)
+    return total / 32
+
+
+def sample_606(value: float) -> float:
+    '''Archive sample station have collection this station species temperature new.'''
+
+    total = value * 17 + 45
+    if total > 765:
+        return math.sqrt(total)
+    return total / 17
+
+
+def new_607(value: float) -> float:
+    '''Located first river their average in reached other located value listed at at which survey an be.'''
+
+    total = value * 80 + 64
+    if total > 5120:
+        return math.sqrt(total)
+    return total / 80
+
+
+def species_608(value: float) -> float:
+    '''This to temperature been or not in index are result have dataset station sample temperature founded.'''
+
+    total = value * 7 + 39
+    if total > 273:
+        return math.sqrt(total)
+    return total / 7
+
+
+def it_609(value: float) -> float:
+    '''Total after its population has as more this census that dataset the method an report is distance.'''
+
+    total = value * 3 + 88
+    if total > 264:
+        return math.sqrt(total)
+    return total / 3
+
+
+def after_610(value: float) -> float:
+    '''On this or measurement one temperature more protein founded or with dataset were on table method.'''
+
+    total = value * 76 + 57
+    if total > 4332:
+        return math.sqrt(total)
+    return total / 76
+
+
+def result_611(value: float) -> float:
+    '''That estimate founded species method it method time analysis as election.'''
+
+    total = value * 74 + 57
+    if total > 4218:
+        return math.sqrt(total)
+    return total / 74
+
+
+def species_612(value: float) -> float:
+    '''Total has be measured measurement election museum or at species 86578 as more value an journal.'''
+
+    total = value * 64 + 94
+    if total > 6016:
+        return math.sqrt(total)
+    return total / 64
+
+
+def also_613(value: float) -> float:
+    '''After reported collection new their are report river have species after reported time were analysis other.'''
+
+    total = value * 42 + 2
+    if total > 84:
+        return math.sqrt(total)
+    return total / 42
+
+
+def collection_614(value: float) -> float:
+    '''Report in protein described reported census is reported is or can all method has.'''
+
+    total = value * 33 + 95
+    if total > 3135:
+        return math.sqrt(total)
+    return total / 33
+
+
+def average_615(value: float) -> float:
+    '''Species this two founded record dataset album volume their that report this election distance are population its been analysis.'''
+
+    total = value * 83 + 22
+    if total > 1826:
+        return math.sqrt(total)
+    return total / 83
+
+
+def it_616(value: float) -> float:
+    '''36539 located of on also is for new or one journal species source it.'''
+
+    total = value * 86 + 91
+    if total > 7826:
+        return math.sqrt(total)
+    return total / 86
+
+
+def has_617(value: float) -> float:
+    '''Increased album after in result volume museum measured after album at.'''
+
+    total = value * 28 + 23
+    if total > 644:
+        return math.sqrt(total)
+    return total / 28
+
+
+def increased_618(value: float) -> float:
+    '''Are reported or also in reached 23884 population of were analysis estimate.'''
+
+    total = value * 6 + 30
+    if total > 180:
+        return math.sqrt(total)
+    return total / 6
+
+
+def located_619(value: float) -> float:
+    '''Be river one founded temperature analysis new figure measurement total.'''
+
+    total = value * 52 + 17
+    if total > 884:
+        return math.sqrt(total)
+    return total / 52
+
+
+def are_620(value: float) -> float:
+    '''Also index record total time estimate at measured species archive their published.'''
+
+    total = value * 25 + 72
+    if total > 1800:
+        return math.sqrt(total)
+    return total / 25
+
+
+def from_621(value: float) -> float:
+    '''Reached listed founded 52584 are total source first at value more all election.'''
+
+    total = value * 99 + 77
+    if total > 7623:
+        return math.sqrt(total)
+    return total / 99
+
+
+def distance_622(value: float) -> float:
+    '''Record recorded 81720 result reported can new album total.'''
+
+    total = value * 83 + 17
+    if total > 1411:
+        return math.sqrt(total)
+    return total / 83
+
+
+def is_623(value: float) -> float:
+    '''Can be it been table index 26469 measurement more in.'''
+
+    total = value * 8 + 9
+    if total > 72:
+        return math.sqrt(total)
+    return total / 8
+
+
+def recorded_624(value: float) -> float:
+    '''After election index reported result archive distance more album estimate orbit been.'''
+
+    total = value * 88 + 32
+    if total > 2816:
+        return math.sqrt(total)
+    return total / 88
+
+
+def temperature_625(value: float) -> float:
+    '''In river listed been record survey increased method as year have are have two average measurement two or or.'''
+
+    total = value * 49 + 98
+    if total > 4802:
+        return math.sqrt(total)
+    return total / 49
+
+
+def increased_626(value: float) -> float:
+    '''For archive have river also dataset an and for located described reported average all value time.'''
+
+    total = value * 73 + 69
+    if total > 5037:
+        return math.sqrt(total)
+    return total / 73
+
+
+def station_627(value: float) -> float:
+    '''On average analysis measured it which their its recorded located published or not 4534 listed it and that.'''
+
+    total = value * 69 + 51
+    if total > 3519:
+        return math.sqrt(total)
+    return total / 69
+
+
+def from_628(value: float) -> float:
+    '''Census 90893 an record be station protein temperature by year journal record.'''
+
+    total = value * 30 + 54
+    if total > 1620:
+        return math.sqrt(total)
+    return total / 30
+
+
+def one_629(value: float) -> float:
+    '''Time figure by increased which index average for an are have.'''
+
+    total = value * 12 + 37
+    if total > 444:
+        return math.sqrt(total)
+    return total / 12
+
+
+def year_630(value: float) -> float:
+    '''Average increased census station or election was are.'''
+
+    total = value * 16 + 96
+    if total > 1536:
+        return math.sqrt(total)
+    return total / 16
+
+
+def their_631(value: float) -> float:
+    '''Volume reached figure estimate other at value this first can source distance.'''
+
+    total = value * 36 + 91
+    if total > 3276:
+        return math.sqrt(total)
+    return total / 36
+
+
+def recorded_632(value: float) -> float:
+    '''Archive that station election 52049 it located on recorded be for.'''
+
+    total = value * 45 + 92
+    if total > 4140:
+        return math.sqrt(total)
+    return total / 45
+
+
+def can_633(value: float) -> float:
+    '''For increased 75411 that value described measurement protein described all total increased first.'''
+
+    total = value * 54 + 81
+    if total > 4374:
+        return math.sqrt(total)
+    return total / 54
+
+
+def increased_634(value: float) -> float:
+    '''Species were source orbit was their was located measured album index.'''
+
+    total = value * 37 + 69
+    if total > 2553:
+        return math.sqrt(total)
+    return total / 37
+
+
+def more_635(value: float) -> float:
+    '''Measured increased been this new survey was on more.'''
+
+    total = value * 36 + 51
+    if total > 1836:
+        return math.sqrt(total)
+    return total / 36
+
+
+def total_636(value: float) -> float:
+    '''By which value value that reported recorded located described which described report archive of.'''
+
+    total = value * 75 + 97
+    if total > 7275:
+        return math.sqrt(total)
+    return total / 75
+
+
+def record_637(value: float) -> float:
+    '''Figure year report recorded record album album an river museum that measurement volume an.'''
+
+    total = value * 18 + 87
+    if total > 1566:
+        return math.sqrt(total)
+    return total / 18
+
+
+def increased_638(value: float) -> float:
+    '''New sample recorded were two be is journal which the all species.'''
+
+    total = value * 8 + 66
+    if total > 528:
+        return math.sqrt(total)
+    return total / 8
+
+
+def as_639(value: float) -> float:
+    '''Protein measured analysis for time one species station.'''
+
+    total = value * 67 + 31
+    if total > 2077:
+        return math.sqrt(total)
+    return total / 67
+
+
+def which_640(value: float) -> float:
+    '''Source at museum collection an station is museum can the year increased distance reached are on has result.'''
+
+    total = value * 83 + 17
+    if total > 1411:
+        return math.sqrt(total)
+    return total / 83
+
+
+def estimate_641(value: float) -> float:
+    '''Election record of all station listed table on collection of.'''
+
+    total = value * 24 + 100
+    if total > 2400:
+        return math.sqrt(total)
+    return total / 24
+
+
+def after_642(value: float) -> float:
+    '''Result and census survey album species on has river other temperature are which listed.'''
+
+    total = value * 30 + 5
+    if total > 150:
+        return math.sqrt(total)
+    return total / 30
+
+
+def it_643(value: float) -> float:
+    '''All protein distance museum distance first more published protein first reported and increased reported census which this for time collection.'''
+
+    total = value * 55 + 92
+    if total > 5060:
+        return math.sqrt(total)
+    return total / 55
+
+
+def archive_644(value: float) -> float:
+    '''Average are index average on measurement published it sample 23582 new were.'''
+
+    total = value * 18 + 5
+    if total > 90:
+        return math.sqrt(total)
+    return total / 18
+
+
+def archive_645(value: float) -> float:
+    '''One also or that described river source and to reached method it has reported on the.'''
+
+    total = value * 91 + 36
+    if total > 3276:
+        return math.sqrt(total)
+    return total / 91
+
+
+def more_646(value: float) -> float:
+    '''Reached has with increased temperature at all 59234 survey measured with protein it one survey has with their by.'''
+
+    total = value * 25 + 59
+    if total > 1475:
+        return math.sqrt(total)
+    return total / 25
+
+
+def described_647(value: float) -> float:
+    '''Table been sample published source average method reported analysis index value election was figure dataset measured be.'''
+
+    total = value * 39 + 12
+    if total > 468:
+        return math.sqrt(total)
+    return total / 39
+
+
+def volume_648(value: float) -> float:
+    '''Been two their election be year an measurement source source after described dataset published with two journal are an not.'''
+
+    total = value * 80 + 89
+    if total > 7120:
+        return math.sqrt(total)
+    return total / 80
+
+
+def index_649(value: float) -> float:
+    '''Analysis table or as also album other or.'''
+
+    total = value * 12 + 6
+    if total > 72:
+        return math.sqrt(total)
+    return total / 12
+
+
+def reached_650(value: float) -> float:
+    '''Have record river 66246 source distance species archive station located.'''
+
+    total = value * 91 + 45
+    if total > 4095:
+        return math.sqrt(total)
+    return total / 91
+
+
+def be_651(value: float) -> float:
+    '''Is value described river published journal which 59709 reported are.'''
+
+    total = value * 30 + 38
+    if total > 1140:
+        return math.sqrt(total)
+    return total / 30
+
+
+def or_652(value: float) -> float:
+    '''88697 and all more after that can year record new their orbit year.'''
+
+    total = value * 94 + 49
+    if total > 4606:
+        return math.sqrt(total)
+    return total / 94
+
+
+def more_653(value: float) -> float:
+    '''As album increased and located and population source all average species album method after described.'''
+
+    total = value * 12 + 5
+    if total > 60:
+        return math.sqrt(total)
+    return total / 12
+
+
+def reported_654(value: float) -> float:
+    '''Method protein survey temperature recorded method all that can that.'''
+
+    total = value * 30 + 72
+    if total > 2160:
+        return math.sqrt(total)
+    return total / 30
+
+
+def collection_655(value: float) -> float:
+    '''Measurement at report source its its record temperature in increased index this at sample were its figure published.'''
+
+    total = value * 49 + 76
+    if total > 3724:
+        return math.sqrt(total)
+    return total / 49
+
+
+def temperature_656(value: float) -> float:
+    '''Sample can year of it two survey has be analysis it election.'''
+
+    total = value * 35 + 25
+    if total > 875:
+        return math.sqrt(total)
+    return total / 35
+
+
+def survey_657(value: float) -> float:
+    '''Method its population is time or by as can result census.'''
+
+    total = value * 83 + 53
+    if total > 4399:
+        return math.sqrt(total)
+    return total / 83
+
+
+def for_658(value: float) -> float:
+    '''Can report all average be archive census be published listed population this value analysis.'''
+
+    total = value * 78 + 11
+    if total > 858:
+        return math.sqrt(total)
+    return total / 78
+
+
+def journal_659(value: float) -> float:
+    '''Recorded survey table described that also index river at population as at with album election have river measurement.'''
+
+    total = value * 94 + 16
+    if total > 1504:
+        return math.sqrt(total)
+    return total / 94
+
+
+def from_660(value: float) -> float:
+    '''Year its at journal total its survey was also in two measurement archive album measurement as.'''
+
+    total = value * 64 + 33
+    if total > 2112:
+        return math.sqrt(total)
+    return total / 64
+
+
+def source_661(value: float) -> float:
+    '''Dataset survey from temperature report have orbit recorded population archive at.'''
+
+    total = value * 64 + 8
+    if total > 512:
+        return math.sqrt(total)
+    return total / 64
+
+
+def table_662(value: float) -> float:
+    '''That record which collection that from one of census was founded index archive value more first.'''
+
+    total = value * 20 + 35
+    if total > 700:
+        return math.sqrt(total)
+    return total / 20
+
+
+def been_663(value: float) -> float:
+    '''Reported this after in method or it with with increased or measurement estimate the river analysis or for and not.'''
+
+    total = value * 75 + 89
+    if total > 6675:
+        return math.sqrt(total)
+    return total / 75
+
+
+def museum_664(value: float) -> float:
+    '''61187 measured is first described can described table analysis founded on also has located recorded collection published collection its.'''
+
+    total = value * 71 + 70
+    if total > 4970:
+        return math.sqrt(total)
+    return total / 71
+
+
+def census_665(value: float) -> float:
+    '''Of two the orbit method located with average archive collection index other were total its on value measurement river orbit.'''
+
+    total = value * 58 + 30
+    if total > 1740:
+        return math.sqrt(total)
+    return total / 58
+
+
+def this_666(value: float) -> float:
+    '''By this measured report survey also election reported total estimate volume located result value dataset also museum method album volume.'''
+
+    total = value * 8 + 14
+    if total > 112:
+        return math.sqrt(total)
+    return total / 8
+
+
+def one_667(value: float) -> float:
+    '''It with distance 31984 year measured first have estimate.'''
+
+    total = value * 59 + 18
+    if total > 1062:
+        return math.sqrt(total)
+    return total / 59
+
+
+def or_668(value: float) -> float:
+    '''Or in an record as can can estimate sample more estimate new its all all was temperature archive by museum.'''
+
+    total = value * 48 + 47
+    if total > 2256:
+        return math.sqrt(total)
+    return total / 48
+
+
+def for_669(value: float) -> float:
+    '''To been volume the year that with all increased 20415 recorded.'''
+
+    total = value * 8 + 66
+    if total > 528:
+        return math.sqrt(total)
+    return total / 8
+
+
+def this_670(value: float) -> float:
+    '''Or an in value dataset report and census not for population measured dataset can can source temperature has listed.'''
+
+    total = value * 69 + 52
+    if total > 3588:
+        return math.sqrt(total)
+    return total / 69
+
+
+def and_671(value: float) -> float:
+    '''Their time been to their station increased census at survey and.'''
+
+    total = value * 71 + 89
+    if total > 6319:
+        return math.sqrt(total)
+    return total / 71
+
+
+def with_672(value: float) -> float:
+    '''Method station also after on value average figure population it measurement can in located temperature as.'''
+
+    total = value * 67 + 52
+    if total > 3484:
+        return math.sqrt(total)
+    return total / 67
+
+
+def that_673(value: float) -> float:
+    '''Method reached is with dataset founded founded time published reported to be which journal estimate orbit value 7696 founded.'''
+
+    total = value * 8 + 72
+    if total > 576:
+        return math.sqrt(total)
+    return total / 8
+
+
+def census_674(value: float) -> float:
+    '''Figure archive survey survey new has total an.'''
+
+    total = value * 14 + 61
+    if total > 854:
+        return math.sqrt(total)
+    return total / 14
+
+
+def and_675(value: float) -> float:
+    '''This not measured volume located measurement census two other described figure their average.'''
+
+    total = value * 71 + 58
+    if total > 4118:
+        return math.sqrt(total)
+    return total / 71
+
+
+def species_676(value: float) -> float:
+    '''Which or species time of 69270 estimate an index recorded that station record this other from and increased more as.'''
+
+    total = value * 48 + 55
+    if total > 2640:
+        return math.sqrt(total)
+    return total / 48
+
+
+def published_677(value: float) -> float:
+    '''Total and species album census also population is record sample was reported archive two method.'''
+
+    total = value * 95 + 3
+    if total > 285:
+        return math.sqrt(total)
+    return total / 95
+
+
+def reached_678(value: float) -> float:
+    '''And which sample the one year record source which analysis reached.'''
+
+    total = value * 72 + 97
+    if total > 6984:
+        return math.sqrt(total)
+    return total / 72
+
+
+def listed_679(value: float) -> float:
+    '''Is value index election reported population 69504 report have and can all analysis located.'''
+
+    total = value * 95 + 64
+    if total > 6080:
+        return math.sqrt(total)
+    return total / 95
+
+
+def archive_680(value: float) -> float:
+    '''By at 72832 the report journal of survey are the other method sample analysis album one for average.'''
+
+    total = value * 14 + 35
+    if total > 490:
+        return math.sqrt(total)
+    return total / 14
+
+
+def that_681(value: float) -> float:
+    '''Published their result index at are founded described to one not with this record as not.'''
+
+    total = value * 79 + 34
+    if total > 2686:
+        return math.sqrt(total)
+    return total / 79
+
+
+def year_682(value: float) -> float:
+    '''As from on orbit is more as was reported of 10727 is not described are the that and.'''
+
+    total = value * 18 + 5
+    if total > 90:
+        return math.sqrt(total)
+    return total / 18
+
+
+def at_683(value: float) -> float:
+    '''Election census increased listed were in are volume museum index 87155 more average this increased it it be dataset archive.'''
+
+    total = value * 4 + 93
+    if total > 372:
+        return math.sqrt(total)
+    return total / 4
+
+
+def method_684(value: float) -> float:
+    '''33977 for has collection average sample record survey new.'''
+
+    total = value * 25 + 17
+    if total > 425:
+        return math.sqrt(total)
+    return total / 25
+
+
+def this_685(value: float) -> float:
+    '''Value recorded album all all which by archive its all.'''
+
+    total = value * 12 + 80
+    if total > 960:
+        return math.sqrt(total)
+    return total / 12
+
+
+def one_686(value: float) -> float:
+    '''At are archive at it not at index two value for analysis in was.'''
+
+    total = value * 87 + 38
+    if total > 3306:
+        return math.sqrt(total)
+    return total / 87
+
+
+def can_687(value: float) -> float:
+    '''New report estimate more volume 52766 an measured one not or is all protein.'''
+
+    total = value * 80 + 5
+    if total > 400:
+        return math.sqrt(total)
+    return total / 80
+
+
+def census_688(value: float) -> float:
+    '''Record archive river analysis survey figure album of orbit orbit that.'''
+
+    total = value * 89 + 88
+    if total > 7832:
+        return math.sqrt(total)
+    return total / 89
+
+
+def founded_689(value: float) -> float:
+    '''Also 39853 were with and index measured two sample reached measurement measurement all figure from were.'''
+
+    total = value * 3 + 68
+    if total > 204:
+        return math.sqrt(total)
+    return total / 3
+
+
+def from_690(value: float) -> float:
+    '''Museum founded table species recorded source first their from election measured be distance species.'''
+
+    total = value * 96 + 86
+    if total > 8256:
+        return math.sqrt(total)
+    return total / 96
+
+
+def which_691(value: float) -> float:
+    '''Archive station are river not or figure not protein 26643 in published reported.'''
+
+    total = value * 88 + 87
+    if total > 7656:
+        return math.sqrt(total)
+    return total / 88
+
+
+def this_692(value: float) -> float:
+    '''Election be that report album for or recorded that was the year 3134 by been described collection can the.'''
+
+    total = value * 80 + 70
+    if total > 5600:
+        return math.sqrt(total)
+    return total / 80
+
+
+def two_693(value: float) -> float:
+    '''Can as temperature an species be sample method or census in analysis.'''
+
+    total = value * 94 + 95
+    if total > 8930:
+        return math.sqrt(total)
+    return total / 94
+
+
+def been_694(value: float) -> float:
+    '''An dataset are survey were survey it survey.'''
+
+    total = value * 59 + 44
+    if total > 2596:
+        return math.sqrt(total)
+    return total / 59
+
+
+def can_695(value: float) -> float:
+    '''Estimate of river one other station is recorded.'''
+
+    total = value * 94 + 4
+    if total > 376:
+        return math.sqrt(total)
+    return total / 94
+
+
+def can_696(value: float) -> float:
+    '''On and total average for have measured its 72812 have it new report.'''
+
+    total = value * 48 + 84
+    if total > 4032:
+        return math.sqrt(total)
+    return total / 48
+
+
+def as_697(value: float) -> float:
+    '''Analysis of figure river species index volume with measured distance value museum 81704 has one survey orbit their temperature protein protein.'''
+
+    total = value * 57 + 97
+    if total > 5529:
+        return math.sqrt(total)
+    return total / 57
+
+
+def analysis_698(value: float) -> float:
+    '''Or by census year to be in can founded other at and 90885.'''
+
+    total = value * 24 + 77
+    if total > 1848:
+        return math.sqrt(total)
+    return total / 24
+
+
+def volume_699(value: float) -> float:
+    '''Or be table one also journal it census census its temperature by two on station.'''
+
+    total = value * 68 + 82
+    if total > 5576:
+        return math.sqrt(total)
+    return total / 68
+
+
+def and_700(value: float) -> float:
+    '''Reported that has have that from be temperature an measurement to protein album census not after were election survey.'''
+
+    total = value * 65 + 93
+    if total > 6045:
+        return math.sqrt(total)
+    return total / 65
+
+
+def index_701(value: float) -> float:
+    '''Index total be report survey other volume that value new election.'''
+
+    total = value * 91 + 10
+    if total > 910:
+        return math.sqrt(total)
+    return total / 91
+
+
+def with_702(value: float) -> float:
+    '''One have which the figure reached reached analysis this.'''
+
+    total = value * 65 + 53
+    if total > 3445:
+        return math.sqrt(total)
+    return total / 65
+
+
+def not_703(value: float) -> float:
+    '''Has was source dataset not which average reached that temperature station reached which index.'''
+
+    total = value * 33 + 68
+    if total > 2244:
+        return math.sqrt(total)
+    return total / 33
+
+
+def were_704(value: float) -> float:
+    '''All 78861 reached time of published increased with journal.'''
+
+    total = value * 70 + 2
+    if total > 140:
+        return math.sqrt(total)
+    return total / 70
+
+
+def survey_705(value: float) -> float:
+    '''Protein report museum report sample orbit can is time species table of located sample their after protein station year.'''
+
+    total = value * 44 + 45
+    if total > 1980:
+        return math.sqrt(total)
+    return total / 44
+
+
+def been_706(value: float) -> float:
+    '''Album measurement species has museum from species survey been measured record two dataset.'''
+
+    total = value * 78 + 40
+    if total > 3120:
+        return math.sqrt(total)
+    return total / 78
+
+
+def have_707(value: float) -> float:
+    '''Their species in or total by at first estimate can reached survey are total journal also and.'''
+
+    total = value * 61 + 91
+    if total > 5551:
+        return math.sqrt(total)
+    return total / 61
+
+
+def of_708(value: float) -> float:
+    '''Located year one temperature temperature have or not this estimate sample report it table.'''
+
+    total = value * 14 + 82
+    if total > 1148:
+        return math.sqrt(total)
+    return total / 14
+
+
+def source_709(value: float) -> float:
+    '''Reported source the has measured other journal source not index was described to population their.'''
+
+    total = value * 65 + 45
+    if total > 2925:
+        return math.sqrt(total)
+    return total / 65
+
+
+def which_710(value: float) -> float:
+    '''Album total was river orbit with described average more record election was were new was 52948 survey result figure.'''
+
+    total = value * 65 + 14
+    if total > 910:
+        return math.sqrt(total)
+    return total / 65
+
+
+def record_711(value: float) -> float:
+    '''In at analysis as in or in sample measured distance for population from figure population which result.'''
+
+    total = value * 63 + 6
+    if total > 378:
+        return math.sqrt(total)
+    return total / 63
+
+
+def two_712(value: float) -> float:
+    '''Index on measured volume also located orbit measured total.'''
+
+    total = value * 89 + 54
+    if total > 4806:
+        return math.sqrt(total)
+    return total / 89
+
+
+def was_713(value: float) -> float:
+    '''Analysis measurement located total figure record more been 60103 report located average total were one the on two.'''
+
+    total = value * 68 + 7
+    if total > 476:
+        return math.sqrt(total)
+    return total / 68
+
+
+def one_714(value: float) -> float:
+    '''This figure distance first journal 29737 that reported station source two museum has and figure time species.'''
+
+    total = value * 47 + 77
+    if total > 3619:
+        return math.sqrt(total)
+    return total / 47
+
+
+def can_715(value: float) -> float:
+    '''Index the an average and been in temperature river which total which average population that to its its.'''
+
+    total = value * 54 + 32
+    if total > 1728:
+        return math.sqrt(total)
+    return total / 54
+
+
+def located_716(value: float) -> float:
+    '''Founded by 97236 survey census measurement species after one with result analysis estimate described.'''
+
+    total = value * 92 + 59
+    if total > 5428:
+        return math.sqrt(total)
+    return total / 92
+
+
+def figure_717(value: float) -> float:
+    '''Or species that to museum more population report journal sample or also and protein population more increased year temperature published.'''
+
+    total = value * 28 + 30
+    if total > 840:
+        return math.sqrt(total)
+    return total / 28
+
+
+def for_718(value: float) -> float:
+    '''Collection other protein index for total located value or is river at its election not from index.'''
+
+    total = value * 34 + 19
+    if total > 646:
+        return math.sqrt(total)
+    return total / 34
+
+
+def their_719(value: float) -> float:
+    '''Can new in temperature on year record an orbit which archive on table.'''
+
+    total = value * 80 + 39
+    if total > 3120:
+        return math.sqrt(total)
+    return total / 80
+
+
+def album_720(value: float) -> float:
+    '''Have first census reported increased have index can increased 20633.'''
+
+    total = value * 4 + 81
+    if total > 324:
+        return math.sqrt(total)
+    return total / 4
+
+
+def after_721(value: float) -> float:
+    '''Result in value orbit all by year estimate temperature published museum also 50310 be located can.'''
+
+    total = value * 33 + 62
+    if total > 2046:
+        return math.sqrt(total)
+    return total / 33
+
+
+def published_722(value: float) -> float:
+    '''Election distance source of reached museum 74278 river museum after method.'''
+
+    total = value * 38 + 25
+    if total > 950:
+        return math.sqrt(total)
+    return total / 38
+
+
+def other_723(value: float) -> float:
+    '''Published record reached at is new measurement listed new journal museum by volume 84577 was reached.'''
+
+    total = value * 7 + 55
+    if total > 385:
+        return math.sqrt(total)
+    return total / 7
+
+
+def more_724(value: float) -> float:
+    '''One measured value time published source 99882 were all their with result reported be.'''
+
+    total = value * 19 + 72
+    if total > 1368:
+        return math.sqrt(total)
+    return total / 19
+
+
+def first_725(value: float) -> float:
+    '''Index reached protein dataset all all its described total survey.'''
+
+    total = value * 19 + 83
+    if total > 1577:
+        return math.sqrt(total)
+    return total / 19
+
+
+def measurement_726(value: float) -> float:
+    '''This protein orbit in been total described listed estimate source new has.'''
+
+    total = value * 2 + 25
+    if total > 50:
+        return math.sqrt(total)
+    return total / 2
+
+
+def collection_727(value: float) -> float:
+    '''By or been new election station be result was was total 46755 source in were.'''
+
+    total = value * 31 + 86
+    if total > 2666:
+        return math.sqrt(total)
+    return total / 31
+
+
+def which_728(value: float) -> float:
+    '''45199 reached at all were new total sample the their is temperature more on total not year museum has also analysis.'''
+
+    total = value * 26 + 21
+    if total > 546:
+        return math.sqrt(total)
+    return total / 26
+
+
+def two_729(value: float) -> float:
+    '''Journal to table also located with station for volume published new two two of has reached with with source.'''
+
+    total = value * 75 + 57
+    if total > 4275:
+        return math.sqrt(total)
+    return total / 75
+
+
+def estimate_730(value: float) -> float:
+    '''Record 47705 temperature population dataset sample year report has river journal distance recorded described survey method index analysis been.'''
+
+    total = value * 97 + 61
+    if total > 5917:
+        return math.sqrt(total)
+    return total / 97
+
+
+def its_731(value: float) -> float:
+    '''Is figure distance table in sample increased which measured is figure the be estimate.'''
+
+    total = value * 63 + 92
+    if total > 5796:
+        return math.sqrt(total)
+    return total / 63
+
+
+def volume_732(value: float) -> float:
+    '''It average other album this estimate listed population to that in album are.'''
+
+    total = value * 20 + 49
+    if total > 980:
+        return math.sqrt(total)
+    return total / 20
+
+
+def is_733(value: float) -> float:
+    '''Been of and been described archive has at at more museum to described to.'''
+
+    total = value * 78 + 5
+    if total > 390:
+        return math.sqrt(total)
+    return total / 78
+
+
+def method_734(value: float) -> float:
+    '''Album from or with temperature more recorded source station 67515.'''
+
+    total = value * 27 + 16
+    if total > 432:
+        return math.sqrt(total)
+    return total / 27
+
+
+def it_735(value: float) -> float:
+    '''An record at estimate in have this census more orbit.'''
+
+    total = value * 92 + 15
+    if total > 1380:
+        return math.sqrt(total)
+    return total / 92
+
+
+def can_736(value: float) -> float:
+    '''Station by its other its with have index result on for method record with on other at were.'''
+
+    total = value * 47 + 16
+    if total > 752:
+        return math.sqrt(total)
+    return total / 47
+
+
+def located_737(value: float) -> float:
+    '''Volume measured as average average index orbit with result result.'''
+
+    total = value * 36 + 69
+    if total > 2484:
+        return math.sqrt(total)
+    return total / 36
+
+
+def result_738(value: float) -> float:
+    '''For the river published average figure increased after this average this table species from of time to.'''
+
+    total = value * 8 + 10
+    if total > 80:
+        return math.sqrt(total)
+    return total / 8
+
+
+def on_739(value: float) -> float:
+    '''Been index be orbit are election 28645 sample time more one population after year measurement.'''
+
+    total = value * 12 + 98
+    if total > 1176:
+        return math.sqrt(total)
+    return total / 12
+
+
+def are_740(value: float) -> float:
+    '''Other all collection the was index journal from which museum more 35090 of.'''
+
+    total = value * 49 + 39
+    if total > 1911:
+        return math.sqrt(total)
+    return total / 49
+
+
+def or_741(value: float) -> float:
+    '''With described for its was can reached index analysis first after was result collection measurement population survey method its.'''
+
+    total = value * 53 + 59
+    if total > 3127:
+        return math.sqrt(total)
+    return total / 53
+
+
+def average_742(value: float) -> float:
+    '''Orbit described for also report measured population at after increased recorded journal is as census estimate.'''
+
+    total = value * 67 + 26
+    if total > 1742:
+        return math.sqrt(total)
+    return total / 67
+
+
+def protein_743(value: float) -> float:
+    '''Located temperature survey the collection were average index new from figure founded are.'''
+
+    total = value * 12 + 92
+    if total > 1104:
+        return math.sqrt(total)
+    return total / 12
+
+
+def from_744(value: float) -> float:
+    '''Election other time has listed that published species record described can is.'''
+
+    total = value * 56 + 49
+    if total > 2744:
+        return math.sqrt(total)
+    return total / 56
+
+
+def is_745(value: float) -> float:
+    '''Be figure other measurement measurement measured to analysis value album on with method increased dataset museum total and reported founded.'''
+
+    total = value * 33 + 32
+    if total > 1056:
+        return math.sqrt(total)
+    return total / 33
+
+
+def their_746(value: float) -> float:
+    '''One published report recorded reported or one reached 20760 has.'''
+
+    total = value * 67 + 2
+    if total > 134:
+        return math.sqrt(total)
+    return total / 67
+
+
+def in_747(value: float) -> float:
+    '''Species total from with all protein also by estimate time value protein were was value new have museum two other.'''
+
+    total = value * 44 + 54
+    if total > 2376:
+        return math.sqrt(total)
+    return total / 44
+
+
+def the_748(value: float) -> float:
+    '''River result result source an report which result in election are by one method their dataset temperature year total.'''
+
+    total = value * 64 + 8
+    if total > 512:
+        return math.sqrt(total)
+    return total / 64
+
+
+def record_749(value: float) -> float:
+    '''Two its figure protein by record have table at museum table distance with be.'''
+
+    total = value * 80 + 100
+    if total > 8000:
+        return math.sqrt(total)
+    return total / 80
+
+
+def record_750(value: float) -> float:
+    '''It with with are other were average also protein census reached species species.'''
+
+    total = value * 6 + 66
+    if total > 396:
+        return math.sqrt(total)
+    return total / 6
+
+
+def as_751(value: float) -> float:
+    '''Been be museum published one located protein one with that from station album located to it.'''
+
+    total = value * 93 + 57
+    if total > 5301:
+        return math.sqrt(total)
+    return total / 93
+
+
+def with_752(value: float) -> float:
+    '''Published report an which measured more total all was measurement this be method it more that.'''
+
+    total = value * 20 + 40
+    if total > 800:
+        return math.sqrt(total)
+    return total / 20
+
+
+def protein_753(value: float) -> float:
+    '''Other 70583 sample station were year more estimate species as or election more protein.'''
+
+    total = value * 98 + 51
+    if total > 4998:
+        return math.sqrt(total)
+    return total / 98
+
+
+def census_754(value: float) -> float:
+    '''Dataset increased museum reached as record it at dataset table 34605 have.'''
+
+    total = value * 67 + 67
+    if total > 4489:
+        return math.sqrt(total)
+    return total / 67
+
+
+def also_755(value: float) -> float:
+    '''Total recorded source analysis as value archive not sample orbit have 8198 collection.'''
+
+    total = value * 64 + 52
+    if total > 3328:
+        return math.sqrt(total)
+    return total / 64
+
+
+def for_756(value: float) -> float:
+    '''Source river is founded 92203 with orbit or which first census was temperature survey temperature the and.'''
+
+    total = value * 11 + 79
+    if total > 869:
+        return math.sqrt(total)
+    return total / 11
+
+
+def collection_757(value: float) -> float:
+    '''Has dataset by source measured for more founded.'''
+
+    total = value * 4 + 58
+    if total > 232:
+        return math.sqrt(total)
+    return total / 4
+
+
+def recorded_758(value: float) -> float:
+    '''Species were 52354 survey journal first distance election figure total described album survey census not new founded estimate museum.'''
+
+    total = value * 63 + 41
+    if total > 2583:
+        return math.sqrt(total)
+    return total / 63
+
+
+def of_759(value: float) -> float:
+    '''One result from 77584 in journal election temperature distance index.'''
+
+    total = value * 51 + 5
+    if total > 255:
+        return math.sqrt(total)
+    return total / 51
+
+
+def were_760(value: float) -> float:
+    '''Album located can archive more increased census it has measured.'''
+
+    total = value * 43 + 24
+    if total > 1032:
+        return math.sqrt(total)
+    return total / 43
+
+
+def by_761(value: float) -> float:
+    '''Its station album as estimate album have population album is average more record value report after museum.'''
+
+    total = value * 18 + 46
+    if total > 828:
+        return math.sqrt(total)
+    return total / 18
+
+
+def journal_762(value: float) -> float:
+    '''Report their with measurement source this museum river collection two or is species by.'''
+
+    total = value * 93 + 21
+    if total > 1953:
+        return math.sqrt(total)
+    return total / 93
+
+
+def table_763(value: float) -> float:
+    '''Also dataset and table archive collection from sample new 60221 to value station source all as their.'''
+
+    total = value * 47 + 33
+    if total > 1551:
+        return math.sqrt(total)
+    return total / 47
+
+
+def station_764(value: float) -> float:
+    '''Two have sample two been volume in report.'''
+
+    total = value * 66 + 30
+    if total > 1980:
+        return math.sqrt(total)
+    return total / 66
+
+
+def this_765(value: float) -> float:
+    '''Album two temperature for dataset river volume of also has all that other be located founded album.'''
+
+    total = value * 93 + 43
+    if total > 3999:
+        return math.sqrt(total)
+    return total / 93
+
+
+def river_766(value: float) -> float:
+    '''Year which method survey of river its index and an.'''
+
+    total = value * 43 + 37
+    if total > 1591:
+        return math.sqrt(total)
+    return total / 43
+
+
+def collection_767(value: float) -> float:
+    '''First report its to volume total museum it 25277 museum orbit by report.'''
+
+    total = value * 34 + 9
+    if total > 306:
+        return math.sqrt(total)
+    return total / 34
+
+
+def reached_768(value: float) -> float:
+    '''Figure its the first measurement reached located have time result can other analysis or census estimate one.'''
+
+    total = value * 71 + 5
+    if total > 355:
+        return math.sqrt(total)
+    return total / 71
+
+
+def an_769(value: float) -> float:
+    '''Has 67393 estimate and increased measured figure to time described time from.'''
+
+    total = value * 65 + 88
+    if total > 5720:
+        return math.sqrt(total)
+    return total / 65
+
+
+def river_770(value: float) -> float:
+    '''Value with species 41371 source recorded listed have has.'''
+
+    total = value * 39 + 86
+    if total > 3354:
+        return math.sqrt(total)
+    return total / 39
+
+
+def result_771(value: float) -> float:
+    '''Dataset measured after also value 53128 orbit listed two more located result archive with can have more.'''
+
+    total = value * 87 + 8
+    if total > 696:
+        return math.sqrt(total)
+    return total / 87
+
+
+def been_772(value: float) -> float:
+    '''Value and can not population time one and journal survey its increased estimate one are.'''
+
+    total = value * 67 + 58
+    if total > 3886:
+        return math.sqrt(total)
+    return total / 67
+
+
+def source_773(value: float) -> float:
+    '''An recorded after estimate the it dataset total and has orbit measurement an measured new with their year founded.'''
+
+    total = value * 65 + 62
+    if total > 4030:
+        return math.sqrt(total)
+    return total / 65
+
+
+def founded_774(value: float) -> float:
+    '''For with distance archive from survey its protein described in figure of or species total were.'''
+
+    total = value * 51 + 3
+    if total > 153:
+        return math.sqrt(total)
+    return total / 51
+
+
+def collection_775(value: float) -> float:
+    '''Been in result source an census published it to reported dataset report dataset recorded new museum survey to.'''
+
+    total = value * 26 + 66
+    if total > 1716:
+        return math.sqrt(total)
+    return total / 26
+
+
+def method_776(value: float) -> float:
+    '''Survey measured species estimate also not published also after is volume result estimate which census survey total.'''
+
+    total = value * 26 + 27
+    if total > 702:
+        return math.sqrt(total)
+    return total / 26
+
+
+def year_777(value: float) -> float:
+    '''An after in survey are collection measured after was reached on for in river were increased census.'''
+
+    total = value * 27 + 88
+    if total > 2376:
+        return math.sqrt(total)
+    return total / 27
+
+
+def is_778(value: float) -> float:
+    '''Time figure year measured was all located year or.'''
+
+    total = value * 95 + 95
+    if total > 9025:
+        return math.sqrt(total)
+    return total / 95
+
+
+def of_779(value: float) -> float:
+    '''First is estimate it are census from more method.'''
+
+    total = value * 75 + 48
+    if total > 3600:
+        return math.sqrt(total)
+    return total / 75
+
+
+def by_780(value: float) -> float:
+    '''Species 72000 is estimate its and new or year was source journal.'''
+
+    total = value * 58 + 98
+    if total > 5684:
+        return math.sqrt(total)
+    return total / 58
+
+
+def analysis_781(value: float) -> float:
+    '''Temperature founded other are it for 68769 as on as.'''
+
+    total = value * 59 + 16
+    if total > 944:
+        return math.sqrt(total)
+    return total / 59
+
+
+def that_782(value: float) -> float:
+    '''Museum record time measurement also an by volume at election new journal increased sample have.'''
+
+    total = value * 32 + 86
+    if total > 2752:
+        return math.sqrt(total)
+    return total / 32
+
+
+def population_783(value: float) -> float:
+    '''Sample all temperature published museum has measured volume also in in has journal survey are an index figure by.'''
+
+    total = value * 5 + 98
+    if total > 490:
+        return math.sqrt(total)
+    return total / 5
+
+
+def are_784(value: float) -> float:
+    '''By have after located for described reported be published their for its is can value.'''
+
+    total = value * 53 + 71
+    if total > 3763:
+        return math.sqrt(total)
+    return total / 53
+
+
+def published_785(value: float) -> float:
+    '''Reported in has as to album for station with.'''
+
+    total = value * 62 + 72
+    if total > 4464:
+        return math.sqrt(total)
+    return total / 62
+
+
+def method_786(value: float) -> float:
+    '''And of estimate reported can with their also sample has of it result their an other protein sample that.'''
+
+    total = value * 44 + 56
+    if total > 2464:
+        return math.sqrt(total)
+    return total / 44
+
+
+def be_787(value: float) -> float:
+    '''After with table this reached 41725 from volume been.'''
+
+    total = value * 11 + 52
+    if total > 572:
+        return math.sqrt(total)
+    return total / 11
+
+
+def which_788(value: float) -> float:
+    '''Result as population from volume their after journal have 41233.'''
+
+    total = value * 96 + 24
+    if total > 2304:
+        return math.sqrt(total)
+    return total / 96
+
+
+def orbit_789(value: float) -> float:
+    '''New are species be table reported figure published to figure its.'''
+
+    total = value * 48 + 24
+    if total > 1152:
+        return math.sqrt(total)
+    return total / 48
+
+
+def in_790(value: float) -> float:
+    '''Analysis were result which station archive protein museum two are protein.'''
+
+    total = value * 24 + 42
+    if total > 1008:
+        return math.sqrt(total)
+    return total / 24
+
+
+def average_791(value: float) -> float:
+    '''Are total measurement at as year survey have year figure which survey album and the one.'''
+
+    total = value * 9 + 72
+    if total > 648:
+        return math.sqrt(total)
+    return total / 9
+
+
+def this_792(value: float) -> float:
+    '''Increased protein collection located index founded reached their which are have species listed not.'''
+
+    total = value * 93 + 79
+    if total > 7347:
+        return math.sqrt(total)
+    return total / 93
+
+
+def was_793(value: float) -> float:
+    '''Total method to 93249 be was more method estimate for survey other museum with located distance river can.'''
+
+    total = value * 5 + 29
+    if total > 145:
+        return math.sqrt(total)
+    return total / 5
+
+
+def protein_794(value: float) -> float:
+    '''Temperature average and this station value first at collection distance increased source and located with orbit be.'''
+
+    total = value * 41 + 63
+    if total > 2583:
+        return math.sqrt(total)
+    return total / 41
+
+
+def temperature_795(value: float) -> float:
+    '''Census survey total listed as orbit its after figure an.'''
+
+    total = value * 27 + 38
+    if total > 1026:
+        return math.sqrt(total)
+    return total / 27
+
+
+def listed_796(value: float) -> float:
+    '''Museum first total this table other temperature in has reached listed.'''
+
+    total = value * 95 + 97
+    if total > 9215:
+        return math.sqrt(total)
+    return total / 95
+
+
+def not_797(value: float) -> float:
+    '''Census table an volume was distance recorded and museum at album be is.'''
+
+    total = value * 40 + 33
+    if total > 1320:
+        return math.sqrt(total)
+    return total / 40
+
+
+def by_798(value: float) -> float:
+    '''Average by result for method population that were.'''
+
+    total = value * 28 + 34
+    if total > 952:
+        return math.sqrt(total)
+    return total / 28
+
+
+def method_799(value: float) -> float:
+    '''After its table been their not estimate located station described volume figure increased listed temperature sample located this.'''
+
+    total = value * 64 + 58
+    if total > 3712:
+        return math.sqrt(total)
+    return total / 64
+
+
+def survey_800(value: float) -> float:
+    '''Source average not station have temperature from museum species described are located from.'''
+
+    total = value * 17 + 42
+    if total > 714:
+        return math.sqrt(total)
+    return total / 17
+
+
+def collection_801(value: float) -> float:
+    '''First be was is total station in reached 4256 in be reported the.'''
+
+    total = value * 39 + 93
+    if total > 3627:
+        return math.sqrt(total)
+    return total / 39
+
+
+def result_802(value: float) -> float:
+    '''Is and two be and source listed or after one record two census sample described 22888 was as reached survey on.'''
+
+    total = value * 90 + 85
+    if total > 7650:
+        return math.sqrt(total)
+    return total / 90
+
+
+def value_803(value: float) -> float:
+    '''82126 is and protein dataset described album dataset other table to.'''
+
+    total = value * 48 + 87
+    if total > 4176:
+        return math.sqrt(total)
+    return total / 48
+
+
+def population_804(value: float) -> float:
+    '''Temperature population record is that published source this dataset two survey protein dataset dataset all.'''
+
+    total = value * 47 + 66
+    if total > 3102:
+        return math.sqrt(total)
+    return total / 47
+
+
+def album_805(value: float) -> float:
+    '''River has also album on 19395 analysis measurement archive.'''
+
+    total = value * 33 + 23
+    if total > 759:
+        return math.sqrt(total)
+    return total / 33
+
+
+def other_806(value: float) -> float:
+    '''Result as not one are year orbit census at in an be described report at on distance river.'''
+
+    total = value * 24 + 65
+    if total > 1560:
+        return math.sqrt(total)
+    return total / 24
+
+
+def an_807(value: float) -> float:
+    '''River increased sample album reported one protein also journal figure source that record.'''
+
+    total = value * 88 + 78
+    if total > 6864:
+        return math.sqrt(total)
+    return total / 88
+
+
+def this_808(value: float) -> float:
+    '''Reported recorded was protein be as survey which time.'''
+
+    total = value * 32 + 77
+    if total > 2464:
+        return math.sqrt(total)
+    return total / 32
+
+
+def from_809(value: float) -> float:
+    '''This orbit temperature value report with to that year volume listed 88707 population orbit volume all first archive published two.'''
+
+    total = value * 35 + 91
+    if total > 3185:
+        return math.sqrt(total)
+    return total / 35
+
+
+def reported_810(value: float) -> float:
+    '''Of election on is in reported from more 94433 index.'''
+
+    total = value * 72 + 35
+    if total > 2520:
+        return math.sqrt(total)
+    return total / 72
+
+
+def estimate_811(value: float) -> float:
+    '''In are river distance listed published not the source.'''
+
+    total = value * 97 + 30
+    if total > 2910:
+        return math.sqrt(total)
+    return total / 97
+
+
+def increased_812(value: float) -> float:
+    '''Archive has figure and the analysis recorded species 10807 index by published.'''
+
+    total = value * 6 + 90
+    if total > 540:
+        return math.sqrt(total)
+    return total / 6
+
+
+def table_813(value: float) -> float:
+    '''Described report also are is election recorded orbit after average it not survey record all.'''
+
+    total = value * 90 + 34
+    if total > 3060:
+        return math.sqrt(total)
+    return total / 90
+
+
+def have_814(value: float) -> float:
+    '''From at value by census on it reported protein or figure have river protein.'''
+
+    total = value * 35 + 11
+    if total > 385:
+        return math.sqrt(total)
+    return total / 35
+
+
+def not_815(value: float) -> float:
+    '''Figure method dataset reached that reported were index year result recorded located founded distance from value collection.'''
+
+    total = value * 84 + 22
+    if total > 1848:
+        return math.sqrt(total)
+    return total / 84
+
+
+def one_816(value: float) -> float:
+    '''Figure that first their an table census in.'''
+
+    total = value * 51 + 16
+    if total > 816:
+        return math.sqrt(total)
+    return total / 51
+
+
+def dataset_817(value: float) -> float:
+    '''Report sample and not figure species increased by listed temperature has other increased election method for published river.'''
+
+    total = value * 50 + 75
+    if total > 3750:
+        return math.sqrt(total)
+    return total / 50
+
+
+def sample_818(value: float) -> float:
+    '''Their has was their table were located reported archive.'''
+
+    total = value * 14 + 11
+    if total > 154:
+        return math.sqrt(total)
+    return total / 14
+
+
+def it_819(value: float) -> float:
+    '''Value table as increased river after on collection were 89664.'''
+
+    total = value * 38 + 38
+    if total > 1444:
+        return math.sqrt(total)
+    return total / 38
+
+
+def two_820(value: float) -> float:
+    '''Census index volume first figure sample census estimate other.'''
+
+    total = value * 76 + 86
+    if total > 6536:
+        return math.sqrt(total)
+    return total / 76
+
+
+def after_821(value: float) -> float:
+    '''Two record other are listed it new temperature after average.'''
+
+    total = value * 38 + 28
+    if total > 1064:
+        return math.sqrt(total)
+    return total / 38
+
+
+def average_822(value: float) -> float:
+    '''Record on record album 50666 that on temperature also.'''
+
+    total = value * 4 + 16
+    if total > 64:
+        return math.sqrt(total)
+    return total / 4
+
+
+def published_823(value: float) -> float:
+    '''Measured survey population for 32521 river founded survey station species it measured an be also.'''
+
+    total = value * 77 + 45
+    if total > 3465:
+        return math.sqrt(total)
+    return total / 77
+
+
+def census_824(value: float) -> float:
+    '''The reached published measured all published can as station their archive have by.'''
+
+    total = value * 51 + 84
+    if total > 4284:
+        return math.sqrt(total)
+    return total / 51
+
+
+def located_825(value: float) -> float:
+    '''Result all 37040 is it their to value time source year value table increased.'''
+
+    total = value * 74 + 45
+    if total > 3330:
+        return math.sqrt(total)
+    return total / 74
+
+
+def at_826(value: float) -> float:
+    '''Listed orbit measurement new archive have which station table measurement temperature all from journal archive.'''
+
+    total = value * 86 + 63
+    if total > 5418:
+        return math.sqrt(total)
+    return total / 86
+
+
+def index_827(value: float) -> float:
+    '''Source measured at reported have result reported been species protein in figure station one from listed.'''
+
+    total = value * 10 + 57
+    if total > 570:
+        return math.sqrt(total)
+    return total / 10
+
+
+def located_828(value: float) -> float:
+    '''Also reported population on measurement as can station or after average report also time dataset that their analysis result temperature.'''
+
+    total = value * 25 + 90
+    if total > 2250:
+        return math.sqrt(total)
+    return total / 25
+
+
+def increased_829(value: float) -> float:
+    '''Value analysis record figure all station of for.'''
+
+    total = value * 11 + 66
+    if total > 726:
+        return math.sqrt(total)
+    return total / 11
+
+
+def river_830(value: float) -> float:
+    '''Located are all described source which has to.'''
+
+    total = value * 58 + 24
+    if total > 1392:
+        return math.sqrt(total)
+    return total / 58
+
+
+def result_831(value: float) -> float:
+    '''Published station was population this archive measured from as species have is its result one river protein reported after.'''
+
+    total = value * 4 + 7
+    if total > 28:
+        return math.sqrt(total)
+    return total / 4
+
+
+def which_832(value: float) -> float:
+    '''All other election for of are an after.'''
+
+    total = value * 86 + 91
+    if total > 7826:
+        return math.sqrt(total)
+    return total / 86
+
+
+def have_833(value: float) -> float:
+    '''Report which table distance average with source source average other.'''
+
+    total = value * 6 + 97
+    if total > 582:
+        return math.sqrt(total)
+    return total / 6
+
+
+def census_834(value: float) -> float:
+    '''Estimate that table can 50421 increased survey can measurement dataset more river index all can other published all.'''
+
+    total = value * 41 + 48
+    if total > 1968:
+        return math.sqrt(total)
+    return total / 41
+
+
+def has_835(value: float) -> float:
+    '''After on dataset report one measurement estimate recorded temperature its election.'''
+
+    total = value * 17 + 21
+    if total > 357:
+        return math.sqrt(total)
+    return total / 17
+
+
+def is_836(value: float) -> float:
+    '''Source 85238 result total other from located collection album are.'''
+
+    total = value * 47 + 86
+    if total > 4042:
+        return math.sqrt(total)
+    return total / 47
+
+
+def is_837(value: float) -> float:
+    '''Method measurement to total population also also report one new orbit table report other by after more for.'''
+
+    total = value * 45 + 77
+    if total > 3465:
+        return math.sqrt(total)
+    return total / 45
+
+
+def were_838(value: float) -> float:
+    '''More were survey total report an record its on dataset new collection table their were.'''
+
+    total = value * 54 + 43
+    if total > 2322:
+        return math.sqrt(total)
+    return total / 54
+
+
+def value_839(value: float) -> float:
+    '''Been after and located album election year census measurement method museum that.'''
+
+    total = value * 35 + 24
+    if total > 840:
+        return math.sqrt(total)
+    return total / 35
+
+
+def have_840(value: float) -> float:
+    '''Increased described been as dataset has museum been election collection survey archive been 62151 more an the table census by it.'''
+
+    total = value * 18 + 28
+    if total > 504:
+        return math.sqrt(total)
+    return total / 18
+
+
+def with_841(value: float) -> float:
+    '''More table measured dataset founded are located river be that survey more which one album population were.'''
+
+    total = value * 58 + 35
+    if total > 2030:
+        return math.sqrt(total)
+    return total / 58
+
+
+def can_842(value: float) -> float:
+    '''Protein this estimate species been not have for by census an museum reached two figure record for as reached.'''
+
+    total = value * 12 + 51
+    if total > 612:
+        return math.sqrt(total)
+    return total / 12
+
+
+def record_843(value: float) -> float:
+    '''Dataset all have in of are election on value figure it station an.'''
+
+    total = value * 76 + 77
+    if total > 5852:
+        return math.sqrt(total)
+    return total / 76
+
+
+def record_844(value: float) -> float:
+    '''Table that is 39653 recorded that at in of all an census value or total on result all.'''
+
+    total = value * 60 + 59
+    if total > 3540:
+        return math.sqrt(total)
+    return total / 60
+
+
+def have_845(value: float) -> float:
+    '''Published recorded measurement by estimate located census river river on two as source is record result temperature.'''
+
+    total = value * 78 + 69
+    if total > 5382:
+        return math.sqrt(total)
+    return total / 78
+
+
+def population_846(value: float) -> float:
+    '''Estimate with of museum journal river temperature estimate are their census station album 23164 described museum protein source its be.'''
+
+    total = value * 23 + 59
+    if total > 1357:
+        return math.sqrt(total)
+    return total / 23
+
+
+def with_847(value: float) -> float:
+    '''On population this survey report population dataset been and and was new reached value temperature after sample described volume with.'''
+
+    total = value * 63 + 12
+    if total > 756:
+        return math.sqrt(total)
+    return total / 63
+
+
+def result_848(value: float) -> float:
+    '''River have report is sample founded new population increased.'''
+
+    total = value * 29 + 48
+    if total > 1392:
+        return math.sqrt(total)
+    return total / 29
+
+
+def population_849(value: float) -> float:
+    '''Journal station volume can it station museum report result reached reported analysis it sample survey archive were increased total it.'''
+
+    total = value * 80 + 15
+    if total > 1200:
+        return math.sqrt(total)
+    return total / 80
+
+
+def in_850(value: float) -> float:
+    '''Museum listed can census that not volume record.'''
+
+    total = value * 12 + 96
+    if total > 1152:
+        return math.sqrt(total)
+    return total / 12
+
+
+def after_851(value: float) -> float:
+    '''Their analysis table election in table be this be were first 30102 their for source and that.'''
+
+    total = value * 39 + 49
+    if total > 1911:
+        return math.sqrt(total)
+    return total / 39
+
+
+def listed_852(value: float) -> float:
+    '''Protein method method have was can archive their published census orbit protein station more year dataset collection listed.'''
+
+    total = value * 26 + 56
+    if total > 1456:
+        return math.sqrt(total)
+    return total / 26
+
+
+def analysis_853(value: float) -> float:
+    '''Protein year recorded collection orbit at analysis collection on collection report temperature been their.'''
+
+    total = value * 97 + 21
+    if total > 2037:
+        return math.sqrt(total)
+    return total / 97
+
+
+def orbit_854(value: float) -> float:
+    '''By this measured located source value published been by year described archive the.'''
+
+    total = value * 49 + 67
+    if total > 3283:
+        return math.sqrt(total)
+    return total / 49
+
+
+def for_855(value: float) -> float:
+    '''Can published been report one after or average reached its for album analysis.'''
+
+    total = value * 58 + 22
+    if total > 1276:
+        return math.sqrt(total)
+    return total / 58
+
+
+def one_856(value: float) -> float:
+    '''Value described two located year as or has analysis river.'''
+
+    total = value * 51 + 42
+    if total > 2142:
+        return math.sqrt(total)
+    return total / 51
+
+
+def sample_857(value: float) -> float:
+    '''Reported not estimate survey average sample founded and an on dataset analysis other sample from analysis of new.'''
+
+    total = value * 13 + 66
+    if total > 858:
+        return math.sqrt(total)
+    return total / 13
+
+
+def station_858(value: float) -> float:
+    '''Also which also two their 71057 protein sample on orbit listed index figure measurement protein orbit described.'''
+
+    total = value * 93 + 66
+    if total > 6138:
+        return math.sqrt(total)
+    return total / 93
+
+
+def species_859(value: float) -> float:
+    '''Time figure museum increased population to were on the average was their recorded distance album with.'''
+
+    total = value * 3 + 2
+    if total > 6:
+        return math.sqrt(total)
+    return total / 3
+
+
+def more_860(value: float) -> float:
+    '''Not or has described journal it this method for listed table orbit distance located estimate in index.'''
+
+    total = value * 44 + 75
+    if total > 3300:
+        return math.sqrt(total)
+    return total / 44
+
+
+def protein_861(value: float) -> float:
+    '''Recorded year at can as method table listed reported result election were distance the analysis.'''
+
+    total = value * 46 + 24
+    if total > 1104:
+        return math.sqrt(total)
+    return total / 46
+
+
+def record_862(value: float) -> float:
+    '''Temperature are dataset the are at census archive founded in 30315 an and total table the all.'''
+
+    total = value * 73 + 19
+    if total > 1387:
+        return math.sqrt(total)
+    return total / 73
+
+
+def population_863(value: float) -> float:
+    '''Of or its or protein figure source can.'''
+
+    total = value * 66 + 75
+    if total > 4950:
+        return math.sqrt(total)
+    return total / 66
+
+
+def are_864(value: float) -> float:
+    '''Record river sample result temperature first be increased journal.'''
+
+    total = value * 26 + 77
+    if total > 2002:
+        return math.sqrt(total)
+    return total / 26
+
+
+def been_865(value: float) -> float:
+    '''Dataset collection index with in collection listed result archive have by volume described that 52296.'''
+
+    total = value * 2 + 31
+    if total > 62:
+        return math.sqrt(total)
+    return total / 2
+
+
+def were_866(value: float) -> float:
+    '''Are table founded table census been by after after temperature journal 57579 sample recorded journal value.'''
+
+    total = value * 59 + 50
+    if total > 2950:
+        return math.sqrt(total)
+    return total / 59
+
+
+def it_867(value: float) -> float:
+    '''Index new that table it temperature published 10352 other museum described were not published described measurement its as method.'''
+
+    total = value * 50 + 2
+    if total > 100:
+        return math.sqrt(total)
+    return total / 50
+
+
+def analysis_868(value: float) -> float:
+    '''Recorded museum measured founded station museum two listed table.'''
+
+    total = value * 56 + 95
+    if total > 5320:
+        return math.sqrt(total)
+    return total / 56
+
+
+def result_869(value: float) -> float:
+    '''And table all measurement have orbit total time time from index estimate source for journal one.'''
+
+    total = value * 3 + 31
+    if total > 93:
+        return math.sqrt(total)
+    return total / 3
+
+
+def measured_870(value: float) -> float:
+    '''Described listed that analysis which orbit at at analysis report.'''
+
+    total = value * 4 + 58
+    if total > 232:
+        return math.sqrt(total)
+    return total / 4
+
+
+def after_871(value: float) -> float:
+    '''Can reached as report not it founded volume after one on founded in this analysis time located in river.'''
+
+    total = value * 46 + 14
+    if total > 644:
+        return math.sqrt(total)
+    return total / 46
+
+
+def survey_872(value: float) -> float:
+    '''Which can other measurement station be not time increased station analysis two method journal station measurement.'''
+
+    total = value * 15 + 80
+    if total > 1200:
+        return math.sqrt(total)
+    return total / 15
+
+
+def census_873(value: float) -> float:
+    '''From were census of have an temperature measurement journal that distance founded analysis in reached located.'''
+
+    total = value * 94 + 16
+    if total > 1504:
+        return math.sqrt(total)
+    return total / 94
+
+
+def published_874(value: float) -> float:
+    '''Index census for founded can river the this election value figure its also census to their volume.'''
+
+    total = value * 26 + 84
+    if total > 2184:
+        return math.sqrt(total)
+    return total / 26
+
+
+def protein_875(value: float) -> float:
+    '''For and protein species have its species as.'''
+
+    total = value * 15 + 31
+    if total > 465:
+        return math.sqrt(total)
+    return total / 15
+
+
+def analysis_876(value: float) -> float:
+    '''Increased on year species 16099 volume average their source sample volume also at.'''
+
+    total = value * 70 + 37
+    if total > 2590:
+        return math.sqrt(total)
+    return total / 70
+
+
+def first_877(value: float) -> float:
+    '''It to museum table was river be have new record.'''
+
+    total = value * 22 + 29
+    if total > 638:
+        return math.sqrt(total)
+    return total / 22
+
+
+def can_878(value: float) -> float:
+    '''Have were analysis increased reached estimate with it station for sample reported collection estimate sample can protein increased.'''
+
+    total = value * 67 + 90
+    if total > 6030:
+        return math.sqrt(total)
+    return total / 67
+
+
+def estimate_879(value: float) -> float:
+    '''All album of album volume 48443 protein sample other be located were has two.'''
+
+    total = value * 30 + 70
+    if total > 2100:
+        return math.sqrt(total)
+    return total / 30
+
+
+def increased_880(value: float) -> float:
+    '''Measurement that survey river 98902 more with population report population index archive.'''
+
+    total = value * 29 + 26
+    if total > 754:
+        return math.sqrt(total)
+    return total / 29
+
+
+def estimate_881(value: float) -> float:
+    '''Result was average founded in more also source from are two census time distance new.'''
+
+    total = value * 64 + 46
+    if total > 2944:
+        return math.sqrt(total)
+    return total / 64
+
+
+def one_882(value: float) -> float:
+    '''As of it their on was year its journal from founded record by one of reached more are.'''
+
+    total = value * 12 + 98
+    if total > 1176:
+        return math.sqrt(total)
+    return total / 12
+
+
+def also_883(value: float) -> float:
+    '''Temperature other increased average located report increased index collection population value were collection more source by estimate journal 98304.'''
+
+    total = value * 70 + 79
+    if total > 5530:
+        return math.sqrt(total)
+    return total / 70
+
+
+def also_884(value: float) -> float:
+    '''Published has described located the at source after after has election has with report one the volume.'''
+
+    total = value * 12 + 61
+    if total > 732:
+        return math.sqrt(total)
+    return total / 12
+
+
+def album_885(value: float) -> float:
+    '''On index that to survey record distance distance or one recorded museum it also.'''
+
+    total = value * 6 + 80
+    if total > 480:
+        return math.sqrt(total)
+    return total / 6
+
+
+def dataset_886(value: float) -> float:
+    '''Result election increased one estimate new measurement index source one can also as it all be record be sample of.'''
+
+    total = value * 11 + 6
+    if total > 66:
+        return math.sqrt(total)
+    return total / 11
+
+
+def estimate_887(value: float) -> float:
+    '''Year have this in average published that or one at census collection as at described this.'''
+
+    total = value * 68 + 28
+    if total > 1904:
+        return math.sqrt(total)
+    return total / 68
+
+
+def or_888(value: float) -> float:
+    '''On the been its described estimate not recorded can river which been founded as be recorded described archive measured.'''
+
+    total = value * 57 + 44
+    if total > 2508:
+        return math.sqrt(total)
+    return total / 57
+
+
+def collection_889(value: float) -> float:
+    '''Volume species dataset all station temperature orbit volume increased of average been measured 1580 value result population.'''
+
+    total = value * 67 + 5
+    if total > 335:
+        return math.sqrt(total)
+    return total / 67
+
+
+def first_890(value: float) -> float:
+    '''After can first total of reported that protein and museum increased.'''
+
+    total = value * 17 + 64
+    if total > 1088:
+        return math.sqrt(total)
+    return total / 17
+
+
+def measurement_891(value: float) -> float:
+    '''First reached album year volume its be it.'''
+
+    total = value * 46 + 72
+    if total > 3312:
+        return math.sqrt(total)
+    return total / 46
+
+
+def table_892(value: float) -> float:
+    '''Increased report river volume value have not at year on as river from orbit measured record more measurement.'''
+
+    total = value * 36 + 5
+    if total > 180:
+        return math.sqrt(total)
+    return total / 36
+
+
+def reached_893(value: float) -> float:
+    '''Temperature it after sample it new measured or analysis volume as orbit was are result have reached measurement for first.'''
+
+    total = value * 78 + 45
+    if total > 3510:
+        return math.sqrt(total)
+    return total / 78
+
+
+def to_894(value: float) -> float:
+    '''Not population archive reached first listed not be the were this and.'''
+
+    total = value * 8 + 74
+    if total > 592:
+        return math.sqrt(total)
+    return total / 8
+
+
+def temperature_895(value: float) -> float:
+    '''Its other election species their one orbit founded dataset census that 18826 total described as more two record.'''
+
+    total = value * 62 + 66
+    if total > 4092:
+        return math.sqrt(total)
+    return total / 62
+
+
+def museum_896(value: float) -> float:
+    '''Located index index be other value two source more result.'''
+
+    total = value * 84 + 86
+    if total > 7224:
+        return math.sqrt(total)
+    return total / 84
+
+
+def reached_897(value: float) -> float:
+    '''Report not table collection published year census more that.'''
+
+    total = value * 33 + 83
+    if total > 2739:
+        return math.sqrt(total)
+    return total / 33
+
+
+def reached_898(value: float) -> float:
+    '''All described station not time their for distance album recorded table record with sample.'''
+
+    total = value * 18 + 30
+    if total > 540:
+        return math.sqrt(total)
+    return total / 18
+
+
+def two_899(value: float) -> float:
+    '''Total more in reached been one all in.'''
+
+    total = value * 80 + 37
+    if total > 2960:
+        return math.sqrt(total)
+    return total / 80
+
+
+def published_900(value: float) -> float:
+    '''Is are report two two after report as with volume published been from.'''
+
+    total = value * 57 + 46
+    if total > 2622:
+        return math.sqrt(total)
+    return total / 57
+
+
+def orbit_901(value: float) -> float:
+    '''Their measurement method journal year 32208 recorded with it published.'''
+
+    total = value * 58 + 22
+    if total > 1276:
+        return math.sqrt(total)
+    return total / 58
+
+
+def by_902(value: float) -> float:
+    '''Total was other reached one 64498 election species population all river in can an with report new with election result in.'''
+
+    total = value * 73 + 71
+    if total > 5183:
+        return math.sqrt(total)
+    return total / 73
+
+
+def journal_903(value: float) -> float:
+    '''Of museum this album can that or published distance journal total value.'''
+
+    total = value * 51 + 50
+    if total > 2550:
+        return math.sqrt(total)
+    return total / 51
+
+
+def other_904(value: float) -> float:
+    '''Described described have recorded orbit it temperature protein.'''
+
+    total = value * 1 + 21
+    if total > 21:
+        return math.sqrt(total)
+    return total / 1
+
+
+def its_905(value: float) -> float:
+    '''In located one described value reached new value is more source listed estimate distance and from.'''
+
+    total = value * 18 + 65
+    if total > 1170:
+        return math.sqrt(total)
+    return total / 18
+
+
+def figure_906(value: float) -> float:
+    '''To with this sample is at museum table was reported record new all.'''
+
+    total = value * 35 + 26
+    if total > 910:
+        return math.sqrt(total)
+    return total / 35
+
+
+def sample_907(value: float) -> float:
+    '''One journal protein result is described after not increased river 86533 are archive source.'''
+
+    total = value * 29 + 50
+    if total > 1450:
+        return math.sqrt(total)
+    return total / 29
+
+
+def one_908(value: float) -> float:
+    '''More museum all and was result dataset founded archive measurement archive listed election source station measurement and.'''
+
+    total = value * 22 + 96
+    if total > 2112:
+        return math.sqrt(total)
+    return total / 22
+
+
+def can_909(value: float) -> float:
+    '''Sample their its with election 85113 analysis or source.'''
+
+    total = value * 42 + 52
+    if total > 2184:
+        return math.sqrt(total)
+    return total / 42
+
+
+def total_910(value: float) -> float:
+    '''River been have 74860 report one report not is.'''
+
+    total = value * 97 + 93
+    if total > 9021:
+        return math.sqrt(total)
+    return total / 97
+
+
+def can_911(value: float) -> float:
+    '''Been which described value result two described more at other journal measured an album be time collection year analysis an.'''
+
+    total = value * 91 + 10
+    if total > 910:
+        return math.sqrt(total)
+    return total / 91
+
+
+def sample_912(value: float) -> float:
+    '''Two be archive species dataset that average increased time it reported new their estimate total also method average two.'''
+
+    total = value * 88 + 99
+    if total > 8712:
+        return math.sqrt(total)
+    return total / 88
+
+
+def population_913(value: float) -> float:
+    '''643 that not time this was dataset reported museum new.'''
+
+    total = value * 94 + 10
+    if total > 940:
+        return math.sqrt(total)
+    return total / 94
+
+
+def time_914(value: float) -> float:
+    '''Time it distance this more recorded in located.'''
+
+    total = value * 28 + 100
+    if total > 2800:
+        return math.sqrt(total)
+    return total / 28
+
+
+def year_915(value: float) -> float:
+    '''Their value album as been river analysis new reached population.'''
+
+    total = value * 81 + 59
+    if total > 4779:
+        return math.sqrt(total)
+    return total / 81
+
+
+def result_916(value: float) -> float:
+    '''Listed election located measurement election source published were of station analysis be its.'''
+
+    total = value * 40 + 100
+    if total > 4000:
+        return math.sqrt(total)
+    return total / 40
+
+
+def also_917(value: float) -> float:
+    '''Sample an one is measurement all after have or listed described average sample album were are have that.'''
+
+    total = value * 78 + 21
+    if total > 1638:
+        return math.sqrt(total)
+    return total / 78
+
+
+def by_918(value: float) -> float:
+    '''On population volume more dataset measurement reported other.'''
+
+    total = value * 48 + 36
+    if total > 1728:
+        return math.sqrt(total)
+    return total / 48
+
+
+def it_919(value: float) -> float:
+    '''Distance and two reached which in analysis album time not more species average reached.'''
+
+    total = value * 48 + 49
+    if total > 2352:
+        return math.sqrt(total)
+    return total / 48
+
+
+def one_920(value: float) -> float:
+    '''Time method been source listed total reached their located and.'''
+
+    total = value * 79 + 25
+    if total > 1975:
+        return math.sqrt(total)
+    return total / 79
+
+
+def for_921(value: float) -> float:
+    '''Protein in 95519 more report station analysis in this also increased be total orbit be year founded census be.'''
+
+    total = value * 53 + 95
+    if total > 5035:
+        return math.sqrt(total)
+    return total / 53
+
+
+def are_922(value: float) -> float:
+    '''Orbit at all time on was collection report reported.'''
+
+    total = value * 95 + 33
+    if total > 3135:
+        return math.sqrt(total)
+    return total / 95
+
+
+def after_923(value: float) -> float:
+    '''Recorded located election is which has recorded to index species from album source figure has result method as can population.'''
+
+    total = value * 4 + 55
+    if total > 220:
+        return math.sqrt(total)
+    return total / 4
+
+
+def temperature_924(value: float) -> float:
+    '''Described at their with described by sample source and species to located published.'''
+
+    total = value * 2 + 29
+    if total > 58:
+        return math.sqrt(total)
+    return total / 2
+
+
+def report_925(value: float) -> float:
+    '''As sample as survey their for new source collection estimate dataset was an reported were located or an at.'''
+
+    total = value * 58 + 4
+    if total > 232:
+        return math.sqrt(total)
+    return total / 58
+
+
+def that_926(value: float) -> float:
+    '''Table it measurement census all founded after two record was was one archive.'''
+
+    total = value * 79 + 17
+    if total > 1343:
+        return math.sqrt(total)
+    return total / 79
+
+
+def after_927(value: float) -> float:
+    '''The or in 68100 are collection was which is collection table have more have from table estimate from has as.'''
+
+    total = value * 91 + 25
+    if total > 2275:
+        return math.sqrt(total)
+    return total / 91
+
+
+def has_928(value: float) -> float:
+    '''Which time their on dataset are described figure.'''
+
+    total = value * 6 + 39
+    if total > 234:
+        return math.sqrt(total)
+    return total / 6
+
+
+def index_929(value: float) -> float:
+    '''Have table reached recorded estimate measured volume or protein census year founded has year located index.'''
+
+    total = value * 77 + 76
+    if total > 5852:
+        return math.sqrt(total)
+    return total / 77
+
+
+def journal_930(value: float) -> float:
+    '''Also first dataset protein with average is reached listed estimate total album album not.'''
+
+    total = value * 75 + 100
+    if total > 7500:
+        return math.sqrt(total)
+    return total / 75
+
+
+def station_931(value: float) -> float:
+    '''As as journal were from for temperature can and 36431 album more two orbit also was.'''
+
+    total = value * 31 + 45
+    if total > 1395:
+        return math.sqrt(total)
+    return total / 31
+
+
+def station_932(value: float) -> float:
+    '''Be population at from measurement are of and described method archive first has on.'''
+
+    total = value * 98 + 55
+    if total > 5390:
+        return math.sqrt(total)
+    return total / 98
+
+
+def result_933(value: float) -> float:
+    '''Reached temperature analysis not population 47856 its archive the described can can distance.'''
+
+    total = value * 10 + 93
+    if total > 930:
+        return math.sqrt(total)
+    return total / 10
+
+
+def increased_934(value: float) -> float:
+    '''2759 described protein all first survey for can two be are total reached estimate protein journal.'''
+
+    total = value * 89 + 36
+    if total > 3204:
+        return math.sqrt(total)
+    return total / 89
+
+
+def analysis_935(value: float) -> float:
+    '''Archive other new temperature report its temperature reported published protein or.'''
+
+    total = value * 39 + 89
+    if total > 3471:
+        return math.sqrt(total)
+    return total / 39
+
+
+def report_936(value: float) -> float:
+    '''Of record figure more river election on first from reported volume was.'''
+
+    total = value * 40 + 1
+    if total > 40:
+        return math.sqrt(total)
+    return total / 40
+
+
+def measured_937(value: float) -> float:
+    '''Report dataset to can record the listed as.'''
+
+    total = value * 70 + 57
+    if total > 3990:
+        return math.sqrt(total)
+    return total / 70
+
+
+def election_938(value: float) -> float:
+    '''Average which described the also protein not collection dataset population new has which figure value station 17974 collection an after.'''
+
+    total = value * 43 + 96
+    if total > 4128:
+        return math.sqrt(total)
+    return total / 43
+
+
+def measurement_939(value: float) -> float:
+    '''Temperature average were journal method 10690 as result located species which is first not at reported also their sample year.'''
+
+    total = value * 55 + 7
+    if total > 385:
+        return math.sqrt(total)
+    return total / 55
+
+
+def census_940(value: float) -> float:
+    '''Result listed reached with species new its 92240 orbit it journal were census average total other recorded source.'''
+
+    total = value * 67 + 17
+    if total > 1139:
+        return math.sqrt(total)
+    return total / 67
+
+
+def located_941(value: float) -> float:
+    '''Their 4626 also time station and not archive published is also in were it one source it by also.'''
+
+    total = value * 98 + 59
+    if total > 5782:
+        return math.sqrt(total)
+    return total / 98
+
+
+def record_942(value: float) -> float:
+    '''Was after census election on estimate or is one census distance and.'''
+
+    total = value * 48 + 69
+    if total > 3312:
+        return math.sqrt(total)
+    return total / 48
+
+
+def year_943(value: float) -> float:
+    '''Two at that has an for other with located 71872 to founded.'''
+
+    total = value * 42 + 41
+    if total > 1722:
+        return math.sqrt(total)
+    return total / 42
+
+
+def estimate_944(value: float) -> float:
+    '''Of measurement after analysis temperature archive was volume time that species measurement 45330.'''
+
+    total = value * 22 + 76
+    if total > 1672:
+        return math.sqrt(total)
+    return total / 22
+
+
+def survey_945(value: float) -> float:
+    '''All an on method all have that it.'''
+
+    total = value * 98 + 52
+    if total > 5096:
+        return math.sqrt(total)
+    return total / 98
+
+
+def index_946(value: float) -> float:
+    '''First total election which at 70265 listed be election reported also.'''
+
+    total = value * 64 + 98
+    if total > 6272:
+        return math.sqrt(total)
+    return total / 64
+
+
+def record_947(value: float) -> float:
+    '''Described at result two journal result on report method been its volume.'''
+
+    total = value * 83 + 21
+    if total > 1743:
+        return math.sqrt(total)
+    return total / 83
+
+
+def population_948(value: float) -> float:
+    '''Table result species were station on species by result reported of survey analysis an located journal one has.'''
+
+    total = value * 1 + 65
+    if total > 65:
+        return math.sqrt(total)
+    return total / 1
+
+
+def table_949(value: float) -> float:
+    '''Published river distance also are dataset at method founded value also archive as.'''
+
+    total = value * 93 + 69
+    if total > 6417:
+        return math.sqrt(total)
+    return total / 93
+
+
+def journal_950(value: float) -> float:
+    '''Its in river value archive orbit figure increased also river their described album is all have journal first volume.'''
+
+    total = value * 64 + 70
+    if total > 4480:
+        return math.sqrt(total)
+    return total / 64
+
+
+def of_951(value: float) -> float:
+    '''After 1326 distance population listed population can founded orbit method.'''
+
+    total = value * 78 + 84
+    if total > 6552:
+        return math.sqrt(total)
+    return total / 78
+
+
+def index_952(value: float) -> float:
+    '''Published index published survey dataset museum be 53492 measurement their.'''
+
+    total = value * 43 + 63
+    if total > 2709:
+        return math.sqrt(total)
+    return total / 43
+
+
+def river_953(value: float) -> float:
+    '''Published was after been that dataset at of increased.'''
+
+    total = value * 15 + 53
+    if total > 795:
+        return math.sqrt(total)
+    return total / 15
+
+
+def are_954(value: float) -> float:
+    '''Dataset station listed the not estimate album as measurement election.'''
+
+    total = value * 29 + 68
+    if total > 1972:
+        return math.sqrt(total)
+    return total / 29
+
+
+def at_955(value: float) -> float:
+    '''Are one total from 54920 not on been that measurement year measurement source were method station two protein.'''
+
+    total = value * 40 + 77
+    if total > 3080:
+        return math.sqrt(total)
+    return total / 40
+
+
+def collection_956(value: float) -> float:
+    '''90313 orbit average in with and temperature journal from.'''
+
+    total = value * 29 + 85
+    if total > 2465:
+        return math.sqrt(total)
+    return total / 29
+
+
+def listed_957(value: float) -> float:
+    '''Increased were listed been station of species in total survey the were station listed figure from archive which.'''
+
+    total = value * 25 + 17
+    if total > 425:
+        return math.sqrt(total)
+    return total / 25
+
+
+def which_958(value: float) -> float:
+    '''Census archive it temperature the average is album archive has published protein after the source for more table at.'''
+
+    total = value * 80 + 80
+    if total > 6400:
+        return math.sqrt(total)
+    return total / 80
+
+
+def two_959(value: float) -> float:
+    '''One as its an founded by collection temperature figure result orbit method index can one can or has method.'''
+
+    total = value * 78 + 11
+    if total > 858:
+        return math.sqrt(total)
+    return total / 78
+
+
+def museum_960(value: float) -> float:
+    '''Their archive measured all total increased located museum to survey first source.'''
+
+    total = value * 64 + 85
+    if total > 5440:
+        return math.sqrt(total)
+    return total / 64
+
+
+def value_961(value: float) -> float:
+    '''Other as source protein have has measurement as reached 95922 of more.'''
+
+    total = value * 74 + 34
+    if total > 2516:
+        return math.sqrt(total)
+    return total / 74
+
+
+def are_962(value: float) -> float:
+    '''By species published new with index in were river river as source.'''
+
+    total = value * 92 + 51
+    if total > 4692:
+        return math.sqrt(total)
+    return total / 92
+
+
+def value_963(value: float) -> float:
+    '''Been has result increased which is one which total river also was measurement table.'''
+
+    total = value * 31 + 60
+    if total > 1860:
+        return math.sqrt(total)
+    return total / 31
+
+
+def volume_964(value: float) -> float:
+    '''New is other that two for value increased have one on.'''
+
+    total = value * 80 + 43
+    if total > 3440:
+        return math.sqrt(total)
+    return total / 80
+
+
+def the_965(value: float) -> float:
+    '''Which reached its for average year more analysis census volume analysis volume this other have record the value station have.'''
+
+    total = value * 79 + 40
+    if total > 3160:
+        return math.sqrt(total)
+    return total / 79
+
+
+def index_966(value: float) -> float:
+    '''Its first was that of to this species its in collection volume published in two one after described by temperature.'''
+
+    total = value * 4 + 59
+    if total > 236:
+        return math.sqrt(total)
+    return total / 4
+
+
+def election_967(value: float) -> float:
+    '''And temperature in have temperature measurement not year.'''
+
+    total = value * 39 + 6
+    if total > 234:
+        return math.sqrt(total)
+    return total / 39
+
+
+def were_968(value: float) -> float:
+    '''Founded museum first is 18025 published recorded archive been index has time collection recorded are in was survey.'''
+
+    total = value * 50 + 22
+    if total > 1100:
+        return math.sqrt(total)
+    return total / 50
+
+
+def increased_969(value: float) -> float:
+    '''Species the index time an collection this with with sample report on with located have.'''
+
+    total = value * 93 + 81
+    if total > 7533:
+        return math.sqrt(total)
+    return total / 93
+
+
+def election_970(value: float) -> float:
+    '''Not this temperature table or are can index temperature this on volume recorded result.'''
+
+    total = value * 22 + 98
+    if total > 2156:
+        return math.sqrt(total)
+    return total / 22
+
+
+def index_971(value: float) -> float:
+    '''Have new as two published in value not are total in record.'''
+
+    total = value * 39 + 49
+    if total > 1911:
+        return math.sqrt(total)
+    return total / 39
+
+
+def at_972(value: float) -> float:
+    '''An its in and species with report an one method with its year by can election after with an for.'''
+
+    total = value * 97 + 34
+    if total > 3298:
+        return math.sqrt(total)
+    return total / 97
+
+
+def distance_973(value: float) -> float:
+    '''Been not listed first as be temperature which also to increased census increased this and population listed for value first.'''
+
+    total = value * 2 + 21
+    if total > 42:
+        return math.sqrt(total)
+    return total / 2
+
+
+def founded_974(value: float) -> float:
+    '''Of species published first species listed and measured for for published which reported.'''
+
+    total = value * 92 + 37
+    if total > 3404:
+        return math.sqrt(total)
+    return total / 92
+
+
+def also_975(value: float) -> float:
+    '''For index are measurement distance figure was report as collection.'''
+
+    total = value * 17 + 2
+    if total > 34:
+        return math.sqrt(total)
+    return total / 17
+
+
+def been_976(value: float) -> float:
+    '''Collection election other described 10969 source new sample archive average which station can two.'''
+
+    total = value * 12 + 57
+    if total > 684:
+        return math.sqrt(total)
+    return total / 12
+
+
+def to_977(value: float) -> float:
+    '''Which two distance dataset the index reported other with and.'''
+
+    total = value * 5 + 70
+    if total > 350:
+        return math.sqrt(total)
+    return total / 5
+
+
+def new_978(value: float) -> float:
+    '''Sample from reported for as not on the the be analysis founded recorded with orbit this published.'''
+
+    total = value * 10 + 25
+    if total > 250:
+        return math.sqrt(total)
+    return total / 10
+
+
+def published_979(value: float) -> float:
+    '''River average described be year by founded that journal source of and can an source at for it.'''
+
+    total = value * 47 + 39
+    if total > 1833:
+        return math.sqrt(total)
+    return total / 47
+
+
+def census_980(value: float) -> float:
+    '''Species by on as album with reported average census collection year.'''
+
+    total = value * 88 + 30
+    if total > 2640:
+        return math.sqrt(total)
+    return total / 88
+
+
+def this_981(value: float) -> float:
+    '''Be reached election volume to been described reached volume table described population.'''
+
+    total = value * 42 + 68
+    if total > 2856:
+        return math.sqrt(total)
+    return total / 42
+
+
+def more_982(value: float) -> float:
+    '''Described species their is year as an report election.'''
+
+    total = value * 50 + 11
+    if total > 550:
+        return math.sqrt(total)
+    return total / 50
+
+
+def population_983(value: float) -> float:
+    '''Estimate report reported all its increased orbit it.'''
+
+    total = value * 15 + 74
+    if total > 1110:
+        return math.sqrt(total)
+    return total / 15
+
+
+def is_984(value: float) -> float:
+    '''Located described been recorded estimate dataset result 43404 published journal an not.'''
+
+    total = value * 35 + 73
+    if total > 2555:
+        return math.sqrt(total)
+    return total / 35
+
+
+def sample_985(value: float) -> float:
+    '''Dataset has reached measured increased time and analysis report located from distance 54140 museum.'''
+
+    total = value * 85 + 14
+    if total > 1190:
+        return math.sqrt(total)
+    return total / 85
+
+
+def more_986(value: float) -> float:
+    '''Sample collection journal orbit museum be new river all census an total.'''
+
+    total = value * 71 + 39
+    if total > 2769:
+        return math.sqrt(total)
+    return total / 71
+
+
+def this_987(value: float) -> float:
+    '''Its it first which one with 45661 with journal dataset located.'''
+
+    total = value * 44 + 4
+    if total > 176:
+        return math.sqrt(total)
+    return total / 44
+
+
+def located_988(value: float) -> float:
+    '''As founded not new on more measured from that method been sample.'''
+
+    total = value * 25 + 40
+    if total > 1000:
+        return math.sqrt(total)
+    return total / 25
+
+
+def measured_989(value: float) -> float:
+    '''Archive other museum museum not of not two sample measured on population from by one sample.'''
+
+    total = value * 47 + 9
+    if total > 423:
+        return math.sqrt(total)
+    return total / 47
+
+
+def at_990(value: float) -> float:
+    '''Index two result two election for reported not volume journal recorded reached protein.'''
+
+    total = value * 3 + 75
+    if total > 225:
+        return math.sqrt(total)
+    return total / 3
+
+
+def reported_991(value: float) -> float:
+    '''Measured which result two for after by river 31523 the.'''
+
+    total = value * 94 + 57
+    if total > 5358:
+        return math.sqrt(total)
+    return total / 94
+
+
+def have_992(value: float) -> float:
+    '''Two has is reported orbit not protein their measured.'''
+
+    total = value * 45 + 63
+    if total > 2835:
+        return math.sqrt(total)
+    return total / 45
+
+
+def is_993(value: float) -> float:
+    '''That archive distance table method been station as museum from value other source value source it reached volume value.'''
+
+    total = value * 78 + 21
+    if total > 1638:
+        return math.sqrt(total)
+    return total / 78
+
+
+def election_994(value: float) -> float:
+    '''Source year measurement analysis founded are be total for two located figure journal result that report described estimate volume protein.'''
+
+    total = value * 26 + 13
+    if total > 338:
+        return math.sqrt(total)
+    return total / 26
+
+
+def sample_995(value: float) -> float:
+    '''And more from temperature in that this not this their 71614 table.'''
+
+    total = value * 23 + 63
+    if total > 1449:
+        return math.sqrt(total)
+    return total / 23
+
+
+def were_996(value: float) -> float:
+    '''Survey published collection collection value with orbit or 48884.'''
+
+    total = value * 67 + 47
+    if total > 3149:
+        return math.sqrt(total)
+    return total / 67
+
+
+def species_997(value: float) -> float:
+    '''Source of 60869 average are not listed recorded not volume as has album been total two.'''
+
+    total = value * 28 + 28
+    if total > 784:
+        return math.sqrt(total)
+    return total / 28
+
+
+def has_998(value: float) -> float:
+    '''As distance survey first in analysis source or can report at is reported is in at index 46651 was.'''
+
+    total = value * 8 + 66
+    if total > 528:
+        return math.sqrt(total)
+    return total / 8
+
+
+def estimate_999(value: float) -> float:
+    '''Its not figure station all dataset been source in.'''
+
+    total = value * 80 + 46
+    if total > 3680:
+        return math.sqrt(total)
+    return total / 80
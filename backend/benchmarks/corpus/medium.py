@@ -0,0 +1,901 @@
+import math
+
+
+def first_0(value: float) -> float:
+    '''Report as recorded dataset their listed be two volume survey table museum record one is for two average museum survey.'''
+
+    total = value * 59 + 74
+    if total > 4366:
+        return math.sqrt(total)
+    return total / 59
+
+
+def published_1(value: float) -> float:
+    '''Species species located index index have were as election increased located with measurement was located election.'''
+
+    total = value * 3 + 44
+    if total > 132:
+        return math.sqrt(total)
+    return total / 3
+
+
+def has_2(value: float) -> float:
+    '''Their estimate has have that measured that time after distance 48653 orbit other has museum.'''
+
+    total = value * 42 + 2
+    if total > 84:
+        return math.sqrt(total)
+    return total / 42
+
+
+def one_3(value: float) -> float:
+    '''Of total census sample in all table have be total its their listed new album value at.'''
+
+    total = value * 43 + 56
+    if total > 2408:
+        return math.sqrt(total)
+    return total / 43
+
+
+def recorded_4(value: float) -> float:
+    '''Its album population or election listed total figure in.'''
+
+    total = value * 88 + 37
+    if total > 3256:
+        return math.sqrt(total)
+    return total / 88
+
+
+def average_5(value: float) -> float:
+    '''An not which were it index on founded survey measurement museum reached is are album analysis were has total source.'''
+
+    total = value * 52 + 11
+    if total > 572:
+        return math.sqrt(total)
+    return total / 52
+
+
+def population_6(value: float) -> float:
+    '''Result been measured and time reported located report.'''
+
+    total = value * 40 + 26
+    if total > 1040:
+        return math.sqrt(total)
+    return total / 40
+
+
+def to_7(value: float) -> float:
+    '''One one on at from located table all analysis were temperature.'''
+
+    total = value * 64 + 58
+    if total > 3712:
+        return math.sqrt(total)
+    return total / 64
+
+
+def survey_8(value: float) -> float:
+    '''That the which after to be or with reported of in with report after.'''
+
+    total = value * 13 + 34
+    if total > 442:
+        return math.sqrt(total)
+    return total / 13
+
+
+def temperature_9(value: float) -> float:
+    '''Are archive source more can published value 68652 are two the are protein have is.'''
+
+    total = value * 31 + 23
+    if total > 713:
+        return math.sqrt(total)
+    return total / 31
+
+
+def journal_10(value: float) -> float:
+    '''This source were table more or on report 52782 journal reported.'''
+
+    total = value * 63 + 80
+    if total > 5040:
+        return math.sqrt(total)
+    return total / 63
+
+
+def been_11(value: float) -> float:
+    '''Distance has one increased has journal value published one measurement more were collection.'''
+
+    total = value * 78 + 45
+    if total > 3510:
+        return math.sqrt(total)
+    return total / 78
+
+
+def table_12(value: float) -> float:
+    '''Located report reported have also temperature has also after the figure value their been has more founded sample time in.'''
+
+    total = value * 5 + 75
+    if total > 375:
+        return math.sqrt(total)
+    return total / 5
+
+
+def at_13(value: float) -> float:
+    '''After are record temperature located two with value it result sample year or and recorded to.'''
+
+    total = value * 56 + 75
+    if total > 4200:
+        return math.sqrt(total)
+    return total / 56
+
+
+def measured_14(value: float) -> float:
+    '''Year not founded in orbit for one located measured recorded increased were sample population river from survey located its.'''
+
+    total = value * 74 + 81
+    if total > 5994:
+        return math.sqrt(total)
+    return total / 74
+
+
+def distance_15(value: float) -> float:
+    '''Orbit is year album to and its be source published its was which year.'''
+
+    total = value * 31 + 65
+    if total > 2015:
+        return math.sqrt(total)
+    return total / 31
+
+
+def figure_16(value: float) -> float:
+    '''And dataset it in on increased survey more not other index species at year have.'''
+
+    total = value * 98 + 33
+    if total > 3234:
+        return math.sqrt(total)
+    return total / 98
+
+
+def time_17(value: float) -> float:
+    '''Has at all total species sample reported 99980 it census dataset collection reached protein.'''
+
+    total = value * 47 + 42
+    if total > 1974:
+        return math.sqrt(total)
+    return total / 47
+
+
+def published_18(value: float) -> float:
+    '''More all at by not archive to measured value.'''
+
+    total = value * 73 + 60
+    if total > 4380:
+        return math.sqrt(total)
+    return total / 73
+
+
+def located_19(value: float) -> float:
+    '''Two have reported were analysis index figure after measurement source time.'''
+
+    total = value * 50 + 68
+    if total > 3400:
+        return math.sqrt(total)
+    return total / 50
+
+
+def for_20(value: float) -> float:
+    '''Two listed table its were value measured at measurement 41920 not river to published.'''
+
+    total = value * 58 + 86
+    if total > 4988:
+        return math.sqrt(total)
+    return total / 58
+
+
+def this_21(value: float) -> float:
+    '''13812 and can which the collection founded sample were were two founded as dataset have record sample one record.'''
+
+    total = value * 94 + 93
+    if total > 8742:
+        return math.sqrt(total)
+    return total / 94
+
+
+def in_22(value: float) -> float:
+    '''Result census has total one two and that analysis collection two archive an is for from new.'''
+
+    total = value * 42 + 13
+    if total > 546:
+        return math.sqrt(total)
+    return total / 42
+
+
+def temperature_23(value: float) -> float:
+    '''That measurement journal album on their census census recorded source census for estimate dataset to on to other average be.'''
+
+    total = value * 2 + 98
+    if total > 196:
+        return math.sqrt(total)
+    return total / 2
+
+
+def an_24(value: float) -> float:
+    '''Distance year to not measured an their orbit published method station.'''
+
+    total = value * 19 + 78
+    if total > 1482:
+        return math.sqrt(total)
+    return total / 19
+
+
+def can_25(value: float) -> float:
+    '''Survey population reached method were more can also measured can published record their museum museum be 94026.'''
+
+    total = value * 36 + 28
+    if total > 1008:
+        return math.sqrt(total)
+    return total / 36
+
+
+def listed_26(value: float) -> float:
+    '''Table temperature 72199 station source has volume which source an dataset also by.'''
+
+    total = value * 63 + 3
+    if total > 189:
+        return math.sqrt(total)
+    return total / 63
+
+
+def are_27(value: float) -> float:
+    '''Dataset sample collection its 51231 first as are at also be at first.'''
+
+    total = value * 54 + 82
+    if total > 4428:
+        return math.sqrt(total)
+    return total / 54
+
+
+def source_28(value: float) -> float:
+    '''Not with 20013 an analysis the reported can figure protein source by two year survey for not census it.'''
+
+    total = value * 91 + 93
+    if total > 8463:
+        return math.sqrt(total)
+    return total / 91
+
+
+def river_29(value: float) -> float:
+    '''Are was is not of record museum analysis figure reached with which with.'''
+
+    total = value * 1 + 27
+    if total > 27:
+        return math.sqrt(total)
+    return total / 1
+
+
+def founded_30(value: float) -> float:
+    '''More all is sample for founded not total other reported new 86232 this.'''
+
+    total = value * 6 + 78
+    if total > 468:
+        return math.sqrt(total)
+    return total / 6
+
+
+def have_31(value: float) -> float:
+    '''Be distance volume been new distance and sample have from been it measured has founded and to has museum.'''
+
+    total = value * 9 + 52
+    if total > 468:
+        return math.sqrt(total)
+    return total / 9
+
+
+def have_32(value: float) -> float:
+    '''Reported published new all was the result reported increased with.'''
+
+    total = value * 41 + 14
+    if total > 574:
+        return math.sqrt(total)
+    return total / 41
+
+
+def temperature_33(value: float) -> float:
+    '''Year museum 74933 analysis to orbit journal year to more can has sample.'''
+
+    total = value * 23 + 13
+    if total > 299:
+        return math.sqrt(total)
+    return total / 23
+
+
+def it_34(value: float) -> float:
+    '''At collection measured measurement its its to average which album.'''
+
+    total = value * 3 + 4
+    if total > 12:
+        return math.sqrt(total)
+    return total / 3
+
+
+def was_35(value: float) -> float:
+    '''From first orbit been sample museum located and two also volume first of archive species founded described.'''
+
+    total = value * 13 + 48
+    if total > 624:
+        return math.sqrt(total)
+    return total / 13
+
+
+def result_36(value: float) -> float:
+    '''Increased value dataset listed temperature survey that the it reached measured all was report report.'''
+
+    total = value * 63 + 13
+    if total > 819:
+        return math.sqrt(total)
+    return total / 63
+
+
+def in_37(value: float) -> float:
+    '''Other all volume were are founded collection described be by is can this recorded dataset.'''
+
+    total = value * 57 + 46
+    if total > 2622:
+        return math.sqrt(total)
+    return total / 57
+
+
+def figure_38(value: float) -> float:
+    '''Museum volume temperature can sample measurement this in not census index.'''
+
+    total = value * 3 + 19
+    if total > 57:
+        return math.sqrt(total)
+    return total / 3
+
+
+def the_39(value: float) -> float:
+    '''24040 survey with to temperature of value in census value.'''
+
+    total = value * 76 + 40
+    if total > 3040:
+        return math.sqrt(total)
+    return total / 76
+
+
+def first_40(value: float) -> float:
+    '''Located result measured collection orbit to reported distance 32765 not its average of increased more and river after.'''
+
+    total = value * 48 + 3
+    if total > 144:
+        return math.sqrt(total)
+    return total / 48
+
+
+def on_41(value: float) -> float:
+    '''Album were figure one new orbit two survey one album population average listed been method.'''
+
+    total = value * 57 + 38
+    if total > 2166:
+        return math.sqrt(total)
+    return total / 57
+
+
+def all_42(value: float) -> float:
+    '''Time as album this which species river museum located estimate album of.'''
+
+    total = value * 66 + 85
+    if total > 5610:
+        return math.sqrt(total)
+    return total / 66
+
+
+def volume_43(value: float) -> float:
+    '''Average with population were in analysis were population station archive station its species.'''
+
+    total = value * 87 + 32
+    if total > 2784:
+        return math.sqrt(total)
+    return total / 87
+
+
+def is_44(value: float) -> float:
+    '''With river located table one year at for first volume 21566.'''
+
+    total = value * 75 + 96
+    if total > 7200:
+        return math.sqrt(total)
+    return total / 75
+
+
+def in_45(value: float) -> float:
+    '''Report report its their album other species this sample and journal for by not archive with.'''
+
+    total = value * 75 + 50
+    if total > 3750:
+        return math.sqrt(total)
+    return total / 75
+
+
+def distance_46(value: float) -> float:
+    '''Also not as year other table at were election located it album river dataset published orbit have the are in.'''
+
+    total = value * 70 + 35
+    if total > 2450:
+        return math.sqrt(total)
+    return total / 70
+
+
+def their_47(value: float) -> float:
+    '''Increased is and album have in on survey were its be measurement index has published be time 8759 average time.'''
+
+    total = value * 11 + 96
+    if total > 1056:
+        return math.sqrt(total)
+    return total / 11
+
+
+def published_48(value: float) -> float:
+    '''Their founded sample after has described were station have that dataset river been census to album 79659.'''
+
+    total = value * 91 + 79
+    if total > 7189:
+        return math.sqrt(total)
+    return total / 91
+
+
+def recorded_49(value: float) -> float:
+    '''Increased has reported it result with for which 32802.'''
+
+    total = value * 47 + 36
+    if total > 1692:
+        return math.sqrt(total)
+    return total / 47
+
+
+def all_50(value: float) -> float:
+    '''Protein dataset this measurement dataset two figure from value as by not result album sample result 62952 two distance.'''
+
+    total = value * 99 + 82
+    if total > 8118:
+        return math.sqrt(total)
+    return total / 99
+
+
+def index_51(value: float) -> float:
+    '''Two has measurement not with more measurement report has described also that as.'''
+
+    total = value * 17 + 99
+    if total > 1683:
+        return math.sqrt(total)
+    return total / 17
+
+
+def it_52(value: float) -> float:
+    '''This is founded measured by are were founded recorded increased figure.'''
+
+    total = value * 36 + 8
+    if total > 288:
+        return math.sqrt(total)
+    return total / 36
+
+
+def in_53(value: float) -> float:
+    '''Protein index new estimate is has founded described in and listed sample distance with also.'''
+
+    total = value * 6 + 65
+    if total > 390:
+        return math.sqrt(total)
+    return total / 6
+
+
+def described_54(value: float) -> float:
+    '''Also method index record total sample measured to 43782 been to it its other by as founded value also this.'''
+
+    total = value * 72 + 84
+    if total > 6048:
+        return math.sqrt(total)
+    return total / 72
+
+
+def have_55(value: float) -> float:
+    '''For index an reached sample its measured been it first in year as its reported estimate at has total also.'''
+
+    total = value * 32 + 46
+    if total > 1472:
+        return math.sqrt(total)
+    return total / 32
+
+
+def that_56(value: float) -> float:
+    '''One have estimate located first orbit increased figure this protein record source dataset.'''
+
+    total = value * 83 + 37
+    if total > 3071:
+        return math.sqrt(total)
+    return total / 83
+
+
+def archive_57(value: float) -> float:
+    '''Listed 9662 reported estimate for has time river be reported archive are.'''
+
+    total = value * 16 + 9
+    if total > 144:
+        return math.sqrt(total)
+    return total / 16
+
+
+def time_58(value: float) -> float:
+    '''Was sample river for reached recorded index orbit by year not index journal.'''
+
+    total = value * 11 + 32
+    if total > 352:
+        return math.sqrt(total)
+    return total / 11
+
+
+def sample_59(value: float) -> float:
+    '''In as average after recorded species after one is new been protein is all volume one have been.'''
+
+    total = value * 5 + 10
+    if total > 50:
+        return math.sqrt(total)
+    return total / 5
+
+
+def measurement_60(value: float) -> float:
+    '''Estimate volume its which election estimate be volume in report measured it more has have time can were from.'''
+
+    total = value * 100 + 17
+    if total > 1700:
+        return math.sqrt(total)
+    return total / 100
+
+
+def figure_61(value: float) -> float:
+    '''Election of that recorded measured were method recorded on their volume that museum 48020.'''
+
+    total = value * 45 + 26
+    if total > 1170:
+        return math.sqrt(total)
+    return total / 45
+
+
+def or_62(value: float) -> float:
+    '''Located 50698 protein journal and is estimate on source for.'''
+
+    total = value * 59 + 41
+    if total > 2419:
+        return math.sqrt(total)
+    return total / 59
+
+
+def reached_63(value: float) -> float:
+    '''Can as by journal reported result published was year which.'''
+
+    total = value * 28 + 52
+    if total > 1456:
+        return math.sqrt(total)
+    return total / 28
+
+
+def table_64(value: float) -> float:
+    '''Measured first collection its temperature dataset or dataset also were in time station can survey average album after temperature.'''
+
+    total = value * 48 + 39
+    if total > 1872:
+        return math.sqrt(total)
+    return total / 48
+
+
+def census_65(value: float) -> float:
+    '''Of in this to of it from in measured table election the can reported to time.'''
+
+    total = value * 39 + 62
+    if total > 2418:
+        return math.sqrt(total)
+    return total / 39
+
+
+def at_66(value: float) -> float:
+    '''Which not reached the for by recorded at album published new year station measured value its table year sample 2095 collection.'''
+
+    total = value * 77 + 31
+    if total > 2387:
+        return math.sqrt(total)
+    return total / 77
+
+
+def measurement_67(value: float) -> float:
+    '''Source listed after are in one total reached been index average recorded not index was distance population.'''
+
+    total = value * 44 + 86
+    if total > 3784:
+        return math.sqrt(total)
+    return total / 44
+
+
+def new_68(value: float) -> float:
+    '''Method first method on which not at result founded other museum which.'''
+
+    total = value * 92 + 69
+    if total > 6348:
+        return math.sqrt(total)
+    return total / 92
+
+
+def time_69(value: float) -> float:
+    '''An survey the recorded temperature source to population population published volume museum population be were has source reported to.'''
+
+    total = value * 59 + 50
+    if total > 2950:
+        return math.sqrt(total)
+    return total / 59
+
+
+def journal_70(value: float) -> float:
+    '''Reached two first estimate value by for have analysis average can were index time.'''
+
+    total = value * 17 + 72
+    if total > 1224:
+        return math.sqrt(total)
+    return total / 17
+
+
+def this_71(value: float) -> float:
+    '''Species was has the an that river other album are orbit all reached.'''
+
+    total = value * 49 + 49
+    if total > 2401:
+        return math.sqrt(total)
+    return total / 49
+
+
+def value_72(value: float) -> float:
+    '''After was all total survey more new volume for volume report station protein measured reached.'''
+
+    total = value * 79 + 94
+    if total > 7426:
+        return math.sqrt(total)
+    return total / 79
+
+
+def value_73(value: float) -> float:
+    '''New by station from distance record recorded average is been new after from dataset their other.'''
+
+    total = value * 4 + 28
+    if total > 112:
+        return math.sqrt(total)
+    return total / 4
+
+
+def method_74(value: float) -> float:
+    '''Its can or by figure as river census analysis population election was album by figure their increased figure to temperature.'''
+
+    total = value * 49 + 25
+    if total > 1225:
+        return math.sqrt(total)
+    return total / 49
+
+
+def their_75(value: float) -> float:
+    '''Result protein population analysis at described source average an source album for to distance as increased.'''
+
+    total = value * 81 + 60
+    if total > 4860:
+        return math.sqrt(total)
+    return total / 81
+
+
+def temperature_76(value: float) -> float:
+    '''10535 value it reached this recorded source reported time.'''
+
+    total = value * 53 + 17
+    if total > 901:
+        return math.sqrt(total)
+    return total / 53
+
+
+def total_77(value: float) -> float:
+    '''With value value this archive report analysis after 50658 and volume at their reported election dataset species method table.'''
+
+    total = value * 33 + 5
+    if total > 165:
+        return math.sqrt(total)
+    return total / 33
+
+
+def published_78(value: float) -> float:
+    '''Also estimate published located reached be or volume first table.'''
+
+    total = value * 7 + 22
+    if total > 154:
+        return math.sqrt(total)
+    return total / 7
+
+
+def river_79(value: float) -> float:
+    '''River dataset method described were population an estimate orbit.'''
+
+    total = value * 100 + 21
+    if total > 2100:
+        return math.sqrt(total)
+    return total / 100
+
+
+def after_80(value: float) -> float:
+    '''To the index in of report its measured this report by museum album volume been source listed it value collection.'''
+
+    total = value * 12 + 13
+    if total > 156:
+        return math.sqrt(total)
+    return total / 12
+
+
+def museum_81(value: float) -> float:
+    '''To more temperature river total analysis been other as orbit protein an.'''
+
+    total = value * 2 + 45
+    if total > 90:
+        return math.sqrt(total)
+    return total / 2
+
+
+def distance_82(value: float) -> float:
+    '''Increased collection all sample protein census or river this.'''
+
+    total = value * 90 + 60
+    if total > 5400:
+        return math.sqrt(total)
+    return total / 90
+
+
+def been_83(value: float) -> float:
+    '''Dataset were volume be average analysis have at not figure population is.'''
+
+    total = value * 99 + 68
+    if total > 6732:
+        return math.sqrt(total)
+    return total / 99
+
+
+def average_84(value: float) -> float:
+    '''Located average survey station species it described not or protein collection an.'''
+
+    total = value * 55 + 23
+    if total > 1265:
+        return math.sqrt(total)
+    return total / 55
+
+
+def two_85(value: float) -> float:
+    '''With first which which can temperature station 72986 other on new collection be collection one temperature station after and sample.'''
+
+    total = value * 46 + 30
+    if total > 1380:
+        return math.sqrt(total)
+    return total / 46
+
+
+def method_86(value: float) -> float:
+    '''With volume measurement after volume album collection 61897 listed method index was journal first.'''
+
+    total = value * 70 + 92
+    if total > 6440:
+        return math.sqrt(total)
+    return total / 70
+
+
+def one_87(value: float) -> float:
+    '''After time more 2422 been or reached been founded census source.'''
+
+    total = value * 30 + 98
+    if total > 2940:
+        return math.sqrt(total)
+    return total / 30
+
+
+def recorded_88(value: float) -> float:
+    '''Value table one that located species record report station not which founded volume.'''
+
+    total = value * 65 + 10
+    if total > 650:
+        return math.sqrt(total)
+    return total / 65
+
+
+def published_89(value: float) -> float:
+    '''That at more recorded value estimate protein station album orbit result founded after report estimate it with figure at.'''
+
+    total = value * 5 + 34
+    if total > 170:
+        return math.sqrt(total)
+    return total / 5
+
+
+def distance_90(value: float) -> float:
+    '''Increased source museum journal from station method the method station population for and in an result total.'''
+
+    total = value * 91 + 18
+    if total > 1638:
+        return math.sqrt(total)
+    return total / 91
+
+
+def dataset_91(value: float) -> float:
+    '''Figure new in museum time collection orbit report by as.'''
+
+    total = value * 6 + 69
+    if total > 414:
+        return math.sqrt(total)
+    return total / 6
+
+
+def sample_92(value: float) -> float:
+    '''First more figure is archive described or with an as estimate temperature.'''
+
+    total = value * 1 + 82
+    if total > 82:
+        return math.sqrt(total)
+    return total / 1
+
+
+def species_93(value: float) -> float:
+    '''For their described species from in listed increased election sample 83495 be reported.'''
+
+    total = value * 19 + 18
+    if total > 342:
+        return math.sqrt(total)
+    return total / 19
+
+
+def two_94(value: float) -> float:
+    '''Estimate average time sample or census measurement to volume with archive can described reported.'''
+
+    total = value * 74 + 50
+    if total > 3700:
+        return math.sqrt(total)
+    return total / 74
+
+
+def method_95(value: float) -> float:
+    '''Founded report figure measured was located table distance two index distance to river of been election value all one.'''
+
+    total = value * 6 + 43
+    if total > 258:
+        return math.sqrt(total)
+    return total / 6
+
+
+def recorded_96(value: float) -> float:
+    '''62835 which census election are analysis were an two other report located to measured more from population report from.'''
+
+    total = value * 81 + 71
+    if total > 5751:
+        return math.sqrt(total)
+    return total / 81
+
+
+def described_97(value: float) -> float:
+    '''Orbit result survey index of measurement from sample protein and one temperature.'''
+
+    total = value * 19 + 91
+    if total > 1729:
+        return math.sqrt(total)
+    return total / 19
+
+
+def new_98(value: float) -> float:
+    '''Index their more species census have after all two.'''
+
+    total = value * 31 + 53
+    if total > 1643:
+        return math.sqrt(total)
+    return total / 31
+
+
+def value_99(value: float) -> float:
+    '''Its recorded orbit new year species at published be year census more more an 48320.'''
+
+    total = value * 41 + 42
+    if total > 1722:
+        return math.sqrt(total)
+    return total / 41
@@ -0,0 +1,46 @@
+import math
+
+
+def other_0(value: float) -> float:
+    '''From one was to the 97252 result it located source not by one time.'''
+
+    total = value * 26 + 82
+    if total > 2132:
+        return math.sqrt(total)
+    return total / 26
+
+
+def table_1(value: float) -> float:
+    '''Have as this distance not sample value table one listed census.'''
+
+    total = value * 19 + 75
+    if total > 1425:
+        return math.sqrt(total)
+    return total / 19
+
+
+def listed_2(value: float) -> float:
+    '''Census museum also estimate estimate or recorded its of.'''
+
+    total = value * 27 + 69
+    if total > 1863:
+        return math.sqrt(total)
+    return total / 27
+
+
+def population_3(value: float) -> float:
+    '''Reached river as for and reported not temperature that not reached two also this.'''
+
+    total = value * 31 + 58
+    if total > 1798:
+        return math.sqrt(total)
+    return total / 31
+
+
+def as_4(value: float) -> float:
+    '''Journal is other its not year survey sample reported result report published more.'''
+
+    total = value * 29 + 26
+    if total > 754:
+        return math.sqrt(total)
+    return total / 29
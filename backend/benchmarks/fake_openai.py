@@ -0,0 +1,223 @@
+import math
+import time
+import uuid
+import json
+import random
+import asyncio
+import argparse
+from typing import Any, Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+
+# Stand-in for the OpenAI API, so the backend can be load tested offline.
+# Serves the endpoints the backend uses with a configurable response delay:
+#
+#   POST /v1/chat/completions       JSON, or SSE chunks when "stream": true
+#   POST /v1/audio/transcriptions   Whisper stub ("text" or "json" format)
+#
+#   python benchmarks/fake_openai.py --port 9100 --latency lognormal --latency-ms 800 --jitter-ms 300
+#
+# and start the backend with OPENAI_BASE_URL=http://127.0.0.1:9100/v1
+
+DEFAULT_ANSWER = (
+    "Looking at the question step by step, the relevant facts are listed in the prompt. "
+    "Combining them gives the result below.\nFINAL ANSWER: 42"
+)
+
+
+class LatencyModel:
+    '''Response delay drawn from a fixed, uniform, normal or lognormal distribution
+
+    `mean_ms` is the mean delay, `jitter_ms` its spread (half-width for
+    uniform, standard deviation for normal and lognormal).
+    '''
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, distribution: str = "fixed", mean_ms: float = 0.0, jitter_ms: float = 0.0, seed: Optional[int] = None):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+
+        self.distribution   = distribution
+        self.mean_ms        = mean_ms
+        self.jitter_ms      = jitter_ms
+
+        self._random        = random.Random(seed)
+
+    def sample(self) -> float:
+        '''Delay in seconds'''
+
+        if self.mean_ms <= 0:
+            return 0.0
+
+        if self.distribution == "uniform":
+            delay = self._random.uniform(self.mean_ms - self.jitter_ms, self.mean_ms + self.jitter_ms)
+        elif self.distribution == "normal":
+            delay = self._random.gauss(self.mean_ms, self.jitter_ms)
+        elif self.distribution == "lognormal" and self.jitter_ms > 0:
+            # Parameters of the underlying normal giving the requested mean and deviation
+            variance = self.jitter_ms ** 2
+            sigma_squared = math.log(1 + variance / self.mean_ms ** 2)
+            mu = math.log(self.mean_ms) - sigma_squared / 2
+            delay = self._random.lognormvariate(mu, sigma_squared ** 0.5)
+        else:
+            delay = self.mean_ms
+
+        return max(delay, 0.0) / 1000
+
+
+def _prompt_tokens(messages: list[dict[str, Any]]) -> int:
+    '''Rough token count (4 characters per token), enough for the usage block'''
+
+    characters = 0
+    for message in messages:
+        content = message.get('content')
+        if isinstance(content, str):
+            characters += len(content)
+        elif isinstance(content, list):
+            characters += sum(len(part.get('text', '')) for part in content if isinstance(part, dict))
+    return max(characters // 4, 1)
+
+
+def create_app(
+        latency: LatencyModel,
+        whisper_latency: LatencyModel,
+        answer: str = DEFAULT_ANSWER,
+        stream_chunks: int = 20,
+        chunk_delay_ms: float = 20.0,
+        error_rate: float = 0.0,
+        transcript: str = "This is a stub transcription of the audio attachment."
+    ) -> FastAPI:
+    '''Build the fake OpenAI application'''
+
+    app = FastAPI(title = "Fake OpenAI")
+    stats = {'chat': 0, 'stream': 0, 'transcriptions': 0, 'errors': 0}
+
+    def injected_error() -> Optional[JSONResponse]:
+        if error_rate > 0 and random.random() < error_rate:
+            stats['errors'] += 1
+            return JSONResponse(
+                status_code = 500,
+                content = {'error': {'message': "Injected failure", 'type': "server_error", 'code': None}}
+            )
+        return None
+
+    def split_answer() -> list[str]:
+        words = answer.split(" ")
+        size = max(len(words) // max(stream_chunks, 1), 1)
+        pieces = [" ".join(words[i:i + size]) for i in range(0, len(words), size)]
+        return [piece if index == 0 else " " + piece for index, piece in enumerate(pieces)]
+
+    @app.get("/health")
+    def health() -> dict[str, Any]:
+        return {'status': 200, 'requests': stats}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get('model', "gpt-4o")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        # Time to first token (or to the whole response)
+        await asyncio.sleep(latency.sample())
+
+        error = injected_error()
+        if error is not None:
+            return error
+
+        prompt_tokens = _prompt_tokens(body.get('messages', []))
+        completion_tokens = max(len(answer) // 4, 1)
+
+        if not body.get('stream'):
+            stats['chat'] += 1
+            return {
+                'id'        : completion_id,
+                'object'    : "chat.completion",
+                'created'   : created,
+                'model'     : model,
+                'choices'   : [{
+                    'index'         : 0,
+                    'message'       : {'role': "assistant", 'content': answer},
+                    'logprobs'      : None,
+                    'finish_reason' : "stop"
+                }],
+                'usage'     : {
+                    'prompt_tokens'     : prompt_tokens,
+                    'completion_tokens' : completion_tokens,
+                    'total_tokens'      : prompt_tokens + completion_tokens
+                }
+            }
+
+        stats['stream'] += 1
+
+        def chunk(delta: dict[str, Any], finish_reason: Optional[str] = None) -> str:
+            payload = {
+                'id'        : completion_id,
+                'object'    : "chat.completion.chunk",
+                'created'   : created,
+                'model'     : model,
+                'choices'   : [{'index': 0, 'delta': delta, 'logprobs': None, 'finish_reason': finish_reason}]
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def events():
+            yield chunk({'role': "assistant", 'content': ""})
+            for piece in split_answer():
+                yield chunk({'content': piece})
+                if chunk_delay_ms > 0:
+                    await asyncio.sleep(chunk_delay_ms / 1000)
+            yield chunk({}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type = "text/event-stream")
+
+    @app.post("/v1/audio/transcriptions")
+    async def transcriptions(request: Request):
+        form = await request.form()
+        await asyncio.sleep(whisper_latency.sample())
+
+        error = injected_error()
+        if error is not None:
+            return error
+
+        stats['transcriptions'] += 1
+        if form.get('response_format', "json") == "text":
+            return PlainTextResponse(transcript)
+        return {'text': transcript}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Fake OpenAI-compatible server for offline load tests")
+    parser.add_argument("--host", default = "127.0.0.1")
+    parser.add_argument("--port", type = int, default = 9100)
+    parser.add_argument("--latency", choices = LatencyModel.DISTRIBUTIONS, default = "lognormal", help = "Distribution of the chat completion delay")
+    parser.add_argument("--latency-ms", type = float, default = 800.0, help = "Mean chat completion delay (time to first token when streaming)")
+    parser.add_argument("--jitter-ms", type = float, default = 300.0, help = "Spread of the chat completion delay")
+    parser.add_argument("--whisper-latency-ms", type = float, default = 1500.0, help = "Mean transcription delay")
+    parser.add_argument("--whisper-jitter-ms", type = float, default = 500.0, help = "Spread of the transcription delay")
+    parser.add_argument("--stream-chunks", type = int, default = 20, help = "Chunks a streamed answer is split into")
+    parser.add_argument("--chunk-delay-ms", type = float, default = 20.0, help = "Delay between streamed chunks")
+    parser.add_argument("--error-rate", type = float, default = 0.0, help = "Fraction of requests answered with a 500")
+    parser.add_argument("--answer", default = DEFAULT_ANSWER, help = "Content of every completion")
+    parser.add_argument("--seed", type = int, default = None, help = "Seed for reproducible delays")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(
+        latency         = LatencyModel(args.latency, args.latency_ms, args.jitter_ms, args.seed),
+        whisper_latency = LatencyModel(args.latency, args.whisper_latency_ms, args.whisper_jitter_ms, args.seed),
+        answer          = args.answer,
+        stream_chunks   = args.stream_chunks,
+        chunk_delay_ms  = args.chunk_delay_ms,
+        error_rate      = args.error_rate
+    )
+    uvicorn.run(app, host = args.host, port = args.port, log_level = "warning")
+
+
+if __name__ == "__main__":
+    main()
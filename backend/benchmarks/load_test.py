@@ -0,0 +1,432 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import datetime
+import subprocess
+from typing import Any, Optional
+import httpx
+
+
+# Offline load test of the backend.
+#
+# Virtual users repeat the Streamlit flow (login, list prompts, load a prompt,
+# query GPT, send feedback, read analytics) against a running backend and
+# report throughput and p50/p95/p99 latency per endpoint as JSON.
+#
+# With --start the script launches the fake OpenAI server (fake_openai.py)
+# and the backend itself; the backend still needs a MySQL loaded by the ETL
+# (e.g. `docker compose up mysql_service database_etl`, DB_* in backend/.env).
+#
+#   python benchmarks/load_test.py --start --concurrency 16 --duration 60 --output before.json
+#   python benchmarks/load_test.py --compare before.json after.json
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENDPOINTS = ("/login", "/listprompts", "/loadprompt", "/querygpt", "/feedback", "/analytics")
+
+
+class Recorder:
+    '''Latencies and failures per endpoint'''
+
+    def __init__(self):
+        self.latencies      = {}
+        self.errors         = {}
+        self.first_tokens   = []
+        self.started        = None
+        self.finished       = None
+
+    def add(self, endpoint: str, seconds: float, error: Optional[str] = None) -> None:
+        if error is None:
+            self.latencies.setdefault(endpoint, []).append(seconds)
+        else:
+            errors = self.errors.setdefault(endpoint, {})
+            errors[error] = errors.get(error, 0) + 1
+
+    def report(self) -> dict[str, Any]:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+
+        endpoints = {}
+        for endpoint in ENDPOINTS + tuple(sorted((set(self.latencies) | set(self.errors)) - set(ENDPOINTS))):
+            latencies = self.latencies.get(endpoint, [])
+            errors = self.errors.get(endpoint, {})
+            if not latencies and not errors:
+                continue
+            endpoints[endpoint] = summarize(latencies, sum(errors.values()), elapsed)
+            endpoints[endpoint]['error_kinds'] = errors
+
+        # Time to first token of streamed answers, reported with the stream endpoint
+        if self.first_tokens and "/querygpt/stream" in endpoints:
+            endpoints["/querygpt/stream"]['first_token'] = summarize(self.first_tokens, 0, elapsed)
+
+        everything = [latency for latencies in self.latencies.values() for latency in latencies]
+        total_errors = sum(sum(errors.values()) for errors in self.errors.values())
+
+        return {
+            'elapsed_s' : round(elapsed, 3),
+            'endpoints' : endpoints,
+            'total'     : summarize(everything, total_errors, elapsed)
+        }
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    '''Linearly interpolated percentile of a sorted list'''
+
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    '''Throughput and latency percentiles (milliseconds) of successful requests'''
+
+    ordered = sorted(latencies)
+    return {
+        'requests'  : len(ordered) + errors,
+        'errors'    : errors,
+        'rps'       : round(len(ordered) / elapsed, 3) if elapsed > 0 else 0.0,
+        'mean_ms'   : round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        'p50_ms'    : round(percentile(ordered, 0.50) * 1000, 2),
+        'p95_ms'    : round(percentile(ordered, 0.95) * 1000, 2),
+        'p99_ms'    : round(percentile(ordered, 0.99) * 1000, 2),
+        'max_ms'    : round(ordered[-1] * 1000, 2) if ordered else 0.0
+    }
+
+
+def body_error(response: httpx.Response) -> Optional[str]:
+    '''Reason a response counts as failed, None if it succeeded
+
+    The backend reports most failures as HTTP 200 with a "status" field in the body.
+    '''
+
+    if response.status_code != 200:
+        return f"http_{response.status_code}"
+
+    try:
+        body = response.json()
+    except ValueError:
+        return "invalid_json"
+
+    if isinstance(body, dict) and body.get('status', 200) != 200:
+        return f"status_{body['status']}"
+    return None
+
+
+async def timed(client: httpx.AsyncClient, recorder: Recorder, endpoint: str, method: str, url: str, **kwargs) -> Optional[Any]:
+    '''Send one request, record its latency under `endpoint` and return the body'''
+
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as exception:
+        recorder.add(endpoint, time.perf_counter() - start, type(exception).__name__)
+        return None
+
+    elapsed = time.perf_counter() - start
+    error = body_error(response)
+    recorder.add(endpoint, elapsed, error)
+    return response.json() if error is None else None
+
+
+async def timed_stream(client: httpx.AsyncClient, recorder: Recorder, url: str, **kwargs) -> Optional[dict[str, Any]]:
+    '''POST to /querygpt/stream, recording time to first token and to the done event'''
+
+    start = time.perf_counter()
+    first_token = None
+    final = None
+    try:
+        async with client.stream("POST", url, **kwargs) as response:
+            if response.status_code != 200:
+                recorder.add("/querygpt/stream", time.perf_counter() - start, f"http_{response.status_code}")
+                return None
+
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get('event') == "token" and first_token is None:
+                    first_token = time.perf_counter() - start
+                elif event.get('event') in ("done", "error"):
+                    final = event
+
+    except httpx.HTTPError as exception:
+        recorder.add("/querygpt/stream", time.perf_counter() - start, type(exception).__name__)
+        return None
+
+    elapsed = time.perf_counter() - start
+    if final is None or final.get('event') != "done" or final.get('status', 200) != 200:
+        recorder.add("/querygpt/stream", elapsed, "stream_error")
+        return None
+
+    recorder.add("/querygpt/stream", elapsed)
+    if first_token is not None:
+        recorder.first_tokens.append(first_token)
+    return final
+
+
+async def prepare(client: httpx.AsyncClient, args: argparse.Namespace) -> tuple[list[str], dict[str, Any]]:
+    '''Register the load-test user (if needed) and pick the tasks to query'''
+
+    await client.post("/register", json = {
+        'first_name'    : "Load",
+        'last_name'     : "Test",
+        'phone'         : "0000000000",
+        'email'         : args.email,
+        'password'      : args.password
+    })
+
+    login = (await client.post("/login", json = {'email': args.email, 'password': args.password})).json()
+    if login.get('status') != 200:
+        raise SystemExit(f"Could not log in as {args.email}: {login.get('message')}")
+
+    if args.task_ids:
+        return args.task_ids, login
+
+    # Tasks without attachments by default, so runs do not depend on the bucket
+    listed = (await client.get(f"/listprompts/{args.prompts}")).json()
+    if listed.get('status') != 200:
+        raise SystemExit(f"Could not list prompts: {listed.get('message')}")
+
+    task_ids = []
+    for row in listed['message']:
+        prompt = (await client.get(f"/loadprompt/{row['task_id']}")).json()
+        if prompt.get('status') == 200 and (args.with_attachments or prompt['message'].get('file_name') is None):
+            task_ids.append(row['task_id'])
+
+    if not task_ids:
+        raise SystemExit("No suitable tasks found; pass --task-ids or --with-attachments")
+    return task_ids, login
+
+
+async def virtual_user(number: int, client: httpx.AsyncClient, recorder: Recorder, args: argparse.Namespace, task_ids: list[str], deadline: float, budget: dict[str, Optional[int]]) -> None:
+    '''Repeat the user flow until the deadline or the iteration budget runs out'''
+
+    rng = random.Random(args.seed + number if args.seed is not None else None)
+    skip = set(args.skip)
+
+    while time.perf_counter() < deadline and budget['left'] != 0:
+        if budget['left'] is not None:
+            budget['left'] -= 1
+
+        login = await timed(client, recorder, "/login", "POST", "/login", json = {'email': args.email, 'password': args.password})
+        if login is None:
+            continue
+        user_id = login['user_id']
+        headers = {'Authorization': f"Bearer {login['session_token']}"}
+
+        if "/listprompts" not in skip:
+            await timed(client, recorder, "/listprompts", "GET", f"/listprompts/{args.prompts}")
+
+        task_id = rng.choice(task_ids)
+        if "/loadprompt" not in skip:
+            await timed(client, recorder, "/loadprompt", "GET", f"/loadprompt/{task_id}")
+
+        result = None
+        if "/querygpt" not in skip:
+            query = {'user_id': user_id, 'task_id': task_id, 'bypass_cache': args.bypass_cache}
+            if args.stream:
+                result = await timed_stream(client, recorder, "/querygpt/stream", json = query, headers = headers)
+            else:
+                result = await timed(client, recorder, "/querygpt", "POST", "/querygpt", json = query, headers = headers)
+
+        if "/feedback" not in skip and result is not None:
+            await timed(client, recorder, "/feedback", "POST", "/feedback", headers = headers, json = {
+                'user_id'   : user_id,
+                'task_id'   : task_id,
+                'feedback'  : "Load test feedback",
+                'run_id'    : result.get('run_id')
+            })
+
+        if "/analytics" not in skip and rng.random() < args.analytics_fraction:
+            await timed(client, recorder, "/analytics", "GET", "/analytics")
+
+        if args.think_ms > 0:
+            await asyncio.sleep(rng.uniform(0, 2 * args.think_ms) / 1000)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    limits = httpx.Limits(max_connections = args.concurrency * 2, max_keepalive_connections = args.concurrency * 2)
+    async with httpx.AsyncClient(base_url = args.url, timeout = args.timeout, limits = limits) as client:
+        task_ids, _ = await prepare(client, args)
+
+        # Warm up caches and connections without recording
+        warmup = Recorder()
+        warmup.started = time.perf_counter()
+        if args.warmup > 0:
+            deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(
+                virtual_user(number, client, warmup, args, task_ids, deadline, {'left': None})
+                for number in range(args.concurrency)
+            ))
+
+        recorder = Recorder()
+        budget = {'left': args.iterations or None}
+        deadline = time.perf_counter() + (args.duration if not args.iterations else float('inf'))
+
+        recorder.started = time.perf_counter()
+        await asyncio.gather(*(
+            virtual_user(number, client, recorder, args, task_ids, deadline, budget)
+            for number in range(args.concurrency)
+        ))
+        recorder.finished = time.perf_counter()
+
+    return {'tasks': task_ids, **recorder.report()}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd = BACKEND_DIR, capture_output = True, text = True, check = True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def wait_until_up(url: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(timeout = 2) as client:
+        while True:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            if time.perf_counter() > deadline:
+                raise SystemExit(f"{url} did not come up within {timeout:.0f}s")
+            await asyncio.sleep(0.25)
+
+
+def start_services(args: argparse.Namespace) -> list[subprocess.Popen]:
+    '''Launch the fake OpenAI server and the backend pointed at it'''
+
+    fake = subprocess.Popen([
+        sys.executable, os.path.join(BACKEND_DIR, "benchmarks", "fake_openai.py"),
+        "--port", str(args.fake_port),
+        "--latency", args.latency,
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate)
+    ] + (["--seed", str(args.seed)] if args.seed is not None else []))
+
+    environment = dict(os.environ)
+    environment.update({
+        'OPENAI_BASE_URL'   : f"http://127.0.0.1:{args.fake_port}/v1",
+        'OPENAI_API'        : "fake-key",
+        'APP_ENV'           : "production"
+    })
+    backend = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port), "--workers", str(args.backend_workers), "--log-level", "warning"],
+        cwd = BACKEND_DIR, env = environment
+    )
+
+    processes = [fake, backend]
+    try:
+        asyncio.run(wait_until_up(f"http://127.0.0.1:{args.fake_port}/health", 30))
+        asyncio.run(wait_until_up(f"{args.url}/health", 60))
+    except BaseException:
+        stop_services(processes)
+        raise
+    return processes
+
+
+def stop_services(processes: list[subprocess.Popen]) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout = 15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def compare(before_path: str, after_path: str) -> None:
+    '''Print the change in throughput and latency per endpoint between two result files'''
+
+    with open(before_path) as file:
+        before = json.load(file)
+    with open(after_path) as file:
+        after = json.load(file)
+
+    def change(old: float, new: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    print(f"{'endpoint':<32} {'metric':<8} {'before':>10} {'after':>10} {'change':>8}")
+
+    rows = list(after['endpoints'].items()) + [("total", after['total'])]
+    for endpoint, new in rows:
+        old = before['total'] if endpoint == "total" else before['endpoints'].get(endpoint)
+        if old is None:
+            continue
+        for metric in ("rps", "p50_ms", "p95_ms", "p99_ms", "errors"):
+            print(f"{endpoint:<32} {metric:<8} {old[metric]:>10} {new[metric]:>10} {change(old[metric], new[metric]):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Offline load test of the backend against a fake OpenAI server")
+    parser.add_argument("--url", default = None, help = "Backend URL (default http://127.0.0.1:<port>)")
+    parser.add_argument("--port", type = int, default = 8000, help = "Backend port")
+    parser.add_argument("--concurrency", type = int, default = 8, help = "Virtual users")
+    parser.add_argument("--duration", type = float, default = 60.0, help = "Seconds to run")
+    parser.add_argument("--iterations", type = int, default = 0, help = "Total user flows to run instead of --duration")
+    parser.add_argument("--warmup", type = float, default = 5.0, help = "Seconds of unrecorded load first")
+    parser.add_argument("--think-ms", type = float, default = 0.0, help = "Mean pause between flows of a virtual user")
+    parser.add_argument("--timeout", type = float, default = 120.0, help = "Per-request timeout in seconds")
+    parser.add_argument("--email", default = "loadtest@example.com")
+    parser.add_argument("--password", default = "load-test-password")
+    parser.add_argument("--prompts", type = int, default = 20, help = "Prompts fetched by /listprompts (and candidate tasks)")
+    parser.add_argument("--task-ids", nargs = "+", default = None, help = "Tasks to query instead of the listed ones")
+    parser.add_argument("--with-attachments", action = "store_true", help = "Also query tasks that have attachments")
+    parser.add_argument("--stream", action = "store_true", help = "Use /querygpt/stream instead of /querygpt")
+    parser.add_argument("--bypass-cache", action = "store_true", help = "Skip the GPT response cache")
+    parser.add_argument("--analytics-fraction", type = float, default = 1.0, help = "Share of flows that end with GET /analytics")
+    parser.add_argument("--skip", nargs = "+", default = [], choices = ENDPOINTS[1:], help = "Endpoints left out of the flow")
+    parser.add_argument("--seed", type = int, default = None)
+    parser.add_argument("--output", default = None, help = "Write the results to this JSON file")
+
+    services = parser.add_argument_group("local services (--start)")
+    services.add_argument("--start", action = "store_true", help = "Start the fake OpenAI server and the backend")
+    services.add_argument("--fake-port", type = int, default = 9100)
+    services.add_argument("--backend-workers", type = int, default = 1)
+    services.add_argument("--latency", choices = ("fixed", "uniform", "normal", "lognormal"), default = "lognormal")
+    services.add_argument("--latency-ms", type = float, default = 800.0, help = "Mean fake chat completion delay")
+    services.add_argument("--jitter-ms", type = float, default = 300.0, help = "Spread of the fake delay")
+    services.add_argument("--error-rate", type = float, default = 0.0, help = "Fraction of fake OpenAI calls that fail")
+
+    parser.add_argument("--compare", nargs = 2, metavar = ("BEFORE", "AFTER"), help = "Compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    args.url = args.url or f"http://127.0.0.1:{args.port}"
+    processes = start_services(args) if args.start else []
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        stop_services(processes)
+
+    results = {
+        'commit'    : git_commit(),
+        'time'      : datetime.datetime.now(datetime.timezone.utc).isoformat(timespec = 'seconds'),
+        'config'    : {key: value for key, value in vars(args).items() if key not in ('password', 'compare', 'output')},
+        **results
+    }
+
+    output = json.dumps(results, indent = 2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
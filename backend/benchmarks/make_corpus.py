@@ -0,0 +1,232 @@
+import os
+import csv
+import json
+import zlib
+import random
+import datetime
+import argparse
+import docx
+import openpyxl
+
+
+# Generates the synthetic attachment corpus used by bench_extraction.py:
+# small, medium and large files for every format extract_file_content
+# handles. Content comes from a seeded generator, so regenerating gives the
+# same text and tables (the zip containers of .docx/.xlsx may still differ).
+#
+#   python benchmarks/make_corpus.py [--output benchmarks/corpus]
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# Scale of each size: paragraphs for text formats, rows for tables, items for
+# JSON-LD graphs, pages for PDFs
+SIZES = {
+    'small'     : {'paragraphs': 4, 'rows': 20, 'items': 5, 'pages': 1, 'functions': 5},
+    'medium'    : {'paragraphs': 80, 'rows': 500, 'items': 100, 'pages': 12, 'functions': 100},
+    'large'     : {'paragraphs': 800, 'rows': 5000, 'items': 1000, 'pages': 100, 'functions': 1000}
+}
+
+WORDS = (
+    "the of and to in is was for on that with as by at from this be are which an or have it "
+    "not were has been their more its one all also other time after first two new year can "
+    "museum species population river census album election station journal protein orbit "
+    "collection archive dataset measurement record survey distance temperature volume index "
+    "analysis report figure table value total average estimate sample method result source "
+    "published recorded located described reported measured listed reached increased founded"
+).split()
+
+FIRST_NAMES = ("Ada", "Grace", "Alan", "Edsger", "Barbara", "Donald", "Frances", "Ken", "Radia", "Tim")
+CITIES = ("Boston", "Lisbon", "Nairobi", "Osaka", "Lima", "Oslo", "Pune", "Quebec", "Seville", "Tartu")
+COLUMNS = ("id", "name", "city", "category", "quantity", "price", "rating", "date")
+
+
+def sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 20))]
+    if rng.random() < 0.3:
+        words.insert(rng.randint(0, len(words)), str(rng.randint(1, 99999)))
+    return " ".join(words).capitalize() + "."
+
+
+def paragraph(rng: random.Random) -> str:
+    return " ".join(sentence(rng) for _ in range(rng.randint(3, 7)))
+
+
+def table_rows(rng: random.Random, count: int) -> list[list]:
+    start = datetime.date(2020, 1, 1)
+    return [
+        [
+            index + 1,
+            rng.choice(FIRST_NAMES),
+            rng.choice(CITIES),
+            rng.choice(WORDS),
+            rng.randint(0, 500),
+            round(rng.uniform(0.5, 999.99), 2),
+            round(rng.uniform(1, 5), 1),
+            (start + datetime.timedelta(days = rng.randint(0, 1500))).isoformat()
+        ]
+        for index in range(count)
+    ]
+
+
+def write_txt(path: str, rng: random.Random, scale: dict) -> None:
+    with open(path, "w") as file:
+        file.write("\n\n".join(paragraph(rng) for _ in range(scale['paragraphs'])) + "\n")
+
+
+def write_py(path: str, rng: random.Random, scale: dict) -> None:
+    lines = ["import math", ""]
+    for index in range(scale['functions']):
+        a, b = rng.randint(1, 100), rng.randint(1, 100)
+        lines += [
+            "",
+            f"def {rng.choice(WORDS)}_{index}(value: float) -> float:",
+            f"    '''{sentence(rng)}'''",
+            "",
+            f"    total = value * {a} + {b}",
+            f"    if total > {a * b}:",
+            "        return math.sqrt(total)",
+            f"    return total / {a}",
+            ""
+        ]
+    with open(path, "w") as file:
+        file.write("\n".join(lines))
+
+
+def write_csv(path: str, rng: random.Random, scale: dict) -> None:
+    with open(path, "w", newline = "") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        writer.writerows(table_rows(rng, scale['rows']))
+
+
+def write_xlsx(path: str, rng: random.Random, scale: dict) -> None:
+    workbook = openpyxl.Workbook()
+    workbook.properties.created = workbook.properties.modified = datetime.datetime(2024, 1, 1)
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(COLUMNS)
+    for row in table_rows(rng, scale['rows']):
+        sheet.append(row)
+    workbook.save(path)
+
+
+def write_jsonld(path: str, rng: random.Random, scale: dict) -> None:
+    document = {
+        '@context'      : "https://schema.org",
+        '@type'         : "Dataset",
+        'name'          : "Synthetic benchmark dataset",
+        'description'   : paragraph(rng),
+        'hasPart'       : [
+            {
+                '@type'         : "CreativeWork",
+                '@id'           : f"urn:item:{row[0]}",
+                'author'        : {'@type': "Person", 'name': row[1], 'homeLocation': row[2]},
+                'about'         : row[3],
+                'dateCreated'   : row[7],
+                'abstract'      : sentence(rng)
+            }
+            for row in table_rows(rng, scale['items'])
+        ]
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent = 2)
+
+
+def write_docx(path: str, rng: random.Random, scale: dict) -> None:
+    document = docx.Document()
+    document.core_properties.created = document.core_properties.modified = datetime.datetime(2024, 1, 1)
+    document.add_heading("Synthetic benchmark document", level = 1)
+    for index in range(scale['paragraphs']):
+        if index % 20 == 0:
+            document.add_heading(sentence(rng)[:60], level = 2)
+        document.add_paragraph(paragraph(rng))
+    document.save(path)
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: str, rng: random.Random, scale: dict) -> None:
+    '''Minimal multi-page PDF with compressed text streams (Helvetica, 45 lines a page)'''
+
+    pages = scale['pages']
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    ]
+
+    page_ids = []
+    for _ in range(pages):
+        lines = []
+        while len(lines) < 45:
+            words = paragraph(rng).split()
+            while words and len(lines) < 45:
+                lines.append(" ".join(words[:12]))
+                words = words[12:]
+
+        text = "BT /F1 10 Tf 12 TL 50 770 Td " + " ".join(f"({_pdf_escape(line)}) '" for line in lines) + " ET"
+        stream = zlib.compress(text.encode('latin-1'))
+
+        objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id)
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>".encode('ascii')
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start = 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as file:
+        file.write(bytes(output))
+
+
+WRITERS = {
+    '.txt'      : write_txt,
+    '.py'       : write_py,
+    '.csv'      : write_csv,
+    '.xlsx'     : write_xlsx,
+    '.jsonld'   : write_jsonld,
+    '.docx'     : write_docx,
+    '.pdf'      : write_pdf
+}
+
+
+def make_corpus(directory: str) -> list[str]:
+    '''Write every size of every format into `directory`; returns the file paths'''
+
+    os.makedirs(directory, exist_ok = True)
+
+    paths = []
+    for size, scale in SIZES.items():
+        for extension, writer in WRITERS.items():
+            path = os.path.join(directory, f"{size}{extension}")
+
+            # One seed per file, so formats and sizes can be regenerated independently
+            writer(path, random.Random(f"{size}{extension}"), scale)
+            paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Generate the synthetic attachment corpus")
+    parser.add_argument("--output", default = CORPUS_DIR)
+    args = parser.parse_args()
+
+    for path in make_corpus(args.output):
+        print(f"{os.path.getsize(path):>10}  {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import os
+import time
+import threading
+import mysql.connector
+from typing import Any
+from collections import deque
+from mysql.connector import Error
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+from metrics import time_stage
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+class PoolTimeout(Exception):
+    '''Raised when no connection became available within the wait timeout'''
+
+
+class PoolClosed(PoolTimeout):
+    '''Raised when a connection is requested after close_all() (callers treat it like a timeout: no retries)'''
+
+
+class TimedCursor:
+    '''Cursor proxy that records statement latency under the db_query stage'''
+
+    def __init__(self, cursor, on_close = None):
+        self._cursor = cursor
+        self._on_close = on_close
+
+    def __getattr__(self, name: str) -> Any:
+        if self._cursor is None:
+            raise Error("Cursor is closed")
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self) -> "TimedCursor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        '''Close the cursor (safe to call more than once, even after its connection went back to the pool)'''
+
+        if self._cursor is not None:
+            cursor, self._cursor = self._cursor, None
+            try:
+                cursor.close()
+            finally:
+                if self._on_close is not None:
+                    self._on_close(self)
+
+    def execute(self, *args, **kwargs) -> Any:
+        with time_stage("db_query"):
+            return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs) -> Any:
+        with time_stage("db_query"):
+            return self._cursor.executemany(*args, **kwargs)
+
+
+class PooledConnection:
+    '''Thin proxy around a MySQL connection that returns it to the pool on close()
+
+    Cursors opened through the proxy are closed before the connection goes
+    back, so a cursor closed later (e.g. by a `with` block around a
+    `finally: conn.close()`) never touches a connection another caller holds.
+    '''
+
+    def __init__(self, pool: "ConnectionPool", conn):
+        self._pool = pool
+        self._conn = conn
+        self._cursors = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if self._conn is None:
+            raise Error("Connection was already returned to the pool")
+        return getattr(self._conn, name)
+
+    def is_connected(self) -> bool:
+        return self._conn is not None and self._conn.is_connected()
+
+    def cursor(self, *args, **kwargs) -> TimedCursor:
+        if self._conn is None:
+            raise Error("Connection was already returned to the pool")
+        cursor = TimedCursor(self._conn.cursor(*args, **kwargs), on_close = self._cursors.discard)
+        self._cursors.add(cursor)
+        return cursor
+
+    def close(self) -> None:
+        '''Close the open cursors and hand the connection back to the pool (safe to call more than once)'''
+
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+
+            # A cursor that fails to close (e.g. unread rows of an unbuffered
+            # cursor) leaves the connection in an unknown state: discard it
+            reusable = True
+            for cursor in list(self._cursors):
+                try:
+                    cursor.close()
+                except Exception as exception:
+                    logger.warning(f"Database - Closing a cursor failed, the connection is discarded: {exception}")
+                    reusable = False
+            self._cursors.clear()
+
+            self._pool.release(conn, reusable)
+
+
+class ConnectionPool:
+    '''Bounded, thread-safe pool of MySQL connections
+
+    Connections are opened lazily up to `size`. Callers wait up to `timeout`
+    seconds for a free connection before PoolTimeout is raised. Idle
+    connections are pinged before being handed out when they have been idle
+    for longer than `health_check_interval` seconds, and dead ones are
+    replaced transparently. After close_all() no connection is handed out
+    and borrowed ones are closed when they are released.
+    '''
+
+    def __init__(self, config: dict, size: int = 10, timeout: float = 5.0, health_check_interval: float = 30.0):
+        self.config                 = config
+        self.size                   = size
+        self.timeout                = timeout
+        self.health_check_interval  = health_check_interval
+
+        self._idle          = deque()   # (connection, last_used) pairs
+        self._open          = 0         # connections currently open (idle + in use)
+        self._lock          = threading.Condition()
+        self._closed        = False
+
+        # Statistics
+        self._acquired      = 0
+        self._timeouts      = 0
+        self._replaced      = 0
+        self._waiting       = 0
+        self._wait_total    = 0.0
+        self._wait_max      = 0.0
+
+    def _connect(self):
+        return mysql.connector.connect(**self.config)
+
+    def _healthy(self, conn, last_used: float) -> bool:
+        '''Ping a connection if it has been idle long enough to have gone stale'''
+
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            conn.ping(reconnect = False)
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def get_connection(self) -> PooledConnection:
+        '''Borrow a connection, waiting up to the pool timeout for one to free up'''
+
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        with self._lock:
+            if self._closed:
+                raise PoolClosed("The database connection pool is closed")
+
+            self._waiting += 1
+            try:
+                while not self._idle and self._open >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(f"No database connection available after {self.timeout}s")
+                    self._lock.wait(remaining)
+                    if self._closed:
+                        raise PoolClosed("The database connection pool is closed")
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                else:
+                    conn, last_used = None, None
+                    self._open += 1
+            finally:
+                self._waiting -= 1
+
+        # Network I/O happens outside the lock
+        try:
+            if conn is not None and not self._healthy(conn, last_used):
+                logger.warning("Database - Discarding a stale pooled connection")
+                self._discard(conn)
+                conn = None
+                with self._lock:
+                    self._replaced += 1
+
+            if conn is None:
+                conn = self._connect()
+                logger.info("Database - New pooled connection was opened")
+
+        except Exception:
+            # Give the slot back so other callers can try
+            with self._lock:
+                self._open -= 1
+                self._lock.notify()
+            raise
+
+        waited = time.monotonic() - start
+        with self._lock:
+            self._acquired += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+        return PooledConnection(self, conn)
+
+    def release(self, conn, reusable: bool = True) -> None:
+        '''Return a borrowed connection to the idle set, or close it when it is not `reusable`'''
+
+        try:
+            # Never hand out a connection with an open transaction
+            if reusable and conn.is_connected():
+                conn.rollback()
+                reusable = True
+            else:
+                reusable = False
+        except Exception:
+            reusable = False
+
+        with self._lock:
+            # Connections returned after close_all() are closed, not kept
+            if reusable and not self._closed:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                reusable = False
+                self._open -= 1
+            self._lock.notify()
+
+        if not reusable:
+            self._discard(conn)
+
+    def close_all(self) -> None:
+        '''Close the pool: idle connections now, in-use ones when they are released'''
+
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._open -= len(idle)
+            # Waiters give up instead of waiting for their timeout
+            self._lock.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict[str, Any]:
+        '''Snapshot of the pool usage counters'''
+
+        with self._lock:
+            idle = len(self._idle)
+            return {
+                'size'          : self.size,
+                'open'          : self._open,
+                'in_use'        : self._open - idle,
+                'idle'          : idle,
+                'waiting'       : self._waiting,
+                'acquired'      : self._acquired,
+                'timeouts'      : self._timeouts,
+                'replaced'      : self._replaced,
+                'avg_wait_ms'   : round(1000 * self._wait_total / self._acquired, 3) if self._acquired else 0.0,
+                'max_wait_ms'   : round(1000 * self._wait_max, 3)
+            }
+
+
+# Shared pool for the backend
+db_pool = ConnectionPool(
+    config = {
+        'user'              : os.getenv('DB_USER'),
+        'password'          : os.getenv('DB_PASSWORD'),
+        'host'              : os.getenv('DB_HOST'),
+        'database'          : os.getenv('DB_NAME'),
+        'raise_on_warnings' : True
+    },
+    size                    = int(os.getenv('DB_POOL_SIZE', 10)),
+    timeout                 = float(os.getenv('DB_POOL_TIMEOUT', 5)),
+    health_check_interval   = float(os.getenv('DB_POOL_HEALTH_CHECK_INTERVAL', 30))
+)
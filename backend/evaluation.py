@@ -0,0 +1,192 @@
+import os
+import re
+import time
+import uuid
+import asyncio
+from http import HTTPStatus
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+# Helper function to normalize answers before comparing them
+def normalize_answer(answer: Optional[str]) -> str:
+    '''Lowercase, trim, and drop surrounding punctuation and repeated whitespace'''
+
+    if answer is None:
+        return ""
+    answer = re.sub(r"\s+", " ", str(answer)).strip().lower()
+    return answer.strip(" .,;:!\"'`")
+
+
+# Helper function to grade a GPT response against the GAIA final answer
+def is_correct(gpt_response: Optional[str], final_answer: Optional[str]) -> bool:
+    '''Exact match after normalization, with numeric answers compared as numbers'''
+
+    response, expected = normalize_answer(gpt_response), normalize_answer(final_answer)
+    if response == expected:
+        return True
+    try:
+        return float(response.replace(",", "")) == float(expected.replace(",", ""))
+    except ValueError:
+        return False
+
+
+class EvaluationJob:
+    '''A batch of GAIA tasks run through the /querygpt pipeline'''
+
+    def __init__(self, task_ids: list[str], user_id: int, concurrency: int):
+        self.job_id         = uuid.uuid4().hex
+        self.task_ids       = task_ids
+        self.user_id        = user_id
+        self.concurrency    = concurrency
+        self.status         = "pending"
+        self.results        = []
+        self.started_at     = None
+        self.finished_at    = None
+
+        self._task          = None
+        self._changed       = asyncio.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "cancelled")
+
+    def summary(self) -> dict[str, Any]:
+        '''Aggregate accuracy, tokens, cost and wall time over finished tasks'''
+
+        succeeded = [result for result in self.results if result['status'] == HTTPStatus.OK]
+        correct = sum(1 for result in succeeded if result['correct'])
+        end = self.finished_at or time.time()
+
+        return {
+            'job_id'        : self.job_id,
+            'state'         : self.status,
+            'total'         : len(self.task_ids),
+            'finished'      : len(self.results),
+            'succeeded'     : len(succeeded),
+            'failed'        : len(self.results) - len(succeeded),
+            'correct'       : correct,
+            'accuracy'      : round(correct / len(succeeded), 4) if succeeded else 0.0,
+            'token_count'   : sum(result['token_count'] for result in succeeded),
+            'file_tokens'   : sum(result['file_tokens'] for result in succeeded),
+            'total_cost'    : round(sum(result['total_cost'] for result in succeeded), 4),
+            'wall_time'     : round(end - self.started_at, 3) if self.started_at else 0.0
+        }
+
+    async def _record(self, result: dict[str, Any]) -> None:
+        async with self._changed:
+            self.results.append(result)
+            self._changed.notify_all()
+
+    async def _run_one(self, run_task: Callable[[str], Awaitable[dict]], task_id: str, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            start = time.time()
+            try:
+                response = await run_task(task_id)
+            except Exception as exception:
+                logger.error(f"Error: evaluation job {self.job_id} failed on task {task_id}")
+                logger.error(exception)
+                response = {'status': HTTPStatus.INTERNAL_SERVER_ERROR}
+
+            ok = response.get('status') == HTTPStatus.OK
+            await self._record({
+                'task_id'       : task_id,
+                'status'        : response.get('status'),
+                'level'         : response.get('level'),
+                'final_answer'  : response.get('final_answer'),
+                'gpt_response'  : response.get('gpt_response'),
+                'correct'       : ok and is_correct(response.get('gpt_response'), response.get('final_answer')),
+                'token_count'   : response.get('token_count', 0) if ok else 0,
+                'file_tokens'   : response.get('file_tokens', 0) if ok else 0,
+                'total_cost'    : response.get('total_cost', 0.0) if ok else 0.0,
+                'cache_hit'     : response.get('cache_hit', False),
+                'time_taken'    : round(time.time() - start, 3)
+            })
+
+    async def run(self, run_task: Callable[[str], Awaitable[dict]]) -> None:
+        '''Run every task with at most `concurrency` in flight'''
+
+        self.status = "running"
+        self.started_at = time.time()
+        logger.info(f"INTERNAL - Evaluation job {self.job_id} started with {len(self.task_ids)} tasks")
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            await asyncio.gather(*(self._run_one(run_task, task_id, semaphore) for task_id in self.task_ids))
+            self.status = "completed"
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            raise
+        finally:
+            self.finished_at = time.time()
+            async with self._changed:
+                self._changed.notify_all()
+            logger.info(f"INTERNAL - Evaluation job {self.job_id} {self.status}")
+
+    def start(self, run_task: Callable[[str], Awaitable[dict]]) -> None:
+        self._task = asyncio.create_task(self.run(run_task))
+
+    def cancel(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    async def events(self):
+        '''Yield each task result as it finishes, then the final summary'''
+
+        sent = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.results) > sent or self.done)
+                pending = self.results[sent:]
+                finished = self.done
+
+            for result in pending:
+                sent += 1
+                yield {'event': "result", 'progress': f"{sent}/{len(self.task_ids)}", 'result': result}
+
+            if finished:
+                yield {'event': "summary", 'summary': self.summary()}
+                return
+
+
+class EvaluationRegistry:
+    '''Keeps the most recent evaluation jobs so clients can poll them'''
+
+    def __init__(self, max_jobs: int = 20):
+        self.max_jobs   = max_jobs
+        self._jobs      = OrderedDict()
+
+    def add(self, job: EvaluationJob) -> None:
+        self._jobs[job.job_id] = job
+
+        # Forget the oldest finished jobs
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id].done:
+                del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[EvaluationJob]:
+        return self._jobs.get(job_id)
+
+    def cancel_all(self) -> None:
+        for job in self._jobs.values():
+            job.cancel()
+
+
+# Shared registry for the backend
+evaluation_jobs = EvaluationRegistry(int(os.getenv('EVALUATION_MAX_JOBS', 20)))
@@ -0,0 +1,86 @@
+import os
+import sys
+from typing import Any, Optional
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+from file_cache import DiskStore, file_digest
+from metrics import cache_requests
+from helpers import EXTRACTOR_VERSION, SUPPORTED_DOCUMENTS, extract_file_content, count_tokens
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+class ExtractionCache:
+    '''Content-addressed store of extracted attachment text and its token count
+
+    Entries are keyed by the SHA-256 of the file plus the extractor version,
+    so an edited file or a change to extract_file_content misses the cache
+    instead of serving stale text.
+    '''
+
+    def __init__(self, directory: str):
+        self.store = DiskStore(directory)
+
+    @staticmethod
+    def key(file_path: str) -> str:
+        return f"{file_digest(file_path)}-v{EXTRACTOR_VERSION}"
+
+    def get(self, file_path: str) -> tuple[Optional[Any], int]:
+        '''Return (content, token count) for a file, extracting it on a miss'''
+
+        key = self.key(file_path)
+        entry = self.store.get(key)
+
+        if entry is not None:
+            logger.info(f"INTERNAL - Extraction cache hit for {os.path.basename(file_path)}")
+            cache_requests.inc(cache = "extraction", result = "hit")
+            return entry['content'], entry['tokens']
+
+        cache_requests.inc(cache = "extraction", result = "miss")
+
+        content = extract_file_content(file_path)
+
+        # Failed extractions are not cached, they may be transient
+        if content is None:
+            return None, 0
+
+        tokens = count_tokens(content)
+        self.store.put(key, {
+            'file_name' : os.path.basename(file_path),
+            'version'   : EXTRACTOR_VERSION,
+            'content'   : content,
+            'tokens'    : tokens
+        })
+        logger.info(f"INTERNAL - Extraction cache filled for {os.path.basename(file_path)}")
+        return content, tokens
+
+    def warm(self, directory: str) -> int:
+        '''Extract every supported file in a directory; returns the number cached'''
+
+        cached = 0
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.lower().endswith(SUPPORTED_DOCUMENTS):
+                content, _ = self.get(os.path.join(directory, file_name))
+                cached += content is not None
+        return cached
+
+
+# Shared cache for the backend
+extraction_cache = ExtractionCache(os.getenv('EXTRACTION_CACHE_DIR', 'cache/extractions'))
+
+
+if __name__ == "__main__":
+
+    # Warm-up: python extraction_cache.py [directory]
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.getenv('DOWNLOAD_DIR')
+    print(f"Cached {extraction_cache.warm(directory)} attachments from {directory}")
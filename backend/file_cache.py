@@ -0,0 +1,68 @@
+import os
+import json
+import uuid
+import hashlib
+import threading
+from typing import Any, Optional
+
+
+# Memoized digests: path -> ((size, mtime_ns), digest)
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+# Helper function to fingerprint a file by its content
+def file_digest(file_path: str) -> str:
+    '''SHA-256 of a file, re-hashed only when its size or mtime changes'''
+
+    stat = os.stat(file_path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    with _digests_lock:
+        cached = _digests.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            sha256.update(block)
+    digest = sha256.hexdigest()
+
+    with _digests_lock:
+        _digests[file_path] = (signature, digest)
+    return digest
+
+
+class DiskStore:
+    '''Directory of JSON documents addressed by a hex key
+
+    Writes go to a temporary file that is atomically renamed into place, so
+    concurrent readers never see a partial document.
+    '''
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        '''Load the document for the key, or None if it is missing or unreadable'''
+
+        try:
+            with open(self._path(key), 'r', encoding = 'utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, document: Any) -> None:
+        '''Store a JSON-serializable document under the key'''
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, 'w', encoding = 'utf-8') as file:
+            json.dump(document, file)
+        os.replace(temp_path, path)
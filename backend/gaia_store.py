@@ -0,0 +1,141 @@
+import asyncio
+import threading
+from typing import Any, Optional
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+
+# Custom libraries
+from log_setup import get_logger
+from db_pool import db_pool
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+class GaiaSnapshot:
+    '''Immutable view of the GAIA tables as loaded at one version'''
+
+    def __init__(self, version: Optional[int], features: dict, annotations: dict):
+        self.version        = version
+        self.features       = features      # task_id -> feature row (insertion ordered)
+        self.annotations    = annotations   # task_id -> annotation steps
+
+
+class GaiaStore:
+    '''In-process, read-through copy of gaia_features and gaia_annotations
+
+    The benchmark tables are written once by the ETL, so the backend loads
+    them in full and serves every read from memory. The ETL bumps the row in
+    gaia_version after each load; refresh() only reloads when that marker
+    has changed.
+    '''
+
+    def __init__(self):
+        self._snapshot  = None
+        self._lock      = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._snapshot.version if self._snapshot else None
+
+    def _read_version(self, cursor) -> Optional[int]:
+        try:
+            cursor.execute("SELECT version FROM gaia_version WHERE id = 1")
+            row = cursor.fetchone()
+            return row['version'] if row else None
+        except Exception:
+            # Tables loaded by an older ETL have no version marker
+            return None
+
+    def refresh(self, force: bool = False) -> bool:
+        '''Reload both tables if the ETL version marker changed; returns True if loaded'''
+
+        with self._lock:
+            try:
+                conn = db_pool.get_connection()
+            except Exception as exception:
+                logger.error("Error: GaiaStore.refresh() could not get a database connection")
+                logger.error(exception)
+                return self.loaded
+
+            try:
+                with conn.cursor(dictionary = True) as cursor:
+                    version = self._read_version(cursor)
+
+                    if self.loaded and not force and version == self.version:
+                        return True
+
+                    logger.info("SQL - Loading gaia_features and gaia_annotations into memory")
+                    cursor.execute("SELECT task_id, question, level, final_answer, file_name FROM gaia_features")
+                    features = {row['task_id']: row for row in cursor.fetchall()}
+
+                    cursor.execute("SELECT task_id, steps FROM gaia_annotations")
+                    annotations = {row['task_id']: row['steps'] for row in cursor.fetchall()}
+
+                self._snapshot = GaiaSnapshot(version, features, annotations)
+                logger.info(f"INTERNAL - GAIA store loaded {len(features)} tasks (version {version})")
+                return True
+
+            except Exception as exception:
+                logger.error("Error: GaiaStore.refresh() encountered an error")
+                logger.error(exception)
+                return self.loaded
+
+            finally:
+                conn.close()
+
+    def ensure_loaded(self) -> bool:
+        '''Load the tables on first use; returns False if the database is unavailable'''
+
+        return self.loaded or self.refresh()
+
+    def list_prompts(self, count: int) -> list[dict[str, Any]]:
+        '''First `count` task_id/question pairs in load order'''
+
+        rows = []
+        for task_id, feature in self._snapshot.features.items():
+            if len(rows) >= count:
+                break
+            rows.append({'task_id': task_id, 'question': feature['question']})
+        return rows
+
+    def task_ids(self, level: Optional[int] = None) -> list[str]:
+        '''All task ids in load order, optionally only those of one GAIA level'''
+
+        return [
+            task_id for task_id, feature in self._snapshot.features.items()
+            if level is None or feature['level'] == level
+        ]
+
+    def get_feature(self, task_id: str) -> Optional[dict[str, Any]]:
+        '''Copy of the gaia_features row for a task'''
+
+        feature = self._snapshot.features.get(task_id)
+        return dict(feature) if feature is not None else None
+
+    def get_steps(self, task_id: str) -> Optional[str]:
+        '''Annotator steps for a task'''
+
+        return self._snapshot.annotations.get(task_id)
+
+    async def watch(self, interval: float) -> None:
+        '''Poll the ETL version marker forever, reloading when it changes'''
+
+        while True:
+            await asyncio.sleep(interval)
+            await run_in_threadpool(self.refresh)
+
+
+# Shared store for the backend
+gaia_store = GaiaStore()
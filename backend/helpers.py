@@ -1,68 +1,33 @@
 import os
-import csv
 import json
 import docx
-import PyPDF2
-import logging
-import openpyxl
-import tiktoken
 import datetime
-from typing import Literal
+from typing import Any, Literal, Optional
 from dotenv import load_dotenv
-from google.cloud import storage
-from google.oauth2 import service_account
-from passlib.context import CryptContext
+
+# Custom libraries
+from log_setup import get_logger
+from metrics import time_stage
+from token_accounting import token_counter
+from table_extraction import table_reader
+from pdf_extraction import pdf_extractor
 
 # Load env variables
 load_dotenv()
 
 # ============================= Logger : Begin =============================
 
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
-# Log to console (dev only)
-if os.getenv('APP_ENV') == "development":
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
-# Also log to a file
-file_handler = logging.FileHandler(os.getenv('LOG_FILE'))
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler) 
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
 
 # ============================= Logger : End ===============================
 
-# Set context for password hashing
-password_context = CryptContext(
-    schemes                         = ["sha256_crypt"],
-    sha256_crypt__default_rounds    = int(os.getenv('SHA256_ROUNDS')),
-    deprecated                      = "auto"
-)
-
-# Helper function to hash passwords
-def get_password_hash(password: str) -> str:
-    '''Helper function to return hashed passwords'''
-
-    return password_context.hash(password)
-
-
-# Helper function to verify passwords
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    '''Helper function to verify passwords'''
-
-    return password_context.verify(plain_password, hashed_password)
-
-
 # Helper function to count tokens
+@time_stage("tokenization")
 def count_tokens(text: str) -> int:
     '''Helper function to count tokens for the GPT-4o model'''
 
-    encoding = tiktoken.encoding_for_model("gpt-4o")
-    return len(encoding.encode(text))
+    return token_counter.count(text)
 
 
 # Helper function to provide rectification strings
@@ -83,7 +48,91 @@ def generate_restriction(final_answer: str) -> str:
         return "Provide only numerical values in your response. No yapping."
     else:
         return "No yapping."
-    
+
+
+# System prompt sent with every GPT request
+SYSTEM_PROMPT = "You are a helpful assistant that obeys the instructions given and provides the correct answers for any questions provided."
+
+
+# Helper function to build the GPT messages for a question
+def build_messages(question: str, final_answer: str, updated_steps: Optional[str] = None) -> tuple[str, list]:
+    '''Helper function to return the full question and the GPT messages asking it'''
+
+    restriction = generate_restriction(final_answer)
+
+    # If updated_steps is empty, then it's a fresh prompt
+    if (updated_steps is None) or (updated_steps == ''):
+        full_question = f"{question} {restriction}".strip()
+    else:
+
+        # Let GPT know the previous response was incorrect
+        rectification = rectification_helper()
+        full_question = f"{rectification} Question: {question} Steps: {updated_steps} {restriction}".strip()
+
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": full_question}
+    ]
+    return full_question, messages
+
+
+# Helper function to wrap an attachment in a GPT message
+def attachment_message(kind: Literal["image", "audio", "document", "notes"], content: str) -> dict[str, Any]:
+    '''Helper function to return the message carrying an image (Base64), transcription, document text or notes on a document'''
+
+    if kind == "image":
+        return {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Here's the image related to the question:"},
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{content}"}}
+            ]
+        }
+
+    if kind == "audio":
+        return {
+            "role": "user",
+            "content": f"Here's the transcription of the audio file related to the question: \n {content}"
+        }
+
+    if kind == "notes":
+        return {
+            "role": "user",
+            "content": f"The file related to the question is too long to include, here are notes taken from it: \n\n {content}"
+        }
+
+    return {
+        "role": "user",
+        "content": f"Here's the content of the file related to the question: \n\n {content}"
+    }
+
+
+# Helper function to count the tokens of a GPT request
+def calculate_tokens(messages: list, file_content: Optional[str], image_token_count: Optional[int] = None, file_token_count: Optional[int] = None) -> tuple[int, int]:
+    '''Count the prompt tokens and the attachment tokens for a GPT request
+
+    Counts are memoized, so the attachment (already counted inside the
+    messages) and static parts like the system prompt are only tokenized
+    once. Images are priced from their dimensions, never from their Base64.
+    '''
+
+    token_count = 0
+
+    for msg in messages:
+        if isinstance(msg['content'], str):
+            token_count += count_tokens(msg['content'])
+        else:
+            token_count += count_tokens(msg['content'][0]['text'])
+            token_count += image_token_count or 0
+
+    if image_token_count is not None:
+        file_token_count = image_token_count
+    elif file_token_count is None:
+        file_token_count = count_tokens(file_content) if file_content is not None else 0
+
+    return token_count, file_token_count
+
+
 # Helper function to check if object is json serializable
 def json_serial(obj):
     """JSON serializer for objects not serializable by default json code"""
@@ -96,7 +145,15 @@ def json_serial(obj):
     return str(obj)
 
 
+# Bump whenever extract_file_content changes its output, so cached extractions are redone
+EXTRACTOR_VERSION = 3
+
+# Attachment types handled by extract_file_content
+SUPPORTED_DOCUMENTS = ('.pdf', '.txt', '.xlsx', '.csv', '.jsonld', '.docx', '.py')
+
+
 # Helper function to extract contents from a file
+@time_stage("extraction")
 def extract_file_content(file_path: str) -> str:
     """Extract content from various file types."""
     
@@ -114,29 +171,22 @@ def extract_file_content(file_path: str) -> str:
 
         elif file_extension == '.pdf':
             logger.info("INTERNAL - Processing .pdf file")
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                return ' '.join([page.extract_text() for page in reader.pages])
+            # Pages are extracted on a process pool and stored (see pdf_extraction.py)
+            return pdf_extractor.extract(file_path)
 
         elif file_extension == '.docx':
             logger.info("INTERNAL - Processing .docx file")
             doc = docx.Document(file_path)
             return ' '.join([paragraph.text for paragraph in doc.paragraphs])
 
-        elif file_extension in ['.xlsx', '.csv']:
-            if file_extension == '.xlsx':
-                logger.info("INTERNAL - Processing .xlsx file")
-                workbook = openpyxl.load_workbook(file_path)
-                sheet = workbook.active
-                data = [[json_serial(cell.value) for cell in row] for row in sheet.iter_rows()]
-            
-            # CSV files
-            else: 
-                logger.info("INTERNAL - Processing .csv file")
-                with open(file_path, 'r') as file:
-                    reader = csv.reader(file)
-                    data = [[json_serial(value) for value in row] for row in reader]
-            return json.dumps(data)
+        # Spreadsheets and CSVs are streamed row by row into compact table text (see table_extraction.py)
+        elif file_extension == '.xlsx':
+            logger.info("INTERNAL - Processing .xlsx file")
+            return table_reader.read_xlsx(file_path)
+
+        elif file_extension == '.csv':
+            logger.info("INTERNAL - Processing .csv file")
+            return table_reader.read_csv(file_path)
 
         elif file_extension == '.jsonld':
             logger.info("INTERNAL - Processing .json file")
@@ -151,56 +201,3 @@ def extract_file_content(file_path: str) -> str:
         return None
     
     logger.info("INTERNAL - File content extraction completed")
-
-
-# Helper function to download files from GCP bucket
-def download_files_from_gcs() -> bool:
-    '''Helper function to download files from GCP bucket'''
-
-    logger.info("INTERNAL - GCP file download request received")
-
-    # Environment variables
-    bucket_name = os.getenv("BUCKET_NAME")
-    gcp_folder_path = os.getenv("GCP_FILES_PATH")
-    creds_file_path = os.path.join(os.getcwd(), os.getenv("GCS_CREDENTIALS_FILE"))
-
-    download_status = False
-    
-    try:
-
-        # Authenticate using the service account file
-        creds = service_account.Credentials.from_service_account_file(creds_file_path)
-        client = storage.Client(credentials = creds)
-        bkt = client.bucket(bucket_name)
-
-        # List all blobs in the folder
-        blobs = bkt.list_blobs(prefix = gcp_folder_path)
-
-        # Iterate through the blobs and download each file
-        for blob in blobs:
-
-            # Extract the file name from the blob's full path
-            file_name = os.path.basename(blob.name)
-            
-            # Skip if it's just the folder itself and not a file
-            if not file_name: 
-                continue
-
-            # Create the download directory if missing
-            if not os.path.exists(os.getenv('DOWNLOAD_DIR')):
-                os.makedirs(os.getenv('DOWNLOAD_DIR'))
-            
-            # File to download and path to save
-            local_file_path = os.path.join(os.getenv('DOWNLOAD_DIR'), file_name)
-
-            # Download the file
-            blob.download_to_filename(local_file_path)
-        
-        download_status = True
-        logger.info("INTERNAL - GCP file download completed")
-    
-    except Exception as exception:
-        logger.error("Error: download_files_from_gcs() encountered a an error")
-        logger.error(exception)
-    
-    return download_status
\ No newline at end of file
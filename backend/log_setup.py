@@ -0,0 +1,216 @@
+import os
+import json
+import uuid
+import zlib
+import random
+import queue
+import atexit
+import logging
+import datetime
+import threading
+from contextvars import ContextVar
+from typing import Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from dotenv import load_dotenv
+
+# Load env variables
+load_dotenv()
+
+# Shared logging for the backend modules
+#
+# Loggers only put records on a bounded in-memory queue; a background
+# listener thread formats them as JSON lines and does the file (and console)
+# writes. Records carry the id of the request they were logged in.
+#
+#   LOG_LEVEL           default level of the backend loggers (INFO)
+#   LOG_LEVELS          per-logger overrides, e.g. "db_pool=WARNING,main=DEBUG"
+#   LOG_SAMPLE_RATE     fraction of requests whose DEBUG records are kept (1.0)
+#   LOG_QUEUE_SIZE      records buffered before new ones are dropped (10000)
+
+# Id of the request being handled, set by RequestIdMiddleware
+request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default = None)
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {'message', 'asctime', 'request_id'}
+
+
+class JsonFormatter(logging.Formatter):
+    '''One JSON object per record'''
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time'          : datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(timespec = 'milliseconds'),
+            'level'         : record.levelname,
+            'logger'        : record.name,
+            'request_id'    : getattr(record, 'request_id', None),
+            'message'       : record.getMessage()
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Rendered before the record was queued
+            entry['exception'] = record.exc_text
+
+        return json.dumps(entry, default = str)
+
+
+class _ContextFilter(logging.Filter):
+    '''Stamps the request id on each record and samples DEBUG records per request'''
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_id = request_id_var.get()
+        record.request_id = request_id
+
+        if record.levelno > logging.DEBUG or self.sample_rate >= 1.0:
+            return True
+
+        # Keep or drop a request's debug trail as a whole
+        if request_id is None:
+            return random.random() < self.sample_rate
+        return zlib.crc32(request_id.encode('ascii', 'ignore')) % 10000 < self.sample_rate * 10000
+
+
+class _DroppingQueueHandler(QueueHandler):
+    '''QueueHandler that never blocks: records are dropped when the queue is full'''
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now (arguments may change later), but leave
+        # formatting to the listener thread
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_lock       = threading.Lock()
+_handler    = None
+_listener   = None
+_levels     = {}
+
+
+def _parse_levels(value: str) -> dict[str, int]:
+    levels = {}
+    for item in value.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return levels
+
+
+def setup_logging() -> QueueHandler:
+    '''Create the shared queue handler and start its listener (once)'''
+
+    global _handler, _listener, _levels
+
+    with _lock:
+        if _handler is not None:
+            return _handler
+
+        _levels = _parse_levels(os.getenv('LOG_LEVELS', ''))
+
+        handlers = []
+
+        # JSON lines to the log file
+        file_handler = logging.FileHandler(os.getenv('LOG_FILE'))
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+
+        # Log to console (dev only)
+        if os.getenv('APP_ENV') == "development":
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"))
+            handlers.append(console_handler)
+
+        log_queue = queue.Queue(maxsize = int(os.getenv('LOG_QUEUE_SIZE', 10000)))
+        _handler = _DroppingQueueHandler(log_queue)
+        _handler.addFilter(_ContextFilter(float(os.getenv('LOG_SAMPLE_RATE', 1.0))))
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level = True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        return _handler
+
+
+def get_logger(name: str) -> logging.Logger:
+    '''Logger for a backend module, writing through the shared queue'''
+
+    handler = setup_logging()
+
+    logger = logging.getLogger(name)
+    logger.setLevel(_levels.get(name, logging.getLevelName(os.getenv('LOG_LEVEL', 'INFO').upper())))
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+    return logger
+
+
+def shutdown_logging() -> None:
+    '''Write out the queued records and stop the listener thread'''
+
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def logging_stats() -> dict[str, Any]:
+    '''Queue depth and number of records dropped because the queue was full'''
+
+    if _handler is None:
+        return {'queued': 0, 'dropped': 0}
+    return {'queued': _handler.queue.qsize(), 'dropped': _handler.dropped}
+
+
+class RequestIdMiddleware:
+    '''ASGI middleware giving every request an id (X-Request-ID) for its log records'''
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reuse the caller's id when one is sent, so logs can be joined across services
+        request_id = None
+        for key, value in scope.get('headers', []):
+            if key == b"x-request-id":
+                request_id = value.decode('latin-1')[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        async def send_with_id(message):
+            if message['type'] == "http.response.start":
+                message['headers'] = list(message.get('headers', [])) + [(b"x-request-id", request_id.encode('latin-1'))]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_var.reset(token)
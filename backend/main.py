@@ -1,32 +1,92 @@
 import os
+import json
 import time
+import uuid
+import asyncio
 import base64
-import logging
 import datetime
-import mysql.connector
-from openai import OpenAI
-from fastapi import FastAPI
+from openai import AsyncOpenAI
+from fastapi import FastAPI, Header
 from http import HTTPStatus
 from pydantic import BaseModel
 from dotenv import load_dotenv
+from contextlib import asynccontextmanager
 from typing import Optional, Any
-from mysql.connector import Error
-from fastapi.responses import JSONResponse
+from mysql.connector import Error, IntegrityError
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 # Custom libraries
+from log_setup import get_logger, logging_stats, shutdown_logging, RequestIdMiddleware
 from helpers import     \
-get_password_hash,      \
-verify_password,        \
-count_tokens,           \
-generate_restriction,   \
-rectification_helper,   \
-extract_file_content,   \
-download_files_from_gcs
+build_messages,         \
+attachment_message,     \
+calculate_tokens,       \
+SUPPORTED_DOCUMENTS
+from db_pool import db_pool, PoolTimeout
+from response_cache import response_cache
+from gaia_store import gaia_store
+from evaluation import EvaluationJob, evaluation_jobs
+from token_accounting import token_counter
+from extraction_cache import extraction_cache
+from attachment_trimming import attachment_trimmer
+from attachment_summarizer import attachment_summarizer
+from transcription_cache import transcription_cache, SUPPORTED_AUDIO
+from attachments import attachment_fetcher
+from pdf_extraction import pdf_extractor
+from analytics_queries import     \
+DEFAULT_RUN_COLUMNS,                \
+build_filters,                      \
+build_summary_query,                \
+build_runs_query,                   \
+serialize_row
+from analytics_export import EXPORT_FORMATS, start_export, parse_columns
+from analytics_writer import analytics_writer
+from auth import password_hasher, session_signer
+from tracing import start_trace, summarize, ServerTimingMiddleware
+from metrics import                 \
+registry,                           \
+time_stage,                         \
+MetricsMiddleware,                  \
+llm_requests,                       \
+llm_tokens,                         \
+llm_cost,                           \
+cache_hit_ratio,                    \
+db_pool_connections,                \
+analytics_queue_depth,              \
+analytics_writer_up
 
 # ============================= FastAPI : Begin =============================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    '''Startup and shutdown hooks for the application'''
+
+    # Load the GAIA tables into memory and reload them when the ETL reruns
+    await run_in_threadpool(gaia_store.refresh)
+    analytics_writer.start()
+
+    # Start the password hashing and PDF extraction workers now rather than on first use
+    password_hasher.start()
+    pdf_extractor.start()
+    gaia_watcher = asyncio.create_task(
+        gaia_store.watch(float(os.getenv('GAIA_VERSION_CHECK_INTERVAL', 60)))
+    )
+
+    yield
+
+    gaia_watcher.cancel()
+    evaluation_jobs.cancel_all()
+    attachment_fetcher.shutdown()
+    password_hasher.shutdown()
+    pdf_extractor.shutdown()
+    await run_in_threadpool(analytics_writer.close)
+    db_pool.close_all()
+    shutdown_logging()
+
+
 # Initialize FastAPI instance
-app = FastAPI()
+app = FastAPI(lifespan = lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -35,7 +95,17 @@ app.add_middleware(
     allow_credentials   = True,
     allow_methods       = ["*"],
     allow_headers       = ["*"],
+    expose_headers      = ["X-Request-ID"],
 )
+
+# Per-request stage breakdown in the Server-Timing header
+app.add_middleware(ServerTimingMiddleware)
+
+# Request counts and latency per route
+app.add_middleware(MetricsMiddleware)
+
+# Tag every request (and its log records) with an id
+app.add_middleware(RequestIdMiddleware)
 # ============================= FastAPI : End ===============================
 
 
@@ -43,30 +113,18 @@ app.add_middleware(
 load_dotenv()
 
 # Setup OpenAI API key
-openai_client = OpenAI(
+openai_client = AsyncOpenAI(
     api_key         = os.getenv("OPENAI_API"),
     project         = os.getenv("PROJECT_ID"),
-    organization    = os.getenv("ORGANIZATION_ID")
+    organization    = os.getenv("ORGANIZATION_ID"),
+    base_url        = os.getenv("OPENAI_BASE_URL")
 )
 
 
 # ============================= Logger : Begin =============================
 
-# Initialize logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
-# Log to console (dev only)
-if os.getenv('APP_ENV') == "development":
-    handler = logging.StreamHandler()
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
-# Also log to a file
-file_handler = logging.FileHandler(os.getenv('LOG_FILE'))
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler) 
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
 
 # ============================= Logger : End ===============================
 
@@ -96,33 +154,39 @@ class QueryGPT(BaseModel):
     user_id: int
     task_id: str
     updated_steps: Optional[str] = None
+    bypass_cache: bool = False
 
 class Feedback(BaseModel):
     user_id: int
     task_id: str
     feedback: str
+    run_id: Optional[str] = None
+
+class Evaluation(BaseModel):
+    user_id: int
+    task_ids: Optional[list[str]] = None
+    level: Optional[int] = None
+    all: bool = False
+    concurrency: Optional[int] = None
+    bypass_cache: bool = False
 
 
 def create_connection(attempts = 3, delay = 2):
-    '''Start a connection with the MySQL database'''
-
-    # Database connection config
-    config = {
-        'user'              : os.getenv('DB_USER'),
-        'password'          : os.getenv('DB_PASSWORD'),
-        'host'              : os.getenv('DB_HOST'),
-        'database'          : os.getenv('DB_NAME'),
-        'raise_on_warnings' : True
-    }
+    '''Borrow a connection from the shared MySQL connection pool'''
 
     # Attempt a reconnection routine
     attempt = 1
     
     while attempt <= attempts:
         try:
-            conn = mysql.connector.connect(**config)
-            logger.info("Database - Connection to the database was opened")
+            conn = db_pool.get_connection()
+            logger.debug("Database - Connection borrowed from the pool")
             return conn
+
+        except PoolTimeout as error:
+            # The pool is saturated; retrying would only queue up more waiters
+            logger.error(f"Database - {error}")
+            return None
         
         except (Error, IOError) as error:
             if attempt == attempts:
@@ -148,10 +212,39 @@ def health() -> dict[str, Any]:
     return {
         'status'    : HTTPStatus.OK,
         'type'      : "string",
-        'message'   : "You're viewing a page from FastAPI"
+        'message'   : "You're viewing a page from FastAPI",
+        'logging'   : logging_stats(),
+        'analytics' : analytics_writer.stats()
     }
 
 
+# Helper function to copy the stats of the shared components into gauges
+def collect_component_metrics() -> None:
+    '''Refresh cache, pool and queue gauges right before a scrape'''
+
+    cache_hit_ratio.set(token_counter.stats()['hit_ratio'], cache = "tokens")
+    if response_cache is not None:
+        cache_hit_ratio.set(response_cache.stats()['hit_ratio'], cache = "responses")
+
+    pool = db_pool.stats()
+    for state in ('open', 'in_use', 'idle', 'waiting'):
+        db_pool_connections.set(pool[state], state = state)
+
+    analytics = analytics_writer.stats()
+    analytics_queue_depth.set(analytics['queue_depth'])
+    analytics_writer_up.set(1 if analytics['worker_alive'] else 0)
+
+registry.add_collector(collect_component_metrics)
+
+
+# Route for Prometheus metrics
+@app.get("/metrics", response_class = PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    '''Request, stage latency, token, cost and cache metrics in the Prometheus text format'''
+
+    return PlainTextResponse(registry.render(), media_type = "text/plain; version=0.0.4")
+
+
 # Route for database health check
 @app.get("/database")
 def dbhealth() -> dict[str, Any]:
@@ -164,20 +257,89 @@ def dbhealth() -> dict[str, Any]:
         response = {
             'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
             'type'      : "string",
-            'message'   : "Database not found :("
+            'message'   : "Database not found :(",
+            'pool'      : db_pool.stats(),
+            'analytics' : analytics_writer.stats()
         }
     else:
+        conn.close()
+        logger.debug("Database - Connection to the database was closed")
         response = {
             'status'    : HTTPStatus.OK,
             'type'      : "string",
-            'message'   : "Connection with database established"
+            'message'   : "Connection with database established",
+            'pool'      : db_pool.stats(),
+            'analytics' : analytics_writer.stats()
         }
-        conn.close()
-        logger.info("Database - Connection to the database was closed")
     
     return response
 
 
+# Helper function to read the user id from an "Authorization: Bearer <token>" header
+def bearer_user(authorization: Optional[str]) -> Optional[int]:
+    '''User id of a valid session token, otherwise None'''
+
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    return session_signer.verify(token.strip())
+
+
+# Helper function to check the session token sent with a request
+def check_session(authorization: Optional[str], user_id: int) -> Optional[dict[str, Any]]:
+    '''Error response unless a valid Bearer token of this user is sent, None if the request may go ahead
+
+    Until SESSION_TOKEN_REQUIRED is turned on, requests sending no token at
+    all are still accepted on the strength of their user_id, so clients from
+    before session tokens keep working. A token that is sent is always checked.
+    '''
+
+    if authorization is None and os.getenv('SESSION_TOKEN_REQUIRED', 'false').lower() != 'true':
+        logger.warning(f"INTERNAL - Request for user {user_id} sent no session token, accepted until SESSION_TOKEN_REQUIRED is turned on")
+        return None
+
+    # The user_id in the request body is only trusted when the token vouches for it
+    session_user_id = bearer_user(authorization)
+    if session_user_id is None:
+        return {
+            'status'    : HTTPStatus.UNAUTHORIZED,
+            'type'      : "string",
+            'message'   : "Missing, invalid or expired session token"
+        }
+
+    if session_user_id != user_id:
+        return {
+            'status'    : HTTPStatus.FORBIDDEN,
+            'type'      : "string",
+            'message'   : "Session token does not belong to this user"
+        }
+
+    return None
+
+
+# Route for checking a session token
+@app.get("/session")
+def session(authorization: Optional[str] = Header(default = None)) -> dict[str, Any]:
+    '''Return the user id of a valid session token'''
+
+    logger.info("GET - /session request received")
+
+    user_id = bearer_user(authorization)
+    if user_id is None:
+        return {
+            'status'    : HTTPStatus.UNAUTHORIZED,
+            'type'      : "string",
+            'message'   : "Invalid or expired session token"
+        }
+
+    return {
+        'status'    : HTTPStatus.OK,
+        'type'      : "string",
+        'message'   : "Session is valid",
+        'user_id'   : user_id
+    }
+
+
 # Route for user registration
 @app.post("/register")
 def register(user: UserRegister) -> dict[str, Any]:
@@ -198,13 +360,13 @@ def register(user: UserRegister) -> dict[str, Any]:
             try:
                 
                 # Check if email already exists
-                logger.info("SQL - Running a SELECT statement")
+                logger.debug("SQL - Running a SELECT statement")
                 cursor.execute("SELECT * FROM users WHERE email = %s", (user.email,))
-                logger.info("SQL - SELECT statement complete")
+                logger.debug("SQL - SELECT statement complete")
                 
                 if cursor.fetchone():
                     conn.close()
-                    logger.info("Database - Connection to the database was closed")
+                    logger.debug("Database - Connection to the database was closed")
 
                     return {
                         'status'    : HTTPStatus.BAD_REQUEST,
@@ -212,11 +374,11 @@ def register(user: UserRegister) -> dict[str, Any]:
                         'message'   : "Email already registered. Please login."
                     }
 
-                # Hash the password
-                hashed_password = get_password_hash(user.password)
+                # Hash the password (in the worker pool)
+                hashed_password = password_hasher.hash(user.password)
 
                 # Insert the new user in the database
-                logger.info("SQL - Running an INSERT statement")
+                logger.debug("SQL - Running an INSERT statement")
                 query = """
                 INSERT INTO users (first_name, last_name, phone, email, password)
                 VALUES (%s, %s, %s, %s, %s)
@@ -229,16 +391,28 @@ def register(user: UserRegister) -> dict[str, Any]:
                     hashed_password
                 ))
                 conn.commit()
-                logger.info("SQL - INSERT statement complete")
+                logger.debug("SQL - INSERT statement complete")
 
                 new_user_id = cursor.lastrowid
                 logger.info(f"New user registered with ID: {new_user_id}")
 
+                session_token, expires_at = session_signer.issue(new_user_id)
                 response = {
-                    "status"    : HTTPStatus.OK,
+                    "status"            : HTTPStatus.OK,
+                    'type'              : "string",
+                    "message"           : "User registered successfully",
+                    "user_id"           : new_user_id,
+                    "session_token"     : session_token,
+                    "expires_at"        : expires_at
+                }
+
+            except IntegrityError:
+                # Lost a race with a concurrent sign up (unique index on users.email)
+                logger.info("SQL - INSERT rejected, email already registered")
+                response = {
+                    'status'    : HTTPStatus.BAD_REQUEST,
                     'type'      : "string",
-                    "message"   : "User registered successfully",
-                    "user_id"   : new_user_id
+                    'message'   : "Email already registered. Please login."
                 }
 
             except Exception as exception:
@@ -252,7 +426,7 @@ def register(user: UserRegister) -> dict[str, Any]:
                 
             finally:
                 conn.close()
-                logger.info("Database - Connection to the database was closed")
+                logger.debug("Database - Connection to the database was closed")
         
         return response
 
@@ -277,15 +451,15 @@ def login(user: UserLogin) -> dict[str, Any]:
             try:
 
                 # Fetch user by email
-                logger.info("SQL - Running a SELECT statement")
+                logger.debug("SQL - Running a SELECT statement")
                 cursor.execute("SELECT * FROM users WHERE email = %s", (user.email,))
-                logger.info("SQL - SELECT statement complete")
+                logger.debug("SQL - SELECT statement complete")
 
                 db_user = cursor.fetchone()
 
                 if db_user is None:
                     conn.close()
-                    logger.info("Database - Connection to the database was closed")
+                    logger.debug("Database - Connection to the database was closed")
 
                     return {
                         'status'    : HTTPStatus.NOT_FOUND,
@@ -293,8 +467,8 @@ def login(user: UserLogin) -> dict[str, Any]:
                         'message'   : "User not found"
                     }
 
-                # Verify password
-                if not verify_password(user.password, db_user['password']):
+                # Verify password (in the worker pool)
+                if not password_hasher.verify(user.password, db_user['password']):
                     response = {
                         'status'    : HTTPStatus.UNAUTHORIZED,
                         'type'      : "string",
@@ -302,11 +476,14 @@ def login(user: UserLogin) -> dict[str, Any]:
                     }
                 else:
                     logger.info(f"User logged in: {db_user['user_id']}")
+                    session_token, expires_at = session_signer.issue(db_user['user_id'])
                     response =  {
-                        "status"    : HTTPStatus.OK,
-                        'type'      : "string",
-                        "message"   : "Login successful",
-                        "user_id"   : db_user['user_id']
+                        "status"            : HTTPStatus.OK,
+                        'type'              : "string",
+                        "message"           : "Login successful",
+                        "user_id"           : db_user['user_id'],
+                        "session_token"     : session_token,
+                        "expires_at"        : expires_at
                     }
 
             except Exception as exception:
@@ -320,7 +497,7 @@ def login(user: UserLogin) -> dict[str, Any]:
 
             finally:
                 conn.close()
-                logger.info("Database - Connection to the database was closed")
+                logger.debug("Database - Connection to the database was closed")
 
         return response
 
@@ -345,7 +522,7 @@ def reset_password(reset_data: PasswordReset) -> dict[str, Any]:
             try:
 
                 # Check if user exists and all provided details match
-                logger.info("SQL - Running a SELECT statement")
+                logger.debug("SQL - Running a SELECT statement")
                 query = """
                 SELECT * FROM users 
                 WHERE first_name = %s 
@@ -359,12 +536,12 @@ def reset_password(reset_data: PasswordReset) -> dict[str, Any]:
                     reset_data.phone, 
                     reset_data.email
                 ))
-                logger.info("SQL - SELECT statement complete")
+                logger.debug("SQL - SELECT statement complete")
                 user = cursor.fetchone()
 
                 if user is None:
                     conn.close()
-                    logger.info("Database - Connection to the database was closed")
+                    logger.debug("Database - Connection to the database was closed")
 
                     return {
                         'status'    : HTTPStatus.UNAUTHORIZED,
@@ -372,15 +549,15 @@ def reset_password(reset_data: PasswordReset) -> dict[str, Any]:
                         'message'   : "User not found or details do not match"
                     }
                     
-                # Hash the new password
-                hashed_password = get_password_hash(reset_data.new_password)
+                # Hash the new password (in the worker pool)
+                hashed_password = password_hasher.hash(reset_data.new_password)
 
                 # Update the password
-                logger.info("SQL - Running a UPDATE statement")
+                logger.debug("SQL - Running a UPDATE statement")
                 update_query = "UPDATE users SET password = %s WHERE user_id = %s"
                 cursor.execute(update_query, (hashed_password, user['user_id']))
                 conn.commit()
-                logger.info("SQL - UPDATE statement complete")
+                logger.debug("SQL - UPDATE statement complete")
 
                 logger.info(f"Password reset successful for user ID: {user['user_id']}")
 
@@ -401,7 +578,7 @@ def reset_password(reset_data: PasswordReset) -> dict[str, Any]:
 
             finally:
                 conn.close()
-                logger.info("Database - Connection to the database was closed")
+                logger.debug("Database - Connection to the database was closed")
 
         return response
 
@@ -410,7 +587,7 @@ def reset_password(reset_data: PasswordReset) -> dict[str, Any]:
 @app.get("/listprompts")
 @app.get("/listprompts/{count}")
 def list_prompts(count: Optional[int] = None) -> dict[str, Any]:
-    '''Fetch "x" number of prompts from the database'''
+    '''Fetch "x" number of prompts from the GAIA store'''
 
     if count is None:
         logger.info("GET - /listprompts request received")
@@ -418,402 +595,397 @@ def list_prompts(count: Optional[int] = None) -> dict[str, Any]:
     else:
         logger.info(f"GET - /listprompts/{count} request received")
 
-    conn = create_connection()
-
-    if conn is None:
+    if not gaia_store.ensure_loaded():
         return {
             'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
             'type'      : "string",
             'message'   : "Database not found :("
         }
 
-    if conn and conn.is_connected():
-        with conn.cursor(dictionary = True) as cursor:
-            try:
-                logger.info("SQL - Running a SELECT statement")
-
-                # Fetch the task_id, question from the table
-                query = f"SELECT `task_id`, `question` FROM `gaia_features` LIMIT {count}"
-                result = cursor.execute(query)
-                rows = cursor.fetchall()
-
-                response = {
-                    'status'    : HTTPStatus.OK,
-                    'type'      : "json",
-                    'message'   : rows,
-                    'length'    : count
-                }
-
-                logger.info("SQL - SELECT statement complete")
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
-
-                return response
-
-            except Exception as exception:
-                logger.error("Error: list_prompts() encountered a SQL error")
-                logger.error(exception)
+    try:
+        rows = gaia_store.list_prompts(count)
 
-            finally:
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
-    
         return {
-            'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
-            'type'      : "string",
-            'message'   : "Could not fetch the list of prompts. Something went wrong."
+            'status'    : HTTPStatus.OK,
+            'type'      : "json",
+            'message'   : rows,
+            'length'    : count
         }
 
+    except Exception as exception:
+        logger.error("Error: list_prompts() encountered an error")
+        logger.error(exception)
+
+    return {
+        'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+        'type'      : "string",
+        'message'   : "Could not fetch the list of prompts. Something went wrong."
+    }
+
 
 # Route for fetching all details about a prompt
 @app.get("/loadprompt/{task_id}")
+@time_stage("loadprompt")
 def loadprompt(task_id: str) -> dict[str, Any]:
-    '''Load all information from the database regarding the given prompt'''
+    '''Load all information from the GAIA store regarding the given prompt'''
 
     logger.info(f"GET - /loadprompt/{task_id} request received")
-    conn = create_connection()
 
-    if conn is None:
+    if not gaia_store.ensure_loaded():
         return {
             'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
             'type'      : "string",
             'message'   : "Database not found :("
         }
 
-    if conn and conn.is_connected():
-        with conn.cursor(dictionary = True) as cursor:
-            try:
-
-                # Fetch the task_id, question, level, final_answer, file_name 
-                logger.info("SQL - Running a SELECT statement")
-                query = """
-                SELECT task_id, question, level, final_answer, file_name 
-                FROM gaia_features
-                WHERE task_id = %s
-                """
-                result = cursor.execute(query, (task_id,))
-                record = cursor.fetchone()
-                logger.info("SQL - SELECT statement complete")
-
-                if record is None:
-                    conn.close()
-                    logger.info("Database - Connection to the database was closed")
-
-                    return {
-                        'status'    : HTTPStatus.NOT_FOUND,
-                        'type'      : "string",
-                        'message'   : f"Could not fetch the details for the given task_id (not found) {task_id}"
-                    }
+    try:
 
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
+        # Fetch the task_id, question, level, final_answer, file_name 
+        record = gaia_store.get_feature(task_id)
 
-                return {
-                    'status'    : HTTPStatus.OK,
-                    'type'      : "json",
-                    'message'   : record
-                }
-
-            except Exception as exception:
-                logger.error("Error: list_prompts() encountered a SQL error")
-                logger.error(exception)
+        if record is None:
+            return {
+                'status'    : HTTPStatus.NOT_FOUND,
+                'type'      : "string",
+                'message'   : f"Could not fetch the details for the given task_id (not found) {task_id}"
+            }
 
-            finally:
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
-    
         return {
-            'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
-            'type'      : "string",
-            'message'   : "Could not fetch details for the prompt. Something went wrong."
+            'status'    : HTTPStatus.OK,
+            'type'      : "json",
+            'message'   : record
         }
 
+    except Exception as exception:
+        logger.error("Error: loadprompt() encountered an error")
+        logger.error(exception)
+
+    return {
+        'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+        'type'      : "string",
+        'message'   : "Could not fetch details for the prompt. Something went wrong."
+    }
+
 
 # Route for fetching annotation details for a prompt
 @app.get("/getannotation/{task_id}")
+@time_stage("getannotation")
 def getannotation(task_id: str) -> dict[str, Any]:
-    '''Load the annotation from the database regarding the given prompt'''
+    '''Load the annotation from the GAIA store regarding the given prompt'''
 
-    logger.info(f"GET - /loadprompt/{task_id} request received")
-    conn = create_connection()
+    logger.info(f"GET - /getannotation/{task_id} request received")
 
-    if conn is None:
+    if not gaia_store.ensure_loaded():
         return {
             'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
             'type'      : "string",
             'message'   : "Database not found :("
         }
 
-    if conn and conn.is_connected():
-        with conn.cursor(dictionary = True) as cursor:
-            try:
+    try:
 
-                # Fetch the final_answer for the task_id
-                logger.info("SQL - Running a SELECT statement")
-                query = """SELECT final_answer FROM gaia_features WHERE task_id = %s"""
+        # Fetch the final_answer for the task_id
+        record = gaia_store.get_feature(task_id)
 
-                result = cursor.execute(query, (task_id,))
-                final_answer = cursor.fetchone()
-                logger.info("SQL - SELECT statement complete")
+        if record is None:
+            return {
+                'status'    : HTTPStatus.NOT_FOUND,
+                'type'      : "string",
+                'message'   : f"Could not fetch the details for the given task_id (not found) {task_id}"
+            }
 
-                if final_answer is None:
-                    conn.close()
-                    logger.info("Database - Connection to the database was closed")
+        # Fetch the steps for the task_id
+        prompt_steps = gaia_store.get_steps(task_id)
 
-                    return {
-                        'status'    : HTTPStatus.NOT_FOUND,
-                        'type'      : "string",
-                        'message'   : f"Could not fetch the details for the given task_id (not found) {task_id}"
-                    }
+        if prompt_steps is None:
+            return {
+                'status'    : HTTPStatus.NOT_FOUND,
+                'type'      : "string",
+                'message'   : f"Could not fetch the annotation steps for the given task_id (not found) {task_id}"
+            }
+        
+        filtered_prompt = prompt_steps.replace(record['final_answer'], '___')
 
-                # Fetch the steps for the task_id
-                logger.info("SQL - Running a SELECT statement")
-                query = """SELECT Steps FROM gaia_annotations WHERE task_id = %s"""
+        return {
+            'status'    : HTTPStatus.OK,
+            'type'      : "string",
+            'message'   : filtered_prompt
+        }
 
-                result = cursor.execute(query, (task_id,))
-                prompt_steps = cursor.fetchone()
-                logger.info("SQL - SELECT statement complete")
+    except Exception as exception:
+        logger.error("Error: getannotation() encountered an error")
+        logger.error(exception)
 
-                if prompt_steps is None:
-                    conn.close()
-                    logger.info("Database - Connection to the database was closed")
+    return {
+        'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+        'type'      : "string",
+        'message'   : "Could not fetch details for the prompt. Something went wrong."
+    }
+    
 
-                    return {
-                        'status'    : HTTPStatus.NOT_FOUND,
-                        'type'      : "string",
-                        'message'   : f"Could not fetch the annotation steps for the given task_id (not found) {task_id}"
-                    }
-                
-                filtered_prompt = prompt_steps['Steps'].replace(final_answer['final_answer'], '___')
+def encode_image(file_path: str) -> tuple[str, int]:
+    '''Read an image from disk, encode it to Base64 and price it in tokens'''
 
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
+    with open(file_path, "rb") as image_file:
+        data = image_file.read()
 
-                return {
-                    'status'    : HTTPStatus.OK,
-                    'type'      : "string",
-                    'message'   : filtered_prompt
-                }
+    return base64.b64encode(data).decode('utf-8'), token_counter.count_image(data)
 
-            except Exception as exception:
-                logger.error("Error: list_prompts() encountered a SQL error")
-                logger.error(exception)
 
-            finally:
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
-    
-        return {
-            'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
-            'type'      : "string",
-            'message'   : "Could not fetch details for the prompt. Something went wrong."
-        }
-    
+async def assemble_prompt(query: QueryGPT) -> Optional[dict[str, Any]]:
+    '''Build the GPT messages for a task (attachment included) and price them'''
 
-def update_analytics(data: dict) -> bool:
-    '''Save GPT-4's response and some other data to the database'''
+    # Blocking work (database, disk, parsing, tokenizing) runs in the
+    # threadpool so the event loop stays free while GPT is in flight
 
-    logger.info("INTERNAL - request to save response data to database received")
-    conn = create_connection()
-    response = False
+    # Get the prompt, apply restriction wherever needed, and send to GPT
+    prompt = await run_in_threadpool(loadprompt, query.task_id)
 
-    if conn and conn.is_connected():
-        with conn.cursor(dictionary = True) as cursor:
-            try:
+    if not prompt or prompt['status'] != HTTPStatus.OK:
+        return None
+            
+    # Apply the restriction (and the rectification for updated steps)
+    full_question, messages = build_messages(
+        prompt['message']['question'],
+        prompt['message']['final_answer'],
+        query.updated_steps
+    )
+
+    # Prepare file parsing if available
+    file_name = prompt['message']['file_name']
+    file_content = None
+    image_token_count = None
+    file_token_count = None
+    original_file_token_count = None
+    map_reduce = None
+    file_path = None
+
+    # Download the attachment if it is not already available
+    if file_name is not None:
+        try:
+            with time_stage("attachment_fetch"):
+                file_path = await attachment_fetcher.fetch(file_name)
+        except Exception as exception:
+            logger.error(f"Error: could not fetch the attachment {file_name}")
+            logger.error(exception)
 
-                # Update the analytics 
-                logger.info("SQL - Running an INSERT statement")
+    if file_path is not None:
 
-                # Get the columns and the corresponding placeholders
-                columns = ', '.join(data.keys())
-                placeholders = ', '.join(['%s'] * len(data))
+        if file_name.lower().endswith(('.png', '.jpg')):
 
-                query = f"INSERT INTO analytics ({columns}) VALUES ({placeholders})"
+            # Encode the image to Base64
+            file_content, image_token_count = await run_in_threadpool(encode_image, file_path)
+            
+            messages.append(attachment_message("image", file_content))
 
-                cursor.execute(query, tuple(data.values()))
-                conn.commit()
-                logger.info("SQL - INSERT statement complete")
-                response = True
+        elif file_name.lower().endswith(SUPPORTED_AUDIO):
+
+            try:
 
+                # Transcribe with Whisper (or reuse the stored transcription)
+                file_content = await transcription_cache.transcribe(openai_client, file_path, "whisper-1")
+
+                if file_content is not None:
+                    messages.append(attachment_message("audio", file_content))
+            
             except Exception as exception:
-                logger.error("Error: update_analytics() encountered an error")
-                logger.error(exception)
-                
-            finally:
-                conn.close()
-                logger.info("Database - Connection to the database was closed")
-    
-    return response
+                logger.error("Error: WHISPER - querygpt() encountered an error")
+
+
+        elif file_name.lower().endswith(SUPPORTED_DOCUMENTS):
+            
+            # Parse the files (or reuse an earlier extraction of the same content)
+            file_content, file_token_count = await run_in_threadpool(extraction_cache.get, file_path)
+            original_file_token_count = file_token_count
+
+            if attachment_summarizer.applies(file_token_count):
+
+                # Too large for one request: read it in parts (if enabled) and send the notes instead
+                map_reduce = await attachment_summarizer.summarize(openai_client, file_content, prompt['message']['question'])
+                file_content, file_token_count = map_reduce['notes'], None
+                messages.append(attachment_message("notes", file_content))
+
+            else:
+
+                # Keep only the parts relevant to the question when the file is too large (if enabled)
+                relevance_query = f"{prompt['message']['question']} {query.updated_steps or ''}"
+                file_content, file_token_count = await run_in_threadpool(attachment_trimmer.trim, file_content, relevance_query, file_token_count)
+
+                if file_content is not None:
+                    messages.append(attachment_message("document", file_content))
+
+    # Calculate the tokens and cost (map requests of a map-reduce read included)
+    token_count, file_token_count = await run_in_threadpool(calculate_tokens, messages, file_content, image_token_count, file_token_count)
+    map_tokens = map_reduce['map_tokens'] if map_reduce is not None else 0
+    map_cost = float('{:.4f}'.format(map_tokens * 0.000005))
+    cost = (token_count + map_tokens) * 0.000005
+    cost = float('{:.4f}'.format(cost))
+
+    # Attachment size before trimming or map-reduce (otherwise the same as file_token_count)
+    if original_file_token_count is None:
+        original_file_token_count = file_token_count
+
+    return {
+        'prompt'                    : prompt['message'],
+        'full_question'             : full_question,
+        'messages'                  : messages,
+        'file_content'              : file_content,
+        'token_count'               : token_count,
+        'file_token_count'          : file_token_count,
+        'original_file_token_count' : original_file_token_count,
+        'map_reduce'                : map_reduce,
+        'map_cost'                  : map_cost,
+        'cost'                      : cost
+    }
+
+
+async def cached_response(query: QueryGPT, messages: list, model: str, temperature: float) -> tuple[Optional[str], Optional[str]]:
+    '''Look the prompt up in the response cache; returns (cache_key, cached response)'''
+
+    if response_cache is None:
+        return None, None
+
+    cache_key = response_cache.make_key(model, temperature, messages)
+
+    if query.bypass_cache:
+        return cache_key, None
+
+    return cache_key, await run_in_threadpool(response_cache.get, cache_key)
+
+
+async def record_response(query: QueryGPT, assembled: dict[str, Any], gpt_response: str, time_consumed: float, cache_hit: bool, model: str) -> dict[str, Any]:
+    '''Save a GPT run to the analytics table and build the /querygpt response body'''
+
+    prompt = assembled['prompt']
+
+    # Nothing but the map requests (if any) was spent on OpenAI for a cached answer
+    cost = assembled['map_cost'] if cache_hit else assembled['cost']
+
+    llm_requests.inc(model = model, cache = "hit" if cache_hit else "miss")
+    llm_tokens.inc(assembled['token_count'] or 0, model = model, kind = "prompt")
+    llm_tokens.inc(assembled['file_token_count'] or 0, model = model, kind = "attachment")
+    if assembled['map_reduce'] is not None:
+        llm_tokens.inc(assembled['map_reduce']['map_tokens'], model = attachment_summarizer.model, kind = "map")
+    llm_cost.inc(cost, model = model)
+
+    # Save to analytics table, keyed by an id the client can send feedback for
+    run_id = uuid.uuid4().hex
+    response_data = {
+        "run_id"                            : run_id,
+        "user_id"                           : query.user_id,
+        "task_id"                           : prompt['task_id'],
+        "gpt_response"                      : gpt_response,
+        "tokens_per_text_prompt"            : assembled['token_count'],
+        "tokens_per_attachment"             : assembled['file_token_count'],
+        "tokens_per_attachment_original"    : assembled['original_file_token_count'],
+        'total_cost'                        : cost,
+        'time_consumed'                     : time_consumed,
+        'cache_hit'                         : cache_hit
+    }
+
+    if (query.updated_steps is not None) and (query.updated_steps != ''):
+        response_data["updated_steps"] = query.updated_steps
+
+    # Where the time went, stored with the run when enabled
+    if os.getenv('ANALYTICS_STORE_STAGE_TIMINGS', 'false').lower() == 'true':
+        response_data['stage_timings'] = json.dumps(summarize())
+
+    # Written in batches by the background writer
+    with time_stage("analytics_enqueue"):
+        queued = await run_in_threadpool(analytics_writer.record, response_data)
+
+    if queued:
+        logger.info("INTERNAL - analytics data queued for the database")
+    else:
+        logger.error("INTERNAL - analytics queue is full, data spilled to disk")
+
+    json_response = {
+        "status"                : HTTPStatus.OK,
+        "run_id"                : run_id,
+        "task_id"               : prompt['task_id'],
+        "question"              : assembled['full_question'],
+        "level"                 : prompt['level'],
+        "final_answer"          : prompt['final_answer'],
+        "file_name"             : prompt['file_name'],
+        "file_content"          : assembled['file_content'],
+        "token_count"           : assembled['token_count'],
+        "file_tokens"           : assembled['file_token_count'],
+        "file_tokens_original"  : assembled['original_file_token_count'],
+        "total_cost"            : cost,
+        "gpt_response"          : gpt_response,
+        "cache_hit"             : cache_hit
+    }
+
+    # How a too-large attachment was read, without repeating the notes
+    if assembled['map_reduce'] is not None:
+        json_response["map_reduce"] = {key: value for key, value in assembled['map_reduce'].items() if key != 'notes'}
+
+    # Get the annotation and append it to the json response
+    logger.info(f"INTERNAL - Fetching annotation for task_id {prompt['task_id']}")
+    annotation = await run_in_threadpool(getannotation, prompt['task_id'])
+
+    if annotation["status"] == HTTPStatus.OK:
+        json_response["annotation_steps"] = annotation["message"]
+
+    json_response["stage_timings"] = summarize()
+    return json_response
 
 
 # Route for querying GPT
 @app.post("/querygpt")
-async def query_gpt(query: QueryGPT) -> dict[str, Any]:
+async def query_gpt(query: QueryGPT, authorization: Optional[str] = Header(default = None)) -> dict[str, Any]:
     '''Forward the question to OpenAI GPT4 and evaluate based on GAIA Benchmark'''
 
     logger.info(f"POST - /querygpt/{query.task_id} request received")
-    
-    try:
 
-        # Get the prompt, apply restriction wherever needed, and send to GPT
-        prompt = loadprompt(query.task_id)
+    session_error = check_session(authorization, query.user_id)
+    if session_error is not None:
+        return session_error
 
-        if prompt and prompt['status'] == HTTPStatus.OK:
-            
-            # If query.updated_steps is empty, then it's a fresh prompt
-            if (query.updated_steps is None) or (query.updated_steps == ''):
-                
-                restriction = generate_restriction(prompt['message']['final_answer'])
-                full_question = f"{prompt['message']['question']} {restriction}".strip()
-            else:
+    return await answer_query(query)
 
-                # Let GPT know the previous response was incorrect
-                rectification = rectification_helper()
-                restriction = generate_restriction(prompt['message']['final_answer'])
-                full_question = f"{rectification} Question: {prompt['message']['question']} Steps: {query.updated_steps} {restriction}".strip()
-
-            # Prepare the message to send to GPT-4o
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant that obeys the instructions given and provides the correct answers for any questions provided."},
-                {"role": "user", "content": full_question}
-            ]
-
-            # Prepare file parsing if available
-            file_name = prompt['message']['file_name']
-            file_content = None
-            content_available = False
-
-            # Download the files if they are not already available
-            if not os.path.exists(os.getenv('DOWNLOAD_DIR')):
-                content_available = download_files_from_gcs()
-            else:
-                content_available = True
-
-            if content_available:
-                if file_name is not None: 
-
-                    file_path = os.path.join(os.getcwd(), os.getenv('DOWNLOAD_DIR'), file_name)
-
-                    if file_name.lower().endswith(('.png', '.jpg')):
-
-                        # Encode the image to Base64
-                        with open(file_path, "rb") as image_file:
-                            file_content = base64.b64encode(image_file.read()).decode('utf-8')
-                        
-                        messages.append({
-                            "role": "user",
-                            "content": [
-                                {"type": "text", "text": "Here's the image related to the question:"},
-                                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{file_content}"}}
-                            ]
-                        })
-
-                    elif file_name.lower().endswith(('.mp3')):
-
-                        audio_file= open(file_path, "rb")
-                        try:
-                            
-                            logger.info("WHISPER - Sending a audio transcription request")
-                            file_content = openai_client.audio.transcriptions.create(
-                                model = "whisper-1", 
-                                file = audio_file,
-                                response_format = "text"
-                            )
-
-                            if file_content is not None:
-                                messages.append({
-                                    "role": "user",
-                                    "content": f"Here's the transcription of the audio file related to the question: \n {file_content}"
-                                })
-                        
-                        except Exception as exception:
-                            logger.error("Error: WHISPER - querygpt() encountered an error")
-
-
-                    elif file_name.lower().endswith(('.pdf', '.txt', '.xlsx', '.csv', '.jsonld', '.docx', '.py')):
-                        
-                        # Parse the files
-                        file_content = extract_file_content(file_path)
-                        
-                        if file_content is not None:
-                            messages.append({
-                                "role": "user",
-                                "content": f"Here's the content of the file related to the question: \n\n {file_content}"
-                            })
-
-            # Calculate the tokens and cost
-            token_count = 0
-
-
-            for msg in messages:
-                if isinstance(msg['content'], str):
-                    token_count += count_tokens(msg['content'])
-                else:
-                    token_count += count_tokens(msg['content'][0]['text'])
-                    token_count += count_tokens(file_content) if file_content is not None else 0
 
-            file_token_count = count_tokens(file_content) if file_content is not None else 0
-            cost = token_count * 0.000005
-            cost = float('{:.4f}'.format(cost))
+# Helper function to answer a query once its session is checked
+async def answer_query(query: QueryGPT) -> dict[str, Any]:
+    '''Body of /querygpt, also run by batch evaluations for every task'''
+
+    try:
+        assembled = await assemble_prompt(query)
+
+        if assembled is not None:
 
             # Record the time
             start_time = time.time()
 
-            # Send question to GPT
-            logger.info("GPT - Sending a ChatCompletion request")
-            response = openai_client.chat.completions.create(
-                model = "gpt-4o",
-                temperature = 1,
-                messages = messages
-            )
+            # Serve repeated prompts from the response cache (if enabled)
+            model = "gpt-4o"
+            temperature = 1
+            cache_key, gpt_response = await cached_response(query, assembled['messages'], model, temperature)
+            cache_hit = gpt_response is not None
 
-            logger.info("GPT - ChatCompletion request complete")
-
-            time_consumed = time.time() - start_time
-            time_consumed = float('{:.3f}'.format(time_consumed))
-            gpt_response = response.choices[0].message.content
-
-            # Save to analytics table
-            response_data = {
-                "user_id"                   : query.user_id,
-                "task_id"                   : prompt['message']['task_id'],
-                "gpt_response"              : gpt_response,
-                "tokens_per_text_prompt"    : token_count,
-                "tokens_per_attachment"     : file_token_count,
-                'total_cost'                : cost,
-                'time_consumed'             : time_consumed
-            }
+            if cache_hit:
+                logger.info("GPT - Response served from the cache")
+            else:
 
-            if (query.updated_steps is not None) or (query.updated_steps != ''):
-                response_data["updated_steps"] = query.updated_steps
+                # Send question to GPT
+                logger.info("GPT - Sending a ChatCompletion request")
+                with time_stage("openai_chat"):
+                    response = await openai_client.chat.completions.create(
+                        model = model,
+                        temperature = temperature,
+                        messages = assembled['messages']
+                    )
 
-            if update_analytics(response_data):
-                logger.info("INTERNAL - analytics data saved to database")
-            else:
-                logger.error("INTERNAL - Failed to save analytics data to database")
-
-            json_response = {
-                "status"        : HTTPStatus.OK,
-                "task_id"       : prompt['message']['task_id'],
-                "question"      : full_question,
-                "level"         : prompt['message']['level'],
-                "final_answer"  : prompt['message']['final_answer'],
-                "file_name"     : prompt['message']['file_name'],
-                "file_content"  : file_content,
-                "token_count"   : token_count,
-                "file_tokens"   : file_token_count,
-                "total_cost"    : cost,
-                "gpt_response"  : gpt_response
-            }
+                logger.info("GPT - ChatCompletion request complete")
+                gpt_response = response.choices[0].message.content
 
-            # Get the annotation and append it to the json response
-            logger.info(f"INTERNAL - Fetching annotation for task_id {prompt['message']['task_id']}")
-            annotation = getannotation(prompt['message']['task_id'])
+                if cache_key is not None and gpt_response is not None:
+                    await run_in_threadpool(response_cache.set, cache_key, gpt_response)
 
-            if annotation["status"] == HTTPStatus.OK:
-                json_response["annotation_steps"] = annotation["message"]
+            time_consumed = time.time() - start_time
+            time_consumed = float('{:.3f}'.format(time_consumed))
 
-            return json_response
+            return await record_response(query, assembled, gpt_response, time_consumed, cache_hit, model)
 
     except Exception as exception:
         logger.error("Error: querygpt() encountered an error")
@@ -826,33 +998,275 @@ async def query_gpt(query: QueryGPT) -> dict[str, Any]:
     }
 
 
-# Route for saving feedback GPT
-@app.post("/feedback")
-def feedback(data: Feedback) -> dict[str, Any]:
-    '''Save the user's feedback for GPT's response for the task_id'''
+# Route for querying GPT with a streamed response
+@app.post("/querygpt/stream")
+async def query_gpt_stream(query: QueryGPT, authorization: Optional[str] = Header(default = None)):
+    '''Same as /querygpt, but forwards GPT's tokens as NDJSON while they are generated
 
-    logger.info(f"POST - /feedback/{data.task_id} request received")
+    Every line is a JSON object. "token" events carry the next piece of the
+    answer; the last line is a "done" event with the full /querygpt response
+    body (token counts, cost, annotation steps), or an "error" event.
+    '''
+
+    logger.info(f"POST - /querygpt/stream/{query.task_id} request received")
+
+    session_error = check_session(authorization, query.user_id)
+    if session_error is not None:
+        return session_error
+
+    error = {
+        'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+        'type'      : "string",
+        'message'   : "Could not send prompt to GPT. Something went wrong."
+    }
+
+    try:
+        assembled = await assemble_prompt(query)
+    except Exception as exception:
+        logger.error("Error: querygpt_stream() encountered an error")
+        logger.error(exception)
+        assembled = None
+
+    if assembled is None:
+        return error
+
+    async def ndjson():
+        try:
+
+            # Record the time
+            start_time = time.time()
+
+            # Serve repeated prompts from the response cache (if enabled)
+            model = "gpt-4o"
+            temperature = 1
+            cache_key, gpt_response = await cached_response(query, assembled['messages'], model, temperature)
+            cache_hit = gpt_response is not None
+
+            if cache_hit:
+                logger.info("GPT - Response served from the cache")
+                yield json.dumps({'event': "token", 'content': gpt_response}) + "\n"
+            else:
+
+                # Send question to GPT and relay the tokens as they arrive
+                logger.info("GPT - Sending a streaming ChatCompletion request")
+                with time_stage("openai_chat"):
+                    stream = await openai_client.chat.completions.create(
+                        model = model,
+                        temperature = temperature,
+                        messages = assembled['messages'],
+                        stream = True
+                    )
+
+                    parts = []
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
+                            yield json.dumps({'event': "token", 'content': chunk.choices[0].delta.content}) + "\n"
+
+                logger.info("GPT - Streaming ChatCompletion request complete")
+                gpt_response = ''.join(parts)
+
+                if cache_key is not None and gpt_response:
+                    await run_in_threadpool(response_cache.set, cache_key, gpt_response)
+
+            time_consumed = time.time() - start_time
+            time_consumed = float('{:.3f}'.format(time_consumed))
+
+            final = await record_response(query, assembled, gpt_response, time_consumed, cache_hit, model)
+            yield json.dumps({'event': "done", **final}) + "\n"
+
+        except Exception as exception:
+            logger.error("Error: querygpt_stream() encountered an error")
+            logger.error(exception)
+            yield json.dumps({'event': "error", **error}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type = "application/x-ndjson")
+
+
+# Route for starting a batch evaluation
+@app.post("/evaluations")
+async def start_evaluation(request: Evaluation, authorization: Optional[str] = Header(default = None)) -> dict[str, Any]:
+    '''Run a set of GAIA tasks through /querygpt concurrently in the background'''
+
+    logger.info("POST - /evaluations request received")
+
+    session_error = check_session(authorization, request.user_id)
+    if session_error is not None:
+        return session_error
+
+    if not await run_in_threadpool(gaia_store.ensure_loaded):
+        return {
+            'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
+            'type'      : "string",
+            'message'   : "Database not found :("
+        }
+
+    # Resolve which tasks to run
+    if request.task_ids:
+        task_ids = list(dict.fromkeys(request.task_ids))
+        unknown = [task_id for task_id in task_ids if gaia_store.get_feature(task_id) is None]
+
+        if unknown:
+            return {
+                'status'    : HTTPStatus.NOT_FOUND,
+                'type'      : "string",
+                'message'   : f"Could not find the given task_ids: {', '.join(unknown)}"
+            }
+    elif request.all or request.level is not None:
+        task_ids = gaia_store.task_ids(request.level)
+    else:
+        return {
+            'status'    : HTTPStatus.BAD_REQUEST,
+            'type'      : "string",
+            'message'   : "Provide task_ids, a level, or set all to true"
+        }
+
+    max_concurrency = int(os.getenv('EVALUATION_MAX_CONCURRENCY', 32))
+    concurrency = request.concurrency or int(os.getenv('EVALUATION_CONCURRENCY', 16))
+    concurrency = max(1, min(concurrency, max_concurrency))
+
+    async def run_task(task_id: str) -> dict[str, Any]:
+        # Each task gets its own trace, not the one of the /evaluations request
+        start_trace()
+
+        # The session was already checked for the whole job
+        return await answer_query(QueryGPT(
+            user_id         = request.user_id,
+            task_id         = task_id,
+            bypass_cache    = request.bypass_cache
+        ))
+
+    job = EvaluationJob(task_ids, request.user_id, concurrency)
+    evaluation_jobs.add(job)
+    job.start(run_task)
+
+    return {
+        'status'    : HTTPStatus.OK,
+        'type'      : "json",
+        'message'   : job.summary(),
+        'job_id'    : job.job_id
+    }
+
+
+# Route for polling a batch evaluation
+@app.get("/evaluations/{job_id}")
+def get_evaluation(job_id: str, results: bool = False) -> dict[str, Any]:
+    '''Report the progress and aggregate scores of a batch evaluation'''
+
+    logger.info(f"GET - /evaluations/{job_id} request received")
+    job = evaluation_jobs.get(job_id)
+
+    if job is None:
+        return {
+            'status'    : HTTPStatus.NOT_FOUND,
+            'type'      : "string",
+            'message'   : f"Could not find the evaluation job {job_id}"
+        }
+
+    response = {
+        'status'    : HTTPStatus.OK,
+        'type'      : "json",
+        'message'   : job.summary()
+    }
+
+    if results:
+        response['results'] = list(job.results)
+
+    return response
+
+
+# Route for streaming the progress of a batch evaluation
+@app.get("/evaluations/{job_id}/stream")
+async def stream_evaluation(job_id: str):
+    '''Stream per-task results as NDJSON, ending with the aggregate summary'''
+
+    logger.info(f"GET - /evaluations/{job_id}/stream request received")
+    job = evaluation_jobs.get(job_id)
+
+    if job is None:
+        return {
+            'status'    : HTTPStatus.NOT_FOUND,
+            'type'      : "string",
+            'message'   : f"Could not find the evaluation job {job_id}"
+        }
+
+    async def ndjson():
+        async for event in job.events():
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(ndjson(), media_type = "application/x-ndjson")
+
+
+# Helper function to look up an analytics row by the run id returned from /querygpt
+def find_run(cursor, run_id: str, user_id: int) -> Optional[int]:
+    '''Primary key of the user's analytics row for the run, or None'''
+
+    logger.debug("SQL - Running a SELECT statement")
+    cursor.execute("SELECT id FROM analytics WHERE run_id = %s AND user_id = %s", (run_id, user_id))
+    rows = cursor.fetchall()
+    logger.debug("SQL - SELECT statement complete")
+
+    return rows[0]['id'] if rows else None
+
+
+# Helper function to wait for queued analytics rows to reach the database
+def await_analytics_flush() -> None:
+    '''Flush the analytics writer, bounded by FEEDBACK_FLUSH_TIMEOUT seconds'''
+
+    if not analytics_writer.flush(float(os.getenv('FEEDBACK_FLUSH_TIMEOUT', 5))):
+        logger.warning("INTERNAL - analytics writer did not flush before the feedback update")
+
+
+# Helper function to save feedback on a pooled connection
+def save_feedback(data: Feedback) -> dict[str, Any]:
+    '''Update the analytics row of the run (or the user's latest run of the task)'''
 
     conn = create_connection()
 
+    if conn is None:
+        return {
+            'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
+            'type'      : "string",
+            'message'   : "Database not found :("
+        }
+
     if conn and conn.is_connected():
         with conn.cursor(dictionary = True) as cursor:
             try:
 
-                # Update the analytics and save the feedback
-                logger.info("SQL - Running an UPDATE statement")
+                if data.run_id:
+                    run_id = find_run(cursor, data.run_id, data.user_id)
 
-                query = """
-                UPDATE analytics AS a
-                JOIN (SELECT id FROM analytics ORDER BY time_stamp DESC LIMIT 1) AS sub
-                ON a.id = sub.id
-                SET a.feedback = %s
-                WHERE a.user_id = %s AND a.task_id = %s
-                """
+                    if run_id is None:
+                        return {
+                            'status'    : HTTPStatus.NOT_FOUND,
+                            'type'      : "string",
+                            'message'   : f"Could not find the run {data.run_id}"
+                        }
+
+                    # Update the analytics row by its primary key
+                    logger.debug("SQL - Running an UPDATE statement")
+                    cursor.execute("UPDATE analytics SET feedback = %s WHERE id = %s", (data.feedback, run_id))
+
+                else:
+                    # Older clients: fall back to the user's latest run of the task
+                    logger.debug("SQL - Running an UPDATE statement")
+
+                    query = """
+                    UPDATE analytics AS a
+                    JOIN (
+                        SELECT id FROM analytics
+                        WHERE user_id = %s AND task_id = %s
+                        ORDER BY time_stamp DESC, id DESC LIMIT 1
+                    ) AS sub
+                    ON a.id = sub.id
+                    SET a.feedback = %s
+                    """
+
+                    cursor.execute(query, (data.user_id, data.task_id, data.feedback))
 
-                cursor.execute(query, (data.feedback, data.user_id, data.task_id))
                 conn.commit()
-                logger.info("SQL - UPDATE statement complete")
+                logger.debug("SQL - UPDATE statement complete")
                 response = {
                     'status'    : HTTPStatus.OK,
                     'type'      : "string",
@@ -870,14 +1284,39 @@ def feedback(data: Feedback) -> dict[str, Any]:
                 
             finally:
                 conn.close()
-                logger.info("Database - Connection to the database was closed")
+                logger.debug("Database - Connection to the database was closed")
     
     return response
 
 
+# Route for saving feedback GPT
+@app.post("/feedback")
+def feedback(data: Feedback, authorization: Optional[str] = Header(default = None)) -> dict[str, Any]:
+    '''Save the user's feedback for GPT's response for the task_id'''
+
+    logger.info(f"POST - /feedback/{data.task_id} request received")
+
+    session_error = check_session(authorization, data.user_id)
+    if session_error is not None:
+        return session_error
+
+    # Analytics rows are written behind, so the run may still be queued. Flushes
+    # happen with no pooled connection held: the writer needs one to drain.
+    if not data.run_id and analytics_writer.pending():
+        await_analytics_flush()
+
+    response = save_feedback(data)
+
+    if data.run_id and response['status'] == HTTPStatus.NOT_FOUND:
+        await_analytics_flush()
+        response = save_feedback(data)
+
+    return response
+
+
 # Route for analytics
 @app.get("/analytics")
-async def get_analytics():
+def get_analytics():
     logger.info("GET - /analytics request received")
     conn = create_connection()
 
@@ -902,17 +1341,7 @@ async def get_analytics():
                 results = cursor.fetchall()
 
                 # Process the results to ensure they are JSON serializable
-                processed_results = []
-                for row in results:
-                    processed_row = {}
-                    for key, value in row.items():
-                        if isinstance(value, (int, float, str, type(None))):
-                            processed_row[key] = value
-                        elif isinstance(value, (datetime.date, datetime.datetime)):
-                            processed_row[key] = value.isoformat()
-                        else:
-                            processed_row[key] = str(value)
-                    processed_results.append(processed_row)
+                processed_results = [serialize_row(row) for row in results]
 
                 return JSONResponse(content=processed_results)
 
@@ -922,6 +1351,215 @@ async def get_analytics():
             
             finally:
                 conn.close()
-                logger.info("Database - Connection to the database was closed")
+                logger.debug("Database - Connection to the database was closed")
+
+
+# Route for aggregated analytics
+@app.get("/analytics/summary")
+def get_analytics_summary(
+    group_by: Optional[str] = None,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    user_id: Optional[int] = None,
+    task_id: Optional[str] = None,
+    level: Optional[int] = None
+) -> dict[str, Any]:
+    '''Totals, averages, cost per token and tokens/sec computed in SQL
+
+    group_by may be "day", "user", "task" or "level"; start and end bound
+    the run timestamps (start inclusive, end exclusive).
+    '''
+
+    logger.info("GET - /analytics/summary request received")
+
+    try:
+        conditions, params = build_filters(start, end, user_id, task_id, level)
+        query, params = build_summary_query(group_by, conditions, params)
+    except ValueError as error:
+        return {
+            'status'    : HTTPStatus.BAD_REQUEST,
+            'type'      : "string",
+            'message'   : str(error)
+        }
+
+    conn = create_connection()
+
+    if conn is None:
+        return {
+            'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
+            'type'      : "string",
+            'message'   : "Database not found :("
+        }
+
+    with conn.cursor(dictionary = True) as cursor:
+        try:
+            logger.debug("SQL - Running a SELECT statement")
+            cursor.execute(query, tuple(params))
+            rows = [serialize_row(row) for row in cursor.fetchall()]
+            logger.debug("SQL - SELECT statement complete")
+
+            response = {
+                'status'    : HTTPStatus.OK,
+                'type'      : "json",
+                'message'   : rows if group_by else rows[0]
+            }
+
+        except Exception as exception:
+            logger.error("Error: get_analytics_summary() encountered an error")
+            logger.error(exception)
+            response = {
+                'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+                'type'      : "string",
+                'message'   : "Could not fetch the analytics summary. Something went wrong."
+            }
+
+        finally:
+            conn.close()
+            logger.debug("Database - Connection to the database was closed")
+
+    return response
+
+
+# Route for paginated analytics rows
+@app.get("/analytics/runs")
+def get_analytics_runs(
+    after_id: int = 0,
+    limit: int = 100,
+    columns: Optional[str] = None,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    user_id: Optional[int] = None,
+    task_id: Optional[str] = None,
+    level: Optional[int] = None
+) -> dict[str, Any]:
+    '''One page of analytics runs ordered by id, continuing after `after_id`
+
+    `columns` is a comma separated subset of the analytics (and question,
+    level, final_answer) columns. Pass the returned next_after_id to get
+    the following page; it is None on the last page.
+    '''
+
+    logger.info("GET - /analytics/runs request received")
+
+    selected = [column.strip() for column in columns.split(",") if column.strip()] if columns else DEFAULT_RUN_COLUMNS
+    limit = max(1, min(limit, int(os.getenv('ANALYTICS_MAX_PAGE_SIZE', 1000))))
+
+    try:
+        conditions, params = build_filters(start, end, user_id, task_id, level)
+        query, params = build_runs_query(selected, after_id, limit, conditions, params)
+    except ValueError as error:
+        return {
+            'status'    : HTTPStatus.BAD_REQUEST,
+            'type'      : "string",
+            'message'   : str(error)
+        }
+
+    conn = create_connection()
+
+    if conn is None:
+        return {
+            'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
+            'type'      : "string",
+            'message'   : "Database not found :("
+        }
+
+    with conn.cursor(dictionary = True) as cursor:
+        try:
+            logger.debug("SQL - Running a SELECT statement")
+            cursor.execute(query, tuple(params))
+            rows = [serialize_row(row) for row in cursor.fetchall()]
+            logger.debug("SQL - SELECT statement complete")
+
+            response = {
+                'status'        : HTTPStatus.OK,
+                'type'          : "json",
+                'message'       : rows,
+                'length'        : len(rows),
+                'next_after_id' : rows[-1]['id'] if len(rows) == limit else None
+            }
+
+        except Exception as exception:
+            logger.error("Error: get_analytics_runs() encountered an error")
+            logger.error(exception)
+            response = {
+                'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+                'type'      : "string",
+                'message'   : "Could not fetch the analytics runs. Something went wrong."
+            }
+
+        finally:
+            conn.close()
+            logger.debug("Database - Connection to the database was closed")
+
+    return response
+
+
+# Route for exporting analytics rows
+@app.get("/analytics/export")
+def export_analytics(
+    format: str = "ndjson",
+    columns: Optional[str] = None,
+    start: Optional[datetime.datetime] = None,
+    end: Optional[datetime.datetime] = None,
+    user_id: Optional[int] = None,
+    task_id: Optional[str] = None,
+    level: Optional[int] = None,
+    batch_size: int = 1000
+):
+    '''Stream the analytics runs as NDJSON, Arrow IPC or Parquet in fixed-size batches'''
+
+    logger.info(f"GET - /analytics/export?format={format} request received")
+
+    if format not in EXPORT_FORMATS:
+        return {
+            'status'    : HTTPStatus.BAD_REQUEST,
+            'type'      : "string",
+            'message'   : f"Unsupported format '{format}', expected one of {', '.join(EXPORT_FORMATS)}"
+        }
+
+    try:
+        selected = parse_columns(columns)
+    except ValueError as error:
+        return {
+            'status'    : HTTPStatus.BAD_REQUEST,
+            'type'      : "string",
+            'message'   : str(error)
+        }
+
+    filters = {
+        'start'     : start,
+        'end'       : end,
+        'user_id'   : user_id,
+        'task_id'   : task_id,
+        'level'     : level
+    }
+    batch_size = max(1, min(batch_size, int(os.getenv('ANALYTICS_MAX_PAGE_SIZE', 1000))))
+    extension = {'ndjson': "ndjson", 'arrow': "arrows", 'parquet': "parquet"}[format]
+
+    # The query runs before the response starts, so database errors still get an error status
+    try:
+        chunks = start_export(format, selected, filters, batch_size)
+    except PoolTimeout as error:
+        logger.error(f"Database - {error}")
+        return {
+            'status'    : HTTPStatus.SERVICE_UNAVAILABLE,
+            'type'      : "string",
+            'message'   : "Database not found :("
+        }
+    except Exception as exception:
+        logger.error("Error: export_analytics() encountered an error")
+        logger.error(exception)
+        return {
+            'status'    : HTTPStatus.INTERNAL_SERVER_ERROR,
+            'type'      : "string",
+            'message'   : "Could not export the analytics runs. Something went wrong."
+        }
+
+    # The rest of the generator is iterated in the threadpool, so the blocking cursor reads stay off the loop
+    return StreamingResponse(
+        chunks,
+        media_type = EXPORT_FORMATS[format],
+        headers = {'Content-Disposition': f'attachment; filename="analytics.{extension}"'}
+    )
 
 # ====================== Application service : End ======================
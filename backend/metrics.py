@@ -0,0 +1,248 @@
+import time
+import bisect
+import threading
+from typing import Any, Callable, Iterator
+from contextlib import contextmanager
+
+# Custom libraries
+from tracing import record_span
+
+
+# In-process metrics rendered in the Prometheus text exposition format.
+# Every metric keeps its own lock, so updates from request threads, the
+# event loop and background workers never contend on a global lock.
+
+# Latency buckets in seconds, from sub-millisecond lookups to long GPT calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    '''Base class: a named family of values keyed by label values'''
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple = ()):
+        self.name           = name
+        self.documentation  = documentation
+        self.labels         = tuple(labels)
+
+        self._values        = {}
+        self._lock          = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple:
+        return tuple(labels.get(name, "") for name in self.labels)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in items]
+
+
+class Counter(_Metric):
+    '''Monotonically increasing total'''
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    '''Value that can go up and down'''
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    '''Distribution of observed values over fixed buckets'''
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # [per-bucket counts..., +Inf count, sum]
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._values.items()]
+
+        lines = self.header()
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                le = 'le="' + _format_value(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {series[-1]!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    '''Collection of metrics plus callbacks that refresh gauges before a scrape'''
+
+    def __init__(self):
+        self._metrics       = {}
+        self._collectors    = []
+        self._lock          = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labels: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        '''Call `collector` before every render (e.g. to copy stats() into gauges)'''
+
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        '''All metrics in the Prometheus text format'''
+
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = list(self._metrics.values())
+
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                # A broken collector must not take the whole scrape down
+                pass
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Shared registry for the backend
+registry = MetricsRegistry()
+
+http_requests = registry.counter("http_requests_total", "HTTP requests by route, method and status", ("route", "method", "status"))
+http_request_duration = registry.histogram("http_request_duration_seconds", "HTTP request latency by route", ("route", "method"))
+http_requests_in_flight = registry.gauge("http_requests_in_flight", "HTTP requests being handled", ("method",))
+
+stage_duration = registry.histogram("stage_duration_seconds", "Latency of internal stages (db_query, attachment_fetch, extraction, tokenization, openai_chat, whisper, analytics_write)", ("stage",))
+
+llm_requests = registry.counter("llm_requests_total", "GPT runs by model and whether the response cache answered", ("model", "cache"))
+llm_tokens = registry.counter("llm_tokens_total", "Input tokens sent (or served from cache) by model and part of the prompt", ("model", "kind"))
+llm_cost = registry.counter("llm_cost_usd_total", "Estimated OpenAI spend in USD by model", ("model",))
+
+cache_requests = registry.counter("cache_requests_total", "Cache lookups by cache and result", ("cache", "result"))
+cache_hit_ratio = registry.gauge("cache_hit_ratio", "Hit ratio of the in-process caches since start", ("cache",))
+
+db_pool_connections = registry.gauge("db_pool_connections", "MySQL pool connections by state", ("state",))
+analytics_queue_depth = registry.gauge("analytics_queue_depth", "Analytics rows waiting for the background writer")
+analytics_writer_up = registry.gauge("analytics_writer_up", "1 while the background analytics writer thread is running")
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    '''Record the duration of the enclosed block under stage_duration_seconds
+
+    The duration is also added as a span to the trace of the current request.
+    '''
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_duration.observe(elapsed, stage = stage)
+        record_span(stage, elapsed)
+
+
+class MetricsMiddleware:
+    '''ASGI middleware counting requests and their latency per route template'''
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status = {'code': 500}
+
+        async def send_with_status(message):
+            if message['type'] == "http.response.start":
+                status['code'] = message['status']
+            await send(message)
+
+        http_requests_in_flight.inc(method = method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec(method = method)
+
+            # Use the route template (/loadprompt/{task_id}) to keep the label set small
+            route = scope.get('route')
+            path = getattr(route, 'path', None) or "unmatched"
+
+            http_requests.inc(route = path, method = method, status = status['code'])
+            http_request_duration.observe(elapsed, route = path, method = method)
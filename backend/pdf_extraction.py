@@ -0,0 +1,140 @@
+import os
+import math
+from typing import Iterable, Iterator, Optional
+from dotenv import load_dotenv
+from concurrent.futures import as_completed
+
+# Custom libraries
+from log_setup import get_logger
+from file_cache import DiskStore, file_digest
+from metrics import cache_requests
+from process_pool import ProcessPool
+from pdf_pages import extract_pages, count_pages
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+# Bump whenever the text extracted from a page changes, so stored pages are redone
+PAGE_VERSION = 1
+
+
+class PdfExtractor(ProcessPool):
+    '''Extracts PDF text page by page on a process pool, storing every page
+
+    extract_text is pure Python and holds the GIL, so a long PDF extracted
+    in a request thread stalls every other request. Missing pages are split
+    into tasks and run on `workers` processes (one per core by default),
+    which import only pdf_pages.py. Every task parses the file again, so by
+    default there is one task per worker; a smaller `pages_per_task` streams
+    pages sooner at that cost. PDFs with fewer than `min_pages` missing pages are
+    extracted in the calling thread, where the pool would cost more than it
+    saves.
+
+    The text of every page is stored by file hash and page number in
+    `directory` (None to store nothing), so a repeat request, or one for an
+    overlapping set of pages, only extracts the pages not seen before.
+    '''
+
+    def __init__(self, directory: Optional[str], workers: Optional[int] = None, pages_per_task: int = 0, min_pages: int = 8):
+        super().__init__(workers)
+
+        self.store          = DiskStore(directory) if directory else None
+        self.pages_per_task = pages_per_task
+        self.min_pages      = min_pages
+
+    @staticmethod
+    def key(digest: str, page: Optional[int] = None) -> str:
+        '''Store key of one page, or of the page count when `page` is None'''
+
+        return f"{digest}-{'pages' if page is None else f'p{page}'}-v{PAGE_VERSION}"
+
+    def page_count(self, file_path: str, digest: Optional[str] = None) -> int:
+        '''Number of pages of a PDF, stored with its pages'''
+
+        if self.store is None:
+            return count_pages(file_path)
+
+        entry = self.store.get(self.key(digest))
+        if entry is not None:
+            return entry['pages']
+
+        count = count_pages(file_path)
+        self.store.put(self.key(digest), {'pages': count})
+        return count
+
+    def _save(self, digest: Optional[str], page: int, text: str) -> None:
+        if self.store is not None:
+            self.store.put(self.key(digest, page), {'page': page, 'version': PAGE_VERSION, 'text': text})
+
+    def iter_pages(self, file_path: str, pages: Optional[Iterable[int]] = None) -> Iterator[tuple[int, str]]:
+        '''Yield (page, text) for the pages (0-based, all by default) as they are ready
+
+        Stored pages come first, in page order; extracted pages follow as
+        their tasks finish, so the order is not guaranteed. Pages outside
+        the document are skipped. Closing the generator early cancels the
+        tasks that have not started.
+        '''
+
+        digest = file_digest(file_path) if self.store is not None else None
+        count = self.page_count(file_path, digest)
+        wanted = range(count) if pages is None else sorted({page for page in pages if 0 <= page < count})
+
+        missing = []
+        for page in wanted:
+            entry = self.store.get(self.key(digest, page)) if self.store is not None else None
+            if entry is not None:
+                cache_requests.inc(cache = "pdf_pages", result = "hit")
+                yield page, entry['text']
+            else:
+                cache_requests.inc(cache = "pdf_pages", result = "miss")
+                missing.append(page)
+
+        if not missing:
+            return
+
+        if len(missing) < self.min_pages:
+            for page, text in zip(missing, extract_pages(file_path, missing)):
+                self._save(digest, page, text)
+                yield page, text
+            return
+
+        size = self.pages_per_task or math.ceil(len(missing) / self.workers)
+        tasks = [missing[index:index + size] for index in range(0, len(missing), size)]
+
+        logger.info(f"INTERNAL - Extracting {len(missing)} pages of {os.path.basename(file_path)} in {len(tasks)} tasks on {self.workers} processes")
+
+        futures = {self.executor.submit(extract_pages, file_path, task): task for task in tasks}
+        try:
+            for future in as_completed(futures):
+                for page, text in zip(futures[future], future.result()):
+                    self._save(digest, page, text)
+                    yield page, text
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def pages(self, file_path: str, pages: Optional[Iterable[int]] = None) -> list[str]:
+        '''Text of the pages (0-based, all by default), in page order'''
+
+        return [text for _, text in sorted(self.iter_pages(file_path, pages))]
+
+    def extract(self, file_path: str, pages: Optional[Iterable[int]] = None) -> str:
+        '''Text of the pages joined the way extract_file_content always returned it'''
+
+        return ' '.join(self.pages(file_path, pages))
+
+
+# Shared extractor for the backend
+pdf_extractor = PdfExtractor(
+    directory       = os.getenv('PDF_PAGE_CACHE_DIR', 'cache/pdf_pages'),
+    workers         = int(os.getenv('PDF_EXTRACTION_WORKERS', 0)) or None,
+    pages_per_task  = int(os.getenv('PDF_PAGES_PER_TASK', 0)),
+    min_pages       = int(os.getenv('PDF_PARALLEL_MIN_PAGES', 8))
+)
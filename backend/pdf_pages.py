@@ -0,0 +1,22 @@
+import PyPDF2
+
+# Functions run by the PDF extraction workers (see pdf_extraction.py). The
+# workers start from a fresh interpreter and import only this module, so it
+# imports nothing but PyPDF2: no logging setup, database or OpenAI.
+
+
+# Helper function to extract the text of some pages (runs in a worker process)
+def extract_pages(file_path: str, pages: list[int]) -> list[str]:
+    '''Text of the given pages (0-based) of a PDF, in the same order'''
+
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return [reader.pages[page].extract_text() for page in pages]
+
+
+# Helper function to count the pages of a PDF
+def count_pages(file_path: str) -> int:
+    '''Number of pages of a PDF'''
+
+    with open(file_path, 'rb') as file:
+        return len(PyPDF2.PdfReader(file).pages)
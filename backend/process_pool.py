@@ -0,0 +1,53 @@
+import os
+import threading
+import multiprocessing
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+
+# Worker processes are never forked from the backend: by the time a pool is
+# created it runs the log listener, the analytics writer and the request
+# threadpool, and a forked child can inherit a lock some other thread held at
+# fork time. Workers start from a fresh interpreter (forkserver, or spawn where
+# it is not available) and import only the module of the function they run.
+
+
+# Helper function to pick how worker processes are started
+def worker_context() -> multiprocessing.context.BaseContext:
+    '''forkserver where the platform has it, otherwise spawn'''
+
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class ProcessPool:
+    '''A process pool of `workers` processes (one per core by default)
+
+    The pool is created by start(), meant for application startup, or on
+    first use otherwise, and is shut down with the application.
+    '''
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers    = workers or os.cpu_count() or 1
+
+        self._executor  = None
+        self._lock      = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers = self.workers, mp_context = worker_context())
+        return self._executor
+
+    def start(self) -> None:
+        '''Create the pool and start its workers without waiting for them'''
+
+        executor = self.executor
+        for _ in range(self.workers):
+            executor.submit(os.getpid)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait = False, cancel_futures = True)
+            self._executor = None
@@ -0,0 +1,190 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Optional
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+class ResponseCache:
+    '''Two-tier cache of GPT responses keyed by the exact request payload
+
+    The first tier is an in-memory LRU of `memory_entries` items. Misses fall
+    through to a SQLite file, which drops entries older than `ttl` seconds and
+    evicts the least recently used rows once the stored responses exceed
+    `max_disk_bytes`.
+    '''
+
+    def __init__(self, path: str, memory_entries: int = 256, ttl: float = 7 * 24 * 3600, max_disk_bytes: int = 256 * 1024 * 1024):
+        self.path           = path
+        self.memory_entries = memory_entries
+        self.ttl            = ttl
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory        = OrderedDict()     # key -> (response, created_at)
+        self._lock          = threading.Lock()
+        self._db            = None
+
+        self.hits           = 0
+        self.misses         = 0
+
+    @staticmethod
+    def make_key(model: str, temperature: float, messages: list) -> str:
+        '''Hash the model, temperature and the final messages list'''
+
+        payload = json.dumps(
+            {'model': model, 'temperature': temperature, 'messages': messages},
+            sort_keys = True,
+            separators = (',', ':'),
+            default = str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Callers hold self._lock
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok = True)
+
+            self._db = sqlite3.connect(self.path, check_same_thread = False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS responses(
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+            self._db.commit()
+        return self._db
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        # Callers hold self._lock
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last = False)
+
+    def get(self, key: str) -> Optional[str]:
+        '''Return the cached response for the key, or None on a miss'''
+
+        now = time.time()
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                response, created_at = cached
+                if now - created_at < self.ttl:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._memory[key]
+
+            try:
+                db = self._connection()
+                row = db.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is not None and now - row[1] < self.ttl:
+                    db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                    db.commit()
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    return row[0]
+
+                if row is not None:
+                    db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    db.commit()
+
+            except sqlite3.Error as exception:
+                logger.error("Error: ResponseCache.get() encountered an error")
+                logger.error(exception)
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        '''Store a response in both tiers'''
+
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, response, now)
+
+            try:
+                db = self._connection()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, response, len(response.encode('utf-8')), now, now)
+                )
+                self._evict(db, now)
+                db.commit()
+
+            except sqlite3.Error as exception:
+                logger.error("Error: ResponseCache.set() encountered an error")
+                logger.error(exception)
+
+    def _evict(self, db: sqlite3.Connection, now: float) -> None:
+        '''Drop expired rows, then the least recently used ones over the size budget'''
+
+        db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        freed = 0
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC"):
+            if total - freed <= self.max_disk_bytes:
+                break
+            doomed.append((key,))
+            freed += size
+
+        db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        logger.info(f"INTERNAL - Response cache evicted {len(doomed)} entries ({freed} bytes)")
+
+    def stats(self) -> dict:
+        '''Hit and miss counters for the cache'''
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits'              : self.hits,
+                'misses'            : self.misses,
+                'hit_ratio'         : round(self.hits / lookups, 4) if lookups else 0.0,
+                'memory_entries'    : len(self._memory)
+            }
+
+
+# Shared cache for the backend (None when caching is disabled)
+response_cache = None
+
+if os.getenv('LLM_CACHE_ENABLED', 'false').lower() == 'true':
+    response_cache = ResponseCache(
+        path            = os.getenv('LLM_CACHE_PATH', 'cache/llm_responses.sqlite3'),
+        memory_entries  = int(os.getenv('LLM_CACHE_MEMORY_ENTRIES', 256)),
+        ttl             = float(os.getenv('LLM_CACHE_TTL', 7 * 24 * 3600)),
+        max_disk_bytes  = int(float(os.getenv('LLM_CACHE_MAX_DISK_MB', 256)) * 1024 * 1024)
+    )
@@ -0,0 +1,219 @@
+import os
+import csv
+import datetime
+import openpyxl
+from typing import Any, Iterable, Iterator, Optional
+from dotenv import load_dotenv
+
+# Custom libraries
+from log_setup import get_logger
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+# Spreadsheets and CSVs are extracted as text: this legend line, then for
+# every sheet a "## Sheet:" line, the header row and the data rows, one row
+# per line with cells separated by DELIMITER. Empty rows and trailing empty
+# cells are dropped, and a cell repeating the value above it is written as
+# DITTO. Other lines starting with META are notes (e.g. the row limit).
+# A cell that would read as one of these marks (a literal DITTO, a first cell
+# starting with META) or that starts with ESCAPE is written with ESCAPE in front.
+TABLE_PREFIX = '[Table: one row per line, cells separated by "|", a " cell repeats the value above it, empty cells are blank]'
+
+DELIMITER = "|"
+DITTO = '"'
+ESCAPE = "\\"
+META = "## "
+SHEET = "## Sheet: "
+
+
+# Helper function to write one spreadsheet / CSV value as a cell
+def cell_text(value: Any) -> str:
+    '''Compact text of a cell value, without delimiters or line breaks'''
+
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, float) and value.is_integer():
+        text = str(int(value))
+    elif isinstance(value, datetime.datetime):
+        text = value.date().isoformat() if value.time() == datetime.time() else value.isoformat(sep = " ")
+    elif isinstance(value, (datetime.date, datetime.time)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+
+    if DELIMITER in text or "\n" in text or "\r" in text:
+        text = " ".join(text.replace(DELIMITER, "/").split())
+    return text.strip()
+
+
+# Helper function to read the rows of one sheet
+def table_cells(rows: Iterable[Iterable[Any]]) -> Iterator[list[str]]:
+    '''Cells of every non-empty row, trailing empty cells dropped'''
+
+    for row in rows:
+        # CSV rows are lists of text; most need no cleaning beyond stripping
+        if type(row) is list:
+            joined = DELIMITER.join(row)
+            clean = joined.count(DELIMITER) == len(row) - 1 and "\n" not in joined and "\r" not in joined
+        else:
+            clean = False
+
+        if clean:
+            cells = [value.strip() for value in row]
+        else:
+            cells = [cell_text(value) for value in row]
+        while cells and not cells[-1]:
+            cells.pop()
+        if cells:
+            yield cells
+
+
+# Helper function to write one row as a delimited line
+def row_line(cells: list[str], previous: list[str] = ()) -> str:
+    '''A cell equal to the one above it (and longer than the ditto mark) becomes DITTO'''
+
+    line = DELIMITER.join([
+        DITTO if len(cell) > len(DITTO) and index < len(previous) and cell == previous[index] else cell
+        for index, cell in enumerate(cells)
+    ])
+
+    # Rarely needed, so only rows that may hold a cell looking like a mark are escaped
+    if DITTO in cells or ESCAPE in line:
+        line = DELIMITER.join([
+            DITTO if len(cell) > len(DITTO) and index < len(previous) and cell == previous[index]
+            else ESCAPE + cell if cell == DITTO or cell[:1] == ESCAPE
+            else cell
+            for index, cell in enumerate(cells)
+        ])
+    return ESCAPE + line if line[:1] == META[0] and line.startswith(META) else line
+
+
+# Helper function to write parsed (or selected) sections back as table text
+def format_table(sections: list[dict[str, Any]], notes: Optional[list[str]] = None) -> str:
+    '''Table text of sections with a 'title' (None for CSVs), a 'header' and 'rows' of cells'''
+
+    lines = [TABLE_PREFIX]
+    lines += [f"{META}{note}" for note in notes or []]
+    for section in sections:
+        if section['title'] is not None:
+            lines.append(f"{SHEET}{section['title']}")
+        lines.append(row_line(section['header']))
+
+        previous = []
+        for cells in section['rows']:
+            lines.append(row_line(cells, previous))
+            previous = cells
+    return "\n".join(lines)
+
+
+# Helper function to read extracted spreadsheet / CSV content back as rows
+def parse_table(content: Any) -> Optional[list[dict[str, Any]]]:
+    '''Sections (title, header, rows with the ditto marks resolved) of table text, otherwise None'''
+
+    if not isinstance(content, str) or not content.startswith(TABLE_PREFIX):
+        return None
+
+    sections, section, previous = [], None, []
+    for line in content[len(TABLE_PREFIX):].splitlines():
+        if not line:
+            continue
+        if line.startswith(SHEET):
+            sections.append({'title': line[len(SHEET):], 'header': None, 'rows': []})
+            section, previous = sections[-1], []
+            continue
+        if line.startswith(META):
+            continue
+
+        if section is None:
+            sections.append({'title': None, 'header': None, 'rows': []})
+            section = sections[-1]
+
+        cells = [
+            previous[index] if cell == DITTO and index < len(previous)
+            else cell[1:] if cell[:1] == ESCAPE
+            else cell
+            for index, cell in enumerate(line.split(DELIMITER))
+        ]
+        if section['header'] is None:
+            section['header'] = cells
+        else:
+            section['rows'].append(cells)
+            previous = cells
+
+    sections = [section for section in sections if section['header'] is not None]
+    return sections if sections else None
+
+
+class TableReader:
+    '''Streams spreadsheets and CSVs into compact table text
+
+    Workbooks are opened read-only and every worksheet is read row by row,
+    so the file is never loaded whole. Reading stops after `max_rows` data
+    rows across all sheets (None for no limit), with a note saying so.
+    '''
+
+    def __init__(self, max_rows: Optional[int] = 10000):
+        self.max_rows = max_rows
+
+    def _write(self, sheets: Iterable[tuple[Optional[str], Iterable[Iterable[Any]]]]) -> str:
+        lines = [TABLE_PREFIX]
+        remaining = self.max_rows
+        truncated = False
+
+        for title, rows in sheets:
+            cells = table_cells(rows)
+            header = next(cells, None)
+            if header is None:
+                continue
+
+            if remaining == 0:
+                truncated = True
+                break
+
+            if title is not None:
+                lines.append(f"{SHEET}{title}")
+            lines.append(row_line(header))
+
+            previous = []
+            for row in cells:
+                if remaining is not None:
+                    if remaining == 0:
+                        truncated = True
+                        break
+                    remaining -= 1
+                lines.append(row_line(row, previous))
+                previous = row
+
+        if truncated:
+            logger.info(f"INTERNAL - Table cut at the limit of {self.max_rows} rows")
+            lines.append(f"{META}Only the first {self.max_rows} rows are included, the rest of the file was left out")
+        return "\n".join(lines)
+
+    def read_xlsx(self, file_path: str) -> str:
+        '''All worksheets of a workbook, with the cached values of formulas'''
+
+        workbook = openpyxl.load_workbook(file_path, read_only = True, data_only = True)
+        try:
+            return self._write((sheet.title, sheet.iter_rows(values_only = True)) for sheet in workbook.worksheets)
+        finally:
+            workbook.close()
+
+    def read_csv(self, file_path: str) -> str:
+        with open(file_path, 'r', newline = '') as file:
+            return self._write([(None, csv.reader(file))])
+
+
+# Shared reader for the backend
+table_reader = TableReader(
+    max_rows = int(os.getenv('TABLE_MAX_ROWS', 10000)) or None
+)
@@ -0,0 +1,145 @@
+import math
+import struct
+import hashlib
+import threading
+import tiktoken
+from typing import Any, Optional
+from collections import OrderedDict
+
+
+# Helper function to read the pixel size of an image
+def image_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    '''Return (width, height) from a PNG or JPEG header, or None if unknown'''
+
+    # PNG: the IHDR chunk always comes first
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+        width, height = struct.unpack(">II", data[16:24])
+        return width, height
+
+    # JPEG: walk the segments until a start-of-frame marker
+    if data[:2] == b"\xff\xd8":
+        index = 2
+        while index + 9 < len(data):
+            if data[index] != 0xFF:
+                index += 1
+                continue
+            marker = data[index + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                index += 2
+                continue
+            length = struct.unpack(">H", data[index + 2:index + 4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[index + 5:index + 9])
+                return width, height
+            index += 2 + length
+
+    return None
+
+
+# Helper function to price an image input for GPT-4o
+def image_tokens(width: int, height: int) -> int:
+    '''Token cost of a high-detail image input (85 base + 170 per 512px tile)'''
+
+    # Fit within 2048 x 2048, then scale the shortest side down to 768
+    scale = min(1.0, 2048 / max(width, height))
+    width, height = width * scale, height * scale
+
+    scale = min(1.0, 768 / min(width, height))
+    width, height = width * scale, height * scale
+
+    tiles = math.ceil(width / 512) * math.ceil(height / 512)
+    return 85 + 170 * tiles
+
+
+class TokenCounter:
+    '''Token counting for one model with a single shared encoder
+
+    Counts are memoized by a digest of the text in a bounded LRU, so static
+    prompt parts and attachments that are counted repeatedly are only
+    tokenized once.
+    '''
+
+    # Texts shorter than this are used as their own cache key
+    DIGEST_THRESHOLD = 256
+
+    def __init__(self, model: str = "gpt-4o", cache_entries: int = 4096):
+        self.model          = model
+        self.cache_entries  = cache_entries
+
+        self._encoding      = None
+        self._counts        = OrderedDict()
+        self._lock          = threading.Lock()
+
+        self.hits           = 0
+        self.misses         = 0
+
+    @property
+    def encoding(self):
+        '''Load the tiktoken encoding once, on first use'''
+
+        if self._encoding is None:
+            with self._lock:
+                if self._encoding is None:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+        return self._encoding
+
+    def _key(self, text: str) -> Any:
+        if len(text) < self.DIGEST_THRESHOLD:
+            return text
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size = 16).digest()
+
+    def count(self, text: Any) -> int:
+        '''Number of tokens in the text (non-strings are counted by their str())'''
+
+        if text is None:
+            return 0
+        if not isinstance(text, str):
+            text = str(text)
+
+        key = self._key(text)
+        with self._lock:
+            if key in self._counts:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return self._counts[key]
+
+        count = len(self.encoding.encode(text, disallowed_special = ()))
+
+        with self._lock:
+            self.misses += 1
+            self._counts[key] = count
+            while len(self._counts) > self.cache_entries:
+                self._counts.popitem(last = False)
+
+        return count
+
+    def count_image(self, data: bytes) -> int:
+        '''Token cost of an image, from its dimensions rather than its bytes'''
+
+        dimensions = image_dimensions(data)
+        if dimensions is None:
+            # Unknown format: assume the largest high-detail image (2048 x 768 -> 8 tiles)
+            return image_tokens(2048, 768)
+        return image_tokens(*dimensions)
+
+    def clear(self) -> None:
+        '''Forget all memoized counts (the encoder stays loaded)'''
+
+        with self._lock:
+            self._counts.clear()
+
+    def stats(self) -> dict[str, Any]:
+        '''Memoization counters'''
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits'      : self.hits,
+                'misses'    : self.misses,
+                'hit_ratio' : round(self.hits / lookups, 4) if lookups else 0.0,
+                'entries'   : len(self._counts)
+            }
+
+
+# Shared counter for the backend
+token_counter = TokenCounter("gpt-4o")
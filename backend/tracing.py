@@ -0,0 +1,89 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+
+# Lightweight per-request span tracing
+#
+# Stages timed with metrics.time_stage are also appended to the span list of
+# the request being handled. The list lives in a context variable, so it
+# follows the request into run_in_threadpool calls and awaited coroutines,
+# and costs one append per span.
+
+_spans: ContextVar[Optional[list]] = ContextVar('spans', default = None)
+
+
+def start_trace() -> list:
+    '''Begin a new span list for the current context (request or task)'''
+
+    spans = []
+    _spans.set(spans)
+    return spans
+
+
+def record_span(stage: str, seconds: float) -> None:
+    '''Add a finished span to the current trace, if there is one'''
+
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((stage, seconds))
+
+
+def summarize(spans: Optional[list] = None) -> dict[str, dict[str, Any]]:
+    '''Total milliseconds and number of spans per stage'''
+
+    if spans is None:
+        spans = _spans.get() or []
+
+    summary = {}
+    for stage, seconds in list(spans):
+        entry = summary.setdefault(stage, {'ms': 0.0, 'count': 0})
+        entry['ms'] += seconds * 1000
+        entry['count'] += 1
+
+    for entry in summary.values():
+        entry['ms'] = round(entry['ms'], 2)
+    return summary
+
+
+def server_timing(summary: dict[str, dict[str, Any]], total_ms: Optional[float] = None) -> str:
+    '''Format a stage summary as a Server-Timing header value'''
+
+    parts = [
+        f'{stage};dur={entry["ms"]};desc="{entry["count"]} span{"s" if entry["count"] != 1 else ""}"'
+        for stage, entry in summary.items()
+    ]
+    if total_ms is not None:
+        parts.append(f"total;dur={round(total_ms, 2)}")
+    return ", ".join(parts)
+
+
+class ServerTimingMiddleware:
+    '''ASGI middleware that traces each request and reports it in Server-Timing
+
+    The header is sent with the response head, so stages that run while a
+    streaming body is being produced are not included.
+    '''
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        token = _spans.set([])
+        spans = _spans.get()
+
+        async def send_with_timing(message):
+            if message['type'] == "http.response.start":
+                header = server_timing(summarize(spans), (time.perf_counter() - start) * 1000)
+                message['headers'] = list(message.get('headers', [])) + [(b"server-timing", header.encode('latin-1'))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _spans.reset(token)
@@ -0,0 +1,129 @@
+import os
+import sys
+from typing import Optional
+from openai import OpenAI
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+
+# Custom libraries
+from log_setup import get_logger
+from file_cache import DiskStore, file_digest
+from metrics import cache_requests, time_stage
+
+# Load env variables
+load_dotenv()
+
+# ============================= Logger : Begin =============================
+
+# Initialize logger (queued, structured JSON records; see log_setup.py)
+logger = get_logger(__name__)
+
+# ============================= Logger : End ===============================
+
+
+# Audio attachment types sent to Whisper
+SUPPORTED_AUDIO = ('.mp3',)
+
+
+class TranscriptionCache:
+    '''Persistent Whisper transcriptions keyed by audio file hash and model'''
+
+    def __init__(self, directory: str):
+        self.store = DiskStore(directory)
+
+    @staticmethod
+    def key(file_path: str, model: str) -> str:
+        return f"{file_digest(file_path)}-{model}"
+
+    def lookup(self, file_path: str, model: str) -> Optional[str]:
+        '''Stored transcription for the file, or None'''
+
+        entry = self.store.get(self.key(file_path, model))
+        return entry['text'] if entry is not None else None
+
+    def save(self, file_path: str, model: str, text: str) -> None:
+        self.store.put(self.key(file_path, model), {
+            'file_name' : os.path.basename(file_path),
+            'model'     : model,
+            'text'      : text
+        })
+
+    def _load(self, file_path: str, model: str) -> tuple[Optional[str], Optional[bytes]]:
+        '''Stored transcription for the file, otherwise the audio to send to Whisper'''
+
+        text = self.lookup(file_path, model)
+        if text is not None:
+            return text, None
+
+        with open(file_path, "rb") as audio_file:
+            return None, audio_file.read()
+
+    async def transcribe(self, client, file_path: str, model: str = "whisper-1") -> str:
+        '''Transcribe an audio file with an AsyncOpenAI client, reusing stored results'''
+
+        # Hashing and reading the file are blocking, so both run in the threadpool
+        text, data = await run_in_threadpool(self._load, file_path, model)
+        if text is not None:
+            logger.info(f"WHISPER - Transcription cache hit for {os.path.basename(file_path)}")
+            cache_requests.inc(cache = "transcription", result = "hit")
+            return text
+
+        cache_requests.inc(cache = "transcription", result = "miss")
+        audio = (os.path.basename(file_path), data)
+
+        logger.info("WHISPER - Sending a audio transcription request")
+        with time_stage("whisper"):
+            text = await client.audio.transcriptions.create(
+                model = model,
+                file = audio,
+                response_format = "text"
+            )
+
+        await run_in_threadpool(self.save, file_path, model, text)
+        return text
+
+    def pretranscribe(self, client: OpenAI, directory: str, model: str = "whisper-1") -> int:
+        '''Fill the store for every audio file in a directory; returns the number transcribed'''
+
+        transcribed = 0
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.lower().endswith(SUPPORTED_AUDIO):
+                continue
+
+            file_path = os.path.join(directory, file_name)
+            if self.lookup(file_path, model) is not None:
+                continue
+
+            try:
+                with open(file_path, "rb") as audio_file:
+                    text = client.audio.transcriptions.create(
+                        model = model,
+                        file = audio_file,
+                        response_format = "text"
+                    )
+                self.save(file_path, model, text)
+                transcribed += 1
+                logger.info(f"WHISPER - Pre-transcribed {file_name}")
+
+            except Exception as exception:
+                logger.error(f"Error: pretranscribe() failed for {file_name}")
+                logger.error(exception)
+
+        return transcribed
+
+
+# Shared cache for the backend
+transcription_cache = TranscriptionCache(os.getenv('TRANSCRIPTION_CACHE_DIR', 'cache/transcriptions'))
+
+
+if __name__ == "__main__":
+
+    # Offline pre-transcription: python transcription_cache.py [directory]
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.getenv('DOWNLOAD_DIR')
+    client = OpenAI(
+        api_key         = os.getenv("OPENAI_API"),
+        project         = os.getenv("PROJECT_ID"),
+        organization    = os.getenv("ORGANIZATION_ID"),
+        base_url        = os.getenv("OPENAI_BASE_URL")
+    )
+    print(f"Transcribed {transcription_cache.pretranscribe(client, directory)} audio files from {directory}")
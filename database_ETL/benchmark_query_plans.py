@@ -0,0 +1,165 @@
+from dotenv import load_dotenv
+from connectDB import connect_to_mysql
+import argparse
+import logging
+import json
+import time
+
+# Logger function
+logging.basicConfig(level = logging.INFO, format = '%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Query plans and latencies of the hot backend queries, captured before and after
+# running migrate.py:
+#   python benchmark_query_plans.py --output before.json
+#   python migrate.py
+#   python benchmark_query_plans.py --output after.json
+#   python benchmark_query_plans.py --compare before.json after.json
+
+# Same statements the backend runs for /login, /feedback and /analytics/summary
+QUERIES = {
+    'login': """
+    SELECT * FROM users WHERE email = %s
+    """,
+    'feedback': """
+    UPDATE analytics AS a
+    JOIN (
+        SELECT id FROM analytics
+        WHERE user_id = %s AND task_id = %s
+        ORDER BY time_stamp DESC, id DESC LIMIT 1
+    ) AS sub
+    ON a.id = sub.id
+    SET a.feedback = %s
+    """,
+    'feedback_by_id': """
+    UPDATE analytics SET feedback = %s WHERE id = %s
+    """,
+    'analytics_user': """
+    SELECT DATE(a.time_stamp) AS group_key, COUNT(*) AS runs,
+        SUM(a.tokens_per_text_prompt + 0) AS prompt_tokens,
+        SUM(a.total_cost) AS total_cost,
+        AVG(a.time_consumed + 0) AS avg_time_consumed
+    FROM analytics a
+    JOIN gaia_features g ON g.task_id = a.task_id
+    WHERE a.user_id = %s AND a.time_stamp >= NOW() - INTERVAL 30 DAY
+    GROUP BY group_key ORDER BY group_key
+    """,
+    'analytics_task': """
+    SELECT COUNT(*) AS runs, SUM(a.total_cost) AS total_cost
+    FROM analytics a
+    WHERE a.task_id = %s AND a.time_stamp >= NOW() - INTERVAL 30 DAY
+    """
+}
+
+def sample_parameters(cursor):
+    # Real values so the optimizer sees representative selectivity
+    cursor.execute("SELECT email FROM users ORDER BY user_id DESC LIMIT 1")
+    row = cursor.fetchone()
+    email = row[0] if row else "nobody@example.com"
+
+    cursor.execute("SELECT id, user_id, task_id FROM analytics ORDER BY id DESC LIMIT 1")
+    row = cursor.fetchone()
+    run_id, user_id, task_id = row if row else (0, 0, "")
+
+    return {
+        'login'             : (email,),
+        'feedback'          : (user_id, task_id, "benchmark"),
+        'feedback_by_id'    : ("benchmark", run_id),
+        'analytics_user'    : (user_id,),
+        'analytics_task'    : (task_id,)
+    }
+
+def explain(cursor, query, params):
+    cursor.execute(f"EXPLAIN {query}", params)
+    columns = [column[0] for column in cursor.description]
+    return [
+        {column: value for column, value in zip(columns, row) if column in ('table', 'type', 'possible_keys', 'key', 'rows', 'Extra')}
+        for row in cursor.fetchall()
+    ]
+
+def time_query(conn, cursor, query, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cursor.execute(query, params)
+        if cursor.with_rows:
+            cursor.fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+
+        # The feedback UPDATE must not change any data
+        conn.rollback()
+
+    timings.sort()
+    return {
+        'median_ms' : round(timings[len(timings) // 2], 3),
+        'min_ms'    : round(timings[0], 3),
+        'max_ms'    : round(timings[-1], 3)
+    }
+
+def table_summary(cursor):
+    cursor.execute("SELECT COUNT(*) FROM analytics")
+    analytics_rows = cursor.fetchone()[0]
+    cursor.execute("SELECT COUNT(*) FROM users")
+    users_rows = cursor.fetchone()[0]
+    return {'analytics': analytics_rows, 'users': users_rows}
+
+def run_benchmark(repeat):
+    conn = connect_to_mysql()
+    conn.autocommit = False
+    cursor = conn.cursor(buffered = True)
+
+    try:
+        params = sample_parameters(cursor)
+        results = {'rows': table_summary(cursor), 'queries': {}}
+
+        for name, query in QUERIES.items():
+            logger.info(f"Benchmarking {name}")
+            results['queries'][name] = {
+                'plan'      : explain(cursor, query, params[name]),
+                'timing'    : time_query(conn, cursor, query, params[name], repeat)
+            }
+        return results
+
+    finally:
+        conn.rollback()
+        conn.close()
+
+def describe_plan(plan):
+    return "; ".join(f"{step['table']}: {step['type']} key={step['key']} rows={step['rows']}" for step in plan)
+
+def compare(before, after):
+    for name in QUERIES:
+        if name not in before['queries'] or name not in after['queries']:
+            continue
+        old, new = before['queries'][name], after['queries'][name]
+        speedup = old['timing']['median_ms'] / new['timing']['median_ms'] if new['timing']['median_ms'] else float('inf')
+
+        print(f"== {name}")
+        print(f"  before: {old['timing']['median_ms']:.3f} ms  {describe_plan(old['plan'])}")
+        print(f"  after:  {new['timing']['median_ms']:.3f} ms  {describe_plan(new['plan'])}")
+        print(f"  speedup: {speedup:.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description = "Capture query plans and timings of the backend's hot queries")
+    parser.add_argument("--output", help = "Write the results as JSON to this file")
+    parser.add_argument("--repeat", type = int, default = 20, help = "Executions per query")
+    parser.add_argument("--compare", nargs = 2, metavar = ("BEFORE", "AFTER"), help = "Compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as before_file, open(args.compare[1]) as after_file:
+            compare(json.load(before_file), json.load(after_file))
+        return
+
+    load_dotenv()
+    results = run_benchmark(args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent = 2, default = str)
+        logger.info(f"Results written to {args.output}")
+    else:
+        print(json.dumps(results, indent = 2, default = str))
+
+if __name__ == "__main__":
+    main()
@@ -63,23 +63,32 @@ def execute_create_query(conn):
             last_name VARCHAR(50) NOT NULL,
             phone VARCHAR(15) NOT NULL,
             email VARCHAR(100) NOT NULL,
-            password VARCHAR(255) NOT NULL
+            password VARCHAR(255) NOT NULL,
+            UNIQUE INDEX uq_users_email (email)
         );
         """
 
         create_analytics_table_query = """
         CREATE TABLE IF NOT EXISTS analytics(
             id INT PRIMARY KEY AUTO_INCREMENT,
+            run_id CHAR(32) DEFAULT NULL,
             user_id INT NOT NULL,
             task_id VARCHAR(255) NOT NULL,
             updated_steps TEXT DEFAULT NULL,
-            tokens_per_text_prompt VARCHAR(255) DEFAULT NULL,
-            tokens_per_attachment VARCHAR(255) DEFAULT NULL,
+            tokens_per_text_prompt INT DEFAULT NULL,
+            tokens_per_attachment INT DEFAULT NULL,
+            tokens_per_attachment_original INT DEFAULT NULL,
             gpt_response TEXT DEFAULT NULL,
             total_cost DOUBLE DEFAULT NULL,
-            time_consumed VARCHAR(255) DEFAULT NULL,
+            time_consumed DOUBLE DEFAULT NULL,
             feedback TEXT NULL,
+            cache_hit BOOLEAN NOT NULL DEFAULT FALSE,
+            stage_timings TEXT DEFAULT NULL,
             time_stamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE INDEX uq_analytics_run_id (run_id),
+            INDEX idx_analytics_time_stamp (time_stamp),
+            INDEX idx_analytics_user_time (user_id, time_stamp),
+            INDEX idx_analytics_task_time (task_id, time_stamp),
             FOREIGN KEY (user_id) REFERENCES users(user_id),
             FOREIGN KEY (task_id) REFERENCES gaia_features(task_id)
         );
@@ -161,6 +170,27 @@ def execute_insert_query(conn, formatted_data, formatted_metadata):
     logger.info("Insertion into gaia_annotations done\n")
     logger.info("Insert statement executed successfully")
 
+def bump_gaia_version(conn):
+    # Signal running backends that the GAIA tables were reloaded
+    logger.info("Bumping the GAIA data version marker")
+
+    create_version_table_query = """
+    CREATE TABLE IF NOT EXISTS gaia_version(
+        id INT PRIMARY KEY,
+        version INT NOT NULL,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    );
+    """
+    bump_version_query = """
+    INSERT INTO gaia_version (id, version) VALUES (1, 1)
+    ON DUPLICATE KEY UPDATE version = version + 1;
+    """
+
+    cursor = conn.cursor()
+    cursor.execute(create_version_table_query)
+    cursor.execute(bump_version_query)
+    logger.info("GAIA data version marker updated")
+
 def connect_to_mysql():
     try:
         connection = mysql.connector.connect(
@@ -267,6 +297,7 @@ def main():
         execute_create_query(conn)
         execute_select_query(conn)
         execute_insert_query(conn, formatted_data, formatted_metadata)
+        bump_gaia_version(conn)
         conn.commit()
 
     except Exception as e:
@@ -33,5 +33,13 @@ def main():
         print(f"Error executing connectDB.py: {e}")
         raise e
 
+    # Apply pending schema migrations
+    try:
+        subprocess.run(['python', 'migrate.py'], check=True)
+        print("Successfully executed migrate.py")
+    except Exception as e:
+        print(f"Error executing migrate.py: {e}")
+        raise e
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
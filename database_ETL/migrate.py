@@ -0,0 +1,187 @@
+from dotenv import load_dotenv
+from connectDB import connect_to_mysql
+import argparse
+import logging
+
+# Logger function
+logging.basicConfig(level = logging.INFO, format = '%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Versioned schema migrations, applied in order and recorded in schema_migrations.
+# Each step is written to be safe to re-run against a partially migrated schema
+# and uses in-place / shared-lock DDL so the backend keeps reading while it runs.
+
+def column_type(cursor, table_name, column_name):
+    cursor.execute("""
+    SELECT DATA_TYPE FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table_name, column_name))
+    row = cursor.fetchone()
+    return row[0].lower() if row else None
+
+def index_exists(cursor, table_name, index_name):
+    cursor.execute("""
+    SELECT 1 FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+    LIMIT 1
+    """, (table_name, index_name))
+    return cursor.fetchone() is not None
+
+def add_index_if_missing(cursor, table_name, index_name, definition):
+    if index_exists(cursor, table_name, index_name):
+        logger.info(f"Index {index_name} already exists on {table_name}")
+        return
+    cursor.execute(f"ALTER TABLE {table_name} ADD {definition}, ALGORITHM = INPLACE, LOCK = NONE;")
+    logger.info(f"Index {index_name} added to {table_name}")
+
+def migration_numeric_analytics(cursor):
+    # tokens_per_text_prompt, tokens_per_attachment and time_consumed were VARCHAR(255)
+    integer_pattern = '^ *-?[0-9]+ *$'
+    decimal_pattern = '^ *-?[0-9]+([.][0-9]+)?([eE][-+]?[0-9]+)? *$'
+    targets = {
+        'tokens_per_text_prompt'    : ("INT", integer_pattern),
+        'tokens_per_attachment'     : ("INT", integer_pattern),
+        'time_consumed'             : ("DOUBLE", decimal_pattern)
+    }
+
+    pending = {column: target for column, target in targets.items() if column_type(cursor, 'analytics', column) == 'varchar'}
+    if not pending:
+        logger.info("analytics numeric columns already converted")
+        return
+
+    for column, (sql_type, pattern) in pending.items():
+        # Fractional token counts are rounded rather than lost
+        if sql_type == "INT":
+            cursor.execute(f"""
+            UPDATE analytics SET {column} = CAST(ROUND({column}) AS SIGNED)
+            WHERE {column} NOT REGEXP %s AND {column} REGEXP %s
+            """, (integer_pattern, decimal_pattern))
+
+        # Values that would not convert cleanly are nulled instead of failing the ALTER
+        cursor.execute(f"""
+        UPDATE analytics SET {column} = NULL
+        WHERE {column} IS NOT NULL AND {column} NOT REGEXP %s
+        """, (pattern,))
+        if cursor.rowcount:
+            logger.warning(f"Nulled {cursor.rowcount} non-numeric values in analytics.{column}")
+
+    # A type change needs a table copy; LOCK = SHARED keeps the table readable meanwhile
+    modify = ", ".join(f"MODIFY {column} {sql_type} DEFAULT NULL" for column, (sql_type, _) in pending.items())
+    cursor.execute(f"ALTER TABLE analytics {modify}, ALGORITHM = COPY, LOCK = SHARED;")
+    logger.info(f"Converted analytics columns to numeric types: {', '.join(pending)}")
+
+def migration_analytics_indexes(cursor):
+    # Latest-run lookups (/feedback) and time range filters (/analytics)
+    add_index_if_missing(cursor, 'analytics', 'idx_analytics_time_stamp', "INDEX idx_analytics_time_stamp (time_stamp)")
+    # Per-user and per-task history, ordered by time
+    add_index_if_missing(cursor, 'analytics', 'idx_analytics_user_time', "INDEX idx_analytics_user_time (user_id, time_stamp)")
+    add_index_if_missing(cursor, 'analytics', 'idx_analytics_task_time', "INDEX idx_analytics_task_time (task_id, time_stamp)")
+
+def migration_unique_user_email(cursor):
+    if index_exists(cursor, 'users', 'uq_users_email'):
+        logger.info("Unique email index already exists")
+        return
+
+    # Refuse to continue rather than silently dropping accounts
+    cursor.execute("SELECT email, COUNT(*) FROM users GROUP BY email HAVING COUNT(*) > 1")
+    duplicates = cursor.fetchall()
+    if duplicates:
+        emails = ", ".join(row[0] for row in duplicates)
+        raise RuntimeError(f"Cannot add a unique email index, duplicate accounts exist for: {emails}")
+
+    add_index_if_missing(cursor, 'users', 'uq_users_email', "UNIQUE INDEX uq_users_email (email)")
+
+def migration_analytics_run_id(cursor):
+    # Client-visible id of each run, so /feedback can update a single row
+    if column_type(cursor, 'analytics', 'run_id') is None:
+        cursor.execute("ALTER TABLE analytics ADD COLUMN run_id CHAR(32) DEFAULT NULL AFTER id, ALGORITHM = INPLACE, LOCK = NONE;")
+        logger.info("Column run_id added to analytics")
+
+    add_index_if_missing(cursor, 'analytics', 'uq_analytics_run_id', "UNIQUE INDEX uq_analytics_run_id (run_id)")
+
+def migration_analytics_cache_hit(cursor):
+    # Whether the run was answered from the response cache (every analytics INSERT writes it)
+    if column_type(cursor, 'analytics', 'cache_hit') is None:
+        cursor.execute("ALTER TABLE analytics ADD COLUMN cache_hit BOOLEAN NOT NULL DEFAULT FALSE AFTER feedback, ALGORITHM = INPLACE, LOCK = NONE;")
+        logger.info("Column cache_hit added to analytics")
+
+def migration_analytics_stage_timings(cursor):
+    # Per-stage latency breakdown (JSON) of each run
+    if column_type(cursor, 'analytics', 'stage_timings') is None:
+        cursor.execute("ALTER TABLE analytics ADD COLUMN stage_timings TEXT DEFAULT NULL AFTER cache_hit, ALGORITHM = INPLACE, LOCK = NONE;")
+        logger.info("Column stage_timings added to analytics")
+
+def migration_analytics_original_attachment_tokens(cursor):
+    # Attachment tokens before relevance trimming, next to the tokens actually sent
+    if column_type(cursor, 'analytics', 'tokens_per_attachment_original') is None:
+        cursor.execute("ALTER TABLE analytics ADD COLUMN tokens_per_attachment_original INT DEFAULT NULL AFTER tokens_per_attachment, ALGORITHM = INPLACE, LOCK = NONE;")
+        logger.info("Column tokens_per_attachment_original added to analytics")
+
+MIGRATIONS = [
+    (1, "Numeric token and time columns in analytics", migration_numeric_analytics),
+    (2, "Secondary indexes on analytics", migration_analytics_indexes),
+    (3, "Unique index on users.email", migration_unique_user_email),
+    (4, "Run id on analytics for feedback updates", migration_analytics_run_id),
+    (5, "Cache hit flag on analytics", migration_analytics_cache_hit),
+    (6, "Stage timings on analytics", migration_analytics_stage_timings),
+    (7, "Untrimmed attachment tokens on analytics", migration_analytics_original_attachment_tokens),
+]
+
+def ensure_migrations_table(cursor):
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS schema_migrations(
+        version INT PRIMARY KEY,
+        description VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+    """)
+
+def applied_versions(cursor):
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+def migrate(conn, target = None):
+    cursor = conn.cursor(buffered = True)
+    ensure_migrations_table(cursor)
+    applied = applied_versions(cursor)
+
+    for version, description, step in MIGRATIONS:
+        if version in applied or (target is not None and version > target):
+            continue
+
+        logger.info(f"Applying migration {version}: {description}")
+        step(cursor)
+        cursor.execute("INSERT INTO schema_migrations (version, description) VALUES (%s, %s)", (version, description))
+        conn.commit()
+        logger.info(f"Migration {version} applied")
+
+def status(conn):
+    cursor = conn.cursor(buffered = True)
+    ensure_migrations_table(cursor)
+    applied = applied_versions(cursor)
+    for version, description, _ in MIGRATIONS:
+        state = "applied" if version in applied else "pending"
+        print(f"{version:>4}  {state:<8} {description}")
+
+def main():
+    parser = argparse.ArgumentParser(description = "Apply versioned schema migrations")
+    parser.add_argument("--status", action = "store_true", help = "List migrations and whether they are applied")
+    parser.add_argument("--target", type = int, help = "Only apply migrations up to this version")
+    args = parser.parse_args()
+
+    load_dotenv()
+    conn = connect_to_mysql()
+    try:
+        if args.status:
+            status(conn)
+        else:
+            migrate(conn, args.target)
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        logger.error(f"Error while executing migrations: {e}")
+        raise(e)
@@ -2,27 +2,61 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from http import HTTPStatus
+import datetime
 import requests
+import json
 import os
 
+# Base URL of the FastAPI backend
+def backend_url():
+    return "http://"+ os.getenv("HOSTNAME") + ":8000"
+
+# Function to fetch server-side aggregated analytics
+def fetch_summary(group_by=None, filters=None):
+    params = dict(filters or {})
+    if group_by:
+        params['group_by'] = group_by
+
+    response = requests.get(backend_url() + "/analytics/summary", params=params)
+    if response.status_code != 200:
+        return None
+
+    response_data = response.json()
+    if response_data['status'] != HTTPStatus.OK:
+        return None
+    return response_data['message']
+
+# Function to fetch one page of analytics runs
+def fetch_runs(after_id=0, limit=50, filters=None, columns=None):
+    params = dict(filters or {})
+    params.update({'after_id': after_id, 'limit': limit})
+    if columns:
+        params['columns'] = ",".join(columns)
+
+    response = requests.get(backend_url() + "/analytics/runs", params=params)
+    if response.status_code != 200:
+        return None
+
+    response_data = response.json()
+    if response_data['status'] != HTTPStatus.OK:
+        return None
+    return response_data
+
 # Function to perform cost efficiency analysis
 def cost_efficiency_analysis(df):
     st.subheader("Cost Efficiency Analysis")
     
-    # Calculate cost per token (for both prompt and attachment)
-    df['total_tokens'] = df['tokens_per_text_prompt'] + df['tokens_per_attachment']
-    df['cost_per_token'] = df['total_cost'] / df['total_tokens']
-    
-    # Fill NaN values with 0 (in case of division by 0 errors)
+    # Cost per token is computed by the backend for each day
     df['cost_per_token'] = df['cost_per_token'].fillna(0)
 
     # Display cost per token
-    st.write("Cost per Token for each timestamp:")
-    st.write(df[['time_stamp', 'cost_per_token']])
+    st.write("Cost per Token for each day:")
+    st.write(df[['group_key', 'cost_per_token']])
 
     # Visualize cost per token over time
     fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(df['time_stamp'], df['cost_per_token'], label='Cost per Token', marker='o', color='purple')
+    ax.plot(df['group_key'], df['cost_per_token'], label='Cost per Token', marker='o', color='purple')
     
     # Add labels and titles
     ax.set_title('Cost per Token Over Time', fontsize=16)
@@ -35,24 +69,22 @@ def cost_efficiency_analysis(df):
     st.pyplot(fig)
 
 # Function to create the operational efficiency dashboard
-def operational_efficiency_dashboard(df):
+def operational_efficiency_dashboard(summary):
     st.subheader("Operational Efficiency Dashboard")
 
-    # Calculate efficiency metrics
-    df['total_tokens'] = df['tokens_per_text_prompt'] + df['tokens_per_attachment']
-    df['tokens_per_second'] = df['total_tokens'] / df['time_consumed']
-
-    # Calculate key metrics
-    avg_completion_time = df['time_consumed'].mean()
-    avg_cost_per_task = df['total_cost'].mean()
-    total_tasks = len(df)
-    total_cost = df['total_cost'].sum()
+    # Key metrics are aggregated by the backend
+    avg_completion_time = summary['avg_time_consumed'] or 0
+    avg_cost_per_task = summary['avg_cost'] or 0
+    total_tasks = summary['runs']
+    total_cost = summary['total_cost'] or 0
 
     # Display key metrics
     st.metric("Total Tasks", total_tasks)
     st.metric("Average Completion Time", f"{avg_completion_time:.2f} seconds")
     st.metric("Average Cost per Task", f"${avg_cost_per_task:.4f}")
     st.metric("Total Cost", f"${total_cost:.2f}")
+    st.metric("Tokens per Second", f"{summary['tokens_per_second'] or 0:.1f}")
+    st.metric("Attachment Tokens Trimmed", f"{int(summary.get('trimmed_attachment_tokens') or 0):,}")
 
     # Metrics and values for the bar plot
     metrics = ['Avg Completion Time (s)', 'Avg Cost per Task ($)', 'Total Tasks', 'Total Cost ($)']
@@ -70,49 +102,115 @@ def operational_efficiency_dashboard(df):
     # Display the plot in Streamlit
     st.pyplot(fig)
 
+# Function to show where the latency of each task goes, from the stored stage timings
+def latency_breakdown(filters):
+    st.subheader("Latency Breakdown by Stage")
+
+    page = fetch_runs(limit=1000, filters=filters, columns=['task_id', 'stage_timings'])
+    if page is None:
+        st.error("Failed to fetch analytics runs.")
+        return
+
+    rows = []
+    for run in page['message']:
+        if not run.get('stage_timings'):
+            continue
+        for stage, timing in json.loads(run['stage_timings']).items():
+            rows.append({'task_id': run['task_id'], 'stage': stage, 'ms': timing['ms']})
+
+    if not rows:
+        st.info("No stage timings recorded yet (set ANALYTICS_STORE_STAGE_TIMINGS=true on the backend).")
+        return
+
+    # Average milliseconds per stage for each task (first 1000 matching runs)
+    df = pd.DataFrame(rows)
+    breakdown = df.groupby(['task_id', 'stage'])['ms'].mean().unstack(fill_value=0)
+    st.write(breakdown.round(1))
+
+    # Visualize the breakdown as stacked bars per task
+    fig, ax = plt.subplots(figsize=(10, 6))
+    breakdown.plot(kind='bar', stacked=True, ax=ax)
+
+    # Add labels and titles
+    ax.set_title('Average Latency per Stage', fontsize=16)
+    ax.set_xlabel('Task', fontsize=12)
+    ax.set_ylabel('Milliseconds', fontsize=12)
+    plt.xticks(rotation=45)
+
+    # Display the plot in Streamlit
+    st.pyplot(fig)
+
+# Function to move the runs table to another page (runs before the next rerun renders)
+def set_runs_cursor(after_id):
+    st.session_state['runs_after_id'] = after_id
+
+# Function to page through the most recent analytics rows
+def recent_runs(filters):
+    st.subheader("Runs")
+
+    # Start again from the first page whenever the filters change
+    if st.session_state.get('runs_filters') != filters:
+        st.session_state['runs_filters'] = dict(filters)
+        st.session_state['runs_after_id'] = 0
+
+    page = fetch_runs(st.session_state['runs_after_id'], filters=filters)
+    if page is None:
+        st.error("Failed to fetch analytics runs.")
+        return
+
+    st.write(pd.DataFrame(page['message']))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("First page", on_click=set_runs_cursor, args=(0,))
+    with col2:
+        if page['next_after_id'] is not None:
+            st.button("Next page", on_click=set_runs_cursor, args=(page['next_after_id'],))
+
 # Call the function to display the analytics page
 def display_analytics_page():
     # Set the title of the analytics dashboard
     st.title("Analytics Dashboard")
     st.subheader("User data")
-    
-    # Fetch analytics data from the API
-    response = requests.get("http://"+ os.getenv("HOSTNAME") + ":8000/analytics")
+
+    # Optional time range filter, applied on the server
+    filters = {}
+    date_range = st.date_input("Date range", value=[], key="analytics_date_range")
+    if len(date_range) == 2:
+        filters['start'] = date_range[0].isoformat()
+        filters['end'] = (date_range[1] + datetime.timedelta(days=1)).isoformat()
+
+    # Fetch aggregated analytics from the API
+    summary = fetch_summary(filters=filters)
     
     # Check if the request was successful
-    if response.status_code == 200:
-        response_data = response.json()
-        
-        # Convert the response data to a DataFrame
-        df = pd.DataFrame(response_data)
-        
-        # Ensure necessary columns are present
-        required_columns = ['time_stamp', 'tokens_per_text_prompt', 'tokens_per_attachment', 'total_cost', 'time_consumed']
-        if all(col in df.columns for col in required_columns):
-            # Convert time_stamp to datetime and numeric columns
-            df['time_stamp'] = pd.to_datetime(df['time_stamp'])
-            df['tokens_per_text_prompt'] = pd.to_numeric(df['tokens_per_text_prompt'], errors='coerce')
-            df['tokens_per_attachment'] = pd.to_numeric(df['tokens_per_attachment'], errors='coerce')
-            df['total_cost'] = pd.to_numeric(df['total_cost'], errors='coerce')
-            df['time_consumed'] = pd.to_numeric(df['time_consumed'], errors='coerce')
-            
-            # Fill NaN values with 0 for tokens_per_attachment and total_cost
-            df['tokens_per_attachment'] = df['tokens_per_attachment'].fillna(0)
-            df['total_cost'] = df['total_cost'].fillna(0)
-
-            # Display DataFrame in Streamlit
-            st.write(df)
-
-            # Call the cost efficiency analysis function
-            cost_efficiency_analysis(df)
-
-            # Call the operational efficiency dashboard function
-            operational_efficiency_dashboard(df)
-
-        else:
-            st.error("Response data does not contain the required columns.")
-    else:
-        st.error("Failed to fetch data from the API. Status code: {}".format(response.status_code))
+    if summary is None:
+        st.error("Failed to fetch data from the API.")
+        return
+
+    if not summary['runs']:
+        st.info("No runs recorded for the selected range.")
+        return
+
+    # Breakdown by the selected dimension
+    group_by = st.selectbox("Group by", ["day", "user", "task", "level"], key="analytics_group_by")
+    grouped = fetch_summary(group_by, filters)
+    if grouped is not None:
+        st.write(pd.DataFrame(grouped))
+
+    # Call the cost efficiency analysis function
+    by_day = grouped if group_by == "day" else fetch_summary("day", filters)
+    if by_day:
+        cost_efficiency_analysis(pd.DataFrame(by_day))
+
+    # Call the operational efficiency dashboard function
+    operational_efficiency_dashboard(summary)
+
+    # Where the time goes for each task
+    latency_breakdown(filters)
+
+    # Page through the individual runs
+    recent_runs(filters)
 
 # Call the function to display the analytics page
 if __name__ == "__main__":
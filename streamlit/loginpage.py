@@ -46,6 +46,7 @@ def display_login_page():
                 st.success("Logged in successfully!")
                 st.session_state['logged_in'] = True  
                 st.session_state['user_id'] = response['user_id']
+                st.session_state['session_token'] = response.get('session_token')
                 # Navigate to the search engine
                 st.session_state['page'] = 'searchengine'  
             else:
@@ -64,6 +65,7 @@ def display_login_page():
                 st.success("Registered successfully!")
                 st.session_state['logged_in'] = True  
                 st.session_state['user_id'] = response['user_id']
+                st.session_state['session_token'] = response.get('session_token')
                 # Navigate to the search engine
                 st.session_state['page'] = 'searchengine'  
             else:
@@ -1,9 +1,23 @@
 import streamlit as st
 import requests
 from http import HTTPStatus
+import threading
+import json
 import os
 
-# Function to query GPT model response
+# Function to build the Authorization header for the logged in user
+def auth_headers():
+    token = st.session_state.get('session_token')
+    return {'Authorization': 'Bearer ' + token} if token else {}
+
+# Function to send the user back to login when the session token was refused (e.g. expired)
+def end_session():
+    for key in ('session_token', 'logged_in', 'user_id'):
+        st.session_state.pop(key, None)
+    st.session_state['page'] = 'login'
+    st.warning("Your session has expired. Please log in again.")
+
+# Function to query GPT model response, rendering the tokens as they stream in
 def query_gpt(task_id, user_id, updated_steps=None):
     data = { 
         'task_id': task_id,
@@ -13,13 +27,56 @@ def query_gpt(task_id, user_id, updated_steps=None):
     
     if updated_steps:
         data['updated_steps'] = updated_steps
-    
-    response = requests.post('http://'+ os.getenv("HOSTNAME") +':8000/querygpt', json=data)
 
-    if response.status_code == HTTPStatus.OK:
-        return response.json()
-    else:
-        return {'status': response.status_code, 'message': 'Error fetching GPT response.'}
+    error = {'status': HTTPStatus.INTERNAL_SERVER_ERROR, 'message': 'Error fetching GPT response.'}
+    placeholder = st.empty()
+    streamed_text = ""
+
+    with requests.post('http://'+ os.getenv("HOSTNAME") +':8000/querygpt/stream', json=data, headers=auth_headers(), stream=True) as response:
+        if response.status_code != HTTPStatus.OK:
+            return {'status': response.status_code, 'message': 'Error fetching GPT response.'}
+
+        # Early failures come back as a plain JSON body instead of a stream
+        if not response.headers.get('content-type', '').startswith('application/x-ndjson'):
+            body = response.json()
+            if body.get('status') == HTTPStatus.UNAUTHORIZED:
+                end_session()
+            return body
+
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            event = json.loads(line)
+
+            if event['event'] == 'token':
+                streamed_text += event['content']
+                placeholder.info(streamed_text)
+            else:
+                # The final "done" (or "error") event carries the full response
+                placeholder.empty()
+                return event
+
+    placeholder.empty()
+    return error
+
+# Function to save feedback for a GPT run without blocking the page
+def send_feedback(task_id, user_id, feedback, run_id=None):
+    data = {
+        'task_id': task_id,
+        'user_id': user_id,
+        'feedback': feedback,
+        'run_id': run_id
+    }
+    headers = auth_headers()
+
+    def post():
+        try:
+            requests.post('http://'+ os.getenv("HOSTNAME") +':8000/feedback', json=data, headers=headers, timeout=30)
+        except requests.RequestException:
+            pass
+
+    # Fire-and-forget: the page does not wait for the database write
+    threading.Thread(target=post, daemon=True).start()
 
 # Function to display the validation page and allow editing of annotator steps
 def display_validation_page():
@@ -58,6 +115,8 @@ def display_validation_page():
 
                 annotation_steps = response.get('annotation_steps', annotation_steps)
                 st.session_state['annotation_steps'] = annotation_steps
+
+                st.session_state['run_id'] = response.get('run_id')
                     
                 st.session_state['action'] = False
 
@@ -107,6 +166,7 @@ def display_validation_page():
     
         if new_response['status'] == HTTPStatus.OK:
             st.session_state['gpt_response'] = new_response['gpt_response']
+            st.session_state['run_id'] = new_response.get('run_id')
             st.success("GPT response regenerated!")
             st.success(updated_annotation_steps)
             st.session_state['count'] += 1  # Increment the count
@@ -125,7 +185,8 @@ def display_validation_page():
 
     if st.button("Submit"):
         if feedback_text.strip():
-            # Here, you would typically save the feedback to a database or handle it accordingly
+            # Save the feedback against the run it was given for
+            send_feedback(task_id, user_id, feedback_text, st.session_state.get('run_id'))
             st.success("Thank you for your feedback!")
             # Optionally clear the feedback box after submission
             st.session_state['feedback'] = feedback_text